@@ -0,0 +1,34 @@
+"""Add materialised data statistics table
+
+Revision ID: b81e3f5d2c47
+Revises: 7c2d9e41a6b3
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b81e3f5d2c47'
+down_revision: Union[str, None] = '7c2d9e41a6b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store precomputed statistics groups served by the stats endpoints"""
+    op.create_table(
+        'data_statistics',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(), nullable=False),
+        sa.Column('duration_ms', sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint('name'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('data_statistics')
@@ -0,0 +1,34 @@
+"""Add entity relationship lookup indexes
+
+Revision ID: d3a6f08c5b19
+Revises: b81e3f5d2c47
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a6f08c5b19'
+down_revision: Union[str, None] = 'b81e3f5d2c47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index relationships by parent and by child for paged relationship listings"""
+    op.create_index(
+        'idx_relationship_parent', 'entity_relationships',
+        ['parent_lei', 'relationship_type', 'relationship_status'],
+    )
+    op.create_index(
+        'idx_relationship_child', 'entity_relationships',
+        ['child_lei', 'relationship_type', 'relationship_status'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_relationship_child', table_name='entity_relationships')
+    op.drop_index('idx_relationship_parent', table_name='entity_relationships')
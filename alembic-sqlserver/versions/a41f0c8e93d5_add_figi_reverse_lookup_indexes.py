@@ -0,0 +1,35 @@
+"""Add FIGI exchange code and reverse lookup indexes
+
+Revision ID: a41f0c8e93d5
+Revises: e8f7g6h5i4j3
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41f0c8e93d5'
+down_revision: Union[str, None] = 'e8f7g6h5i4j3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index FIGI mappings for FIGI -> ISIN and ticker -> instrument lookups"""
+    op.add_column('figi_mappings', sa.Column('exchange_code', sa.String(length=10), nullable=True))
+    op.create_index('idx_figi_composite_figi', 'figi_mappings', ['composite_figi'])
+    op.create_index('idx_figi_share_class_figi', 'figi_mappings', ['share_class_figi'])
+    op.create_index('idx_figi_ticker_exchange', 'figi_mappings', ['ticker', 'exchange_code'])
+    op.create_index('idx_figi_isin', 'figi_mappings', ['isin'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_figi_isin', table_name='figi_mappings')
+    op.drop_index('idx_figi_ticker_exchange', table_name='figi_mappings')
+    op.drop_index('idx_figi_share_class_figi', table_name='figi_mappings')
+    op.drop_index('idx_figi_composite_figi', table_name='figi_mappings')
+    op.drop_column('figi_mappings', 'exchange_code')
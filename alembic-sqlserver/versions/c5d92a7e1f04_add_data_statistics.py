@@ -0,0 +1,34 @@
+"""Add materialised data statistics table
+
+Revision ID: c5d92a7e1f04
+Revises: a41f0c8e93d5
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d92a7e1f04'
+down_revision: Union[str, None] = 'a41f0c8e93d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store precomputed statistics groups served by the stats endpoints"""
+    op.create_table(
+        'data_statistics',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(), nullable=False),
+        sa.Column('duration_ms', sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint('name'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('data_statistics')
@@ -688,7 +688,7 @@ export default class HomePage extends BasePage {
   private async checkAuthenticationRequired(): Promise<boolean> {
     try {
       // Test a protected endpoint (instruments) to check if auth is required
-      const response = await fetch('/api/v1/instruments/?page=1&limit=1');
+      const response = await fetch('/api/v1/instruments/?page=1&limit=1&count=none');
       
       if (response.status === 401) {
         // 401 means authentication is required (SQL Server mode)
@@ -229,7 +229,10 @@ export class InstrumentDataService {
       }
       
       const data = await response.json();
-      return Array.isArray(data) ? data : [];
+      if (Array.isArray(data)) {
+        return data;
+      }
+      return data.status === 'success' && Array.isArray(data.data) ? data.data : [];
     } catch (error) {
       console.error('Error searching instruments:', error);
       throw error;
@@ -1,8 +1,44 @@
-import { defineConfig } from 'vite'
+import { defineConfig, type Plugin } from 'vite'
+import { readdirSync, readFileSync, statSync, writeFileSync } from 'node:fs'
+import { join } from 'node:path'
+import { brotliCompressSync, constants, gzipSync } from 'node:zlib'
+
+const COMPRESSIBLE = /\.(js|mjs|css|html|svg|json|txt)$/
+const MIN_SIZE = 1024
+
+// Write .br and .gz siblings next to each built asset; the Flask static
+// view serves them as-is with Content-Encoding (api/utils/compression.py)
+function precompress(outDir: string): Plugin {
+  const walk = (dir: string): string[] =>
+    readdirSync(dir).flatMap((name) => {
+      const path = join(dir, name)
+      return statSync(path).isDirectory() ? walk(path) : [path]
+    })
+
+  return {
+    name: 'precompress',
+    apply: 'build',
+    closeBundle() {
+      for (const file of walk(outDir)) {
+        if (!COMPRESSIBLE.test(file)) continue
+        const source = readFileSync(file)
+        if (source.length < MIN_SIZE) continue
+        writeFileSync(`${file}.gz`, gzipSync(source, { level: 9 }))
+        writeFileSync(
+          `${file}.br`,
+          brotliCompressSync(source, {
+            params: { [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY }
+          })
+        )
+      }
+    }
+  }
+}
 
 export default defineConfig({
   root: '.',
   publicDir: 'public',
+  plugins: [precompress('dist')],
   build: {
     outDir: 'dist',
     emptyOutDir: true,
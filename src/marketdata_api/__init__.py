@@ -17,6 +17,7 @@ def create_app(config_override=None):
     )
     app.config["ENV"] = FLASK_ENV
     app.config["ROOT_PATH"] = Config.ROOT_PATH
+    app.config["RESPONSE_CACHE_ENABLED"] = Config.RESPONSE_CACHE_ENABLED
     
     # JWT Configuration
     app.config['JWT_SECRET_KEY'] = JWT_SECRET_KEY
@@ -26,18 +27,9 @@ def create_app(config_override=None):
     # Initialize JWT
     jwt = JWTManager(app)
     
-    # Configure JSON serialization to handle NaN values
-    import json
-    import math
-    
-    def default_json_handler(obj):
-        """Handle special values in JSON serialization"""
-        if isinstance(obj, float):
-            if math.isnan(obj) or math.isinf(obj):
-                return None
-        raise TypeError(f"Object {obj} is not JSON serializable")
-    
-    app.json.default = default_json_handler
+    # JSON through the shared serializer (orjson/msgspec when installed; NaN -> null)
+    from marketdata_api.api.utils.json_serializer import SerializerJSONProvider
+    app.json = SerializerJSONProvider(app)
     
     # Initialize rate limiter
     limiter = Limiter(
@@ -52,6 +44,11 @@ def create_app(config_override=None):
     if config_override:
         app.config.update(config_override)
 
+    # gzip/brotli for large API responses; precompressed frontend assets
+    from marketdata_api.api.utils.compression import init_compression, serve_precompressed_static
+    init_compression(app)
+    serve_precompressed_static(app)
+
     # Enable CORS for all routes with comprehensive configuration
     # In development, be more permissive with origins
     if FLASK_ENV == "development":
@@ -124,6 +121,14 @@ def create_app(config_override=None):
         init_database()
         app.logger.info("Database initialization complete")
 
+        # Load the in-process MIC reference snapshot used by response builders
+        from marketdata_api.services.utils.mic_reference import mic_reference
+        mic_reference.warm()
+
+        # Build the instrument typeahead index in the background
+        from marketdata_api.services.utils.instrument_typeahead import instrument_typeahead
+        instrument_typeahead.warm()
+
     from marketdata_api.api.resources.frontend import create_frontend_blueprint  # Import frontend blueprint function
     from marketdata_api.api import (  # Import the consolidated API blueprint
         create_swagger_blueprint,
@@ -135,6 +140,10 @@ def create_app(config_override=None):
     swagger_bp = create_swagger_blueprint()
     app.register_blueprint(swagger_bp)
 
+    # Render swagger.json now rather than on the first Swagger UI load
+    if not app.config.get("TESTING"):
+        swagger_bp.api.warm(app)
+
     # Create and register the frontend blueprint (non-API routes for serving templates)
     frontend_bp = create_frontend_blueprint()
     app.register_blueprint(frontend_bp)  # Register the frontend blueprint
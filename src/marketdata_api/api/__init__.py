@@ -38,4 +38,7 @@ def create_swagger_blueprint():
     # Register all resources
     register_all_resources(api)
 
+    # Kept so the app can pre-render the OpenAPI document once registered
+    swagger_bp.api = api
+
     return swagger_bp
@@ -2,12 +2,107 @@
 Swagger API Configuration
 
 This module contains the core Flask-RESTx API configuration and setup.
+
+The OpenAPI document (swagger.json) describes every namespace and model,
+which only change on deploy, so it is rendered and serialised once per
+process and served from memory with a strong ETag and a Cache-Control
+max-age (Config.OPENAPI_CACHE_SECONDS). The Swagger UI then gets a 304 or
+a cached copy instead of a freshly serialised document.
 """
 
-from flask_restx import Api
+import hashlib
+import logging
+import threading
+from typing import NamedTuple, Optional
+
+from flask import current_app, request
+from flask_restx import Api, Resource
 
+from ..config import Config
 from ..constants import API as APIConstants
 from ..constants import HTTPStatus
+from .utils.json_serializer import output_json
+
+logger = logging.getLogger(__name__)
+
+
+class SpecDocument(NamedTuple):
+    body: bytes
+    etag: str
+
+
+class MarketDataApi(Api):
+    """Flask-RESTx Api serving swagger.json from a document rendered once."""
+
+    def __init__(self, *args, **kwargs):
+        self._spec_document: Optional[SpecDocument] = None
+        self._spec_document_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+        self.representations["application/json"] = output_json
+
+    def _register_specs(self, app_or_blueprint):
+        if self._add_specs:
+            endpoint = "specs"
+            self._register_view(
+                app_or_blueprint,
+                CachedSwaggerView,
+                self.default_namespace,
+                "/" + self.default_swagger_filename,
+                endpoint=endpoint,
+                resource_class_args=(self,),
+            )
+            self.endpoints.add(endpoint)
+
+    def spec_document(self) -> Optional[SpecDocument]:
+        """
+        Return the serialised OpenAPI document, rendering it on first use.
+
+        Needs a request context (the document's basePath is resolved with
+        url_for). Returns None when the schema cannot be rendered; failures
+        are not cached.
+        """
+        document = self._spec_document
+        if document is None:
+            with self._spec_document_lock:
+                document = self._spec_document
+                if document is None:
+                    schema = self.__schema__
+                    if "error" in schema:
+                        return None
+                    body = output_json(schema, HTTPStatus.OK).get_data()
+                    document = SpecDocument(body, hashlib.sha1(body).hexdigest())
+                    self._spec_document = document
+                    logger.info(f"OpenAPI document rendered ({len(body)} bytes)")
+        return document
+
+    def warm(self, app) -> None:
+        """Render the OpenAPI document at startup instead of on the first request."""
+        try:
+            with app.test_request_context():
+                self.spec_document()
+        except Exception as e:
+            logger.warning(f"Could not pre-render the OpenAPI document: {e}")
+
+
+class CachedSwaggerView(Resource):
+    """Serve the pre-rendered Swagger specifications with ETag and cache headers."""
+
+    def get(self):
+        document = self.api.spec_document()
+        if document is None:
+            return {"error": "Unable to render schema"}, HTTPStatus.INTERNAL_SERVER_ERROR
+
+        if request.if_none_match.contains_weak(document.etag):
+            response = current_app.response_class(status=HTTPStatus.NOT_MODIFIED)
+        else:
+            response = current_app.response_class(document.body, mimetype="application/json")
+        response.set_etag(document.etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = Config.OPENAPI_CACHE_SECONDS
+        return response
+
+    def mediatypes(self):
+        return ["application/json"]
 
 
 def create_swagger_api(blueprint):
@@ -20,7 +115,7 @@ def create_swagger_api(blueprint):
     Returns:
         Api: Configured Flask-RESTx API instance
     """
-    api = Api(
+    api = MarketDataApi(
         blueprint,
         version=APIConstants.VERSION,
         title="MarketDataAPI",
@@ -51,6 +51,9 @@ def create_common_models(api):
             ResponseFields.TOTAL: fields.Integer(description="Total number of records"),
             "has_next": fields.Boolean(description="Whether there are more pages"),
             "has_prev": fields.Boolean(description="Whether there are previous pages"),
+            ResponseFields.NEXT_CURSOR: fields.String(
+                description="Cursor for the next page in keyset mode (null on the last page)"
+            ),
         },
     )
 
@@ -68,8 +71,38 @@ def create_common_models(api):
         },
     )
 
+    # Multi-get lookup response
+    lookup_response = api.model(
+        "LookupResponse",
+        {
+            ResponseFields.STATUS: fields.String(
+                required=True, description="Response status", enum=["success"]
+            ),
+            ResponseFields.DATA: fields.Nested(
+                api.model(
+                    "LookupResult",
+                    {
+                        "found": fields.Raw(description="Identifier -> record"),
+                        "not_found": fields.Raw(description="Identifier -> reason it was not resolved"),
+                    },
+                )
+            ),
+            ResponseFields.META: fields.Nested(
+                api.model(
+                    "LookupMeta",
+                    {
+                        "requested": fields.Integer(description="Distinct identifiers requested"),
+                        "found": fields.Integer(description="Identifiers resolved"),
+                        "not_found": fields.Integer(description="Identifiers not resolved"),
+                    },
+                )
+            ),
+        },
+    )
+
     return {
         "error_model": error_model, 
         "pagination_meta": pagination_meta,
         "success_model": success_model,
+        "lookup_response": lookup_response,
     }
@@ -255,6 +255,38 @@ def create_instrument_models(api, common_models):
     )
 
     # Instrument creation request
+    instrument_lookup_request = api.model(
+        "InstrumentLookupRequest",
+        {
+            "isins": fields.List(
+                fields.String, required=True, description="ISINs to resolve", example=["SE0000108656"]
+            ),
+        },
+    )
+
+    # FIGI reverse lookup requests
+    figi_lookup_request = api.model(
+        "FigiLookupRequest",
+        {
+            "figis": fields.List(
+                fields.String,
+                required=True,
+                description="FIGIs (instrument, composite or share class) to resolve",
+                example=["BBG000BLWXT4"],
+            ),
+        },
+    )
+
+    ticker_lookup_request = api.model(
+        "TickerLookupRequest",
+        {
+            "tickers": fields.List(
+                fields.String, required=True, description="Tickers to resolve", example=["VOLVB"]
+            ),
+            "exchange_code": fields.String(description="OpenFIGI exchange code (e.g. SS)", example="SS"),
+        },
+    )
+
     instrument_create_request = api.model(
         "InstrumentCreateRequest",
         {
@@ -289,6 +321,9 @@ def create_instrument_models(api, common_models):
         "cfi_info_response": cfi_info_response,
         "instrument_cfi_classification": instrument_cfi_classification,
         "instrument_create_request": instrument_create_request,
+        "instrument_lookup_request": instrument_lookup_request,
+        "figi_lookup_request": figi_lookup_request,
+        "ticker_lookup_request": ticker_lookup_request,
         "classification_model": classification_model,
         "issuer_model": issuer_model,
         "venue_info": venue_info,
@@ -152,6 +152,16 @@ def create_legal_entity_models(api, common_models):
         },
     )
 
+    # Legal entity multi-get request
+    legal_entity_lookup_request = api.model(
+        "LegalEntityLookupRequest",
+        {
+            "leis": fields.List(
+                fields.String, required=True, description="LEIs to resolve", example=["549300DTUYXVMJXZNY12"]
+            ),
+        },
+    )
+
     return {
         "legal_entity_base": legal_entity_base,
         "legal_entity_detailed": legal_entity_detailed,
@@ -159,6 +169,7 @@ def create_legal_entity_models(api, common_models):
         "legal_entity_detail_response": legal_entity_detail_response,
         "legal_entity_create_request": legal_entity_create_request,
         "legal_entity_search_request": legal_entity_search_request,
+        "legal_entity_lookup_request": legal_entity_lookup_request,
         "entity_address_model": entity_address_model,
         "entity_registration_model": entity_registration_model,
     }
@@ -290,6 +290,16 @@ def create_transparency_models(api, common_models):
         },
     )
 
+    # Transparency multi-get request
+    transparency_lookup_request = api.model(
+        "TransparencyLookupRequest",
+        {
+            "isins": fields.List(
+                fields.String, required=True, description="ISINs whose calculations to resolve", example=["SE0000108656"]
+            ),
+        },
+    )
+
     return {
         "transparency_base": transparency_base,
         "transparency_detailed": transparency_detailed,
@@ -299,6 +309,7 @@ def create_transparency_models(api, common_models):
         "transparency_create_request": transparency_create_request,
         "batch_transparency_request": batch_transparency_request,
         "batch_create_transparency_request": batch_create_transparency_request,
+        "transparency_lookup_request": transparency_lookup_request,
         "transparency_statistics": transparency_statistics,
         "transparency_statistics_response": transparency_statistics_response,
     }
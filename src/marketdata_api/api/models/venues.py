@@ -161,6 +161,7 @@ def create_venue_models(api, common_models):
             ),
             "venues_with_instruments": fields.Integer(description="Venues with instruments"),
             "total_trading_venues": fields.Integer(description="Total trading venue records"),
+            "computed_at": fields.String(description="When these figures were computed (ISO 8601, UTC)"),
         },
     )
 
@@ -6,6 +6,8 @@ This module handles the registration of all Swagger API resources.
 
 from .auth import auth_ns
 from .docs import create_docs_resources
+from .export import create_export_resources
+from .figi import create_figi_resources
 from .files import create_file_resources
 from .frontend import create_frontend_resources
 from .instruments import create_instrument_resources  # Use the working version
@@ -37,6 +39,7 @@ def register_all_resources(api):
     # Register domain-specific resources with complete working endpoints
     instruments_ns = create_instrument_resources(api, models)  # Working endpoints
     legal_entities_ns = create_legal_entity_resources(api, models)  # Working endpoints
+    figi_ns = create_figi_resources(api, models)  # FIGI and ticker reverse lookups
     relationships_ns = create_relationship_resources(api, models)
     transparency_ns = create_transparency_resources(api, models)  # Working endpoints
     mic_ns = create_mic_resources(api, models)  # MIC endpoints in Swagger
@@ -46,6 +49,7 @@ def register_all_resources(api):
     docs_ns = create_docs_resources(api, models)  # Documentation endpoints migrated from routes
     frontend_ns = create_frontend_resources(api, models)  # Frontend endpoints migrated from routes
     files_ns = create_file_resources(api, models)  # File management endpoints migrated to Swagger
+    export_ns = create_export_resources(api, models)  # Streaming NDJSON/CSV exports
 
     return {
         "auth": auth_ns,  # Authentication endpoints
@@ -53,6 +57,7 @@ def register_all_resources(api):
         "venues": venues_ns,  # Venue endpoints
         "instruments": instruments_ns,
         "legal_entities": legal_entities_ns,
+        "figi": figi_ns,
         "relationships": relationships_ns,
         "transparency": transparency_ns,
         "schema": schema_ns,
@@ -60,4 +65,5 @@ def register_all_resources(api):
         "docs": docs_ns,
         "frontend": frontend_ns,
         "files": files_ns,
+        "export": export_ns,
     }
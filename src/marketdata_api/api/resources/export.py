@@ -0,0 +1,226 @@
+"""
+Export API Resources
+
+Streaming bulk exports of instruments, transparency calculations and legal
+entities as NDJSON or CSV. Exports accept the same filters as the matching
+list endpoints but are not paginated: rows are streamed from a server-side
+cursor, so memory use and time-to-first-byte do not depend on result size.
+"""
+
+import logging
+
+from flask import Response, request, stream_with_context
+from flask_restx import Resource
+
+from ...constants import ExportFormats, HTTPStatus, QueryParams, ResponseFields, ResponseViews
+from ...services import InstrumentService, LegalEntityService, TransparencyService
+from ..utils.api_utils import get_fieldset, get_match_threshold, validate_filter_params
+from ..utils.export_utils import export_columns, stream_query
+from ..utils.list_filters import (
+    INSTRUMENT_FILTERS,
+    apply_instrument_filters,
+    apply_legal_entity_filters,
+    apply_transparency_filters,
+)
+from ..utils.type_specific_responses import (
+    INSTRUMENT_PROJECTION_FIELDS,
+    INSTRUMENT_VIEW_FIELDS,
+    instrument_projection_columns,
+)
+
+# Import authentication decorators
+from ...auth.decorators import require_read_permission
+from ...auth.rate_limiting import read_rate_limit
+
+logger = logging.getLogger(__name__)
+
+FORMAT_PARAM_DOC = "Output format: ndjson (default) or csv"
+FIELDS_PARAM_DOC = "Comma-separated columns to export (default: all scalar columns)"
+
+
+def _get_export_format() -> str:
+    """Read ?format=, raising ValueError for unsupported formats."""
+    export_format = request.args.get(QueryParams.FORMAT, ExportFormats.NDJSON).strip().lower()
+    if export_format not in ExportFormats.VALID_FORMATS:
+        raise ValueError(
+            f"Invalid export format: {export_format} "
+            f"(expected one of {', '.join(ExportFormats.VALID_FORMATS)})"
+        )
+    return export_format
+
+
+def _bad_request(error: Exception):
+    return {
+        ResponseFields.STATUS: "error",
+        ResponseFields.ERROR: {
+            "code": str(HTTPStatus.BAD_REQUEST),
+            ResponseFields.MESSAGE: str(error),
+        },
+    }, HTTPStatus.BAD_REQUEST
+
+
+def _stream_response(build_query, fields, export_format: str, name: str) -> Response:
+    logger.info(f"Streaming {name} export as {export_format} ({len(fields)} columns)")
+    return Response(
+        stream_with_context(stream_query(build_query, fields, export_format)),
+        mimetype=ExportFormats.MIMETYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{export_format}"'},
+    )
+
+
+def create_export_resources(api, models):
+    """
+    Create and register streaming export resources.
+
+    Args:
+        api: Flask-RESTx API instance
+        models: Dictionary of registered models
+
+    Returns:
+        Namespace: Export namespace with registered resources
+    """
+
+    # Create namespace
+    export_ns = api.namespace("export", description="Streaming bulk exports (NDJSON/CSV)")
+
+    # Get model references
+    common_models = models["common"]
+
+    @export_ns.route("/instruments")
+    class InstrumentExport(Resource):
+        @export_ns.doc(
+            description="Stream all instruments matching the list filters as NDJSON or CSV",
+            params={
+                "format": FORMAT_PARAM_DOC,
+                "fields": FIELDS_PARAM_DOC,
+                "view": "Column set: compact (isin, name, type) or standard (default, all columns)",
+                "type": 'Filter by instrument type (e.g., "equity", "debt", "future")',
+                "cfi_type": "Filter by CFI first letter",
+                "currency": "Filter by currency code",
+                "mic_code": "Filter by Market Identification Code",
+                "cfi_code": "Filter by CFI code",
+                "search": "Prefix search over ISIN, names, LEI and issuer name (e.g. \"volvo b\")",
+            },
+            responses={
+                HTTPStatus.OK: "Streamed export",
+                HTTPStatus.BAD_REQUEST: ("Invalid request", common_models["error_model"]),
+                HTTPStatus.UNAUTHORIZED: ("Unauthorized", common_models["error_model"]),
+            },
+        )
+        @export_ns.produces(list(ExportFormats.MIMETYPES.values()))
+        @require_read_permission
+        @read_rate_limit
+        def get(self):
+            """Stream instruments as NDJSON or CSV"""
+            try:
+                export_format = _get_export_format()
+                fields = get_fieldset(INSTRUMENT_PROJECTION_FIELDS, INSTRUMENT_VIEW_FIELDS, "isin")
+            except ValueError as e:
+                return _bad_request(e)
+            filters = validate_filter_params(INSTRUMENT_FILTERS)
+
+            # The full rich representation is not streamable; export every column instead
+            if fields is None:
+                fields = list(INSTRUMENT_VIEW_FIELDS[ResponseViews.STANDARD])
+
+            service = InstrumentService()
+            Instrument, TradingVenue = service.Instrument, service.TradingVenue
+
+            def build_query(session):
+                query = session.query(*instrument_projection_columns(Instrument, fields))
+                query = apply_instrument_filters(query, Instrument, TradingVenue, filters)
+                return query.order_by(Instrument.isin)
+
+            return _stream_response(build_query, fields, export_format, "instruments")
+
+    @export_ns.route("/transparency")
+    class TransparencyExport(Resource):
+        @export_ns.doc(
+            description="Stream transparency calculations matching the list filters as NDJSON or CSV",
+            params={
+                "format": FORMAT_PARAM_DOC,
+                "fields": FIELDS_PARAM_DOC,
+                "file_type": "Filter by FITRS file type",
+                "calculation_type": "Legacy filter - maps to file_type patterns (EQUITY/NON_EQUITY)",
+                "isin": "Filter by ISIN",
+            },
+            responses={
+                HTTPStatus.OK: "Streamed export",
+                HTTPStatus.BAD_REQUEST: ("Invalid request", common_models["error_model"]),
+                HTTPStatus.UNAUTHORIZED: ("Unauthorized", common_models["error_model"]),
+            },
+        )
+        @export_ns.produces(list(ExportFormats.MIMETYPES.values()))
+        @require_read_permission
+        @read_rate_limit
+        def get(self):
+            """Stream transparency calculations as NDJSON or CSV"""
+            TransparencyCalculation = TransparencyService().TransparencyCalculation
+            columns = export_columns(TransparencyCalculation)
+            try:
+                export_format = _get_export_format()
+                fields = get_fieldset(columns, {ResponseViews.FULL: None}, "id") or columns
+            except ValueError as e:
+                return _bad_request(e)
+
+            file_type = request.args.get("file_type")
+            calculation_type = request.args.get("calculation_type")
+            isin = request.args.get("isin")
+
+            def build_query(session):
+                query = session.query(*[getattr(TransparencyCalculation, field) for field in fields])
+                query = apply_transparency_filters(
+                    query, TransparencyCalculation,
+                    file_type=file_type, calculation_type=calculation_type, isin=isin,
+                )
+                return query.order_by(TransparencyCalculation.id)
+
+            return _stream_response(build_query, fields, export_format, "transparency")
+
+    @export_ns.route("/legal-entities")
+    class LegalEntityExport(Resource):
+        @export_ns.doc(
+            description="Stream legal entities matching the list filters as NDJSON or CSV",
+            params={
+                "format": FORMAT_PARAM_DOC,
+                "fields": FIELDS_PARAM_DOC,
+                "status": 'Filter by entity status (e.g., "ACTIVE", "INACTIVE", "PENDING")',
+                "jurisdiction": "Filter by jurisdiction code (ISO 3166-1)",
+                "name": "Name search, as in the legal entities list",
+                "threshold": "Minimum score (0-1) of typo-tolerant name matches (default: 0.3)",
+            },
+            responses={
+                HTTPStatus.OK: "Streamed export",
+                HTTPStatus.BAD_REQUEST: ("Invalid request", common_models["error_model"]),
+                HTTPStatus.UNAUTHORIZED: ("Unauthorized", common_models["error_model"]),
+            },
+        )
+        @export_ns.produces(list(ExportFormats.MIMETYPES.values()))
+        @require_read_permission
+        @read_rate_limit
+        def get(self):
+            """Stream legal entities as NDJSON or CSV"""
+            LegalEntity = LegalEntityService().LegalEntity
+            columns = export_columns(LegalEntity)
+            try:
+                export_format = _get_export_format()
+                fields = get_fieldset(columns, {ResponseViews.FULL: None}, "lei") or columns
+                threshold = get_match_threshold()
+            except ValueError as e:
+                return _bad_request(e)
+
+            filters = {
+                "status": request.args.get("status"),
+                "jurisdiction": request.args.get("jurisdiction"),
+                "name": request.args.get("name", "").strip(),
+                "threshold": threshold,
+            }
+
+            def build_query(session):
+                query = session.query(*[getattr(LegalEntity, field) for field in fields])
+                query = apply_legal_entity_filters(query, LegalEntity, filters)
+                return query.order_by(LegalEntity.lei)
+
+            return _stream_response(build_query, fields, export_format, "legal-entities")
+
+    return export_ns
@@ -0,0 +1,196 @@
+"""
+FIGI API Resources
+
+Reverse lookups from Bloomberg identifiers to instruments: which ISIN a
+FIGI (instrument, composite or share class level) belongs to, and which
+instruments trade under a ticker. Each lookup is served by an index on
+figi_mappings; the batch variants resolve many identifiers per query.
+"""
+
+import logging
+
+from flask import request
+from flask_restx import Resource
+
+from ...auth.decorators import require_read_permission
+from ...auth.rate_limiting import read_rate_limit
+from ...constants import HTTPStatus, ResponseFields
+from ...services import InstrumentService
+from ..utils.http_cache import conditional_get
+
+logger = logging.getLogger(__name__)
+
+FIGI_NOT_FOUND = "FIGI not found"
+TICKER_NOT_FOUND = "Ticker not found"
+
+
+def _error(status, message):
+    return {
+        ResponseFields.STATUS: "error",
+        ResponseFields.ERROR: {
+            "code": str(status),
+            ResponseFields.MESSAGE: message,
+        },
+    }, status
+
+
+def create_figi_resources(api, models):
+    """
+    Create and register FIGI lookup API resources.
+
+    Args:
+        api: Flask-RESTx API instance
+        models: Dictionary of registered models
+
+    Returns:
+        Namespace: FIGI namespace with registered resources
+    """
+
+    figi_ns = api.namespace("figi", description="FIGI and ticker reverse lookups")
+
+    instrument_models = models["instruments"]
+    common_models = models["common"]
+
+    @figi_ns.route("/<string:figi>")
+    @figi_ns.param("figi", "FIGI, composite FIGI or share class FIGI (12 characters)")
+    class FigiDetail(Resource):
+        @figi_ns.doc(
+            description="Find the instruments (ISINs) a FIGI belongs to",
+            responses={
+                HTTPStatus.OK: ("Success", common_models["success_model"]),
+                HTTPStatus.BAD_REQUEST: ("Invalid FIGI", common_models["error_model"]),
+                HTTPStatus.NOT_FOUND: ("FIGI not found", common_models["error_model"]),
+            },
+        )
+        @require_read_permission
+        @read_rate_limit
+        @conditional_get("figi_mappings")
+        def get(self, figi):
+            """Find the instruments a FIGI belongs to"""
+            from ..utils.api_utils import validate_figi
+
+            try:
+                figi = validate_figi(figi.strip())
+                mappings = InstrumentService().lookup_figis([figi]).get(figi)
+                if not mappings:
+                    return _error(HTTPStatus.NOT_FOUND, FIGI_NOT_FOUND)
+
+                return {
+                    ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
+                    ResponseFields.DATA: mappings,
+                    ResponseFields.META: {"isins": sorted({mapping["isin"] for mapping in mappings})},
+                }, HTTPStatus.OK
+
+            except ValueError as e:
+                return _error(HTTPStatus.BAD_REQUEST, str(e))
+            except Exception as e:
+                logger.error(f"Error looking up FIGI {figi}: {str(e)}")
+                return _error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+
+    @figi_ns.route("/lookup")
+    class FigiLookup(Resource):
+        @figi_ns.doc(
+            description=(
+                "Resolve up to 5000 FIGIs in one request. Returns found (FIGI -> FIGI mappings) and "
+                "not_found (FIGI -> reason) maps"
+            ),
+            responses={
+                HTTPStatus.OK: ("Success", common_models["lookup_response"]),
+                HTTPStatus.BAD_REQUEST: ("Invalid request", common_models["error_model"]),
+            },
+        )
+        @figi_ns.expect(instrument_models["figi_lookup_request"])
+        @require_read_permission
+        @read_rate_limit
+        def post(self):
+            """Resolve many FIGIs in one request"""
+            from ..utils.api_utils import validate_figi
+            from ..utils.lookup_utils import build_lookup_response, read_lookup_identifiers
+
+            try:
+                figis, invalid = read_lookup_identifiers("figis", validate_figi)
+                found = InstrumentService().lookup_figis(figis)
+                return build_lookup_response(figis, found, invalid, FIGI_NOT_FOUND)
+
+            except ValueError as e:
+                return _error(HTTPStatus.BAD_REQUEST, str(e))
+            except Exception as e:
+                logger.error(f"Error in FIGI lookup: {str(e)}")
+                return _error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+
+    @figi_ns.route("/search")
+    class TickerSearch(Resource):
+        @figi_ns.doc(
+            description="Find the instruments trading under a ticker",
+            params={
+                "ticker": "Ticker (required, matched exactly, case-insensitive)",
+                "exchange_code": "OpenFIGI exchange code (e.g. SS, US) to restrict the match",
+            },
+            responses={
+                HTTPStatus.OK: ("Success", common_models["success_model"]),
+                HTTPStatus.BAD_REQUEST: ("Missing or invalid ticker", common_models["error_model"]),
+            },
+        )
+        @require_read_permission
+        @read_rate_limit
+        @conditional_get("figi_mappings")
+        def get(self):
+            """Find the instruments trading under a ticker"""
+            from ..utils.api_utils import validate_ticker
+
+            try:
+                ticker = validate_ticker((request.args.get("ticker") or "").strip())
+                exchange_code = (request.args.get("exchange_code") or "").strip().upper() or None
+                mappings = InstrumentService().lookup_tickers([ticker], exchange_code).get(ticker, [])
+
+                return {
+                    ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
+                    ResponseFields.DATA: mappings,
+                    ResponseFields.META: {
+                        "ticker": ticker,
+                        "exchange_code": exchange_code,
+                        ResponseFields.TOTAL: len(mappings),
+                    },
+                }, HTTPStatus.OK
+
+            except ValueError as e:
+                return _error(HTTPStatus.BAD_REQUEST, str(e))
+            except Exception as e:
+                logger.error(f"Error in ticker search: {str(e)}")
+                return _error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+
+        @figi_ns.doc(
+            description=(
+                "Resolve up to 5000 tickers in one request, optionally on one exchange. Returns found "
+                "(ticker -> FIGI mappings) and not_found (ticker -> reason) maps"
+            ),
+            responses={
+                HTTPStatus.OK: ("Success", common_models["lookup_response"]),
+                HTTPStatus.BAD_REQUEST: ("Invalid request", common_models["error_model"]),
+            },
+        )
+        @figi_ns.expect(instrument_models["ticker_lookup_request"])
+        @require_read_permission
+        @read_rate_limit
+        def post(self):
+            """Resolve many tickers in one request"""
+            from ..utils.api_utils import validate_ticker
+            from ..utils.lookup_utils import build_lookup_response, read_lookup_identifiers
+
+            try:
+                tickers, invalid = read_lookup_identifiers("tickers", validate_ticker)
+                exchange_code = (request.get_json(silent=True) or {}).get("exchange_code")
+                if exchange_code is not None and not isinstance(exchange_code, str):
+                    raise ValueError("exchange_code must be a string")
+                exchange_code = (exchange_code or "").strip().upper() or None
+
+                found = InstrumentService().lookup_tickers(tickers, exchange_code)
+                return build_lookup_response(tickers, found, invalid, TICKER_NOT_FOUND)
+
+            except ValueError as e:
+                return _error(HTTPStatus.BAD_REQUEST, str(e))
+            except Exception as e:
+                logger.error(f"Error in ticker lookup: {str(e)}")
+                return _error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+
+    return figi_ns
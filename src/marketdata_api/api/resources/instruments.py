@@ -9,15 +9,17 @@ import logging
 
 from flask import current_app, request
 from flask_restx import Namespace, Resource
-from sqlalchemy import func, distinct
 from sqlalchemy.orm import sessionmaker
 
-from ...constants import ErrorMessages, HTTPStatus, Pagination, ResponseFields
+from ...constants import ErrorMessages, HTTPStatus, Pagination, ResponseFields, ServiceDefaults
 from ...database import get_session
 from ...config import DatabaseConfig
 
 # Import database-agnostic services
 from ...services import InstrumentService
+from ...services.utils.facets import FACET_TABLES, compute_instrument_facets, facet_cache
+from ...services.utils.statistics import STATISTICS_TABLE, coverage, statistics_store
+from ..utils.http_cache import conditional_get
 
 # Import authentication decorators
 from ...auth.decorators import require_auth, require_write_permission, require_read_permission
@@ -29,22 +31,23 @@ def _get_models():
     db_type = DatabaseConfig.get_database_type()
     
     if db_type == 'sqlite':
-        from ...models.sqlite.instrument import Instrument
+        from ...models.sqlite.instrument import Instrument, TradingVenue
         from ...models.sqlite.legal_entity import LegalEntity
         from ...models.sqlite.figi import FigiMapping
         from ...models.sqlite.transparency import TransparencyCalculation
     elif db_type in ['azure_sql', 'sqlserver', 'sql_server', 'mssql']:
         from ...models.sqlserver.instrument import SqlServerInstrument as Instrument
+        from ...models.sqlserver.instrument import SqlServerTradingVenue as TradingVenue
         from ...models.sqlserver.legal_entity import SqlServerLegalEntity as LegalEntity
         from ...models.sqlserver.figi import SqlServerFigiMapping as FigiMapping
         from ...models.sqlserver.transparency import SqlServerTransparencyCalculation as TransparencyCalculation
     else:
         raise ValueError(f"Unsupported database type: {db_type}")
     
-    return Instrument, LegalEntity, FigiMapping, TransparencyCalculation
+    return Instrument, LegalEntity, FigiMapping, TransparencyCalculation, TradingVenue
 
 # Get models for this module
-Instrument, LegalEntity, FigiMapping, TransparencyCalculation = _get_models()
+Instrument, LegalEntity, FigiMapping, TransparencyCalculation, TradingVenue = _get_models()
 
 logger = logging.getLogger(__name__)
 
@@ -78,11 +81,15 @@ def create_instrument_resources(api, models):
                 "currency": "Filter by currency code",
                 "mic_code": "Filter by Market Identification Code",
                 "cfi_code": "Filter by CFI code",
-                "search": "Search by ISIN or instrument name (partial matching supported)",
+                "search": "Prefix search over ISIN, names, LEI and issuer name (e.g. \"volvo b\")",
                 "page": f"Page number for paginated results (default: {Pagination.DEFAULT_PAGE})",
                 "per_page": f"Number of records per page (default: {Pagination.DEFAULT_PER_PAGE}, max: {Pagination.MAX_PER_PAGE})",
                 "limit": "Maximum number of records to return",
                 "offset": "Number of records to skip",
+                "cursor": "Opaque keyset cursor from meta.next_cursor (pass an empty value to start); replaces page/offset",
+                "count": "Total count mode: exact (default, cached), estimate or none",
+                "fields": "Comma-separated instrument columns to return (e.g. isin,full_name,currency); skips rich details",
+                "view": "Response projection: compact (isin, name, type), standard (all columns) or full (default, rich details)",
             },
             responses={
                 HTTPStatus.OK: ("Success", instrument_models["instrument_list_response"]),
@@ -100,91 +107,94 @@ def create_instrument_resources(api, models):
                 handle_api_errors,
                 validate_pagination_params,
                 validate_filter_params,
-                validate_currency_code,
-                validate_mic_code,
-                validate_cfi_code,
+                apply_keyset_pagination,
+                get_fieldset,
+            )
+            from ..utils.list_filters import INSTRUMENT_FILTERS, apply_instrument_filters
+            from ...services.utils.count_cache import resolve_total
+            from ..utils.type_specific_responses import (
+                INSTRUMENT_PROJECTION_FIELDS,
+                INSTRUMENT_VIEW_FIELDS,
             )
 
             try:
                 # Validate pagination parameters
                 pagination = validate_pagination_params()
+
+                # Sparse fieldset (None = full rich response)
+                fieldset = get_fieldset(INSTRUMENT_PROJECTION_FIELDS, INSTRUMENT_VIEW_FIELDS, "isin")
                 
                 # Validate filter parameters
-                allowed_filters = {
-                    'type': str,  # No specific validation for instrument type
-                    'cfi_type': lambda x: x.upper() if x.upper() in 'CDEFHIJORS' else None,  # CFI first letter
-                    'currency': validate_currency_code,
-                    'mic_code': validate_mic_code,
-                    'cfi_code': validate_cfi_code,
-                    'search': str,  # Search by ISIN or instrument name
-                }
-                filters = validate_filter_params(allowed_filters)
+                filters = validate_filter_params(INSTRUMENT_FILTERS)
 
                 # Get models directly
                 from ...models.sqlite import Instrument
+                from ...models.sqlite.instrument import TradingVenue
 
                 with get_session() as session:
-                    query = session.query(Instrument)
-
                     # Apply filters
                     logger.debug(f"Swagger: Filtering instruments with filters={filters}")
-                    
-                    if 'type' in filters:
-                        query = query.filter(Instrument.instrument_type == filters['type'])
-                        count = query.count()
-                        logger.debug(f"Swagger: Found {count} instruments with type={filters['type']}")
-                    
-                    if 'cfi_type' in filters:
-                        # Filter by CFI first letter (instrument classification)
-                        cfi_prefix = filters['cfi_type'] + '%'
-                        query = query.filter(Instrument.cfi_code.like(cfi_prefix))
-                        count = query.count()
-                        logger.debug(f"Swagger: Found {count} instruments with CFI type={filters['cfi_type']}")
-                    
-                    if 'currency' in filters:
-                        query = query.filter(Instrument.currency == filters['currency'])
-                    
-                    if 'mic_code' in filters:
-                        # Filter by MIC code through trading venues
-                        from ...models.sqlite.instrument import TradingVenue
-                        query = query.join(TradingVenue).filter(TradingVenue.mic_code == filters['mic_code'])
-                    
-                    if 'cfi_code' in filters:
-                        query = query.filter(Instrument.cfi_code == filters['cfi_code'])
-                    
-                    if 'search' in filters:
-                        # Search by ISIN (exact or partial) or instrument name
-                        search_term = filters['search']
-                        query = query.filter(
-                            (Instrument.isin.ilike(f'%{search_term}%')) |
-                            (Instrument.short_name.ilike(f'%{search_term}%')) |
-                            (Instrument.full_name.ilike(f'%{search_term}%'))
-                        )
-                        count = query.count()
-                        logger.debug(f"Swagger: Found {count} instruments matching search='{search_term}'")
+                    query = apply_instrument_filters(
+                        session.query(Instrument), Instrument, TradingVenue, filters
+                    )
 
-                    # Get total count for pagination
-                    total_count = query.count()
+                    # Total for the filter set, served from the count cache when possible
+                    total_count = resolve_total(
+                        pagination['count'], "instruments", filters,
+                        ("instruments", "trading_venues"), query.count,
+                    )
+
+                    from ..utils.type_specific_responses import (
+                        build_instrument_response,
+                        build_projected_instrument_response,
+                        build_raw_instrument_response,
+                        instrument_projection_columns,
+                        resolve_venue_displays,
+                        rich_instrument_load_options,
+                    )
+
+                    if fieldset is not None:
+                        # Select only the requested columns; no ORM entities, no relationships
+                        query = query.with_entities(*instrument_projection_columns(Instrument, fieldset))
+                    else:
+                        # Load exactly the relationships the rich response reads, one query each
+                        query = query.options(*rich_instrument_load_options(Instrument))
 
-                    # Apply pagination with ORDER BY for SQL Server compatibility
                     limit = pagination['limit'] or pagination['per_page']
-                    offset = pagination['offset'] or (pagination['page'] - 1) * pagination['per_page']
-                    instruments = query.order_by(Instrument.isin).limit(limit).offset(offset).all()
+                    next_cursor = None
+                    if pagination['cursor'] is not None:
+                        # Keyset mode: seek past the last ISIN
+                        instruments, next_cursor = apply_keyset_pagination(
+                            query, Instrument.isin, pagination['cursor'], limit
+                        )
+                    else:
+                        # Apply pagination with ORDER BY for SQL Server compatibility
+                        offset = pagination['offset'] or (pagination['page'] - 1) * pagination['per_page']
+                        instruments = query.order_by(Instrument.isin).limit(limit).offset(offset).all()
 
-                    # Use rich instrument response builder following CLI pattern
-                    from ..utils.type_specific_responses import build_instrument_response, build_raw_instrument_response
-                    
-                    logger.debug(f"Building rich responses for {len(instruments)} instruments")
-                    result = []
-                    for instrument in instruments:
-                        try:
-                            rich_response = build_instrument_response(instrument, include_rich_details=True)
-                            logger.debug(f"Rich response for {instrument.isin} has keys: {list(rich_response.keys())}")
-                            result.append(rich_response)
-                        except Exception as e:
-                            logger.error(f"Error building rich response for {instrument.isin}: {e}")
-                            # Fallback to basic response
-                            result.append(build_raw_instrument_response(instrument.to_raw_data()))
+                    if fieldset is not None:
+                        # Projection rows skip CFI decoding, type attributes and venue/issuer expansion
+                        result = [build_projected_instrument_response(row, fieldset) for row in instruments]
+                    else:
+                        # Resolve primary venue names for the whole page from the MIC snapshot
+                        venue_displays = resolve_venue_displays(
+                            instrument.relevant_trading_venue for instrument in instruments
+                        )
+
+                        # Use rich instrument response builder following CLI pattern
+                        logger.debug(f"Building rich responses for {len(instruments)} instruments")
+                        result = []
+                        for instrument in instruments:
+                            try:
+                                rich_response = build_instrument_response(
+                                    instrument, include_rich_details=True, venue_displays=venue_displays
+                                )
+                                logger.debug(f"Rich response for {instrument.isin} has keys: {list(rich_response.keys())}")
+                                result.append(rich_response)
+                            except Exception as e:
+                                logger.error(f"Error building rich response for {instrument.isin}: {e}")
+                                # Fallback to basic response
+                                result.append(build_raw_instrument_response(instrument.to_raw_data()))
 
                     return {
                         ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
@@ -193,9 +203,18 @@ def create_instrument_resources(api, models):
                             ResponseFields.PAGE: pagination['page'],
                             ResponseFields.PER_PAGE: pagination['per_page'],
                             ResponseFields.TOTAL: total_count,
+                            ResponseFields.NEXT_CURSOR: next_cursor,
                         },
                     }
 
+            except ValueError as e:
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.BAD_REQUEST),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.BAD_REQUEST
             except Exception as e:
                 logger.error(f"Error in swagger list_instruments: {str(e)}")
                 return {
@@ -358,6 +377,211 @@ def create_instrument_resources(api, models):
                     },
                 }, HTTPStatus.INTERNAL_SERVER_ERROR
 
+    @instruments_ns.route("/search")
+    class InstrumentSearch(Resource):
+        @instruments_ns.doc(
+            description="Autocomplete instruments by ISIN, short name or FIGI ticker prefix (served from memory)",
+            params={
+                "q": "Prefix to complete (case-insensitive)",
+                "limit": f"Maximum number of suggestions (default: {ServiceDefaults.TYPEAHEAD_DEFAULT_LIMIT}, max: {ServiceDefaults.TYPEAHEAD_MAX_LIMIT})",
+            },
+            responses={
+                HTTPStatus.OK: ("Success", common_models["success_model"]),
+                HTTPStatus.UNAUTHORIZED: ("Unauthorized", common_models["error_model"]),
+            },
+        )
+        @require_read_permission
+        @read_rate_limit
+        def get(self):
+            """Autocomplete instruments by prefix"""
+            from ...services.utils.instrument_typeahead import (
+                format_typeahead_result,
+                instrument_typeahead,
+            )
+
+            try:
+                prefix = request.args.get("q", "")
+                limit = request.args.get("limit", ServiceDefaults.TYPEAHEAD_DEFAULT_LIMIT, type=int)
+                limit = max(1, min(limit, ServiceDefaults.TYPEAHEAD_MAX_LIMIT))
+
+                matches = instrument_typeahead.search(prefix, limit)
+
+                return {
+                    ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
+                    ResponseFields.DATA: [
+                        format_typeahead_result(record, matched_on) for record, matched_on in matches
+                    ],
+                    ResponseFields.META: {
+                        "query": prefix,
+                        "limit": limit,
+                        ResponseFields.TOTAL: len(matches),
+                    },
+                }
+
+            except Exception as e:
+                logger.error(f"Error in instrument typeahead search: {str(e)}")
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.INTERNAL_SERVER_ERROR),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.INTERNAL_SERVER_ERROR
+
+    @instruments_ns.route("/lookup")
+    class InstrumentLookup(Resource):
+        @instruments_ns.doc(
+            description=(
+                "Resolve up to 5000 ISINs in one request. Returns found (ISIN -> instrument) and "
+                "not_found (ISIN -> reason) maps; instruments use the list representation"
+            ),
+            params={
+                "fields": "Comma-separated instrument fields to return (isin is always included)",
+                "view": "Named field set: compact, standard or full (default: full rich response)",
+            },
+            responses={
+                HTTPStatus.OK: ("Success", common_models["lookup_response"]),
+                HTTPStatus.BAD_REQUEST: ("Invalid request", common_models["error_model"]),
+                HTTPStatus.UNAUTHORIZED: ("Unauthorized", common_models["error_model"]),
+            },
+        )
+        @instruments_ns.expect(instrument_models["instrument_lookup_request"])
+        @require_read_permission
+        @read_rate_limit
+        def post(self):
+            """Resolve many ISINs in one request"""
+            from ...database.session import get_session
+            from ..utils.api_utils import get_fieldset, validate_isin
+            from ..utils.lookup_utils import build_lookup_response, fetch_in_chunks, read_lookup_identifiers
+            from ..utils.type_specific_responses import (
+                INSTRUMENT_PROJECTION_FIELDS,
+                INSTRUMENT_VIEW_FIELDS,
+                build_instrument_response,
+                build_projected_instrument_response,
+                build_raw_instrument_response,
+                instrument_projection_columns,
+                resolve_venue_displays,
+                rich_instrument_load_options,
+            )
+
+            try:
+                isins, invalid = read_lookup_identifiers("isins", validate_isin)
+                fieldset = get_fieldset(INSTRUMENT_PROJECTION_FIELDS, INSTRUMENT_VIEW_FIELDS, "isin")
+
+                Instrument = InstrumentService().Instrument
+                found = {}
+                with get_session() as session:
+                    if fieldset is not None:
+                        query = session.query(*instrument_projection_columns(Instrument, fieldset))
+                        for row in fetch_in_chunks(query, Instrument.isin, isins):
+                            found[row.isin] = build_projected_instrument_response(row, fieldset)
+                    else:
+                        query = session.query(Instrument).options(*rich_instrument_load_options(Instrument))
+                        instruments = fetch_in_chunks(query, Instrument.isin, isins)
+                        venue_displays = resolve_venue_displays(
+                            instrument.relevant_trading_venue for instrument in instruments
+                        )
+                        for instrument in instruments:
+                            try:
+                                found[instrument.isin] = build_instrument_response(
+                                    instrument, include_rich_details=True, venue_displays=venue_displays
+                                )
+                            except Exception as e:
+                                logger.error(f"Error building rich response for {instrument.isin}: {e}")
+                                found[instrument.isin] = build_raw_instrument_response(instrument.to_raw_data())
+
+                return build_lookup_response(isins, found, invalid, ErrorMessages.INSTRUMENT_NOT_FOUND)
+
+            except ValueError as e:
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.BAD_REQUEST),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.BAD_REQUEST
+            except Exception as e:
+                logger.error(f"Error in instrument lookup: {str(e)}")
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.INTERNAL_SERVER_ERROR),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.INTERNAL_SERVER_ERROR
+
+    @instruments_ns.route("/exists")
+    class InstrumentExists(Resource):
+        @instruments_ns.doc(
+            description=(
+                f"Check up to {ServiceDefaults.EXISTS_MAX_IDENTIFIERS} ISINs against the loaded instruments. "
+                "Returns one status code per input ISIN, in request order: the sum of the bits in data.flags "
+                "(1 loaded, 2 FIGI mapped, 4 transparency, 8 issuer stored); 0 means not loaded or malformed"
+            ),
+            responses={
+                HTTPStatus.OK: ("Success", common_models["success_model"]),
+                HTTPStatus.BAD_REQUEST: ("Invalid request", common_models["error_model"]),
+                HTTPStatus.UNAUTHORIZED: ("Unauthorized", common_models["error_model"]),
+            },
+        )
+        @instruments_ns.expect(instrument_models["instrument_lookup_request"])
+        @require_read_permission
+        @read_rate_limit
+        def post(self):
+            """Check which ISINs are loaded, with FIGI, transparency and issuer flags"""
+            from ..utils.api_utils import validate_isin
+            from ..utils.lookup_utils import read_identifier_list
+            from ...services.utils.instrument_membership import MEMBERSHIP_FLAGS, instrument_membership
+
+            try:
+                values = read_identifier_list("isins", ServiceDefaults.EXISTS_MAX_IDENTIFIERS)
+
+                isins = []
+                invalid = {}
+                for value in values:
+                    value = value.strip()
+                    try:
+                        isins.append(validate_isin(value))
+                    except ValueError as e:
+                        invalid[value] = str(e)
+                        isins.append(None)
+
+                index = instrument_membership.index()
+                statuses = [index.status(isin) if isin else 0 for isin in isins]
+
+                return {
+                    ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
+                    ResponseFields.DATA: {
+                        "flags": dict(MEMBERSHIP_FLAGS),
+                        "statuses": statuses,
+                        "invalid": invalid,
+                    },
+                    ResponseFields.META: {
+                        "requested": len(values),
+                        "loaded": sum(1 for status in statuses if status),
+                        "invalid": len(invalid),
+                        "index_size": len(index),
+                    },
+                }, HTTPStatus.OK
+
+            except ValueError as e:
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.BAD_REQUEST),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.BAD_REQUEST
+            except Exception as e:
+                logger.error(f"Error in instrument existence check: {str(e)}")
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.INTERNAL_SERVER_ERROR),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.INTERNAL_SERVER_ERROR
+
     @instruments_ns.route("/<string:isin>")
     @instruments_ns.param("isin", "International Securities Identification Number")
     class InstrumentDetail(Resource):
@@ -371,6 +595,7 @@ def create_instrument_resources(api, models):
         )
         @require_read_permission
         @read_rate_limit
+        @conditional_get("instruments", "trading_venues", "figi_mappings", "legal_entities", "market_identification_codes")
         def get(self, isin):
             """Retrieves detailed information about a specific instrument by its ISIN"""
             try:
@@ -1110,66 +1335,33 @@ def create_instrument_resources(api, models):
                 HTTPStatus.INTERNAL_SERVER_ERROR: ("Server Error", common_models["error_model"]),
             },
         )
+        @conditional_get(STATISTICS_TABLE, "instruments", "legal_entities", "figi_mappings", "transparency_calculations")
         def get(self):
             """Get general instrument statistics"""
             try:
-                instrument_service = InstrumentService()
-                
-                # Get basic count statistics
-                from ...database.session import get_session
-                with get_session() as session:
-                    total_instruments = session.query(instrument_service.Instrument).count()
-                    
-                    # Count by CFI type (first letter of CFI code)
-                    cfi_type_counts = {}
-                    cfi_types = ['C', 'D', 'E', 'F', 'H', 'I', 'J', 'O', 'R', 'S']
-                    
-                    for cfi_type in cfi_types:
-                        count = session.query(instrument_service.Instrument).filter(
-                            instrument_service.Instrument.cfi_code.like(f'{cfi_type}%')
-                        ).count()
-                        if count > 0:
-                            cfi_type_counts[cfi_type] = count
-                    
-                    # Also count by instrument type for backward compatibility
-                    type_counts = {}
-                    from ...models.utils.cfi_instrument_manager import get_valid_instrument_types
-                    valid_types = get_valid_instrument_types()
-                    
-                    for instrument_type in valid_types:
-                        count = session.query(instrument_service.Instrument).filter(
-                            instrument_service.Instrument.instrument_type == instrument_type
-                        ).count()
-                        if count > 0:
-                            type_counts[instrument_type] = count
-                    
-                    # Count with/without LEI
-                    with_lei = session.query(instrument_service.Instrument).filter(
-                        instrument_service.Instrument.lei_id.isnot(None),
-                        instrument_service.Instrument.lei_id != ""
-                    ).count()
-                    
-                    # Count with FIGI mappings
-                    with_figi = session.query(instrument_service.Instrument).filter(
-                        instrument_service.Instrument.figi_mappings.any()
-                    ).count()
+                snapshot = statistics_store.get("instruments")
+                figures = snapshot.figures
+                total_instruments = figures["total_instruments"]
+                with_lei = figures["with_lei"]
+                with_figi = figures["with_figi"]
                 
                 return {
                     ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
                     ResponseFields.DATA: {
                         "total_instruments": total_instruments,
-                        "cfi_type_breakdown": cfi_type_counts,
-                        "type_breakdown": type_counts,
+                        "cfi_type_breakdown": figures["cfi_type_breakdown"],
+                        "type_breakdown": figures["type_breakdown"],
                         "lei_coverage": {
                             "with_lei": with_lei,
                             "without_lei": total_instruments - with_lei,
-                            "percentage": round((with_lei / total_instruments * 100) if total_instruments > 0 else 0, 1)
+                            "percentage": coverage(with_lei, total_instruments)
                         },
                         "figi_coverage": {
                             "with_figi": with_figi,
                             "without_figi": total_instruments - with_figi,
-                            "percentage": round((with_figi / total_instruments * 100) if total_instruments > 0 else 0, 1)
-                        }
+                            "percentage": coverage(with_figi, total_instruments)
+                        },
+                        "computed_at": snapshot.computed_at.isoformat()
                     },
                     ResponseFields.MESSAGE: "Instrument statistics retrieved successfully"
                 }, HTTPStatus.OK
@@ -1193,64 +1385,35 @@ def create_instrument_resources(api, models):
                 HTTPStatus.INTERNAL_SERVER_ERROR: ("Server Error", common_models["error_model"]),
             },
         )
+        @conditional_get(STATISTICS_TABLE, "instruments", "legal_entities", "figi_mappings", "transparency_calculations")
         def get(self):
             """Get statistics on data coverage (entities, FIGIs, transparency)"""
             try:
-                with get_session() as session:
-                    # Get total number of instruments
-                    total_instruments = session.query(func.count(distinct(Instrument.isin))).scalar() or 0
-                    
-                    if total_instruments == 0:
-                        # Return zeros if no instruments
-                        coverage_stats = {
-                            "total_instruments": 0,
-                            "entity_coverage": {"covered": 0, "percentage": 0.0},
-                            "figi_coverage": {"covered": 0, "percentage": 0.0},
-                            "transparency_coverage": {"covered": 0, "percentage": 0.0}
-                        }
-                    else:
-                        # Count instruments with actual legal entity records linked
-                        instruments_with_entities = session.query(
-                            func.count(distinct(Instrument.isin))
-                        ).join(
-                            LegalEntity, Instrument.lei_id == LegalEntity.lei
-                        ).scalar() or 0
-                        
-                        # Count instruments with FIGI mappings
-                        instruments_with_figis = session.query(
-                            func.count(distinct(FigiMapping.isin))
-                        ).scalar() or 0
-                        
-                        # Count instruments with transparency data
-                        instruments_with_transparency = session.query(
-                            func.count(distinct(TransparencyCalculation.isin))
-                        ).scalar() or 0
-                        
-                        # Calculate percentages
-                        entity_percentage = (instruments_with_entities / total_instruments) * 100
-                        figi_percentage = (instruments_with_figis / total_instruments) * 100
-                        transparency_percentage = (instruments_with_transparency / total_instruments) * 100
-                        
-                        coverage_stats = {
-                            "total_instruments": total_instruments,
-                            "entity_coverage": {
-                                "covered": instruments_with_entities,
-                                "percentage": round(entity_percentage, 1)
-                            },
-                            "figi_coverage": {
-                                "covered": instruments_with_figis,
-                                "percentage": round(figi_percentage, 1)
-                            },
-                            "transparency_coverage": {
-                                "covered": instruments_with_transparency,
-                                "percentage": round(transparency_percentage, 1)
-                            }
-                        }
-                    
-                    return {
-                        ResponseFields.STATUS: "success",
-                        "data": coverage_stats
-                    }, HTTPStatus.OK
+                snapshot = statistics_store.get("instruments")
+                figures = snapshot.figures
+                total_instruments = figures["total_instruments"]
+                
+                coverage_stats = {
+                    "total_instruments": total_instruments,
+                    "entity_coverage": {
+                        "covered": figures["with_entity"],
+                        "percentage": coverage(figures["with_entity"], total_instruments)
+                    },
+                    "figi_coverage": {
+                        "covered": figures["with_figi"],
+                        "percentage": coverage(figures["with_figi"], total_instruments)
+                    },
+                    "transparency_coverage": {
+                        "covered": figures["with_transparency"],
+                        "percentage": coverage(figures["with_transparency"], total_instruments)
+                    },
+                    "computed_at": snapshot.computed_at.isoformat()
+                }
+                
+                return {
+                    ResponseFields.STATUS: "success",
+                    "data": coverage_stats
+                }, HTTPStatus.OK
 
             except Exception as e:
                 logger.error(f"Error getting coverage statistics: {str(e)}")
@@ -1262,4 +1425,74 @@ def create_instrument_resources(api, models):
                     },
                 }, HTTPStatus.INTERNAL_SERVER_ERROR
 
+    @instruments_ns.route("/facets")
+    class InstrumentFacets(Resource):
+        @instruments_ns.doc(
+            description="Instrument counts per type, CFI category, currency, competent authority and venue MIC",
+            params={
+                "type": "Filter by instrument type",
+                "cfi_type": "Filter by CFI instrument type (first CFI letter)",
+                "currency": "Filter by currency code",
+                "mic_code": "Filter by Market Identification Code",
+                "cfi_code": "Filter by CFI code",
+                "search": "Prefix search over ISIN, names, LEI and issuer name",
+            },
+            responses={
+                HTTPStatus.OK: ("Success", common_models["success_model"]),
+                HTTPStatus.BAD_REQUEST: ("Invalid request", common_models["error_model"]),
+                HTTPStatus.INTERNAL_SERVER_ERROR: ("Server Error", common_models["error_model"]),
+            },
+        )
+        @require_read_permission
+        @read_rate_limit
+        @conditional_get(STATISTICS_TABLE, *FACET_TABLES)
+        def get(self):
+            """Get instrument facet counts for the list filters"""
+            from ..utils.api_utils import validate_filter_params
+            from ..utils.list_filters import INSTRUMENT_FILTERS, apply_instrument_filters
+            from ...services.utils.count_cache import normalize_filters
+
+            try:
+                filters = validate_filter_params(INSTRUMENT_FILTERS)
+
+                if normalize_filters(filters):
+                    def compute():
+                        with get_session() as session:
+                            return compute_instrument_facets(
+                                session,
+                                {"Instrument": Instrument, "TradingVenue": TradingVenue},
+                                lambda query: apply_instrument_filters(query, Instrument, TradingVenue, filters),
+                            )
+
+                    facets = facet_cache.get_exact("instrument_facets", filters, FACET_TABLES, compute)
+                    computed_at = None
+                else:
+                    # All instruments: served from the materialised statistics
+                    snapshot = statistics_store.get("instrument_facets")
+                    facets, computed_at = snapshot.figures, snapshot.computed_at.isoformat()
+
+                return {
+                    ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
+                    ResponseFields.DATA: facets,
+                    ResponseFields.META: {"filters": filters, "computed_at": computed_at},
+                }, HTTPStatus.OK
+
+            except ValueError as e:
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.BAD_REQUEST),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.BAD_REQUEST
+            except Exception as e:
+                logger.error(f"Error getting instrument facets: {str(e)}")
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.INTERNAL_SERVER_ERROR),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.INTERNAL_SERVER_ERROR
+
     return instruments_ns
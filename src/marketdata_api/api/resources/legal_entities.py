@@ -12,6 +12,10 @@ from flask_restx import Namespace, Resource
 
 from ...constants import ErrorMessages, HTTPStatus, Pagination, ResponseFields
 from ...services import LegalEntityService
+from ..utils.api_utils import encode_cursor, get_count_mode, get_cursor_param, get_match_threshold
+from ..utils.http_cache import conditional_get
+from ...services.utils.count_cache import resolve_total
+from ...services.utils.statistics import STATISTICS_TABLE, statistics_store
 
 logger = logging.getLogger(__name__)
 
@@ -43,11 +47,14 @@ def create_legal_entity_resources(api, models):
                 "status": 'Filter by entity status (e.g., "ACTIVE", "INACTIVE", "PENDING")',
                 "jurisdiction": "Filter by jurisdiction code (ISO 3166-1)",
                 "legal_form": "Filter by legal form",
-                "name": "Search by entity name (case-insensitive)",
+                "name": "Ranked name search: token prefixes, falling back to typo-tolerant matches",
+                "threshold": "Minimum score (0-1) of typo-tolerant name matches (default: 0.3)",
                 "page": f"Page number for paginated results (default: {Pagination.DEFAULT_PAGE})",
                 "per_page": f"Number of records per page (default: {Pagination.DEFAULT_PER_PAGE}, max: {Pagination.MAX_PER_PAGE})",
                 "limit": "Maximum number of records to return",
                 "offset": "Number of records to skip",
+                "cursor": "Opaque keyset cursor from meta.next_cursor (pass an empty value to start); replaces offset",
+                "count": "Total count mode: exact (default, cached), estimate or none",
             },
             responses={
                 HTTPStatus.OK: ("Success", legal_entity_models["legal_entity_list_response"]),
@@ -69,6 +76,8 @@ def create_legal_entity_resources(api, models):
                     request.args.get("per_page", Pagination.DEFAULT_PER_PAGE, type=int),
                     Pagination.MAX_PER_PAGE,
                 )
+                cursor = get_cursor_param()
+                count_mode = get_count_mode(cursor is not None)
 
                 # Create filters dictionary only if we have filters to apply
                 filters = {}
@@ -76,6 +85,10 @@ def create_legal_entity_resources(api, models):
                     filters["status"] = status
                 if jurisdiction:
                     filters["jurisdiction"] = jurisdiction
+                name = request.args.get("name", "").strip()
+                if name:
+                    filters["name"] = name
+                    filters["threshold"] = get_match_threshold()
 
                 # Use rich legal entity response builder like CLI
                 from ..utils.legal_entity_utils import build_legal_entity_response
@@ -83,14 +96,27 @@ def create_legal_entity_resources(api, models):
                 
                 service = LegalEntityService()
                 
-                # Get total count efficiently (no data loading)
-                total_count = service.count_entities(filters=filters if filters else None)
-                
-                # Get only paginated results
-                session, entities = service.get_all_entities(
-                    limit=limit, offset=offset, filters=filters if filters else None
+                # Get total count efficiently (no data loading, cached per filter set)
+                total_count = resolve_total(
+                    count_mode, "legal_entities", filters, ("legal_entities",),
+                    lambda: service.count_entities(filters=filters if filters else None),
                 )
 
+                next_cursor = None
+                if cursor is not None:
+                    # Keyset mode: seek past the last LEI
+                    session, entities = service.get_all_entities(
+                        limit=limit + 1, filters=filters if filters else None, after_lei=cursor
+                    )
+                    if len(entities) > limit:
+                        entities = entities[:limit]
+                        next_cursor = encode_cursor(entities[-1].lei)
+                else:
+                    # Get only paginated results
+                    session, entities = service.get_all_entities(
+                        limit=limit, offset=offset, filters=filters if filters else None
+                    )
+
                 logger.debug(f"Building responses for {len(entities)} legal entities (total: {total_count})")
                 result = []
                 for entity in entities:
@@ -122,9 +148,19 @@ def create_legal_entity_resources(api, models):
                         ResponseFields.PAGE: page,
                         ResponseFields.PER_PAGE: per_page,
                         ResponseFields.TOTAL: total_count,  # Now uses real total count!
+                        ResponseFields.NEXT_CURSOR: next_cursor,
                     },
                 }
 
+            except ValueError as e:
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.BAD_REQUEST),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.BAD_REQUEST
+
             except Exception as e:
                 logger.error(f"Error in swagger list_entities: {str(e)}")
                 return {
@@ -135,6 +171,65 @@ def create_legal_entity_resources(api, models):
                     },
                 }, HTTPStatus.INTERNAL_SERVER_ERROR
 
+    @legal_entities_ns.route("/lookup")
+    class LegalEntityLookup(Resource):
+        @legal_entities_ns.doc(
+            description=(
+                "Resolve up to 5000 LEIs in one request. Returns found (LEI -> entity) and "
+                "not_found (LEI -> reason) maps; entities use the list representation"
+            ),
+            responses={
+                HTTPStatus.OK: ("Success", common_models["lookup_response"]),
+                HTTPStatus.BAD_REQUEST: ("Invalid request", common_models["error_model"]),
+            },
+        )
+        @legal_entities_ns.expect(legal_entity_models["legal_entity_lookup_request"])
+        def post(self):
+            """Resolve many LEIs in one request"""
+            from sqlalchemy.orm import joinedload, selectinload
+
+            from ...database.session import get_session
+            from ..utils.api_utils import validate_lei
+            from ..utils.lookup_utils import build_lookup_response, fetch_in_chunks, read_lookup_identifiers
+
+            try:
+                leis, invalid = read_lookup_identifiers("leis", validate_lei)
+
+                LegalEntity = LegalEntityService().LegalEntity
+                found = {}
+                with get_session() as session:
+                    # Addresses are a collection: selectin-load them instead of multiplying rows
+                    query = session.query(LegalEntity).options(
+                        selectinload(LegalEntity.addresses),
+                        joinedload(LegalEntity.registration),
+                    )
+                    for entity in fetch_in_chunks(query, LegalEntity.lei, leis):
+                        found[entity.lei] = entity.to_api_response(
+                            include_relationships=False,
+                            include_addresses=True,
+                            include_registration=True,
+                        )
+
+                return build_lookup_response(leis, found, invalid, ErrorMessages.ENTITY_NOT_FOUND)
+
+            except ValueError as e:
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.BAD_REQUEST),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.BAD_REQUEST
+            except Exception as e:
+                logger.error(f"Error in legal entity lookup: {str(e)}")
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.INTERNAL_SERVER_ERROR),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.INTERNAL_SERVER_ERROR
+
     @legal_entities_ns.route("/<string:lei>")
     @legal_entities_ns.param("lei", "Legal Entity Identifier (20 characters)")
     class LegalEntityDetail(Resource):
@@ -146,6 +241,14 @@ def create_legal_entity_resources(api, models):
                 HTTPStatus.UNAUTHORIZED: ("Unauthorized", common_models["error_model"]),
             },
         )
+        @conditional_get(
+            "legal_entities",
+            "entity_addresses",
+            "entity_registrations",
+            "entity_relationships",
+            "entity_relationship_exceptions",
+            "instruments",
+        )
         def get(self, lei):
             """Retrieves detailed information about a specific legal entity by its LEI"""
             try:
@@ -238,46 +341,25 @@ def create_legal_entity_resources(api, models):
                 HTTPStatus.INTERNAL_SERVER_ERROR: ("Server Error", common_models["error_model"]),
             },
         )
+        @conditional_get(STATISTICS_TABLE, "legal_entities")
         def get(self):
             """Get legal entity statistics"""
             try:
-                service = LegalEntityService()
-                
-                # Use direct count query for performance - don't load all entities
-                from ...database import SessionLocal
-                session = SessionLocal()
-                
-                try:
-                    # Just count entities, don't load them all
-                    total_count = session.query(service.LegalEntity).count()
-                    
-                finally:
-                    session.close()
+                snapshot = statistics_store.get("legal_entities")
+                figures = snapshot.figures
+                total_count = figures["total_entities"]
                 
                 return {
                     ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
                     ResponseFields.DATA: {
                         "total_entities": total_count,
-                        "entity_breakdown": {},  # Placeholder for future detailed breakdown
+                        "entity_breakdown": figures["status_breakdown"],
+                        "top_jurisdictions": figures["top_jurisdictions"],
+                        "computed_at": snapshot.computed_at.isoformat(),
                         "message": "Legal entity statistics retrieved successfully"
                     },
                     ResponseFields.MESSAGE: f"Found {total_count} legal entities"
                 }, HTTPStatus.OK
-                
-                return {
-                    ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
-                    ResponseFields.DATA: {
-                        "total_entities": total_entities,
-                        "status_breakdown": status_counts,
-                        "top_jurisdictions": jurisdiction_counts,
-                        "relationship_coverage": {
-                            "with_relationships": with_relationships,
-                            "without_relationships": total_entities - with_relationships,
-                            "percentage": round((with_relationships / total_entities * 100) if total_entities > 0 else 0, 1)
-                        }
-                    },
-                    ResponseFields.MESSAGE: "Legal entity statistics retrieved successfully"
-                }, HTTPStatus.OK
             
             except Exception as e:
                 logger.error(f"Error getting legal entity statistics: {str(e)}")
@@ -8,9 +8,17 @@ Includes both local database operations and remote real-time operations.
 import logging
 
 from flask import current_app, request
-from flask_restx import Namespace, Resource
-
-from ...constants import ErrorMessages, HTTPStatus, Pagination, ResponseFields
+from flask_restx import Namespace, Resource, marshal
+
+from ...constants import ErrorMessages, HTTPStatus, Pagination, ResponseFields, ServiceDefaults
+from ..utils.api_utils import (
+    apply_keyset_pagination,
+    get_count_mode,
+    get_cursor_param,
+    get_match_threshold,
+)
+from ..utils.http_cache import conditional_get
+from ...services.utils.count_cache import resolve_total
 
 logger = logging.getLogger(__name__)
 
@@ -44,9 +52,13 @@ def create_mic_resources(api, models):
                 "category": "Filter by market category (APPA, REGULATED, MULTMK, etc.)",
                 "mic_type": "Filter by MIC type (OPRT for operating, SGMT for segment)",
                 "operating_mic": "Filter segment MICs by their operating MIC",
+                "search": "Ranked, typo-tolerant search over MIC code, market name, legal entity name and acronym",
+                "threshold": "Minimum search match score between 0 and 1 (default: 0.3)",
                 "page": f"Page number for paginated results (default: {Pagination.DEFAULT_PAGE})",
                 "per_page": f"Number of records per page (default: {Pagination.DEFAULT_PER_PAGE}, max: {Pagination.MAX_PER_PAGE})",
                 "limit": "Maximum number of records to return",
+                "cursor": "Opaque keyset cursor from meta.next_cursor (pass an empty value to start); replaces offset and search ranking",
+                "count": "Total count mode: exact (default, cached), estimate or none",
             },
             responses={
                 HTTPStatus.OK: ("Success", mic_models["mic_list_response"]),
@@ -57,7 +69,6 @@ def create_mic_resources(api, models):
                 ),
             },
         )
-        @mic_ns.marshal_with(mic_models["mic_list_response"])
         def get(self):
             """List MICs with advanced filtering"""
             try:
@@ -99,31 +110,68 @@ def create_mic_resources(api, models):
                         )
 
                     search = request.args.get("search")
+                    threshold = None
+                    ranks = None
                     if search:
-                        search_term = f"%{search}%"
-                        query = query.filter(
-                            MarketIdentificationCode.market_name.ilike(search_term)
-                            | MarketIdentificationCode.legal_entity_name.ilike(search_term)
-                        )
+                        # Ranked MIC codes from the in-memory name index
+                        from ...services.utils.mic_reference import mic_reference
+
+                        threshold = get_match_threshold()
+                        ranks = mic_reference.snapshot().search(search, threshold)
+                        query = query.filter(MarketIdentificationCode.mic.in_(list(ranks)))
 
                     # Pagination
                     limit = min(int(request.args.get("limit", 100)), 1000)
                     offset = int(request.args.get("offset", 0))
 
-                    total = query.count()
-                    # Add ORDER BY for SQL Server compatibility (MSSQL requires order_by when using OFFSET/LIMIT)
-                    mics = query.order_by(MarketIdentificationCode.mic).offset(offset).limit(limit).all()
+                    cursor = get_cursor_param()
+                    total = resolve_total(
+                        get_count_mode(cursor is not None), "market_identification_codes",
+                        {
+                            "country": country, "status": status, "type": mic_type,
+                            "category": category, "search": search, "threshold": threshold,
+                        },
+                        ("market_identification_codes",), query.count,
+                    )
 
-                    return {
-                        ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
-                        ResponseFields.DATA: [mic.to_dict() for mic in mics],
-                        ResponseFields.META: {
-                            "total": total,
-                            "limit": limit,
-                            "offset": offset,
-                            "count": len(mics),
+                    next_cursor = None
+                    if cursor is not None:
+                        # Keyset mode: seek past the last MIC
+                        mics, next_cursor = apply_keyset_pagination(
+                            query, MarketIdentificationCode.mic, cursor, limit
+                        )
+                    elif ranks is not None:
+                        # Search results are few (capped); order by match score
+                        mics = sorted(query.all(), key=lambda mic: (-ranks[mic.mic], mic.mic))
+                        mics = mics[offset:offset + limit]
+                    else:
+                        # Add ORDER BY for SQL Server compatibility (MSSQL requires order_by when using OFFSET/LIMIT)
+                        mics = query.order_by(MarketIdentificationCode.mic).offset(offset).limit(limit).all()
+
+                    # Only the success payload follows the list model; errors use error_model
+                    return marshal(
+                        {
+                            ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
+                            ResponseFields.DATA: [mic.to_dict() for mic in mics],
+                            ResponseFields.META: {
+                                "total": total,
+                                "limit": limit,
+                                "offset": offset,
+                                "count": len(mics),
+                                ResponseFields.NEXT_CURSOR: next_cursor,
+                            },
                         },
-                    }
+                        mic_models["mic_list_response"],
+                    ), HTTPStatus.OK
+
+            except ValueError as e:
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.BAD_REQUEST),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.BAD_REQUEST
 
             except Exception as e:
                 logger.error(f"Error in MIC list endpoint: {str(e)}")
@@ -153,36 +201,34 @@ def create_mic_resources(api, models):
                 ),
             },
         )
+        @conditional_get("market_identification_codes", "trading_venues")
         @mic_ns.marshal_with(mic_models["mic_detail_response"])
         def get(self, mic_code):
             """Get detailed MIC information"""
             try:
                 # Call business logic directly instead of route function
                 from ...database.session import get_session
-                from ...models.sqlite.market_identification_code import MarketIdentificationCode
+                from ...services.utils.mic_reference import mic_reference
 
-                with get_session() as session:
-                    mic = (
-                        session.query(MarketIdentificationCode)
-                        .filter_by(mic=mic_code.upper())
-                        .first()
-                    )
+                # MIC metadata comes from the in-process reference snapshot
+                mic = mic_reference.snapshot().get(mic_code)
 
-                    if not mic:
-                        return {
-                            ResponseFields.STATUS: "error",
-                            ResponseFields.ERROR: {
-                                "code": str(HTTPStatus.NOT_FOUND),
-                                ResponseFields.MESSAGE: f"MIC not found: {mic_code}",
-                            },
-                        }, HTTPStatus.NOT_FOUND
+                if not mic:
+                    return {
+                        ResponseFields.STATUS: "error",
+                        ResponseFields.ERROR: {
+                            "code": str(HTTPStatus.NOT_FOUND),
+                            ResponseFields.MESSAGE: f"MIC not found: {mic_code}",
+                        },
+                    }, HTTPStatus.NOT_FOUND
 
-                    # Optionally include related trading venues
-                    include_venues = request.args.get("include_venues", "false").lower() == "true"
+                # Optionally include related trading venues
+                include_venues = request.args.get("include_venues", "false").lower() == "true"
 
-                    result = mic.to_dict()
+                result = dict(mic)
 
-                    if include_venues:
+                if include_venues:
+                    with get_session() as session:
                         # Get trading venues that use this MIC
                         from ...models.sqlite.instrument import TradingVenue
 
@@ -203,10 +249,10 @@ def create_mic_resources(api, models):
                             for venue in venues
                         ]
 
-                    return {
-                        ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
-                        ResponseFields.DATA: result,
-                    }
+                return {
+                    ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
+                    ResponseFields.DATA: result,
+                }
 
             except Exception as e:
                 logger.error(f"Error in MIC detail endpoint: {str(e)}")
@@ -295,8 +341,9 @@ def create_mic_resources(api, models):
         @mic_ns.doc(
             description="Advanced MIC search by name, entity, or code",
             params={
-                "name": "Search in market name (case-insensitive)",
-                "entity": "Search in legal entity name (case-insensitive)",
+                "name": "Ranked, typo-tolerant search in market name",
+                "entity": "Ranked, typo-tolerant search in legal entity name",
+                "threshold": "Minimum name match score between 0 and 1 (default: 0.3)",
                 "mic": "Search for specific MIC code",
                 "country": "Filter by ISO country code",
                 "status": "Filter by MIC status",
@@ -337,6 +384,8 @@ def create_mic_resources(api, models):
                     filters['status'] = request.args.get('status')
                 if request.args.get('type'):
                     filters['mic_type'] = request.args.get('type')
+                if 'market_name' in filters or 'legal_entity_name' in filters:
+                    filters['threshold'] = get_match_threshold()
                 
                 # Pagination
                 try:
@@ -348,6 +397,14 @@ def create_mic_resources(api, models):
 
                 with get_session() as session:
                     return search_mics_data(session, **filters)
+            except ValueError as e:
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.BAD_REQUEST),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.BAD_REQUEST
             except Exception as e:
                 logger.error(f"Error in MIC search endpoint: {str(e)}")
                 return {
@@ -370,6 +427,7 @@ def create_mic_resources(api, models):
                 ),
             },
         )
+        @conditional_get("market_identification_codes")
         @mic_ns.marshal_with(mic_models["mic_statistics_response"])
         def get(self):
             """Get MIC registry statistics"""
@@ -553,7 +611,8 @@ def create_mic_resources(api, models):
         @remote_ns.doc(
             description="Real-time search in official ISO data",
             params={
-                "name": "Search in market name",
+                "name": "Ranked, typo-tolerant search over MIC code, market name, legal entity name and acronym",
+                "threshold": "Minimum name match score between 0 and 1 (default: 0.3)",
                 "country": "Filter by ISO country code",
                 "status": "Filter by MIC status",
                 "limit": "Maximum number of results (default: 100)",
@@ -598,8 +657,10 @@ def create_mic_resources(api, models):
 
                 # Get search results from remote service
                 if name:
-                    # If name is provided, use search functionality
-                    results = remote_mic_service.search_mics(name, limit=limit)
+                    # If name is provided, use ranked search; filters below may drop some matches
+                    results = remote_mic_service.search_mics(
+                        name, limit=ServiceDefaults.NAME_SEARCH_MAX_RESULTS, threshold=get_match_threshold()
+                    )
                 else:
                     # If only country/status filters, get all data and filter manually
                     # Use a common term to get broader results, then filter
@@ -636,6 +697,7 @@ def create_mic_resources(api, models):
                     }
                     filtered_results.append(mapped_mic)
 
+                filtered_results = filtered_results[:limit]
                 return {
                     ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
                     ResponseFields.DATA: filtered_results,
@@ -646,6 +708,14 @@ def create_mic_resources(api, models):
                     },
                 }
 
+            except ValueError as e:
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.BAD_REQUEST),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.BAD_REQUEST
             except Exception as e:
                 logger.error(f"Error in remote MIC search endpoint: {str(e)}")
                 return {
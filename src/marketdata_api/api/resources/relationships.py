@@ -7,10 +7,13 @@ This module contains Flask-RESTx resource definitions for entity relationship en
 import logging
 
 from flask import current_app, request
-from flask_restx import Namespace, Resource
+from flask_restx import Namespace, Resource, marshal
 
-from ...constants import ErrorMessages, HTTPStatus, Pagination, ResponseFields
+from ...constants import ErrorMessages, HTTPStatus, Pagination, ResponseFields, ServiceDefaults
 from ...services import LegalEntityService
+from ...services.utils.count_cache import resolve_total
+from ..utils.api_utils import encode_cursor, get_count_mode, get_cursor_param
+from ..utils.http_cache import conditional_get
 
 logger = logging.getLogger(__name__)
 
@@ -43,12 +46,14 @@ def create_relationship_resources(api, models):
                 "relationship_type": 'Filter by relationship type ("DIRECT", "ULTIMATE")',
                 "relationship_status": 'Filter by relationship status ("ACTIVE", "INACTIVE")',
                 "direction": 'Filter by relationship direction ("PARENT", "CHILD")',
-                "include_hierarchy": "Include hierarchical structure (true/false, default: false)",
                 "page": f"Page number for paginated results (default: {Pagination.DEFAULT_PAGE})",
                 "per_page": f"Number of records per page (default: {Pagination.DEFAULT_PER_PAGE}, max: {Pagination.MAX_PER_PAGE})",
+                "cursor": "Opaque keyset cursor from meta.next_cursor (pass an empty value to start); replaces page",
+                "count": "Total count mode: exact (default, cached), estimate or none",
             },
             responses={
                 HTTPStatus.OK: ("Success", relationship_models["relationship_list_response"]),
+                HTTPStatus.BAD_REQUEST: ("Invalid filter or cursor", common_models["error_model"]),
                 HTTPStatus.NOT_FOUND: ("Legal entity not found", common_models["error_model"]),
                 HTTPStatus.INTERNAL_SERVER_ERROR: (
                     "Internal server error",
@@ -56,16 +61,13 @@ def create_relationship_resources(api, models):
                 ),
             },
         )
-        @relationships_ns.marshal_with(relationship_models["relationship_list_response"])
         def get(self, lei):
             """Retrieves all relationships for a specific legal entity"""
             try:
-                from ...database.session import get_session
-
-                # First check if the entity exists
                 service = LegalEntityService()
-                session, entity = service.get_entity(lei)
 
+                # First check if the entity exists
+                entity = service.get_entity_summary(lei)
                 if not entity:
                     return {
                         ResponseFields.STATUS: "error",
@@ -76,94 +78,89 @@ def create_relationship_resources(api, models):
                     }, HTTPStatus.NOT_FOUND
 
                 # Get query parameters
-                relationship_type = request.args.get("relationship_type")
-                relationship_status = request.args.get("relationship_status")
-                direction = request.args.get("direction")
-                include_hierarchy = request.args.get("include_hierarchy", "false").lower() == "true"
-                page = request.args.get("page", Pagination.DEFAULT_PAGE, type=int)
+                filters = {
+                    "relationship_type": request.args.get("relationship_type"),
+                    "relationship_status": request.args.get("relationship_status"),
+                    "direction": request.args.get("direction"),
+                }
+                page = max(request.args.get("page", Pagination.DEFAULT_PAGE, type=int), 1)
                 per_page = min(
                     request.args.get("per_page", Pagination.DEFAULT_PER_PAGE, type=int),
                     Pagination.MAX_PER_PAGE,
                 )
+                cursor = get_cursor_param()
+                count_mode = get_count_mode(cursor is not None)
 
-                # Get models directly
-                from ...models.sqlite.legal_entity import EntityRelationship
+                total_count = resolve_total(
+                    count_mode, "entity_relationships", dict(filters, lei=lei), ("entity_relationships",),
+                    lambda: service.count_relationships(lei, filters),
+                )
 
-                # Query relationships where this entity is either parent or child
-                with get_session() as rel_session:
-                    query = rel_session.query(EntityRelationship).filter(
-                        (EntityRelationship.parent_lei == lei)
-                        | (EntityRelationship.child_lei == lei)
+                next_cursor = None
+                if cursor is not None:
+                    # Keyset mode: seek past the last relationship id
+                    relationships = service.get_relationships(
+                        lei, filters, limit=per_page + 1, after_id=cursor
+                    )
+                    if len(relationships) > per_page:
+                        relationships = relationships[:per_page]
+                        next_cursor = encode_cursor(relationships[-1]["id"])
+                else:
+                    relationships = service.get_relationships(
+                        lei, filters, limit=per_page, offset=(page - 1) * per_page
                     )
 
-                    # Apply filters
-                    if relationship_type:
-                        query = query.filter(
-                            EntityRelationship.relationship_type == relationship_type
-                        )
-                    if relationship_status:
-                        query = query.filter(
-                            EntityRelationship.relationship_status == relationship_status
-                        )
-                    if direction:
-                        if direction.upper() == "PARENT":
-                            query = query.filter(EntityRelationship.child_lei == lei)
-                        elif direction.upper() == "CHILD":
-                            query = query.filter(EntityRelationship.parent_lei == lei)
-
-                    relationships = query.all()
-
-                    # Build response
-                    relationship_data = []
-                    for rel in relationships:
-                        relationship_data.append(
-                            {
-                                "relationship_type": rel.relationship_type,
-                                "relationship_status": rel.relationship_status,
-                                "parent_lei": rel.parent_lei,
-                                "parent_name": rel.parent.name if rel.parent else None,
-                                "parent_jurisdiction": (
-                                    rel.parent.jurisdiction if rel.parent else None
-                                ),
-                                "child_lei": rel.child_lei,
-                                "child_name": rel.child.name if rel.child else None,
-                                "child_jurisdiction": rel.child.jurisdiction if rel.child else None,
-                                "relationship_period_start": (
-                                    rel.relationship_period_start.isoformat()
-                                    if rel.relationship_period_start
-                                    else None
-                                ),
-                                "relationship_period_end": (
-                                    rel.relationship_period_end.isoformat()
-                                    if rel.relationship_period_end
-                                    else None
-                                ),
-                                "percentage_ownership": rel.percentage_of_ownership,
-                            }
-                        )
+                # Build response
+                relationship_data = [
+                    {
+                        "relationship_type": rel["relationship_type"],
+                        "relationship_status": rel["relationship_status"],
+                        "parent_lei": rel["parent_lei"],
+                        "parent_name": rel["parent_name"],
+                        "parent_jurisdiction": rel["parent_jurisdiction"],
+                        "child_lei": rel["child_lei"],
+                        "child_name": rel["child_name"],
+                        "child_jurisdiction": rel["child_jurisdiction"],
+                        "relationship_period_start": (
+                            rel["relationship_period_start"].isoformat()
+                            if rel["relationship_period_start"]
+                            else None
+                        ),
+                        "relationship_period_end": (
+                            rel["relationship_period_end"].isoformat()
+                            if rel["relationship_period_end"]
+                            else None
+                        ),
+                        "percentage_ownership": rel["percentage_of_ownership"],
+                    }
+                    for rel in relationships
+                ]
 
-                result = {
-                    "entity": {
-                        "lei": entity.lei,
-                        "name": entity.name,
-                        "jurisdiction": entity.jurisdiction,
-                        "legal_form": entity.legal_form,
-                        "status": entity.status,
+                return marshal(
+                    {
+                        ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
+                        ResponseFields.DATA: {
+                            "entity": entity,
+                            "relationships": relationship_data,
+                        },
+                        ResponseFields.META: {
+                            ResponseFields.PAGE: page,
+                            ResponseFields.PER_PAGE: per_page,
+                            ResponseFields.TOTAL: total_count,
+                            ResponseFields.NEXT_CURSOR: next_cursor,
+                        },
                     },
-                    "relationships": relationship_data,
-                }
-
-                session.close()
+                    relationship_models["relationship_list_response"],
+                ), HTTPStatus.OK
 
+            except ValueError as e:
                 return {
-                    ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
-                    ResponseFields.DATA: result,
-                    ResponseFields.META: {
-                        ResponseFields.PAGE: page,
-                        ResponseFields.PER_PAGE: per_page,
-                        ResponseFields.TOTAL: len(relationship_data),
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.BAD_REQUEST),
+                        ResponseFields.MESSAGE: str(e),
                     },
-                }
+                }, HTTPStatus.BAD_REQUEST
 
             except Exception as e:
                 logger.error(f"Error in entity relationships endpoint: {str(e)}")
@@ -216,14 +213,15 @@ def create_relationship_resources(api, models):
     @relationships_ns.param("lei", "Legal Entity Identifier for hierarchy root")
     class EntityHierarchy(Resource):
         @relationships_ns.doc(
-            description="Get complete entity hierarchy starting from the specified entity",
+            description="Get the entity hierarchy below the specified entity, retrieved with one recursive query",
             params={
-                "max_depth": "Maximum depth to traverse (default: 10)",
-                "relationship_type": 'Filter by relationship type ("DIRECT", "ULTIMATE")',
+                "max_depth": f"Maximum depth to traverse (default: {ServiceDefaults.HIERARCHY_DEFAULT_DEPTH}, max: {ServiceDefaults.HIERARCHY_MAX_DEPTH})",
+                "relationship_type": 'Relationship type to follow ("DIRECT", "ULTIMATE"; default: "DIRECT")',
                 "include_inactive": "Include inactive relationships (true/false, default: false)",
             },
             responses={
                 HTTPStatus.OK: ("Success", relationship_models["relationship_hierarchy_response"]),
+                HTTPStatus.BAD_REQUEST: ("Invalid depth or relationship type", common_models["error_model"]),
                 HTTPStatus.NOT_FOUND: ("Entity not found", common_models["error_model"]),
                 HTTPStatus.INTERNAL_SERVER_ERROR: (
                     "Internal server error",
@@ -231,27 +229,45 @@ def create_relationship_resources(api, models):
                 ),
             },
         )
-        @relationships_ns.marshal_with(relationship_models["relationship_hierarchy_response"])
+        @conditional_get("legal_entities", "entity_relationships")
         def get(self, lei):
             """Get complete entity hierarchy"""
             try:
-                # This would implement hierarchy traversal logic
-                # For now, return a placeholder response
-                return {
-                    ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
-                    ResponseFields.DATA: {
-                        "root_entity": {
-                            "lei": lei,
-                            "name": "Entity hierarchy endpoint - implementation pending",
-                            "jurisdiction": None,
-                            "legal_form": None,
-                            "status": None,
+                max_depth = request.args.get(
+                    "max_depth", ServiceDefaults.HIERARCHY_DEFAULT_DEPTH, type=int
+                )
+                relationship_type = request.args.get("relationship_type", "DIRECT")
+                include_inactive = request.args.get("include_inactive", "false").lower() == "true"
+
+                hierarchy = LegalEntityService().get_hierarchy(
+                    lei.upper(), max_depth, relationship_type, include_inactive
+                )
+                if hierarchy is None:
+                    return {
+                        ResponseFields.STATUS: "error",
+                        ResponseFields.ERROR: {
+                            "code": str(HTTPStatus.NOT_FOUND),
+                            ResponseFields.MESSAGE: ErrorMessages.ENTITY_NOT_FOUND,
                         },
-                        "hierarchy": {},
-                        "total_entities": 0,
-                        "max_depth": 0,
+                    }, HTTPStatus.NOT_FOUND
+
+                # Only the success payload follows the hierarchy model; errors use error_model
+                return marshal(
+                    {
+                        ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
+                        ResponseFields.DATA: hierarchy,
                     },
-                }
+                    relationship_models["relationship_hierarchy_response"],
+                ), HTTPStatus.OK
+
+            except ValueError as e:
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.BAD_REQUEST),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.BAD_REQUEST
 
             except Exception as e:
                 logger.error(f"Error in entity hierarchy endpoint: {str(e)}")
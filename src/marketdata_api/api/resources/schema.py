@@ -13,7 +13,7 @@ import yaml
 from flask import current_app, request
 from flask_restx import Namespace, Resource
 
-from ...constants import ErrorMessages, HTTPStatus, ResponseFields
+from ...constants import ErrorMessages, HTTPStatus, Pagination, ResponseFields
 
 logger = logging.getLogger(__name__)
 
@@ -51,8 +51,7 @@ def create_schema_resources(api, models):
         def post(self):
             """Search using a schema-based query"""
             try:
-                from ...database.session import get_session
-                from ...schema.schema_mapper import SchemaMapper
+                from ...config import schema_mapper
 
                 data = request.get_json()
                 if not data:
@@ -68,17 +67,26 @@ def create_schema_resources(api, models):
                     return {
                         ResponseFields.ERROR: "Query is required"
                     }, HTTPStatus.BAD_REQUEST
+                if not isinstance(limit, int) or limit < 1:
+                    return {
+                        ResponseFields.ERROR: "Limit must be a positive integer"
+                    }, HTTPStatus.BAD_REQUEST
 
-                with get_session() as session:
-                    mapper = SchemaMapper(session)
-                    results = mapper.search_by_schema(query, schema_name, limit)
+                results = schema_mapper.search_by_schema(
+                    query, schema_name, min(limit, Pagination.MAX_PER_PAGE)
+                )
 
-                    return {
-                        ResponseFields.MESSAGE: "Search completed successfully",
-                        "results": results,
-                        "total": len(results),
-                    }, HTTPStatus.OK
+                return {
+                    ResponseFields.MESSAGE: "Search completed successfully",
+                    "results": results,
+                    "total": len(results),
+                }, HTTPStatus.OK
 
+            except ValueError as e:
+                return {
+                    ResponseFields.ERROR: ErrorMessages.INVALID_REQUEST_BODY,
+                    "details": str(e),
+                }, HTTPStatus.BAD_REQUEST
             except Exception as e:
                 logger.error(f"Error in schema search: {str(e)}")
                 return {
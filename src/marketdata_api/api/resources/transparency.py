@@ -12,6 +12,9 @@ from flask_restx import Namespace, Resource
 
 from ...constants import ErrorMessages, HTTPStatus, Pagination, ResponseFields
 from ...services import TransparencyService
+from ..utils.api_utils import apply_keyset_pagination, get_count_mode, get_cursor_param
+from ..utils.list_filters import apply_transparency_filters
+from ...services.utils.count_cache import resolve_total
 
 # Import authentication decorators
 from ...auth.decorators import require_read_permission, require_write_permission
@@ -51,6 +54,8 @@ def create_transparency_resources(api, models):
                 "isin": "Filter by ISIN",
                 "page": "Page number (default: 1)",
                 "per_page": "Items per page (default: 20, max: 100)",
+                "cursor": "Opaque keyset cursor from meta.next_cursor (pass an empty value to start); replaces page",
+                "count": "Total count mode: exact (default, cached), estimate or none",
             },
             responses={
                 HTTPStatus.OK: ("Success", transparency_models["transparency_list_response"]),
@@ -72,6 +77,8 @@ def create_transparency_resources(api, models):
                 isin = request.args.get("isin")
                 page = request.args.get("page", 1, type=int)
                 per_page = min(request.args.get("per_page", 20, type=int), 100)
+                cursor = get_cursor_param()
+                count_mode = get_count_mode(cursor is not None)
 
                 # Get models directly
                 # Create a new session
@@ -84,31 +91,28 @@ def create_transparency_resources(api, models):
                     query = session.query(TransparencyCalculation)
 
                     # Apply filters - updated for unified transparency model
-                    if file_type:
-                        # Direct file_type filtering - more specific than calculation_type
-                        if file_type.upper() in ["FULECR", "FULECR_E"]:
-                            query = query.filter(TransparencyCalculation.file_type.like("FULECR_%"))
-                        elif file_type.upper() in ["FULNCR", "FULNCR_E"]:
-                            query = query.filter(TransparencyCalculation.file_type.like("FULNCR_%"))
-                        else:
-                            # Exact file_type match for specific types
-                            query = query.filter(TransparencyCalculation.file_type == file_type)
-                    elif calculation_type:
-                        # Map old calculation_type to new file_type patterns (legacy support)
-                        if calculation_type.upper() == "EQUITY":
-                            query = query.filter(TransparencyCalculation.file_type.like("FULECR_%"))
-                        elif calculation_type.upper() == "NON_EQUITY":
-                            query = query.filter(TransparencyCalculation.file_type.like("FULNCR_%"))
-
-                    if isin:
-                        query = query.filter(TransparencyCalculation.isin == isin)
-
-                    # Get total count
-                    total = query.count()
-
-                    # Apply pagination with ORDER BY for SQL Server compatibility
-                    offset = (page - 1) * per_page
-                    calculations = query.order_by(TransparencyCalculation.id).offset(offset).limit(per_page).all()
+                    query = apply_transparency_filters(
+                        query, TransparencyCalculation,
+                        file_type=file_type, calculation_type=calculation_type, isin=isin,
+                    )
+
+                    # Get total count (cached per filter set)
+                    total = resolve_total(
+                        count_mode, "transparency_calculations",
+                        {"file_type": file_type, "calculation_type": calculation_type, "isin": isin},
+                        ("transparency_calculations",), query.count,
+                    )
+
+                    next_cursor = None
+                    if cursor is not None:
+                        # Keyset mode: seek past the last id
+                        calculations, next_cursor = apply_keyset_pagination(
+                            query, TransparencyCalculation.id, cursor, per_page
+                        )
+                    else:
+                        # Apply pagination with ORDER BY for SQL Server compatibility
+                        offset = (page - 1) * per_page
+                        calculations = query.order_by(TransparencyCalculation.id).offset(offset).limit(per_page).all()
 
                     # Use rich transparency response builder like CLI
                     from ..utils.transparency_utils import build_transparency_response
@@ -138,12 +142,21 @@ def create_transparency_resources(api, models):
                             ResponseFields.PAGE: page,
                             ResponseFields.PER_PAGE: per_page,
                             ResponseFields.TOTAL: total,
+                            ResponseFields.NEXT_CURSOR: next_cursor,
                         },
                     }
 
                 finally:
                     session.close()
 
+            except ValueError as e:
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.BAD_REQUEST),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.BAD_REQUEST
             except Exception as e:
                 logger.error(f"Error in swagger list_transparency: {str(e)}")
                 return {
@@ -307,6 +320,61 @@ def create_transparency_resources(api, models):
                     },
                 }, HTTPStatus.INTERNAL_SERVER_ERROR
 
+    @transparency_ns.route("/lookup")
+    class TransparencyLookup(Resource):
+        @transparency_ns.doc(
+            description=(
+                "Resolve transparency calculations for up to 5000 ISINs in one request. Returns found "
+                "(ISIN -> list of calculations) and not_found (ISIN -> reason) maps"
+            ),
+            responses={
+                HTTPStatus.OK: ("Success", common_models["lookup_response"]),
+                HTTPStatus.BAD_REQUEST: ("Invalid request", common_models["error_model"]),
+                HTTPStatus.UNAUTHORIZED: ("Unauthorized", common_models["error_model"]),
+            },
+        )
+        @transparency_ns.expect(transparency_models["transparency_lookup_request"])
+        @require_read_permission
+        @read_rate_limit
+        def post(self):
+            """Resolve transparency calculations for many ISINs in one request"""
+            from ...database.session import get_session
+            from ..utils.api_utils import validate_isin
+            from ..utils.lookup_utils import build_lookup_response, fetch_in_chunks, read_lookup_identifiers
+            from ..utils.transparency_utils import build_transparency_response
+
+            try:
+                isins, invalid = read_lookup_identifiers("isins", validate_isin)
+
+                TransparencyCalculation = TransparencyService().TransparencyCalculation
+                found = {}
+                with get_session() as session:
+                    query = session.query(TransparencyCalculation).order_by(TransparencyCalculation.id)
+                    for calc in fetch_in_chunks(query, TransparencyCalculation.isin, isins):
+                        found.setdefault(calc.isin, []).append(
+                            build_transparency_response(calc, include_rich_details=True)
+                        )
+
+                return build_lookup_response(isins, found, invalid, ErrorMessages.TRANSPARENCY_NOT_FOUND)
+
+            except ValueError as e:
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.BAD_REQUEST),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.BAD_REQUEST
+            except Exception as e:
+                logger.error(f"Error in transparency lookup: {str(e)}")
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.INTERNAL_SERVER_ERROR),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.INTERNAL_SERVER_ERROR
+
     @transparency_ns.route("/batch")
     class BatchTransparency(Resource):
         @transparency_ns.doc(
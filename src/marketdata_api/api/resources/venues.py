@@ -12,6 +12,9 @@ from flask_restx import Namespace, Resource
 
 from ...constants import ErrorMessages, HTTPStatus, Pagination, ResponseFields
 from ...services import VenueService
+from ...services.utils.statistics import STATISTICS_TABLE
+from ..utils.api_utils import get_match_threshold
+from ..utils.http_cache import conditional_get
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +48,8 @@ def create_venue_resources(api, models):
                 "status": "Filter by MIC status (ACTIVE, EXPIRED, SUSPENDED, UPDATED)",
                 "mic_type": "Filter by MIC type (OPRT for operating, SGMT for segment)",
                 "operating_mic": "Filter segment MICs by their operating MIC",
-                "search": "Search venue names and legal entities",
+                "search": "Ranked, typo-tolerant search over MIC code, venue name, legal entity and acronym",
+                "threshold": "Minimum search match score between 0 and 1 (default: 0.3)",
                 "has_instruments": "Filter venues with/without instruments (true/false)",
                 "page": f"Page number for paginated results (default: {Pagination.DEFAULT_PAGE})",
                 "per_page": f"Number of records per page (default: {Pagination.DEFAULT_PER_PAGE}, max: {Pagination.MAX_PER_PAGE})",
@@ -60,6 +64,7 @@ def create_venue_resources(api, models):
                 ),
             },
         )
+        @conditional_get("market_identification_codes", "trading_venues", "instruments")
         @venues_ns.marshal_with(venue_models["venue_list_response"])
         def get(self):
             """List trading venues with comprehensive filtering"""
@@ -75,6 +80,8 @@ def create_venue_resources(api, models):
                     "search": request.args.get("search"),
                     "has_instruments": request.args.get("has_instruments"),
                 }
+                if filters["search"]:
+                    filters["threshold"] = get_match_threshold()
                 
                 # Pagination
                 page = int(request.args.get("page", Pagination.DEFAULT_PAGE))
@@ -100,6 +107,15 @@ def create_venue_resources(api, models):
                     },
                 }
 
+            except ValueError as e:
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.BAD_REQUEST),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.BAD_REQUEST
+
             except Exception as e:
                 logger.error(f"Error in venues list endpoint: {str(e)}")
                 return {
@@ -128,6 +144,7 @@ def create_venue_resources(api, models):
                 ),
             },
         )
+        @conditional_get("market_identification_codes", "trading_venues", "instruments")
         @venues_ns.marshal_with(venue_models["venue_detail_response"])
         def get(self, mic_code):
             """Get detailed venue information"""
@@ -238,7 +255,9 @@ def create_venue_resources(api, models):
                 "query": "Search term for venue names, MIC codes, legal entities",
                 "country": "Filter by country code",
                 "status": "Filter by venue status",
+                "threshold": "Minimum match score between 0 and 1 (default: 0.3)",
                 "limit": "Maximum results to return (default: 20, max: 100)",
+                "offset": "Number of ranked results to skip",
             },
             responses={
                 HTTPStatus.OK: ("Success", venue_models["venue_search_response"]),
@@ -268,17 +287,28 @@ def create_venue_resources(api, models):
                 filters = {
                     "country": request.args.get("country"),
                     "status": request.args.get("status"),
+                    "threshold": get_match_threshold(),
                 }
                 
                 limit = min(int(request.args.get("limit", 20)), 100)
+                offset = max(int(request.args.get("offset", 0)), 0)
                 
-                results = service.search_venues(query, filters, limit)
+                results = service.search_venues(query, filters, limit, offset)
                 
                 return {
                     ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
                     ResponseFields.DATA: results,
                 }
 
+            except ValueError as e:
+                return {
+                    ResponseFields.STATUS: "error",
+                    ResponseFields.ERROR: {
+                        "code": str(HTTPStatus.BAD_REQUEST),
+                        ResponseFields.MESSAGE: str(e),
+                    },
+                }, HTTPStatus.BAD_REQUEST
+
             except Exception as e:
                 logger.error(f"Error in venue search endpoint: {str(e)}")
                 return {
@@ -301,6 +331,7 @@ def create_venue_resources(api, models):
                 ),
             },
         )
+        @conditional_get(STATISTICS_TABLE, "market_identification_codes", "trading_venues")
         @venues_ns.marshal_with(venue_models["venue_statistics_response"])
         def get(self):
             """Get venue and trading statistics"""
@@ -5,14 +5,24 @@ This module provides common functionality used across all API resources,
 including error handling, validation, and response formatting.
 """
 
+import base64
+import json
 import logging
 from functools import wraps
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from flask import request
 from flask_restx import abort
 
-from ...constants import ErrorMessages, HTTPStatus, ResponseFields
+from ...constants import (
+    CountModes,
+    ErrorMessages,
+    HTTPStatus,
+    QueryParams,
+    ResponseFields,
+    ResponseViews,
+    ServiceDefaults,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -57,22 +67,187 @@ def validate_pagination_params():
     
     Returns:
         Dict containing validated pagination parameters
+        
+    Raises:
+        ValueError: If the cursor is malformed or the count mode is not recognised
     """
     try:
         page = max(1, int(request.args.get('page', 1)))
         per_page = min(1000, max(1, int(request.args.get('per_page', 20))))
         limit = request.args.get('limit', type=int)
         offset = max(0, int(request.args.get('offset', 0)))
-        
-        return {
-            'page': page,
-            'per_page': per_page,
-            'limit': limit,
-            'offset': offset,
-        }
     except (ValueError, TypeError) as e:
         abort(HTTPStatus.BAD_REQUEST, f"Invalid pagination parameters: {str(e)}")
 
+    # Cursor and count mode errors are left to the caller's ValueError handling,
+    # which answers 400 with the message
+    cursor = get_cursor_param()
+
+    return {
+        'page': page,
+        'per_page': per_page,
+        'limit': limit,
+        'offset': offset,
+        'cursor': cursor,
+        'count': get_count_mode(cursor is not None),
+    }
+
+
+def encode_cursor(last_key: str) -> str:
+    """
+    Encode the sort key of the last row on a page into an opaque cursor.
+    
+    Args:
+        last_key: Sort key value (ISIN, id, LEI, MIC) of the last returned row
+        
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps({"k": last_key}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """
+    Decode a cursor produced by encode_cursor back into its sort key.
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        last_key = payload["k"]
+    except (ValueError, TypeError, KeyError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(last_key, str):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return last_key
+
+
+def get_cursor_param() -> Optional[str]:
+    """
+    Read the keyset pagination cursor from the request.
+    
+    Returns:
+        None when the request uses page/offset pagination, "" for the first
+        page of a keyset traversal (``?cursor=``), otherwise the decoded sort key
+    """
+    cursor = request.args.get(QueryParams.CURSOR)
+    if cursor is None:
+        return None
+    cursor = cursor.strip()
+    return decode_cursor(cursor) if cursor else ""
+
+
+def get_count_mode(keyset: bool = False) -> str:
+    """
+    Read how the list total should be computed (``count=none|estimate|exact``).
+    
+    Args:
+        keyset: Whether the request pages by cursor, where totals default to 'none'
+        
+    Raises:
+        ValueError: If the mode is not recognised
+    """
+    default = CountModes.NONE if keyset else CountModes.EXACT
+    mode = request.args.get(QueryParams.COUNT, default).strip().lower()
+    if mode not in CountModes.VALID_MODES:
+        raise ValueError(
+            f"Invalid count mode: {mode} (expected one of {', '.join(CountModes.VALID_MODES)})"
+        )
+    return mode
+
+
+def get_match_threshold() -> float:
+    """
+    Read the minimum name-search match score (``threshold=0..1``).
+    
+    Raises:
+        ValueError: If the threshold is not a number between 0 and 1
+    """
+    raw = request.args.get(QueryParams.THRESHOLD)
+    if raw is None or not raw.strip():
+        return ServiceDefaults.NAME_SEARCH_THRESHOLD
+    try:
+        threshold = float(raw)
+    except ValueError:
+        raise ValueError(f"Invalid threshold: {raw} (expected a number between 0 and 1)")
+    if not 0.0 <= threshold <= 1.0:
+        raise ValueError(f"Invalid threshold: {raw} (expected a number between 0 and 1)")
+    return threshold
+
+
+def apply_keyset_pagination(query, key_column, after: str, limit: int) -> Tuple[List[Any], Optional[str]]:
+    """
+    Fetch one page of a query using ``WHERE key > :last ORDER BY key``.
+    
+    Unlike OFFSET, the cost of each page does not grow with its depth.
+    One extra row is fetched to tell whether a further page exists.
+    
+    Args:
+        query: SQLAlchemy query with filters already applied
+        key_column: Unique, ordered column backing the cursor
+        after: Sort key of the last row already seen ("" for the first page)
+        limit: Page size
+        
+    Returns:
+        Tuple of (rows, next_cursor) where next_cursor is None on the last page
+    """
+    if after:
+        query = query.filter(key_column > after)
+    rows = query.order_by(key_column).limit(limit + 1).all()
+
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(getattr(rows[-1], key_column.key))
+
+
+def get_fieldset(
+    allowed_fields: Sequence[str],
+    views: Dict[str, Optional[Sequence[str]]],
+    key_field: str,
+) -> Optional[List[str]]:
+    """
+    Read a sparse fieldset from ``fields=a,b,c`` or ``view=compact|standard|full``.
+    
+    ``fields`` takes precedence over ``view``. The key field is always
+    included (first), since keyset cursors are built from it.
+    
+    Args:
+        allowed_fields: Field names that can be projected
+        views: View name to field list; None means the full representation
+        key_field: Field always returned with a projection
+        
+    Returns:
+        Ordered list of field names, or None for the full representation
+        
+    Raises:
+        ValueError: On unknown fields or views
+    """
+    fields_param = request.args.get(QueryParams.FIELDS)
+    if fields_param is not None and fields_param.strip():
+        requested = [name.strip() for name in fields_param.split(",") if name.strip()]
+        unknown = [name for name in requested if name not in allowed_fields]
+        if unknown:
+            raise ValueError(
+                f"Unknown fields: {', '.join(unknown)} (allowed: {', '.join(allowed_fields)})"
+            )
+    else:
+        view = request.args.get(QueryParams.VIEW, ResponseViews.FULL).strip().lower()
+        if view not in views:
+            raise ValueError(f"Invalid view: {view} (expected one of {', '.join(views)})")
+        if views[view] is None:
+            return None
+        requested = list(views[view])
+
+    fieldset = [key_field]
+    for name in requested:
+        if name not in fieldset:
+            fieldset.append(name)
+    return fieldset
+
 
 def validate_filter_params(allowed_filters: Dict[str, Any]):
     """
@@ -176,6 +351,27 @@ def validate_isin(isin: str) -> str:
     return isin.upper()
 
 
+def validate_figi(figi: str) -> str:
+    """Validate FIGI format."""
+    if not figi or len(figi) != 12:
+        raise ValueError("FIGI must be exactly 12 characters")
+    return figi.upper()
+
+
+def validate_ticker(ticker: str) -> str:
+    """Validate ticker format."""
+    if not ticker or len(ticker) > 100:
+        raise ValueError("Ticker must be 1-100 characters")
+    return ticker.upper()
+
+
+def validate_lei(lei: str) -> str:
+    """Validate LEI format."""
+    if not lei or len(lei) != 20:
+        raise ValueError("LEI must be exactly 20 characters")
+    return lei.upper()
+
+
 def validate_cfi_code(cfi: str) -> str:
     """Validate CFI code format."""
     if not cfi or len(cfi) != 6:
@@ -0,0 +1,146 @@
+"""
+Response Compression
+
+Two halves:
+
+- init_compression registers an after_request hook compressing API
+  responses (brotli when the optional brotli package is installed and the
+  client accepts it, else gzip) when the body is at least
+  COMPRESSION_MIN_SIZE bytes and its mimetype is on the allow-list.
+  Streamed responses (NDJSON/CSV exports, files) are left alone. The ETag of
+  a compressed response is made weak, so conditional GETs keep matching
+  the identity representation's tag.
+
+- serve_precompressed_static replaces Flask's static view for the
+  frontend bundle. The Vite build writes .br and .gz siblings next to each
+  asset (see frontend-modern/vite.config.ts); the best one the client
+  accepts is sent as-is with Content-Encoding, so assets are never
+  compressed per request. Vite's content-hashed file names get immutable
+  year-long Cache-Control; everything carries an ETag.
+"""
+
+import gzip
+import mimetypes
+import os
+import re
+
+from flask import current_app, request, send_from_directory
+from werkzeug.security import safe_join
+
+from ...config import Config
+from ...constants import HTTPStatus
+
+# Optional brotli support; gzip is always available
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+COMPRESSIBLE_MIMETYPES = frozenset(
+    {
+        "application/json",
+        "application/javascript",
+        "application/xml",
+        "image/svg+xml",
+        "text/css",
+        "text/csv",
+        "text/html",
+        "text/javascript",
+        "text/plain",
+        "text/xml",
+    }
+)
+
+# Precompressed sibling suffix per Content-Encoding, in order of preference
+STATIC_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+# Vite output names: name-<hash>.ext
+HASHED_ASSET = re.compile(r"-[A-Za-z0-9_-]{8,}\.\w+$")
+
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+
+def _choose_encoding(available):
+    """Best Content-Encoding the client accepts among available ones."""
+    for encoding in available:
+        if request.accept_encodings[encoding]:
+            return encoding
+    return None
+
+
+def compress_response(response):
+    """after_request hook: compress eligible responses in place."""
+    if (
+        not current_app.config.get("COMPRESSION_ENABLED", Config.COMPRESSION_ENABLED)
+        or response.status_code < HTTPStatus.OK
+        or response.status_code in (HTTPStatus.NO_CONTENT, HTTPStatus.NOT_MODIFIED)
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    if request.method == "HEAD":
+        return response
+
+    body = response.get_data()
+    if len(body) < current_app.config.get("COMPRESSION_MIN_SIZE", Config.COMPRESSION_MIN_SIZE):
+        return response
+
+    encoding = _choose_encoding(("br", "gzip") if HAS_BROTLI else ("gzip",))
+    if encoding == "br":
+        compressed = brotli.compress(body, quality=Config.COMPRESSION_BROTLI_QUALITY)
+    elif encoding == "gzip":
+        compressed = gzip.compress(body, compresslevel=Config.COMPRESSION_GZIP_LEVEL)
+    else:
+        return response
+
+    response.set_data(compressed)
+    response.headers["Content-Encoding"] = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def init_compression(app) -> None:
+    """Compress eligible responses of the app."""
+    app.config.setdefault("COMPRESSION_ENABLED", Config.COMPRESSION_ENABLED)
+    app.config.setdefault("COMPRESSION_MIN_SIZE", Config.COMPRESSION_MIN_SIZE)
+    app.after_request(compress_response)
+
+
+def serve_precompressed_static(app) -> None:
+    """Serve app.static_folder through precompressed siblings and long-lived cache headers."""
+
+    def static(filename):
+        folder = app.static_folder
+        mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+        path = safe_join(folder, filename)
+        available = [
+            encoding for encoding, suffix in STATIC_ENCODINGS
+            if path is not None and os.path.isfile(path + suffix)
+        ]
+        encoding = _choose_encoding(available) if available else None
+        suffix = dict(STATIC_ENCODINGS)[encoding] if encoding else ""
+
+        response = send_from_directory(folder, filename + suffix, mimetype=mimetype, etag=True)
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+        if available:
+            response.vary.add("Accept-Encoding")
+
+        response.cache_control.public = True
+        if HASHED_ASSET.search(filename):
+            response.cache_control.no_cache = None
+            response.cache_control.max_age = IMMUTABLE_MAX_AGE
+            response.cache_control.immutable = True
+        else:
+            response.cache_control.no_cache = True
+        return response
+
+    app.view_functions["static"] = static
@@ -0,0 +1,103 @@
+"""
+Streaming Export Utilities
+
+Serializes query results as NDJSON or CSV chunks while they are read from a
+server-side cursor (Query.yield_per), so exports run in constant memory and
+the first bytes go out before the whole result has been read.
+"""
+
+import csv
+import io
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence
+
+from sqlalchemy import JSON
+
+from ...constants import ExportFormats, ServiceDefaults
+from .json_serializer import dumps
+
+
+def export_columns(model) -> List[str]:
+    """Scalar (non-JSON) column names of a model, in table order."""
+    return [
+        column.key
+        for column in model.__table__.columns
+        if not isinstance(column.type, JSON)
+    ]
+
+
+def _export_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _row_values(row, fields: Sequence[str]) -> Dict[str, Any]:
+    mapping = row._mapping if hasattr(row, "_mapping") else row
+    return {field: _export_value(mapping[field]) for field in fields}
+
+
+def iter_ndjson(rows: Iterable[Any], fields: Sequence[str], batch_size: int) -> Iterator[str]:
+    """Yield newline-delimited JSON, one object per row, in chunks of batch_size rows."""
+    lines = []
+    for row in rows:
+        lines.append(dumps(_row_values(row, fields)).decode("utf-8"))
+        if len(lines) >= batch_size:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def iter_csv(rows: Iterable[Any], fields: Sequence[str], batch_size: int) -> Iterator[str]:
+    """Yield a CSV header, then CSV rows in chunks of batch_size rows."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(fields))
+    writer.writeheader()
+    yield buffer.getvalue()
+
+    buffer.seek(0)
+    buffer.truncate()
+    pending = 0
+    for row in rows:
+        writer.writerow(_row_values(row, fields))
+        pending += 1
+        if pending >= batch_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if pending:
+        yield buffer.getvalue()
+
+
+def stream_query(
+    build_query: Callable[[Any], Any],
+    fields: Sequence[str],
+    export_format: str,
+    batch_size: int = ServiceDefaults.EXPORT_BATCH_SIZE,
+) -> Iterator[str]:
+    """
+    Run a query on its own session and stream it in the requested format.
+
+    The session lives as long as the generator, so the response body can be
+    consumed after the view function has returned.
+
+    Args:
+        build_query: Callable taking a session and returning a column query
+        fields: Column labels to export, in order
+        export_format: One of ExportFormats.VALID_FORMATS
+        batch_size: Rows per cursor fetch and per yielded chunk
+    """
+    from ...database.session import get_session
+
+    serialize = iter_csv if export_format == ExportFormats.CSV else iter_ndjson
+    with get_session() as session:
+        rows = build_query(session).yield_per(batch_size)
+        yield from serialize(rows, fields, batch_size)
@@ -0,0 +1,154 @@
+"""
+HTTP Conditional GET and Response Cache
+
+Reference data only changes when an ingest or write service commits, so
+read endpoints can be revalidated instead of recomputed. The conditional_get
+decorator:
+- tags 200 responses with a strong ETag (hash of the JSON body) and a
+  Last-Modified taken from the data versions of the tables the endpoint reads
+- answers a matching If-None-Match with 304 Not Modified
+- optionally (RESPONSE_CACHE_ENABLED, off by default) keeps rendered bodies in a bounded in-memory cache keyed by
+  (route, query args, table data versions), so hot reads skip the database
+
+Data versions are process-local (see database.data_version) and writes from
+other processes (CLI ingests, other workers) are not seen, so cache entries
+also expire after a TTL. ETags are derived from the body itself and stay
+valid across processes and restarts.
+
+Apply the decorator below authentication and rate limiting, and above
+marshal_with, so only authorized requests are served from the cache and the
+cached body is the marshalled one.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Hashable, NamedTuple, Optional, Tuple
+
+from flask import current_app, request
+from werkzeug.wrappers import Response
+
+from ...config import Config
+from ...constants import HTTPStatus
+from ...database import data_version
+from .json_serializer import output_json
+
+logger = logging.getLogger(__name__)
+
+
+class CachedResponse(NamedTuple):
+    etag: str
+    body: bytes
+    stored_at: float
+
+
+class ResponseCache:
+    """Bounded LRU of rendered JSON bodies with a TTL."""
+
+    def __init__(
+        self,
+        max_entries: int = Config.RESPONSE_CACHE_MAX_ENTRIES,
+        ttl_seconds: int = Config.RESPONSE_CACHE_TTL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry.stored_at >= self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def store(self, key: Hashable, etag: str, body: bytes) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = CachedResponse(etag, body, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide cache shared by all conditional_get endpoints
+response_cache = ResponseCache()
+
+
+def _unpack(result) -> Tuple[object, int, dict]:
+    """Split a flask-restx handler return value into (data, status, headers)."""
+    if isinstance(result, tuple):
+        data = result[0]
+        status = result[1] if len(result) > 1 else HTTPStatus.OK
+        headers = result[2] if len(result) > 2 else {}
+        return data, int(status), dict(headers or {})
+    return result, HTTPStatus.OK, {}
+
+
+def _cache_key(tables: Tuple[str, ...]) -> Hashable:
+    args = tuple(sorted(request.args.items(multi=True)))
+    return (request.endpoint, request.path, args, data_version.get_version(*tables))
+
+
+def _finalize(body: bytes, etag: str, tables: Tuple[str, ...]) -> Response:
+    if request.if_none_match.contains_weak(etag):
+        response = current_app.response_class(status=HTTPStatus.NOT_MODIFIED)
+    else:
+        response = current_app.response_class(body, mimetype="application/json")
+    response.set_etag(etag)
+    response.last_modified = data_version.last_modified(*tables)
+    response.cache_control.no_cache = True
+    return response
+
+
+def conditional_get(*tables: str):
+    """
+    Serve a GET endpoint with ETag/Last-Modified, 304s and the response cache.
+
+    Args:
+        *tables: Tables the response is built from; a committed write to any
+            of them invalidates cached bodies.
+    """
+
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            use_cache = current_app.config.get("RESPONSE_CACHE_ENABLED", False)
+            key = _cache_key(tables) if use_cache else None
+
+            cached = response_cache.get(key) if use_cache else None
+            if cached is not None:
+                return _finalize(cached.body, cached.etag, tables)
+
+            result = f(*args, **kwargs)
+            if isinstance(result, Response):
+                return result
+
+            data, status, headers = _unpack(result)
+            if status != HTTPStatus.OK or headers:
+                return result
+
+            body = output_json(data, status).get_data()
+            etag = hashlib.sha1(body).hexdigest()
+            if use_cache:
+                response_cache.store(key, etag, body)
+            return _finalize(body, etag, tables)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,187 @@
+"""
+JSON Serialization
+
+One serializer encodes every JSON body the API sends: Flask-RESTx
+resources, plain Flask routes (app.json), conditional-GET cache bodies, the
+OpenAPI document and NDJSON exports. The backend is picked once per process
+(Config.JSON_SERIALIZER):
+
+    auto     orjson, else msgspec, else the stdlib
+    orjson   requires the optional orjson package
+    msgspec  requires the optional msgspec package
+    stdlib   the json module
+
+Whatever the backend, the output is standard JSON: NaN and +/-Infinity are
+encoded as null, dates and datetimes as ISO 8601 strings and Decimals as
+numbers. orjson and msgspec do this natively while encoding. The stdlib
+encoder runs with allow_nan=False and only re-encodes through a
+null-emitting float formatter when a payload actually contains a
+non-finite float, so no payload is walked ahead of encoding.
+"""
+
+import json
+import logging
+import math
+from datetime import date, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Optional
+from uuid import UUID
+
+from flask import current_app, make_response
+from flask.json.provider import DefaultJSONProvider
+
+from ...config import Config
+
+# Optional fast encoders; the stdlib is always available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+logger = logging.getLogger(__name__)
+
+
+def _default(obj: Any) -> Any:
+    """Encode types the backends do not handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj) if obj.is_finite() else None
+    if isinstance(obj, float):  # float subclasses, e.g. numpy.float64
+        return float(obj) if math.isfinite(obj) else None
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "item"):  # numpy scalars
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JSONSerializer:
+    """Encode Python values to UTF-8 JSON bytes."""
+
+    name = "stdlib"
+
+    def dumps(self, obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+        kwargs = {"indent": 4 if indent else None, "sort_keys": sort_keys}
+        try:
+            text = json.dumps(obj, default=_default, allow_nan=False, **kwargs)
+        except ValueError as e:
+            if "Out of range float" not in str(e):
+                raise
+            text = self._dumps_non_finite(obj, **kwargs)
+        return text.encode("utf-8")
+
+    @staticmethod
+    def _dumps_non_finite(obj: Any, indent: Optional[int], sort_keys: bool) -> str:
+        """Pure-Python encode emitting null for NaN and +/-Infinity."""
+
+        def floatstr(value, _repr=float.__repr__):
+            return _repr(value) if math.isfinite(value) else "null"
+
+        encoder = json.JSONEncoder(default=_default, indent=indent, sort_keys=sort_keys)
+        iterencode = json.encoder._make_iterencode(
+            {},
+            encoder.default,
+            json.encoder.py_encode_basestring_ascii,
+            " " * indent if indent else None,
+            floatstr,
+            encoder.key_separator,
+            encoder.item_separator,
+            sort_keys,
+            False,
+            True,
+        )
+        return "".join(iterencode(obj, 0))
+
+
+class OrjsonSerializer(JSONSerializer):
+    name = "orjson"
+
+    def dumps(self, obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=_default, option=option)
+
+
+class MsgspecSerializer(JSONSerializer):
+    name = "msgspec"
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder(enc_hook=_default, decimal_format="number")
+        self._sorted_encoder = msgspec.json.Encoder(
+            enc_hook=_default, decimal_format="number", order="sorted"
+        )
+
+    def dumps(self, obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+        body = (self._sorted_encoder if sort_keys else self._encoder).encode(obj)
+        return msgspec.json.format(body, indent=4) if indent else body
+
+
+SERIALIZERS = {
+    "orjson": (HAS_ORJSON, OrjsonSerializer),
+    "msgspec": (HAS_MSGSPEC, MsgspecSerializer),
+    "stdlib": (True, JSONSerializer),
+}
+
+
+def get_serializer(name: str = Config.JSON_SERIALIZER) -> JSONSerializer:
+    """
+    Create the serializer for a backend name, or the fastest installed one for "auto".
+
+    Raises:
+        ValueError: For an unknown backend name
+    """
+    name = (name or "auto").lower()
+    if name == "auto":
+        name = next(candidate for candidate, (installed, _) in SERIALIZERS.items() if installed)
+    if name not in SERIALIZERS:
+        raise ValueError(f"Unknown JSON serializer: {name}. Valid options: auto, {', '.join(SERIALIZERS)}")
+
+    installed, serializer_class = SERIALIZERS[name]
+    if not installed:
+        logger.warning(f"JSON serializer {name} is not installed, using the stdlib")
+        serializer_class = JSONSerializer
+    return serializer_class()
+
+
+# Process-wide serializer
+json_serializer = get_serializer()
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    return json_serializer.dumps(obj, indent=indent, sort_keys=sort_keys)
+
+
+def output_json(data, code, headers=None):
+    """Flask-RESTx representation: JSON body from the shared serializer."""
+    response = make_response(dumps(data, indent=current_app.debug) + b"\n", code)
+    response.mimetype = "application/json"
+    response.headers.extend(headers or {})
+    return response
+
+
+class SerializerJSONProvider(DefaultJSONProvider):
+    """app.json provider for plain Flask routes (jsonify, dict returns)."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return dumps(obj, sort_keys=kwargs.get("sort_keys", self.sort_keys)).decode("utf-8")
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = dumps(obj, indent=self._app.debug, sort_keys=self.sort_keys)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
@@ -0,0 +1,122 @@
+"""
+Shared query filters for list and export endpoints.
+
+The export endpoints stream the same slices the paginated JSON list
+endpoints return, so both build their queries from these helpers.
+"""
+
+from typing import Any, Dict, Optional
+
+from ...constants import ServiceDefaults
+from ...database.fulltext import match_instruments, match_legal_entities
+from .api_utils import validate_cfi_code, validate_currency_code, validate_mic_code
+
+# Allowed instrument list filters and their validators (see validate_filter_params)
+INSTRUMENT_FILTERS = {
+    "type": str,  # No specific validation for instrument type
+    "cfi_type": lambda x: x.upper() if x.upper() in "CDEFHIJORS" else None,  # CFI first letter
+    "currency": validate_currency_code,
+    "mic_code": validate_mic_code,
+    "cfi_code": validate_cfi_code,
+    "search": str,  # Full-text prefix search (ISIN, names, LEI, issuer)
+}
+
+
+def apply_instrument_filters(query, instrument_model, trading_venue_model, filters: Dict[str, Any]):
+    """
+    Apply validated instrument list filters to a query.
+
+    Args:
+        query: Query selecting from the instrument model
+        instrument_model: Instrument model class
+        trading_venue_model: TradingVenue model class (for mic_code)
+        filters: Output of validate_filter_params(INSTRUMENT_FILTERS)
+    """
+    if "type" in filters:
+        query = query.filter(instrument_model.instrument_type == filters["type"])
+
+    if "cfi_type" in filters:
+        # Filter by CFI first letter (instrument classification)
+        query = query.filter(instrument_model.cfi_code.like(filters["cfi_type"] + "%"))
+
+    if "currency" in filters:
+        query = query.filter(instrument_model.currency == filters["currency"])
+
+    if "mic_code" in filters:
+        # Filter by MIC code through trading venues
+        query = query.join(trading_venue_model).filter(
+            trading_venue_model.mic_code == filters["mic_code"]
+        )
+
+    if "cfi_code" in filters:
+        query = query.filter(instrument_model.cfi_code == filters["cfi_code"])
+
+    if "search" in filters:
+        # Prefix search over ISIN, names, LEI and issuer name via the full-text index
+        search_term = filters["search"]
+        matched = match_instruments(query, instrument_model, search_term)
+        if matched is not None:
+            query = matched[0]
+        else:
+            query = query.filter(
+                (instrument_model.isin.ilike(f"%{search_term}%"))
+                | (instrument_model.short_name.ilike(f"%{search_term}%"))
+                | (instrument_model.full_name.ilike(f"%{search_term}%"))
+            )
+
+    return query
+
+
+def apply_transparency_filters(
+    query,
+    transparency_model,
+    file_type: Optional[str] = None,
+    calculation_type: Optional[str] = None,
+    isin: Optional[str] = None,
+):
+    """
+    Apply transparency list filters to a query.
+
+    file_type takes precedence over the legacy calculation_type
+    (EQUITY/NON_EQUITY), which maps to FITRS file type patterns.
+    """
+    if file_type:
+        # Direct file_type filtering - more specific than calculation_type
+        if file_type.upper() in ["FULECR", "FULECR_E"]:
+            query = query.filter(transparency_model.file_type.like("FULECR_%"))
+        elif file_type.upper() in ["FULNCR", "FULNCR_E"]:
+            query = query.filter(transparency_model.file_type.like("FULNCR_%"))
+        else:
+            # Exact file_type match for specific types
+            query = query.filter(transparency_model.file_type == file_type)
+    elif calculation_type:
+        # Map old calculation_type to new file_type patterns (legacy support)
+        if calculation_type.upper() == "EQUITY":
+            query = query.filter(transparency_model.file_type.like("FULECR_%"))
+        elif calculation_type.upper() == "NON_EQUITY":
+            query = query.filter(transparency_model.file_type.like("FULNCR_%"))
+
+    if isin:
+        query = query.filter(transparency_model.isin == isin)
+
+    return query
+
+
+def apply_legal_entity_filters(query, legal_entity_model, filters: Optional[Dict[str, Any]]):
+    """Apply legal entity list filters (status, jurisdiction, name) to a query."""
+    if not filters:
+        return query
+    if filters.get("status"):
+        query = query.filter(legal_entity_model.status == filters["status"])
+    if filters.get("jurisdiction"):
+        query = query.filter(legal_entity_model.jurisdiction == filters["jurisdiction"])
+    if filters.get("name"):
+        # Same matches as the list endpoint; callers choose the ordering
+        matched = match_legal_entities(
+            query, legal_entity_model, filters["name"], filters.get("threshold", ServiceDefaults.NAME_SEARCH_THRESHOLD)
+        )
+        if matched is not None:
+            query = matched[0]
+        else:
+            query = query.filter(legal_entity_model.name.ilike(f"%{filters['name']}%"))
+    return query
@@ -0,0 +1,101 @@
+"""
+Multi-get lookup helpers.
+
+POST /instruments/lookup, /legal-entities/lookup and /transparency/lookup
+resolve many identifiers in one request. Identifiers are read from the JSON
+body, normalised and de-duplicated, fetched with chunked IN queries (so a
+5,000-ISIN portfolio costs a handful of queries instead of 5,000 requests)
+and returned as found / not_found maps keyed by identifier.
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+from flask import request
+
+from ...constants import ResponseFields, ServiceDefaults
+
+
+def read_identifier_list(body_key: str, max_identifiers: int = ServiceDefaults.LOOKUP_MAX_IDENTIFIERS) -> List[str]:
+    """
+    Read the raw identifier list of a request body, in request order.
+
+    Raises:
+        ValueError: If the body is not an object with a list of strings under
+            body_key, or the list has more than max_identifiers entries
+    """
+    data = request.get_json(silent=True)
+    values = data.get(body_key) if isinstance(data, dict) else None
+    if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+        raise ValueError(f"Request body must be a JSON object whose '{body_key}' field is a list of strings")
+    if len(values) > max_identifiers:
+        raise ValueError(f"Too many {body_key}: {len(values)} (maximum {max_identifiers} per request)")
+    return values
+
+
+def read_lookup_identifiers(
+    body_key: str, validator: Callable[[str], str]
+) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Read the identifiers list of a lookup request body.
+
+    Args:
+        body_key: Body field holding the list (e.g. "isins")
+        validator: Format validator returning the normalised identifier
+            and raising ValueError for malformed ones (e.g. validate_isin)
+
+    Returns:
+        (valid identifiers in request order, malformed identifier -> reason)
+
+    Raises:
+        ValueError: If the body is not an object with a list of strings under
+            body_key, or the list exceeds ServiceDefaults.LOOKUP_MAX_IDENTIFIERS
+    """
+    values = read_identifier_list(body_key)
+
+    identifiers: List[str] = []
+    invalid: Dict[str, str] = {}
+    seen = set()
+    for value in values:
+        value = value.strip()
+        try:
+            identifier = validator(value)
+        except ValueError as e:
+            invalid[value] = str(e)
+            continue
+        if identifier not in seen:
+            seen.add(identifier)
+            identifiers.append(identifier)
+    return identifiers, invalid
+
+
+def chunked(values: Sequence[Any], size: int = ServiceDefaults.LOOKUP_CHUNK_SIZE) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def fetch_in_chunks(query, key_column, identifiers: Sequence[str]) -> List[Any]:
+    """Run query once per chunk of identifiers with key_column IN (chunk)."""
+    rows: List[Any] = []
+    for chunk in chunked(identifiers):
+        rows.extend(query.filter(key_column.in_(chunk)).all())
+    return rows
+
+
+def build_lookup_response(
+    identifiers: Sequence[str], found: Dict[str, Any], invalid: Dict[str, str], not_found_message: str
+) -> Dict[str, Any]:
+    """Assemble the found / not_found response for a lookup."""
+    not_found = {identifier: not_found_message for identifier in identifiers if identifier not in found}
+    not_found.update(invalid)
+    return {
+        ResponseFields.STATUS: ResponseFields.SUCCESS_STATUS,
+        ResponseFields.DATA: {
+            "found": found,
+            "not_found": not_found,
+        },
+        ResponseFields.META: {
+            "requested": len(identifiers) + len(invalid),
+            "found": len(found),
+            "not_found": len(not_found),
+        },
+    }
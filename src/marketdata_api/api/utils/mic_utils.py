@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
+from ...constants import ServiceDefaults
 from ...database.session import get_session
 from ...models.sqlite.market_identification_code import (
     MarketCategoryCode,
@@ -17,12 +18,16 @@ from ...models.sqlite.market_identification_code import (
     MICType,
 )
 from ...services.utils.mic_data_loader import MICDataLoader, load_mic_data_from_csv
+from ...services.utils.mic_reference import mic_reference
 
 
 def get_mic_segments_data(session, mic_code: str):
     """
     Get all segment MICs for a given operating MIC.
     
+    Served from the in-process MIC reference snapshot; the session argument
+    is kept for API compatibility.
+    
     Args:
         session: SQLAlchemy session
         mic_code: Operating MIC code
@@ -30,23 +35,23 @@ def get_mic_segments_data(session, mic_code: str):
     Returns:
         dict: Operating MIC and its segments, or error if not found
     """
-    # Verify the operating MIC exists
-    operating_mic = (
-        session.query(MarketIdentificationCode)
-        .filter_by(mic=mic_code.upper(), operation_type=MICType.OPRT)
-        .first()
-    )
+    snapshot = mic_reference.snapshot()
 
-    if not operating_mic:
+    # Verify the operating MIC exists
+    operating_mic = snapshot.get(mic_code)
+    if not operating_mic or operating_mic["operation_type"] != MICType.OPRT.value:
         return {"error": f"Operating MIC not found: {mic_code}", "status_code": 404}
 
-    segments = MarketIdentificationCode.get_segments_for_operating_mic(
-        session, mic_code.upper()
-    )
+    segments = [
+        segment
+        for segment in snapshot.segments(mic_code)
+        if segment["operation_type"] == MICType.SGMT.value
+        and segment["status"] == MICStatus.ACTIVE.value
+    ]
 
     return {
-        "operating_mic": operating_mic.to_dict(),
-        "segments": [segment.to_dict() for segment in segments],
+        "operating_mic": dict(operating_mic),
+        "segments": [dict(segment) for segment in segments],
     }
 
 
@@ -118,14 +123,19 @@ def search_mics_data(session, **filters):
     """
     query = session.query(MarketIdentificationCode)
     
-    # Apply filters
-    if 'market_name' in filters:
-        search_term = f"%{filters['market_name']}%"
-        query = query.filter(MarketIdentificationCode.market_name.ilike(search_term))
-    
-    if 'legal_entity_name' in filters:
-        search_term = f"%{filters['legal_entity_name']}%"
-        query = query.filter(MarketIdentificationCode.legal_entity_name.ilike(search_term))
+    # Name filters are ranked by the in-memory MIC name index
+    ranks = None
+    threshold = filters.get('threshold', ServiceDefaults.NAME_SEARCH_THRESHOLD)
+    for field in ('market_name', 'legal_entity_name'):
+        if field in filters:
+            field_ranks = mic_reference.snapshot().search(filters[field], threshold, fields=(field,))
+            if ranks is None:
+                ranks = field_ranks
+            else:
+                # Both names must match; the weaker match decides the rank
+                ranks = {mic: min(score, field_ranks[mic]) for mic, score in ranks.items() if mic in field_ranks}
+    if ranks is not None:
+        query = query.filter(MarketIdentificationCode.mic.in_(list(ranks)))
     
     if 'mic_code' in filters:
         query = query.filter(MarketIdentificationCode.mic_code == filters['mic_code'].upper())
@@ -147,7 +157,12 @@ def search_mics_data(session, **filters):
     per_page = min(filters.get('per_page', 50), 1000)  # Max 1000 results
     offset = (page - 1) * per_page
     
-    results = query.offset(offset).limit(per_page).all()
+    if ranks is not None:
+        # Name search results are capped, so rank them in memory
+        results = sorted(query.all(), key=lambda mic: (-ranks[mic.mic], mic.mic))
+        results = results[offset:offset + per_page]
+    else:
+        results = query.offset(offset).limit(per_page).all()
     
     return {
         "results": [mic.to_dict() for mic in results],
@@ -5,12 +5,99 @@ This module handles all presentation logic for instrument API responses,
 including normalization and type-specific formatting.
 """
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 from datetime import datetime
 import logging
 
+from ...constants import ResponseViews
+
 logger = logging.getLogger(__name__)
 
+# Scalar instrument columns that can be requested through ?fields=
+INSTRUMENT_PROJECTION_FIELDS = (
+    "id",
+    "isin",
+    "instrument_type",
+    "full_name",
+    "short_name",
+    "currency",
+    "cfi_code",
+    "commodity_derivative_indicator",
+    "lei_id",
+    "competent_authority",
+    "relevant_trading_venue",
+    "publication_from_date",
+    "created_at",
+    "updated_at",
+)
+
+# Fields returned for each ?view=; None is the full rich response
+INSTRUMENT_VIEW_FIELDS = {
+    ResponseViews.COMPACT: ("isin", "full_name", "instrument_type"),
+    ResponseViews.STANDARD: INSTRUMENT_PROJECTION_FIELDS,
+    ResponseViews.FULL: None,
+}
+
+
+def rich_instrument_load_options(instrument_model) -> List[Any]:
+    """
+    Loader options for the relationships read by build_instrument_response.
+    
+    Collections use selectinload (one IN query per relationship for the whole
+    page, no row multiplication); the issuer is a many-to-one and is joined.
+    transparency_calculations is referenced by to_raw_data() but never read by
+    the response, so it is not loaded at all.
+    """
+    from sqlalchemy.orm import joinedload, noload, selectinload
+
+    return [
+        selectinload(instrument_model.trading_venues),
+        selectinload(instrument_model.figi_mappings),
+        joinedload(instrument_model.legal_entity),
+        noload(instrument_model.transparency_calculations),
+    ]
+
+
+def instrument_projection_columns(instrument_model, fields: Iterable[str]) -> List[Any]:
+    """Model columns for a sparse fieldset, for use with query.with_entities()."""
+    return [getattr(instrument_model, field) for field in fields]
+
+
+def build_projected_instrument_response(row, fields: Iterable[str]) -> Dict[str, Any]:
+    """
+    Build a sparse instrument response from a column-only result row.
+    
+    Values are normalized exactly like the full response; CFI decoding,
+    type-specific attributes, venues and the issuer are not built.
+    """
+    base = normalize_base_fields(row._asdict())
+    return {field: base[field] for field in fields}
+
+
+def resolve_venue_displays(mic_codes: Iterable[Optional[str]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Resolve primary venue displays for many MIC codes from the MIC reference snapshot.
+    
+    Args:
+        mic_codes: MIC codes to resolve (None and duplicates are ignored)
+        
+    Returns:
+        dict: MIC code -> display dict, for every requested code
+    """
+    codes = {code for code in mic_codes if code}
+    if not codes:
+        return {}
+
+    try:
+        from ...services.utils.mic_reference import mic_reference
+
+        snapshot = mic_reference.snapshot()
+    except Exception as e:
+        logger.warning(f"MIC reference unavailable for {len(codes)} venues: {e}")
+        return {code: _build_venue_display(code, None) for code in codes}
+
+    return {code: _build_venue_display(code, snapshot.get(code)) for code in codes}
+
 
 def _safe_isoformat(value: Union[str, datetime, None]) -> Optional[str]:
     """
@@ -19,10 +106,10 @@ def _safe_isoformat(value: Union[str, datetime, None]) -> Optional[str]:
     """
     if value is None:
         return None
-    
+
     if isinstance(value, datetime):
         return value.isoformat()
-    
+
     if isinstance(value, str):
         try:
             # Try to parse the string as datetime and convert back to ISO format
@@ -31,7 +118,7 @@ def _safe_isoformat(value: Union[str, datetime, None]) -> Optional[str]:
         except (ValueError, AttributeError):
             # If parsing fails, return the string as-is (assuming it's already ISO format)
             return value
-    
+
     return None
 
 
@@ -43,13 +130,19 @@ def build_raw_instrument_response(raw_data: Dict[str, Any]) -> Dict[str, Any]:
     return normalize_base_fields(raw_data)
 
 
-def build_instrument_response(instrument, include_rich_details: bool = True) -> Dict[str, Any]:
+def build_instrument_response(
+    instrument,
+    include_rich_details: bool = True,
+    venue_displays: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
     """
     Build complete instrument response with type-specific formatting.
     
     Args:
         instrument: SQLAlchemy Instrument model instance
         include_rich_details: Whether to include enriched data
+        venue_displays: Pre-resolved primary venue displays (see resolve_venue_displays);
+            when omitted the primary venue is looked up individually
         
     Returns:
         dict: Complete normalized response with type-specific attributes
@@ -62,7 +155,7 @@ def build_instrument_response(instrument, include_rich_details: bool = True) ->
     
     if include_rich_details:
         # Add enriched data
-        response.update(_extract_rich_data(instrument, raw_data))
+        response.update(_extract_rich_data(instrument, raw_data, venue_displays))
         
         # Add type-specific attributes based on instrument type
         response.update(_build_type_specific_attributes(instrument, raw_data))
@@ -70,13 +163,17 @@ def build_instrument_response(instrument, include_rich_details: bool = True) ->
     return response
 
 
-def build_detailed_instrument_response(instrument) -> Dict[str, Any]:
+def build_detailed_instrument_response(
+    instrument, venue_displays: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Dict[str, Any]:
     """
     Build detailed response for single instrument endpoint (/api/v1/instruments/{isin}).
     Includes all available data formatted for the specific instrument type.
     """
     # Get base response with rich details
-    response = build_instrument_response(instrument, include_rich_details=True)
+    response = build_instrument_response(
+        instrument, include_rich_details=True, venue_displays=venue_displays
+    )
     
     # Add type-specific detailed sections
     instrument_type = instrument.instrument_type
@@ -144,7 +241,10 @@ def normalize_base_fields(raw_data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _extract_rich_data(instrument, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+def _extract_rich_data(
+    instrument, raw_data: Dict[str, Any],
+    venue_displays: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
     """Extract rich data like status indicators, FIGI mappings, legal entity info."""
     rich_data = {}
     
@@ -229,7 +329,10 @@ def _extract_rich_data(instrument, raw_data: Dict[str, Any]) -> Dict[str, Any]:
     # Primary venue display with MIC lookup
     relevant_venue = raw_data.get('relevant_trading_venue')
     if relevant_venue:
-        rich_data["primary_venue_display"] = _format_primary_venue_display(relevant_venue)
+        if venue_displays is not None and relevant_venue in venue_displays:
+            rich_data["primary_venue_display"] = venue_displays[relevant_venue]
+        else:
+            rich_data["primary_venue_display"] = _format_primary_venue_display(relevant_venue)
     
     return rich_data
 
@@ -1591,32 +1694,26 @@ def _build_option_detailed_response(instrument, base_response: Dict) -> Dict:
     }
 
 
-def _format_primary_venue_display(mic_code: str) -> Dict[str, Any]:
-    """Format primary venue with MIC lookup."""
-    try:
-        from ...database.session import get_session
-        from ...models.sqlite.market_identification_code import MarketIdentificationCode
-        
-        with get_session() as session:
-            mic_data = session.query(MarketIdentificationCode).filter(
-                MarketIdentificationCode.mic == mic_code
-            ).first()
-            
-            if mic_data:
-                return {
-                    "mic_code": mic_code,
-                    "market_name": mic_data.market_name,
-                    "country_code": mic_data.iso_country_code,
-                    "status": mic_data.status.value if mic_data.status else None,
-                    "formatted": f"{mic_code} ({mic_data.market_name})"
-                }
-    except Exception:
-        pass
-    
+def _build_venue_display(mic_code: str, mic_record) -> Dict[str, Any]:
+    """Build the primary venue display for a MIC reference record (or an unknown MIC)."""
+    if mic_record:
+        return {
+            "mic_code": mic_code,
+            "market_name": mic_record["market_name"],
+            "country_code": mic_record["iso_country_code"],
+            "status": mic_record["status"],
+            "formatted": f"{mic_code} ({mic_record['market_name']})"
+        }
+
     return {
         "mic_code": mic_code,
         "market_name": "Unknown",
         "country_code": None,
         "status": None,
         "formatted": mic_code
-    }
\ No newline at end of file
+    }
+
+
+def _format_primary_venue_display(mic_code: str) -> Dict[str, Any]:
+    """Format primary venue with MIC lookup."""
+    return resolve_venue_displays([mic_code])[mic_code]
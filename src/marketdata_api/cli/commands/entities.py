@@ -5,6 +5,7 @@ import click
 from rich.panel import Panel
 from rich.table import Table
 
+from ...constants import ServiceDefaults
 from ..core.utils import console, handle_database_error
 
 
@@ -204,6 +205,62 @@ def get_remote(ctx, lei, include_relationships):
             traceback.print_exc()
 
 
+@entities.command("hierarchy")
+@click.argument("lei")
+@click.option(
+    "--max-depth",
+    default=ServiceDefaults.HIERARCHY_DEFAULT_DEPTH,
+    type=click.IntRange(1, ServiceDefaults.HIERARCHY_MAX_DEPTH),
+    help="Maximum levels below the entity",
+)
+@click.option(
+    "--type", "relationship_type", default="DIRECT",
+    type=click.Choice(["DIRECT", "ULTIMATE"], case_sensitive=False), help="Relationship type to follow",
+)
+@click.option("--include-inactive", is_flag=True, help="Also follow inactive relationships")
+@click.pass_context
+@handle_database_error
+def hierarchy(ctx, lei, max_depth, relationship_type, include_inactive):
+    """Show the stored corporate tree below an entity"""
+    try:
+        from rich.tree import Tree
+
+        from marketdata_api.services.core.legal_entity_service import LegalEntityService
+
+        with console.status(f"[bold green]Building hierarchy for {lei}..."):
+            result = LegalEntityService().get_hierarchy(
+                lei.upper(), max_depth, relationship_type, include_inactive
+            )
+
+        if not result:
+            console.print(f"[red]❌ Legal entity not found: {lei}[/red]")
+            return
+
+        def label(node):
+            name = node["name"] or "[dim]not stored[/dim]"
+            return f"[cyan]{node['lei']}[/cyan] {name} [magenta]{node['jurisdiction'] or ''}[/magenta]"
+
+        def add_children(branch, node):
+            for child in node["children"]:
+                add_children(branch.add(label(child)), child)
+
+        tree = Tree(label(result["hierarchy"]))
+        add_children(tree, result["hierarchy"])
+        console.print(tree)
+        console.print(
+            f"\n[dim]{result['total_entities']} entities, {result['max_depth']} levels deep "
+            f"({relationship_type.upper()} relationships)[/dim]"
+        )
+
+    except ValueError as e:
+        console.print(f"[red]❌ {str(e)}[/red]")
+    except Exception as e:
+        console.print(f"[red]❌ Error: {str(e)}[/red]")
+        if ctx.obj.get("verbose"):
+            import traceback
+            traceback.print_exc()
+
+
 def _validate_lei_format(lei):
     """Validate LEI format (20 characters)"""
     return lei and len(lei) == 20 and lei.isalnum()
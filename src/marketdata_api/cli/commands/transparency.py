@@ -548,9 +548,15 @@ def _display_calculation_details(calculation, index):
     default=True,
     help="Skip instruments that already have transparency data",
 )
+@click.option(
+    "--workers",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Worker processes for concurrent asset type extraction (1 = sequential)",
+)
 @click.pass_context
 @handle_database_error
-def bulk_create(ctx, limit, batch_size, skip_existing):
+def bulk_create(ctx, limit, batch_size, skip_existing, workers):
     """Create transparency calculations in bulk for instruments without them"""
     try:
         from marketdata_api.services.core.transparency_service import TransparencyService
@@ -562,11 +568,12 @@ def bulk_create(ctx, limit, batch_size, skip_existing):
         console.print(f"  Limit: [yellow]{limit or 'No limit'}[/yellow]")
         console.print(f"  Batch size: [yellow]{batch_size}[/yellow]")
         console.print(f"  Skip existing: [yellow]{skip_existing}[/yellow]")
+        console.print(f"  Workers: [yellow]{workers}[/yellow]")
         console.print()
 
         with console.status("[bold green]Processing bulk transparency creation..."):
             results = service.create_transparency_bulk(
-                limit=limit, batch_size=batch_size, skip_existing=skip_existing
+                limit=limit, batch_size=batch_size, skip_existing=skip_existing, workers=workers
             )
 
         # Display results
@@ -606,19 +613,19 @@ def bulk_create(ctx, limit, batch_size, skip_existing):
 
         console.print(summary_table)
 
-        # Show batch details if verbose
-        if ctx.obj.get("verbose") and results["batch_results"]:
+        # Show asset type details if verbose
+        if ctx.obj.get("verbose") and results["asset_type_results"]:
             console.print()
-            batch_table = Table(title="Batch Results")
-            batch_table.add_column("Batch", style="cyan")
+            batch_table = Table(title="Asset Type Results")
+            batch_table.add_column("Asset Type", style="cyan")
             batch_table.add_column("Processed", style="green")
             batch_table.add_column("Created", style="blue")
             batch_table.add_column("Failed", style="red")
             batch_table.add_column("Time", style="yellow")
 
-            for idx, batch in enumerate(results["batch_results"], 1):
+            for batch in results["asset_type_results"]:
                 batch_table.add_row(
-                    str(idx),
+                    batch["asset_type"],
                     str(batch["processed"]),
                     str(batch["created_calculations"]),
                     str(batch["failed"]),
@@ -102,6 +102,25 @@ class Config:
         int(os.getenv("MAX_UPLOAD_SIZE", "500")) * 1024 * 1024
     )  # Convert MB to bytes
 
+    # Opt-in in-memory cache of GET responses keyed by route, query and data version.
+    # Data versions are process-local: with several processes writing (CLI
+    # ingests, other workers), bodies can be stale for up to the TTL
+    RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "false").lower() == "true"
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512"))
+    RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "300"))
+
+    # swagger.json is rendered once per process; clients may reuse it this long
+    OPENAPI_CACHE_SECONDS = int(os.getenv("OPENAPI_CACHE_SECONDS", "3600"))
+
+    # gzip/brotli compression of API responses at least this large
+    COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+    COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+    COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
+
+    # JSON encoder backend: auto (orjson, else msgspec, else stdlib), orjson, msgspec or stdlib
+    JSON_SERIALIZER = os.getenv("JSON_SERIALIZER", "auto")
+
 
 class esmaConfig:
     # Use environment variables with fallback defaults
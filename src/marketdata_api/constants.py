@@ -9,6 +9,8 @@ Centralizes hardcoded values, HTTP status codes, default values, and error messa
 class HTTPStatus:
     OK = 200
     CREATED = 201
+    NO_CONTENT = 204
+    NOT_MODIFIED = 304
     BAD_REQUEST = 400
     UNAUTHORIZED = 401
     FORBIDDEN = 403
@@ -27,6 +29,30 @@ class Pagination:
     MAX_BATCH_SIZE = 100
 
 
+# Total count modes for list endpoints
+class CountModes:
+    NONE = "none"
+    ESTIMATE = "estimate"
+    EXACT = "exact"
+    VALID_MODES = [NONE, ESTIMATE, EXACT]
+
+
+# Response projections for list endpoints (?view=)
+class ResponseViews:
+    COMPACT = "compact"
+    STANDARD = "standard"
+    FULL = "full"
+    VALID_VIEWS = [COMPACT, STANDARD, FULL]
+
+
+# Streaming export formats
+class ExportFormats:
+    NDJSON = "ndjson"
+    CSV = "csv"
+    VALID_FORMATS = [NDJSON, CSV]
+    MIMETYPES = {NDJSON: "application/x-ndjson", CSV: "text/csv"}
+
+
 # API Version and Info
 class API:
     VERSION = "1.0"
@@ -46,6 +72,7 @@ class ErrorMessages:
     NO_DATA_PROVIDED = "No data provided"
     INSTRUMENT_NOT_FOUND = "Instrument not found"
     ENTITY_NOT_FOUND = "Legal entity not found"
+    TRANSPARENCY_NOT_FOUND = "No transparency data found"
     SCHEMA_NOT_FOUND = "Schema not found"
     DATABASE_ERROR = "A database error occurred"
     INVALID_BATCH_OPERATION = (
@@ -62,6 +89,8 @@ class ErrorMessages:
     NO_FILE_PROVIDED = "No file provided"
     FILE_EMPTY = "File is empty"
     NO_FILTERS_PROVIDED = "No filters provided"
+    INVALID_REQUEST_BODY = "Invalid request body"
+    INTERNAL_SERVER_ERROR = "Internal server error"
 
     # LEI/GLEIF specific
     LEI_CODE_REQUIRED = "LEI code is required"
@@ -108,6 +137,7 @@ class ResponseFields:
     PAGE = "page"
     PER_PAGE = "per_page"
     TOTAL = "total"
+    NEXT_CURSOR = "next_cursor"
 
     # Batch operation fields
     OPERATION = "operation"
@@ -152,6 +182,10 @@ class QueryParams:
     OFFSET = "offset"
     PAGE = "page"
     PER_PAGE = "per_page"
+    CURSOR = "cursor"
+    COUNT = "count"
+    FIELDS = "fields"
+    VIEW = "view"
     STATUS = "status"
     JURISDICTION = "jurisdiction"
     VERSION = "version"
@@ -161,6 +195,7 @@ class QueryParams:
     FILTERS = "filters"
     DATE = "date"
     FILE_PREFIX = "file_prefix"
+    THRESHOLD = "threshold"
 
 
 # Form Fields
@@ -220,6 +255,40 @@ class FirdsFieldMappings:
     }
 
 
+# FITRS Column Normalisation
+class FitrsColumns:
+    """Canonical key and typed columns applied to FITRS data at ingest time."""
+
+    # Canonical key column (FULNCR files key on 'ISIN', FULECR files on 'Id')
+    KEY = "isin"
+    SOURCE_KEYS = ("ISIN", "Id")
+
+    # Statistics published as numbers (repeated fields carry a _2, _3 ... suffix)
+    NUMERIC_FIELDS = (
+        "TtlNbOfTxsExctd",
+        "TtlVolOfTxsExctd",
+        "AvrgDalyTrnvr",
+        "AvrgDalyNbOfTxs",
+        "AvrgTxVal",
+        "LrgInScale",
+        "StdMktSz",
+    )
+    # Threshold amounts/numbers are flattened as <Parent>_Amt / <Parent>_Nb
+    NUMERIC_SUFFIXES = ("_Amt", "_Nb")
+
+    DATE_FIELDS = ("FrDt", "ToDt")
+
+    REPEAT_SUFFIX_PATTERN = r"_\d+$"
+
+    # Field values read back as missing (pandas' default NA tokens), for full-file and indexed reads alike
+    NA_VALUES = frozenset(
+        {
+            "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+            "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+        }
+    )
+
+
 # External API Configuration
 class ExternalAPIs:
     """External API endpoints and base URLs."""
@@ -278,10 +347,47 @@ class ServiceDefaults:
     
     # Transparency service specific
     TRANSPARENCY_BATCH_SIZE = 10
+    TRANSPARENCY_BULK_WORKERS = 1  # 1 = process asset types sequentially
     
     # File processing
     FILE_PROCESSING_CHUNK_SIZE = 1000
 
+    # List endpoint total count cache
+    COUNT_CACHE_TTL_SECONDS = 300
+    COUNT_CACHE_MAX_ENTRIES = 1024
+
+    # Streaming exports: rows fetched per server-side cursor batch
+    EXPORT_BATCH_SIZE = 1000
+
+    # Instrument typeahead (/instruments/search)
+    TYPEAHEAD_DEFAULT_LIMIT = 10
+    TYPEAHEAD_MAX_LIMIT = 50
+    TYPEAHEAD_REFRESH_SECONDS = 600
+
+    # Instrument existence checks (POST /instruments/exists)
+    EXISTS_MAX_IDENTIFIERS = 100000
+    MEMBERSHIP_REFRESH_SECONDS = 600
+    MEMBERSHIP_MAX_PATCHES = 50000  # Written ISINs overlaid on the index before a background rebuild
+
+    # Name search (legal entities, MICs, venues)
+    NAME_SEARCH_THRESHOLD = 0.3  # Minimum match score (0-1) for fuzzy matches
+    NAME_SEARCH_MAX_RESULTS = 500  # Ranked matches kept per search
+    NAME_SEARCH_FUZZY_CANDIDATES = 200  # Trigram index candidates re-scored per fuzzy search
+
+    # Multi-get lookups (POST .../lookup)
+    LOOKUP_MAX_IDENTIFIERS = 5000
+    LOOKUP_CHUNK_SIZE = 500  # Identifiers per IN query, well below SQL Server's 2100 parameters
+
+    # Materialised statistics (/stats endpoints): rebuilt at least this often
+    STATISTICS_REFRESH_SECONDS = 600
+
+    # Instrument facets (/instruments/facets): values returned per facet, by count
+    FACET_MAX_VALUES = 50
+
+    # Corporate hierarchy (/relationships/hierarchy): levels below the root
+    HIERARCHY_DEFAULT_DEPTH = 10
+    HIERARCHY_MAX_DEPTH = 50  # Well below SQL Server's default MAXRECURSION of 100
+
 
 # Business Logic Constants
 class BusinessConstants:
@@ -0,0 +1,101 @@
+"""
+Per-table data version counters.
+
+Every committed ORM write bumps a process-local counter for each table it
+touched. Read-side caches key their entries on these counters, so any write
+to a table implicitly invalidates everything derived from it without the
+write paths having to know which caches exist.
+
+Writes are detected through SQLAlchemy session events:
+- unit-of-work flushes (session.add / delete / attribute changes)
+- ORM-enabled bulk statements (session.execute(insert/update/delete(...)))
+
+Textual SQL executed directly on a connection is not tracked; callers doing
+that should call bump() themselves.
+
+Alongside the counters, the time of each table's last bump is kept so HTTP
+responses can report Last-Modified. Tables not written since startup report
+the process start time from last_modified(), and None from last_written().
+"""
+
+import logging
+import threading
+from datetime import UTC, datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "_data_version_pending_tables"
+
+_lock = threading.Lock()
+_versions: Dict[str, int] = {}
+_modified_at: Dict[str, datetime] = {}
+_started_at = datetime.now(UTC).replace(microsecond=0)
+
+
+def bump(*tables: str) -> None:
+    """Advance the version of one or more tables."""
+    now = datetime.now(UTC).replace(microsecond=0)
+    with _lock:
+        for table in tables:
+            _versions[table] = _versions.get(table, 0) + 1
+            _modified_at[table] = now
+    logger.debug(f"Data version bumped for tables: {', '.join(tables)}")
+
+
+def get_version(*tables: str) -> Tuple[int, ...]:
+    """Return the current versions of the given tables, in order."""
+    with _lock:
+        return tuple(_versions.get(table, 0) for table in tables)
+
+
+def last_modified(*tables: str) -> datetime:
+    """Return the latest modification time across the given tables."""
+    with _lock:
+        return max((_modified_at.get(table, _started_at) for table in tables), default=_started_at)
+
+
+def last_written(*tables: str) -> Optional[datetime]:
+    """Return the latest write made by this process across the given tables, or None."""
+    with _lock:
+        return max((_modified_at[table] for table in tables if table in _modified_at), default=None)
+
+
+def _pending(session: Session) -> set:
+    return session.info.setdefault(_PENDING_KEY, set())
+
+
+def _tables_for(instances: Iterable[object]) -> set:
+    tables = set()
+    for instance in instances:
+        for table in inspect(instance).mapper.tables:
+            tables.add(table.name)
+    return tables
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session, flush_context):
+    _pending(session).update(_tables_for(list(session.new) + list(session.dirty) + list(session.deleted)))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_statement_tables(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None and getattr(table, "name", None):
+            _pending(orm_execute_state.session).add(table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed_tables(session):
+    tables = session.info.pop(_PENDING_KEY, None)
+    if tables:
+        bump(*sorted(tables))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_tables(session):
+    session.info.pop(_PENDING_KEY, None)
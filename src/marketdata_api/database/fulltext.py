@@ -0,0 +1,537 @@
+"""
+Full-text search indexes.
+
+Instrument search covers ISIN, full and short name, LEI and issuer name:
+
+- SQLite: an FTS5 virtual table (instruments_fts) keyed by instruments.rowid,
+  kept in sync by triggers on instruments and legal_entities.
+- SQL Server: full-text indexes on instruments and legal_entities in the
+  marketdata_catalog catalog, kept in sync by CHANGE_TRACKING AUTO.
+
+Legal entity name search reuses the legal_entities index on SQL Server. On
+SQLite it has its own FTS5 table (legal_entities_fts) plus a
+trigram-tokenised side table (legal_entities_trigram) used to find
+candidates for fuzzy, typo-tolerant matches when no name token matches.
+
+User input is tokenised into ranked prefix queries ("volvo b" matches
+"Volvo AB ser. B"); ranks come from bm25() on SQLite and RANK on SQL Server.
+Callers fall back to ILIKE when no index exists (e.g. a database created
+before the index was introduced and not yet initialized again).
+
+The name scoring helpers at the end (name_tokens, score_name) define the
+0-1 match score shared by the database fuzzy search and the in-memory MIC
+name index: an exact token scores 1, a token prefix 0.5-1 depending on how
+much of the token it covers, anything else its trigram similarity.
+"""
+
+import logging
+import re
+import threading
+import unicodedata
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Integer, String, bindparam, case, false, literal, literal_column, select, table, text
+
+from ..constants import ServiceDefaults
+
+logger = logging.getLogger(__name__)
+
+INSTRUMENT_FTS_TABLE = "instruments_fts"
+LEGAL_ENTITY_FTS_TABLE = "legal_entities_fts"
+LEGAL_ENTITY_TRIGRAM_TABLE = "legal_entities_trigram"
+SQLSERVER_FULLTEXT_CATALOG = "marketdata_catalog"
+
+# bm25 column weights, in instruments_fts column order
+_SQLITE_INSTRUMENT_WEIGHTS = "10.0, 4.0, 6.0, 8.0, 2.0"  # isin, full_name, short_name, lei_id, issuer_name
+
+_SQLITE_INSTRUMENT_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {INSTRUMENT_FTS_TABLE} USING fts5(
+        isin, full_name, short_name, lei_id, issuer_name,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3 4'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS instruments_fts_insert AFTER INSERT ON instruments BEGIN
+        INSERT INTO {INSTRUMENT_FTS_TABLE} (rowid, isin, full_name, short_name, lei_id, issuer_name)
+        VALUES (new.rowid, new.isin, new.full_name, new.short_name, new.lei_id,
+                (SELECT name FROM legal_entities WHERE lei = new.lei_id));
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS instruments_fts_update
+    AFTER UPDATE OF isin, full_name, short_name, lei_id ON instruments BEGIN
+        DELETE FROM {INSTRUMENT_FTS_TABLE} WHERE rowid = old.rowid;
+        INSERT INTO {INSTRUMENT_FTS_TABLE} (rowid, isin, full_name, short_name, lei_id, issuer_name)
+        VALUES (new.rowid, new.isin, new.full_name, new.short_name, new.lei_id,
+                (SELECT name FROM legal_entities WHERE lei = new.lei_id));
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS instruments_fts_delete AFTER DELETE ON instruments BEGIN
+        DELETE FROM {INSTRUMENT_FTS_TABLE} WHERE rowid = old.rowid;
+    END
+    """,
+    # Issuers are often stored after the instruments that reference them
+    f"""
+    CREATE TRIGGER IF NOT EXISTS instruments_fts_issuer_insert AFTER INSERT ON legal_entities BEGIN
+        UPDATE {INSTRUMENT_FTS_TABLE} SET issuer_name = new.name
+        WHERE rowid IN (SELECT rowid FROM instruments WHERE lei_id = new.lei);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS instruments_fts_issuer_update AFTER UPDATE OF name ON legal_entities BEGIN
+        UPDATE {INSTRUMENT_FTS_TABLE} SET issuer_name = new.name
+        WHERE rowid IN (SELECT rowid FROM instruments WHERE lei_id = new.lei);
+    END
+    """,
+]
+
+_SQLITE_INSTRUMENT_BACKFILL = [
+    f"DELETE FROM {INSTRUMENT_FTS_TABLE}",
+    f"""
+    INSERT INTO {INSTRUMENT_FTS_TABLE} (rowid, isin, full_name, short_name, lei_id, issuer_name)
+    SELECT i.rowid, i.isin, i.full_name, i.short_name, i.lei_id, e.name
+    FROM instruments i LEFT JOIN legal_entities e ON e.lei = i.lei_id
+    """,
+]
+
+_SQLITE_LEGAL_ENTITY_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {LEGAL_ENTITY_FTS_TABLE} USING fts5(
+        name,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3 4'
+    )
+    """,
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {LEGAL_ENTITY_TRIGRAM_TABLE} USING fts5(
+        name,
+        tokenize = 'trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS legal_entities_fts_insert AFTER INSERT ON legal_entities BEGIN
+        INSERT INTO {LEGAL_ENTITY_FTS_TABLE} (rowid, name) VALUES (new.rowid, new.name);
+        INSERT INTO {LEGAL_ENTITY_TRIGRAM_TABLE} (rowid, name) VALUES (new.rowid, new.name);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS legal_entities_fts_update AFTER UPDATE OF name ON legal_entities BEGIN
+        DELETE FROM {LEGAL_ENTITY_FTS_TABLE} WHERE rowid = old.rowid;
+        DELETE FROM {LEGAL_ENTITY_TRIGRAM_TABLE} WHERE rowid = old.rowid;
+        INSERT INTO {LEGAL_ENTITY_FTS_TABLE} (rowid, name) VALUES (new.rowid, new.name);
+        INSERT INTO {LEGAL_ENTITY_TRIGRAM_TABLE} (rowid, name) VALUES (new.rowid, new.name);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS legal_entities_fts_delete AFTER DELETE ON legal_entities BEGIN
+        DELETE FROM {LEGAL_ENTITY_FTS_TABLE} WHERE rowid = old.rowid;
+        DELETE FROM {LEGAL_ENTITY_TRIGRAM_TABLE} WHERE rowid = old.rowid;
+    END
+    """,
+]
+
+_SQLITE_LEGAL_ENTITY_BACKFILL = [
+    f"DELETE FROM {LEGAL_ENTITY_FTS_TABLE}",
+    f"DELETE FROM {LEGAL_ENTITY_TRIGRAM_TABLE}",
+    f"INSERT INTO {LEGAL_ENTITY_FTS_TABLE} (rowid, name) SELECT rowid, name FROM legal_entities",
+    f"INSERT INTO {LEGAL_ENTITY_TRIGRAM_TABLE} (rowid, name) SELECT rowid, name FROM legal_entities",
+]
+
+# SQLite index name -> (DDL, backfill); the SQL Server indexes cover both
+_SQLITE_INDEXES = {
+    INSTRUMENT_FTS_TABLE: (_SQLITE_INSTRUMENT_DDL, _SQLITE_INSTRUMENT_BACKFILL),
+    LEGAL_ENTITY_FTS_TABLE: (_SQLITE_LEGAL_ENTITY_DDL, _SQLITE_LEGAL_ENTITY_BACKFILL),
+}
+
+# SQL Server tables whose full-text index each search needs
+_SQLSERVER_INDEX_TABLES = {
+    INSTRUMENT_FTS_TABLE: ("instruments", "legal_entities"),
+    LEGAL_ENTITY_FTS_TABLE: ("legal_entities",),
+}
+
+_SQLSERVER_FULLTEXT_COLUMNS = {
+    "instruments": "isin, full_name, short_name, lei_id",
+    "legal_entities": "name",
+}
+
+_availability: Dict[Tuple[str, str], bool] = {}
+_availability_lock = threading.Lock()
+
+
+def _tokens(term: str) -> List[str]:
+    return re.findall(r"\w+", term or "", flags=re.UNICODE)
+
+
+def build_match_query(term: str, dialect: str) -> Optional[str]:
+    """
+    Turn free text into a prefix match expression for the dialect.
+
+    Returns None when the text contains no searchable tokens.
+    """
+    tokens = _tokens(term)
+    if not tokens:
+        return None
+    if dialect == "mssql":
+        return " AND ".join(f'"{token}*"' for token in tokens)
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def build_trigram_query(term: str) -> Optional[str]:
+    """
+    Turn free text into an OR of its trigrams for the SQLite trigram table.
+
+    Tokens shorter than three characters cannot be matched by trigrams and
+    are skipped; returns None when nothing is left.
+    """
+    trigrams = sorted({
+        token[i:i + 3]
+        for token in name_tokens(term)
+        for i in range(len(token) - 2)
+    })
+    if not trigrams:
+        return None
+    return " OR ".join(f'"{trigram}"' for trigram in trigrams)
+
+
+def _availability_key(bind, index: str) -> Tuple[str, str]:
+    return str(getattr(bind, "url", bind)), index
+
+
+def _ensure_fulltext(engine, index: str) -> bool:
+    """
+    Create a full-text index if it does not exist yet.
+
+    On SQLite a newly created index is backfilled from existing rows.
+
+    Returns:
+        True when the index is available afterwards
+    """
+    dialect = engine.dialect.name
+    try:
+        if dialect == "sqlite":
+            ddl, backfill = _SQLITE_INDEXES[index]
+            with engine.begin() as conn:
+                exists = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                    {"name": index},
+                ).first()
+                for statement in ddl:
+                    conn.execute(text(statement))
+                if not exists:
+                    for statement in backfill:
+                        conn.execute(text(statement))
+                    logger.info(f"Created and populated {index}")
+        elif dialect == "mssql":
+            # Full-text DDL cannot run inside a user transaction
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                conn.execute(
+                    text(
+                        f"IF NOT EXISTS (SELECT 1 FROM sys.fulltext_catalogs WHERE name = '{SQLSERVER_FULLTEXT_CATALOG}') "
+                        f"CREATE FULLTEXT CATALOG {SQLSERVER_FULLTEXT_CATALOG}"
+                    )
+                )
+                for table_name, columns in _SQLSERVER_FULLTEXT_COLUMNS.items():
+                    conn.execute(
+                        text(
+                            f"""
+                            IF NOT EXISTS (SELECT 1 FROM sys.fulltext_indexes WHERE object_id = OBJECT_ID('{table_name}'))
+                            BEGIN
+                                DECLARE @pk sysname = (
+                                    SELECT name FROM sys.indexes
+                                    WHERE object_id = OBJECT_ID('{table_name}') AND is_primary_key = 1
+                                );
+                                EXEC('CREATE FULLTEXT INDEX ON {table_name} ({columns}) KEY INDEX '
+                                     + QUOTENAME(@pk) + ' ON {SQLSERVER_FULLTEXT_CATALOG} WITH CHANGE_TRACKING AUTO');
+                            END
+                            """
+                        )
+                    )
+        else:
+            return False
+    except Exception as e:
+        logger.warning(f"Could not create full-text index {index} on {dialect}: {e}")
+        with _availability_lock:
+            _availability.pop(_availability_key(engine, index), None)
+        return False
+
+    with _availability_lock:
+        _availability[_availability_key(engine, index)] = True
+    return True
+
+
+def ensure_instrument_fulltext(engine) -> bool:
+    """Create the instrument full-text index if it does not exist yet."""
+    return _ensure_fulltext(engine, INSTRUMENT_FTS_TABLE)
+
+
+def ensure_legal_entity_fulltext(engine) -> bool:
+    """Create the legal entity name indexes if they do not exist yet."""
+    return _ensure_fulltext(engine, LEGAL_ENTITY_FTS_TABLE)
+
+
+def ensure_fulltext_indexes(engine) -> bool:
+    """Create all full-text indexes; True when every one of them is available."""
+    results = [ensure_instrument_fulltext(engine), ensure_legal_entity_fulltext(engine)]
+    return all(results)
+
+
+def rebuild_instrument_fulltext(engine) -> None:
+    """Repopulate the full-text indexes from the base tables."""
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as conn:
+            for _, backfill in _SQLITE_INDEXES.values():
+                for statement in backfill:
+                    conn.execute(text(statement))
+    elif engine.dialect.name == "mssql":
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            for table_name in _SQLSERVER_FULLTEXT_COLUMNS:
+                conn.execute(text(f"ALTER FULLTEXT INDEX ON {table_name} START FULL POPULATION"))
+    logger.info("Full-text index rebuild started")
+
+
+def fulltext_available(session, index: str = INSTRUMENT_FTS_TABLE) -> bool:
+    """Whether a full-text index exists for the session's database (cached)."""
+    bind = session.get_bind()
+    key = _availability_key(bind, index)
+    with _availability_lock:
+        if key in _availability:
+            return _availability[key]
+
+    dialect = bind.dialect.name
+    try:
+        if dialect == "sqlite":
+            available = session.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": index},
+            ).first() is not None
+        elif dialect == "mssql":
+            table_names = _SQLSERVER_INDEX_TABLES[index]
+            object_ids = ", ".join(f"OBJECT_ID('{table_name}')" for table_name in table_names)
+            available = session.execute(
+                text(f"SELECT COUNT(*) FROM sys.fulltext_indexes WHERE object_id IN ({object_ids})")
+            ).scalar() == len(table_names)
+        else:
+            available = False
+    except Exception as e:
+        logger.warning(f"Could not check full-text index availability: {e}")
+        available = False
+
+    with _availability_lock:
+        _availability[key] = available
+    return available
+
+
+def match_instruments(query, instrument_model, term: str) -> Optional[Tuple[Any, Any]]:
+    """
+    Restrict an instrument query to full-text matches of a search term.
+
+    Args:
+        query: ORM query selecting from the instrument model
+        instrument_model: Instrument model class
+        term: Free-text search input
+
+    Returns:
+        (query, rank) where ordering by rank ascending puts the best match
+        first, or None when no full-text index is available or the term has
+        no searchable tokens (the caller should fall back to ILIKE)
+    """
+    session = query.session
+    if not fulltext_available(session):
+        return None
+
+    dialect = session.get_bind().dialect.name
+    match = build_match_query(term, dialect)
+    if match is None:
+        return None
+
+    if dialect == "sqlite":
+        fts = (
+            select(
+                literal_column("rowid").label("instrument_rowid"),
+                literal_column(
+                    f"bm25({INSTRUMENT_FTS_TABLE}, {_SQLITE_INSTRUMENT_WEIGHTS})"
+                ).label("rank"),
+            )
+            .select_from(table(INSTRUMENT_FTS_TABLE))
+            .where(literal_column(INSTRUMENT_FTS_TABLE).op("MATCH")(bindparam("fts_match", match)))
+            .subquery("fts")
+        )
+        instrument_rowid = literal_column(f"{instrument_model.__table__.name}.rowid")
+        return query.join(fts, fts.c.instrument_rowid == instrument_rowid), fts.c.rank
+
+    fts = (
+        text(
+            """
+            SELECT ft.instrument_id, MAX(ft.match_rank) AS rank FROM (
+                SELECT ct.[KEY] AS instrument_id, ct.RANK AS match_rank
+                FROM CONTAINSTABLE(instruments, (isin, full_name, short_name, lei_id), :fts_match) ct
+                UNION ALL
+                SELECT i.id, ct.RANK
+                FROM CONTAINSTABLE(legal_entities, name, :fts_match) ct
+                JOIN instruments i ON i.lei_id = ct.[KEY]
+            ) ft
+            GROUP BY ft.instrument_id
+            """
+        )
+        .bindparams(fts_match=match)
+        .columns(instrument_id=String, rank=Integer)
+        .subquery("fts")
+    )
+    # Higher RANK is better on SQL Server
+    return query.join(fts, fts.c.instrument_id == instrument_model.id), -fts.c.rank
+
+
+def match_legal_entities(
+    query,
+    legal_entity_model,
+    term: str,
+    threshold: float = ServiceDefaults.NAME_SEARCH_THRESHOLD,
+) -> Optional[Tuple[Any, Any]]:
+    """
+    Restrict a legal entity query to name matches of a search term.
+
+    Entities whose name tokens start with every search token are ranked by
+    the full-text index. When there are none (e.g. a typo), candidates
+    sharing trigrams with the term are re-scored with score_name and those
+    scoring at least threshold are returned best first. The fuzzy fallback
+    needs the SQLite trigram table; on SQL Server only prefix matches apply.
+
+    Args:
+        query: ORM query selecting from the legal entity model, other filters applied
+        legal_entity_model: LegalEntity model class
+        term: Free-text name search input
+        threshold: Minimum score (0-1) of fuzzy matches
+
+    Returns:
+        (query, rank) where ordering by rank ascending puts the best match
+        first, or None when no full-text index is available or the term has
+        no searchable tokens (the caller should fall back to ILIKE)
+    """
+    session = query.session
+    if not fulltext_available(session, LEGAL_ENTITY_FTS_TABLE):
+        return None
+
+    dialect = session.get_bind().dialect.name
+    match = build_match_query(term, dialect)
+    if match is None:
+        return None
+
+    if dialect == "mssql":
+        fts = (
+            text("SELECT ct.[KEY] AS lei, ct.RANK AS rank FROM CONTAINSTABLE(legal_entities, name, :fts_match) ct")
+            .bindparams(fts_match=match)
+            .columns(lei=String, rank=Integer)
+            .subquery("fts")
+        )
+        # Higher RANK is better on SQL Server
+        return query.join(fts, fts.c.lei == legal_entity_model.lei), -fts.c.rank
+
+    fts = (
+        select(
+            literal_column("rowid").label("entity_rowid"),
+            literal_column(f"bm25({LEGAL_ENTITY_FTS_TABLE})").label("rank"),
+        )
+        .select_from(table(LEGAL_ENTITY_FTS_TABLE))
+        .where(literal_column(LEGAL_ENTITY_FTS_TABLE).op("MATCH")(bindparam("fts_match", match)))
+        .subquery("fts")
+    )
+    entity_rowid = literal_column(f"{legal_entity_model.__table__.name}.rowid")
+    matched = query.join(fts, fts.c.entity_rowid == entity_rowid)
+    if session.query(matched.exists()).scalar():
+        return matched, fts.c.rank
+
+    return _fuzzy_match_legal_entities(query, legal_entity_model, term, threshold)
+
+
+def _fuzzy_match_legal_entities(query, legal_entity_model, term: str, threshold: float) -> Tuple[Any, Any]:
+    """Trigram candidates re-scored in Python; the result is an IN list ranked by score."""
+    trigram_match = build_trigram_query(term)
+    if trigram_match is None:
+        return query.filter(false()), literal(0)
+
+    table_name = legal_entity_model.__table__.name
+    candidates = query.session.execute(
+        text(
+            f"""
+            SELECT e.lei, e.name FROM {LEGAL_ENTITY_TRIGRAM_TABLE} t
+            JOIN {table_name} e ON e.rowid = t.rowid
+            WHERE {LEGAL_ENTITY_TRIGRAM_TABLE} MATCH :trigram_match
+            ORDER BY bm25({LEGAL_ENTITY_TRIGRAM_TABLE})
+            LIMIT :candidates
+            """
+        ),
+        {"trigram_match": trigram_match, "candidates": ServiceDefaults.NAME_SEARCH_FUZZY_CANDIDATES},
+    ).all()
+
+    query_tokens = name_tokens(term)
+    scored = sorted(
+        (
+            (score, lei)
+            for score, lei in ((score_name(query_tokens, name), lei) for lei, name in candidates)
+            if score >= threshold
+        ),
+        key=lambda item: (-item[0], item[1]),
+    )
+    if not scored:
+        return query.filter(false()), literal(0)
+
+    leis = [lei for _, lei in scored]
+    rank = case({lei: position for position, lei in enumerate(leis)}, value=legal_entity_model.lei)
+    return query.filter(legal_entity_model.lei.in_(leis)), rank
+
+
+def normalize_name(value: Optional[str]) -> str:
+    """Case-fold and strip diacritics so 'Société' and 'SOCIETE' compare equal."""
+    decomposed = unicodedata.normalize("NFKD", value or "")
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+
+def name_tokens(value: Optional[str]) -> List[str]:
+    return _tokens(normalize_name(value))
+
+
+def token_trigrams(token: str) -> FrozenSet[str]:
+    """Trigrams of a token padded like pg_trgm ('  ab ' -> '  a', ' ab', 'ab ')."""
+    padded = f"  {token} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def trigram_similarity(a: str, b: str) -> float:
+    """Jaccard similarity of two tokens' trigram sets."""
+    trigrams_a, trigrams_b = token_trigrams(a), token_trigrams(b)
+    return len(trigrams_a & trigrams_b) / len(trigrams_a | trigrams_b)
+
+
+def score_tokens(query_tokens: Sequence[str], candidate_tokens: Sequence[str]) -> float:
+    """
+    Score (0-1) how well a candidate's tokens match the query tokens.
+
+    Each query token takes its best match among the candidate tokens: 1 for
+    an equal token, 0.5-1 for a prefix (by the share of the token it covers)
+    and the trigram similarity otherwise. The score is the mean over query
+    tokens.
+    """
+    if not query_tokens or not candidate_tokens:
+        return 0.0
+
+    total = 0.0
+    for query_token in query_tokens:
+        best = 0.0
+        for token in candidate_tokens:
+            if token == query_token:
+                best = 1.0
+                break
+            if token.startswith(query_token):
+                score = 0.5 + 0.5 * len(query_token) / len(token)
+            else:
+                score = trigram_similarity(query_token, token)
+            best = max(best, score)
+        total += best
+    return total / len(query_tokens)
+
+
+def score_name(query_tokens: Sequence[str], name: Optional[str]) -> float:
+    return score_tokens(query_tokens, name_tokens(name))
@@ -10,6 +10,7 @@ import os
 from sqlalchemy import inspect, text
 
 from ..config import DatabaseConfig
+from .fulltext import ensure_fulltext_indexes
 
 logger = logging.getLogger(__name__)
 
@@ -123,6 +124,7 @@ def init_database(force_recreate=False):
             logger.info("Database exists, verifying tables...")
             if verify_tables():
                 logger.info("Database structure is valid")
+                ensure_fulltext_indexes(engine)
                 return True
             else:
                 logger.warning(
@@ -133,6 +135,7 @@ def init_database(force_recreate=False):
         # Create all tables using factory
         db.init_db()
         logger.info("Created new database with all tables via factory")
+        ensure_fulltext_indexes(engine)
         return True
 
     except Exception as e:
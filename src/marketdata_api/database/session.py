@@ -12,6 +12,7 @@ from typing import Generator
 from sqlalchemy.orm import Session, sessionmaker
 
 from ..config import DatabaseConfig
+from . import data_version  # noqa: F401 - registers write tracking on all sessions
 
 logger = logging.getLogger(__name__)
 
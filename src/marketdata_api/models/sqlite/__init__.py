@@ -12,6 +12,7 @@ from .legal_entity import (
     LegalEntity,
 )
 from .market_identification_code import MarketIdentificationCode
+from .statistics import DataStatistics
 from .transparency import TransparencyCalculation
 
 # Export all models
@@ -27,4 +28,5 @@ __all__ = [
     "MarketIdentificationCode",
     "Instrument",
     "TradingVenue",
+    "DataStatistics",
 ]
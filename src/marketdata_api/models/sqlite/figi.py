@@ -1,7 +1,7 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String
 from sqlalchemy.orm import relationship
 
 from .base_model import Base
@@ -9,7 +9,14 @@ from .base_model import Base
 
 class FigiMapping(Base):
     __tablename__ = "figi_mappings"
-    __table_args__ = {"extend_existing": True}  # Allow table redefinition
+    __table_args__ = (
+        # Reverse lookups (FIGI -> ISIN, ticker -> instruments); figi has its unique index
+        Index("idx_figi_composite_figi", "composite_figi"),
+        Index("idx_figi_share_class_figi", "share_class_figi"),
+        Index("idx_figi_ticker_exchange", "ticker", "exchange_code"),
+        Index("idx_figi_isin", "isin"),
+        {"extend_existing": True},
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     isin = Column(
@@ -21,6 +28,7 @@ class FigiMapping(Base):
     composite_figi = Column(String(12))
     share_class_figi = Column(String(12))
     ticker = Column(String(20))
+    exchange_code = Column(String(10))  # OpenFIGI exchCode
     security_type = Column(String(50))
     market_sector = Column(String(50))
     security_description = Column(String(255))
@@ -330,6 +330,9 @@ class EntityRelationship(Base):
 
     __table_args__ = (
         Index("idx_parent_child", "parent_lei", "child_lei", "relationship_type", unique=True),
+        # Relationship listings filter one side by LEI, then by type and status
+        Index("idx_relationship_parent", "parent_lei", "relationship_type", "relationship_status"),
+        Index("idx_relationship_child", "child_lei", "relationship_type", "relationship_status"),
         CheckConstraint(
             'relationship_type IN ("DIRECT", "ULTIMATE")', name="ck_relationship_type_values"
         ),
@@ -0,0 +1,22 @@
+"""
+Materialised statistics.
+
+One row per statistics group (instruments, venues, legal_entities) holding
+the precomputed figures served by the stats endpoints, so polling them does
+not scan the large tables. Rows are written by
+services.utils.statistics.StatisticsStore.
+"""
+
+from sqlalchemy import Column, DateTime, Integer, String, Text
+
+from .base_model import Base
+
+
+class DataStatistics(Base):
+    __tablename__ = "data_statistics"
+    __table_args__ = {"extend_existing": True}
+
+    name = Column(String(50), primary_key=True)  # Statistics group
+    payload = Column(Text, nullable=False, default="{}")  # Figures as JSON text
+    computed_at = Column(DateTime, nullable=False)  # UTC start of the computation
+    duration_ms = Column(Integer)  # Time the rebuild took
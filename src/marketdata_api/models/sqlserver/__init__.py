@@ -6,6 +6,7 @@ from .legal_entity import SqlServerLegalEntity, SqlServerEntityAddress, SqlServe
 from .figi import SqlServerFigiMapping
 from .transparency import SqlServerTransparencyCalculation
 from .market_identification_code import SqlServerMarketIdentificationCode
+from .statistics import SqlServerDataStatistics
 from .auth import User as SqlServerUser, Role as SqlServerRole, Permission as SqlServerPermission
 
 __all__ = [
@@ -20,6 +21,7 @@ __all__ = [
     "SqlServerFigiMapping",
     "SqlServerTransparencyCalculation",
     "SqlServerMarketIdentificationCode",
+    "SqlServerDataStatistics",
     "SqlServerUser",
     "SqlServerRole",
     "SqlServerPermission",
@@ -3,7 +3,7 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String
 from sqlalchemy.orm import relationship
 
 from .base_model import SqlServerBaseModel
@@ -13,7 +13,13 @@ class SqlServerFigiMapping(SqlServerBaseModel):
     """SQL Server FIGI mapping model - EXACT match to SQLite FigiMapping."""
     
     __tablename__ = "figi_mappings"
-    __table_args__ = {}  # Allow table redefinition, like SQLite
+    __table_args__ = (
+        # Reverse lookups (FIGI -> ISIN, ticker -> instruments); figi has its unique index
+        Index("idx_figi_composite_figi", "composite_figi"),
+        Index("idx_figi_share_class_figi", "share_class_figi"),
+        Index("idx_figi_ticker_exchange", "ticker", "exchange_code"),
+        Index("idx_figi_isin", "isin"),
+    )
 
     # EXACT column match to SQLite
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
@@ -26,6 +32,7 @@ class SqlServerFigiMapping(SqlServerBaseModel):
     composite_figi = Column(String(12))
     share_class_figi = Column(String(12))
     ticker = Column(String(100))  # Increased size to handle longer ticker symbols
+    exchange_code = Column(String(10))  # OpenFIGI exchCode
     security_type = Column(String(50))
     market_sector = Column(String(50))
     security_description = Column(String(255))
@@ -0,0 +1,16 @@
+"""SQL Server materialised statistics model - EXACT copy of SQLite schema."""
+
+from sqlalchemy import Column, DateTime, Integer, String, Text
+
+from .base_model import SqlServerBase
+
+
+class SqlServerDataStatistics(SqlServerBase):
+    """SQL Server statistics model - EXACT match to SQLite DataStatistics."""
+
+    __tablename__ = "data_statistics"
+
+    name = Column(String(50), primary_key=True)  # Statistics group
+    payload = Column(Text, nullable=False, default="{}")  # Figures as JSON text
+    computed_at = Column(DateTime, nullable=False)  # UTC start of the computation
+    duration_ms = Column(Integer)  # Time the rebuild took
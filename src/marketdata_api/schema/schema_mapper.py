@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import date, datetime
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 import yaml
 
@@ -32,11 +32,103 @@ class SchemaMapping:
     updated_at: Optional[str] = None
 
 
+# strftime directives for the date tokens used in format(...) transformations
+_DATE_FORMAT_TOKENS = (("YYYY", "%Y"), ("MM", "%m"), ("DD", "%d"))
+
+
+def _get_source(obj: Any, source: str) -> Any:
+    """Read a field source from a model (column, then processed attribute) or a dict."""
+    if isinstance(obj, dict):
+        return obj.get(source)
+    value = getattr(obj, source, None)
+    if value is None:
+        processed = getattr(obj, "processed_attributes", None)
+        if isinstance(processed, dict):
+            value = processed.get(source)
+    return value
+
+
+def compile_transformation(transformation: Optional[str]) -> Optional[Callable[[Any], Any]]:
+    """
+    Turn a transformation rule into a function, once per schema.
+
+    Like the rules it replaces, the returned function leaves a value
+    unchanged when the transformation fails.
+    """
+    if not transformation:
+        return None
+
+    if transformation.startswith("round"):
+        decimals = int(transformation.split("(")[1].split(")")[0])
+        transform = lambda value: round(float(value), decimals)
+    elif transformation.startswith("format"):
+        format_str = transformation.split("(")[1].split(")")[0]
+        if "%" not in format_str:
+            for token, directive in _DATE_FORMAT_TOKENS:
+                format_str = format_str.replace(token, directive)
+        transform = lambda value: (
+            value.strftime(format_str) if isinstance(value, (datetime, date)) else value
+        )
+    elif transformation == "upper":
+        transform = lambda value: str(value).upper()
+    elif transformation == "lower":
+        transform = lambda value: str(value).lower()
+    else:
+        logger.warning(f"Unknown transformation: {transformation}")
+        return None
+
+    def safe_transform(value: Any) -> Any:
+        try:
+            return transform(value)
+        except Exception as e:
+            logger.error(f"Transformation error: {str(e)}")
+            return value
+
+    return safe_transform
+
+
+@dataclass(frozen=True)
+class CompiledField:
+    name: str
+    source: str
+    required: bool
+    transform: Optional[Callable[[Any], Any]]
+
+
+class CompiledSchema:
+    """A schema flattened (inherited fields included) into field getters and transformers."""
+
+    def __init__(self, name: str, fields: List[SchemaField]):
+        self.name = name
+        compiled: Dict[str, CompiledField] = {}
+        # Own fields come before inherited ones, so they win on name clashes
+        for field in fields:
+            if field.name not in compiled:
+                compiled[field.name] = CompiledField(
+                    field.name, field.source, field.required, compile_transformation(field.transformation)
+                )
+        self.fields: Tuple[CompiledField, ...] = tuple(compiled.values())
+        self.sources: Dict[str, str] = {field.name: field.source for field in self.fields}
+
+    def map(self, obj: Any) -> Dict[str, Any]:
+        """Map one instrument (model or dict) to the schema."""
+        result = {}
+        for field in self.fields:
+            value = _get_source(obj, field.source)
+            if value is not None and field.transform is not None:
+                value = field.transform(value)
+            if value is not None or field.required:
+                result[field.name] = value
+        return result
+
+
 class SchemaMapper:
-    def __init__(self):
+    def __init__(self, session=None):
+        self.session = session
         self.mappings: Dict[str, SchemaMapping] = {}
         self.type_mapping = {}  # Will be populated lazily
         self._schema_cache = {}
+        self._compiled: Dict[Tuple[Tuple[str, str], ...], CompiledSchema] = {}
         self._version_history = {}  # Store version history
         self._dependents = {}  # Track schema dependencies
         self.load_mappings()
@@ -44,15 +136,10 @@ class SchemaMapper:
     def _get_type_mapping(self):
         """Lazy load type mapping using direct imports"""
         if not self.type_mapping:
-            from ..models.sqlite.instrument import Debt, Equity, Future, Instrument
-
-            # Create type mapping based on available models
-            self.type_mapping = {
-                "equity": Equity,
-                "debt": Debt,
-                "future": Future,
-                "base": Instrument,
-            }
+            from ..models.sqlite.instrument import Instrument
+
+            # One unified instrument model; schemas differ by instrument_type
+            self.type_mapping = {name: Instrument for name in self.mappings}
         return self.type_mapping
 
     @lru_cache(maxsize=32)
@@ -126,92 +213,115 @@ class SchemaMapper:
                 logger.error(f"Error loading schema from {path}: {e}")
                 raise ValueError(f"Invalid schema file: {path}")
 
-    def map_to_schema(
-        self, instrument: Union[Any, Dict[str, Any]], schema_name: str
-    ) -> Dict[str, Any]:
-        """Map instrument data to requested schema format"""
+    def compile_schema(self, schema_name: str) -> CompiledSchema:
+        """
+        Return the compiled form of a schema.
+
+        Compiled schemas are cached by the name and version of the schema
+        and every schema it extends, so updating any of them recompiles.
+        """
         if schema_name not in self.mappings:
             raise ValueError(f"Unknown schema: {schema_name}")
 
-        # Handle both dict and model instances
-        if isinstance(instrument, dict):
-            return self._map_dict_to_schema(instrument, schema_name)
-        else:
-            return self._map_model_to_schema(instrument, schema_name)
-
-    def _map_dict_to_schema(self, data: Dict[str, Any], schema_name: str) -> Dict[str, Any]:
-        """Map dictionary data to schema format"""
-        mapping = self.mappings[schema_name]
-        result = {}
-        fields = self._get_all_fields(schema_name)
-
-        logger.debug(f"Mapping data to schema {schema_name}")
-        logger.debug(f"Available data keys: {list(data.keys())}")
-        logger.debug(f"Schema fields: {[field.name for field in fields]}")
+        key = tuple((name, self.mappings[name].version) for name in self._schema_chain(schema_name))
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = CompiledSchema(schema_name, self._get_all_fields(schema_name))
+            self._compiled[key] = compiled
+        return compiled
 
-        for field in fields:
-            try:
-                value = data.get(field.source)
-                logger.debug(f"Field {field.name} (source: {field.source}) = {value}")
-
-                if value is not None and field.transformation:
-                    value = self._apply_transformation(value, field.transformation)
-                    logger.debug(f"After transformation: {value}")
+    def map_to_schema(
+        self, instrument: Union[Any, Dict[str, Any]], schema_name: str
+    ) -> Dict[str, Any]:
+        """Map instrument data (model instance or dict) to requested schema format"""
+        return self.compile_schema(schema_name).map(instrument)
+
+    def map_many(self, instruments: Iterable[Any], schema_name: str) -> List[Dict[str, Any]]:
+        """
+        Map a batch of loaded instruments to a schema.
+
+        The schema is compiled once for the batch; field sources are read from
+        columns and processed attributes, so instruments only need their own
+        row loaded.
+        """
+        compiled = self.compile_schema(schema_name)
+        return [compiled.map(instrument) for instrument in instruments]
+
+    def search_by_schema(
+        self, query: Union[str, Dict[str, Any]], schema_name: Optional[str] = None, limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find instruments and return them in a schema's format.
+
+        Args:
+            query: Free text (full-text instrument search), or a dict of schema
+                field name -> value (a list matches any of its values)
+            schema_name: Output schema (default "base"); instrument type
+                schemas (equity, debt, ...) also restrict the instrument type
+            limit: Maximum number of results
+
+        Returns:
+            Matching instruments mapped to the schema
+
+        Raises:
+            ValueError: For an unknown schema, or query fields that are not in
+                the schema or not stored as instrument columns
+        """
+        from ..database.fulltext import match_instruments
+        from ..database.session import get_session
+        from ..models.utils.cfi_instrument_manager import get_valid_instrument_types
+        from ..services import InstrumentService
+
+        schema_name = schema_name or "base"
+        compiled = self.compile_schema(schema_name)
+        Instrument = InstrumentService().Instrument
+
+        # Validate structured queries before touching the database
+        conditions = []
+        if isinstance(query, dict):
+            for field_name, value in query.items():
+                source = compiled.sources.get(field_name)
+                if source is None:
+                    raise ValueError(f"Field '{field_name}' is not part of schema '{schema_name}'")
+                if source not in Instrument.__table__.columns:
+                    raise ValueError(f"Field '{field_name}' cannot be searched")
+                column = getattr(Instrument, source)
+                conditions.append(column.in_(value) if isinstance(value, list) else column == value)
+        elif not isinstance(query, str):
+            raise ValueError("Query must be a search string or an object of schema fields")
+
+        def run(session) -> List[Dict[str, Any]]:
+            db_query = session.query(Instrument).filter(*conditions)
+            rank = None
+            if schema_name in get_valid_instrument_types():
+                db_query = db_query.filter(Instrument.instrument_type == schema_name)
+
+            if isinstance(query, str):
+                matched = match_instruments(db_query, Instrument, query)
+                if matched is not None:
+                    db_query, rank = matched
+                else:
+                    db_query = db_query.filter(
+                        (Instrument.full_name.ilike(f"%{query}%"))
+                        | (Instrument.short_name.ilike(f"%{query}%"))
+                        | (Instrument.isin.ilike(f"%{query}%"))
+                    )
 
-                if value is not None or field.required:
-                    result[field.name] = value
-            except Exception as e:
-                logger.error(f"Error processing field {field.name}: {str(e)}")
-                if field.required:
-                    raise
-                result[field.name] = None
+            ordering = (rank, Instrument.isin) if rank is not None else (Instrument.isin,)
+            return self.map_many(db_query.order_by(*ordering).limit(limit), schema_name)
 
-        return result
+        if self.session is not None:
+            return run(self.session)
+        with get_session() as session:
+            return run(session)
 
-    def _map_model_to_schema(self, instrument: Any, schema_name: str) -> Dict[str, Any]:
-        """Map model instance to schema format"""
-        expected_type = self._get_type_mapping().get(schema_name)
-
-        # Create a dictionary from the instrument data
-        data = {}
-
-        # First add all base instrument attributes
-        for key, value in instrument.__dict__.items():
-            if not key.startswith("_"):  # Skip SQLAlchemy internal attributes
-                data[key] = value
-
-        # For specific instrument types, we need to fully load their attributes
-        instrument_type = getattr(instrument, "type", "").lower()
-
-        # Debug the type and expected type
-        logger.debug(f"Mapping instrument of type {instrument_type} to schema {schema_name}")
-        logger.debug(f"Expected type: {expected_type.__name__ if expected_type else 'None'}")
-
-        # Handle Future type specially - we need to get all the future-specific attributes
-        if instrument_type == "future" and hasattr(instrument, "expiration_date"):
-            logger.debug("Processing Future instrument attributes")
-            # Add future-specific attributes
-            for attr in [
-                "expiration_date",
-                "final_settlement_date",
-                "delivery_type",
-                "settlement_method",
-                "contract_size",
-                "contract_unit",
-                "price_multiplier",
-                "settlement_currency",
-            ]:
-                try:
-                    # Try to get attribute directly from instrument
-                    value = getattr(instrument, attr, None)
-                    if value is not None:
-                        data[attr] = value
-                        logger.debug(f"Found attribute {attr} = {value}")
-                except Exception as e:
-                    logger.warning(f"Error getting future attribute {attr}: {e}")
-
-        # Map the collected data using the schema
-        return self._map_dict_to_schema(data, schema_name)
+    def _schema_chain(self, schema_name: str) -> List[str]:
+        """The schema followed by the schemas it extends."""
+        chain = []
+        while schema_name and schema_name in self.mappings and schema_name not in chain:
+            chain.append(schema_name)
+            schema_name = self.mappings[schema_name].extends
+        return chain
 
     def _get_all_fields(self, schema_name: str, visited=None) -> List[SchemaField]:
         """Get all fields including from extended schemas"""
@@ -242,31 +352,8 @@ class SchemaMapper:
 
     def _apply_transformation(self, value: Any, transformation: str) -> Any:
         """Apply transformation rule to value"""
-        try:
-            if not transformation:
-                return value
-
-            if transformation.startswith("round"):
-                decimals = int(transformation.split("(")[1].split(")")[0])
-                return round(float(value), decimals)
-
-            if transformation.startswith("format"):
-                format_str = transformation.split("(")[1].split(")")[0]
-                if isinstance(value, (datetime, date)):
-                    return value.strftime(format_str)
-                return value
-
-            if transformation == "upper":
-                return str(value).upper()
-
-            if transformation == "lower":
-                return str(value).lower()
-
-            logger.warning(f"Unknown transformation: {transformation}")
-            return value
-        except Exception as e:
-            logger.error(f"Transformation error: {str(e)}")
-            return value
+        transform = compile_transformation(transformation)
+        return transform(value) if transform is not None else value
 
     def validate_value(self, value: Any, field: SchemaField) -> bool:
         """Validate a value against field requirements"""
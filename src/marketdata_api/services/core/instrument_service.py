@@ -465,23 +465,25 @@ class InstrumentService(InstrumentServiceInterface):
     def get_instrument(self, identifier: str) -> Tuple[Session, Optional[InstrumentInterface]]:
         """
         Retrieve an instrument by its identifier with relationships loaded.
+
+        Collections are selectin-loaded so the two of them do not multiply
+        each other's rows; the session is fresh, so no refresh is needed and
+        the eagerly loaded relationships stay populated.
         """
-        from sqlalchemy.orm import joinedload
+        from sqlalchemy.orm import joinedload, selectinload
 
         session = SessionLocal()
         try:
             instrument = (
                 session.query(self.Instrument)
                 .options(
-                    joinedload(self.Instrument.figi_mappings),
+                    selectinload(self.Instrument.figi_mappings),
                     joinedload(self.Instrument.legal_entity),
-                    joinedload(self.Instrument.trading_venues),
+                    selectinload(self.Instrument.trading_venues),
                 )
                 .filter((self.Instrument.id == identifier) | (self.Instrument.isin == identifier))
                 .first()
             )
-            if instrument:
-                session.refresh(instrument)
             return session, instrument
         except:
             session.close()
@@ -1056,22 +1058,17 @@ class InstrumentService(InstrumentServiceInterface):
             # Get MIC code by looking up the operating MIC from relevant_trading_venue
             mic_code = None
             if instrument.relevant_trading_venue:
-                if self.database_type == 'sqlite':
-                    from ...models.sqlite.market_identification_code import MarketIdentificationCode
-                else:
-                    from ...models.sqlserver.market_identification_code import SqlServerMarketIdentificationCode as MarketIdentificationCode
-                
+                from ..utils.mic_reference import mic_reference
+
                 # Look up the MIC record to get the operating MIC
-                mic_record = session.query(MarketIdentificationCode).filter(
-                    MarketIdentificationCode.mic == instrument.relevant_trading_venue
-                ).first()
+                mic_record = mic_reference.snapshot().get(instrument.relevant_trading_venue)
                 
-                if mic_record and mic_record.operating_mic:
-                    mic_code = mic_record.operating_mic
+                if mic_record and mic_record["operating_mic"]:
+                    mic_code = mic_record["operating_mic"]
                     self.logger.info(f"Mapped {instrument.relevant_trading_venue} to operating MIC: {mic_code}")
                 elif mic_record:
                     # Use the MIC itself if no operating MIC is set
-                    mic_code = mic_record.mic
+                    mic_code = mic_record["mic"]
                     self.logger.info(f"Using MIC directly: {mic_code}")
                 else:
                     # Fallback to using relevant_trading_venue as-is
@@ -1462,59 +1459,118 @@ class InstrumentService(InstrumentServiceInterface):
     def _extract_mic_for_figi_search(self, instrument) -> str:
         """
         Extract MIC code for FIGI search from instrument data.
-        
+
         Prioritizes operating MIC over segment MIC for better OpenFIGI results.
         Segment MICs (like ONSE, MSTO, DSTO) are converted to their operating MIC (XSTO).
+        The MIC is resolved from the in-memory MIC reference, so batch
+        enrichment does not query the database per instrument.
         """
-        if self.database_type == 'sqlite':
-            from ...models.sqlite.market_identification_code import MarketIdentificationCode
-        else:
-            from ...models.sqlserver.market_identification_code import SqlServerMarketIdentificationCode as MarketIdentificationCode
-        
-        session = SessionLocal()
-        try:
-            # Try relevant_trading_venue first
-            mic_code = None
-            if instrument.relevant_trading_venue:
-                mic_code = instrument.relevant_trading_venue
-            else:
-                # Try to extract from firds_data
-                if instrument.firds_data and isinstance(instrument.firds_data, dict):
-                    mic_code = (
-                        instrument.firds_data.get('TechAttrbts_RlvntTradgVn') or
-                        instrument.firds_data.get('relevant_trading_venue') or
-                        instrument.firds_data.get('mic_code') or
-                        instrument.firds_data.get('MIC')
-                    )
-            
-            if mic_code:
-                # Look up the MIC in our database to get the operating MIC
-                mic_record = session.query(MarketIdentificationCode).filter(
-                    MarketIdentificationCode.mic == mic_code
-                ).first()
-                
-                if mic_record:
-                    # Return the operating MIC for better OpenFIGI results
-                    operating_mic = mic_record.operating_mic
-                    if operating_mic and operating_mic != mic_code:
-                        self.logger.debug(f"🔄 Converting segment MIC {mic_code} to operating MIC {operating_mic} for FIGI search")
-                        return operating_mic
-                    else:
-                        self.logger.debug(f"✅ Using operating MIC {mic_code} for FIGI search")
-                        return mic_code
-                else:
-                    # MIC not found in database, use as-is but log warning
-                    self.logger.warning(f"⚠️ MIC {mic_code} not found in database, using as-is for FIGI search")
-                    return mic_code
-            
+        from ..utils.mic_reference import mic_reference
+
+        # Try relevant_trading_venue first, then firds_data
+        mic_code = instrument.relevant_trading_venue
+        if not mic_code and instrument.firds_data and isinstance(instrument.firds_data, dict):
+            mic_code = (
+                instrument.firds_data.get('TechAttrbts_RlvntTradgVn') or
+                instrument.firds_data.get('relevant_trading_venue') or
+                instrument.firds_data.get('mic_code') or
+                instrument.firds_data.get('MIC')
+            )
+
+        if not mic_code:
             # Default to empty string (will trigger broad FIGI search)
             return ""
-            
+
+        try:
+            operating_mic = mic_reference.snapshot().operating_mic_for(mic_code)
         except Exception as e:
             self.logger.error(f"Error extracting MIC for FIGI search: {str(e)}")
-            return mic_code or ""  # Fallback to original MIC if available
-        finally:
-            session.close()
+            return mic_code  # Fallback to original MIC
+
+        if operating_mic is None:
+            # MIC not found in reference data, use as-is but log warning
+            self.logger.warning(f"⚠️ MIC {mic_code} not found in database, using as-is for FIGI search")
+            return mic_code
+        if operating_mic != mic_code:
+            self.logger.debug(f"🔄 Converting segment MIC {mic_code} to operating MIC {operating_mic} for FIGI search")
+        else:
+            self.logger.debug(f"✅ Using operating MIC {mic_code} for FIGI search")
+        return operating_mic
+
+    # FIGI and ticker reverse lookups
+
+    # FIGI columns a reverse lookup matches, in precedence order
+    FIGI_ID_COLUMNS = ("figi", "composite_figi", "share_class_figi")
+
+    @staticmethod
+    def format_figi_mapping(mapping) -> Dict[str, Any]:
+        """API representation of a FIGI mapping row."""
+        return {
+            "isin": mapping.isin,
+            "figi": mapping.figi,
+            "composite_figi": mapping.composite_figi,
+            "share_class_figi": mapping.share_class_figi,
+            "ticker": mapping.ticker,
+            "exchange_code": mapping.exchange_code,
+            "security_type": mapping.security_type,
+            "market_sector": mapping.market_sector,
+            "security_description": mapping.security_description,
+        }
+
+    def lookup_figis(self, figis: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Resolve FIGIs (instrument, composite or share class level) to their mappings.
+
+        Each chunk of identifiers is one query whose conditions are each
+        served by an index on the FIGI columns.
+
+        Returns:
+            FIGI -> mappings carrying it, for the FIGIs that were found
+        """
+        from sqlalchemy import or_
+
+        wanted = set(figis)
+        found: Dict[str, List[Dict[str, Any]]] = {}
+        columns = [getattr(self.FigiMapping, name) for name in self.FIGI_ID_COLUMNS]
+        size = ServiceDefaults.LOOKUP_CHUNK_SIZE
+        with get_session() as session:
+            for start in range(0, len(figis), size):
+                chunk = figis[start:start + size]
+                rows = (
+                    session.query(self.FigiMapping)
+                    .filter(or_(*(column.in_(chunk) for column in columns)))
+                    .order_by(self.FigiMapping.isin, self.FigiMapping.figi)
+                    .all()
+                )
+                for row in rows:
+                    formatted = self.format_figi_mapping(row)
+                    for figi in {getattr(row, name) for name in self.FIGI_ID_COLUMNS} & wanted:
+                        found.setdefault(figi, []).append(formatted)
+        return found
+
+    def lookup_tickers(
+        self, tickers: List[str], exchange_code: Optional[str] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Resolve tickers, optionally on one exchange, to their FIGI mappings.
+
+        Backed by the (ticker, exchange_code) index; tickers are matched
+        exactly, so callers should pass them upper-cased as OpenFIGI stores them.
+
+        Returns:
+            Ticker -> mappings listed under it, for the tickers that were found
+        """
+        size = ServiceDefaults.LOOKUP_CHUNK_SIZE
+        found: Dict[str, List[Dict[str, Any]]] = {}
+        with get_session() as session:
+            for start in range(0, len(tickers), size):
+                chunk = tickers[start:start + size]
+                query = session.query(self.FigiMapping).filter(self.FigiMapping.ticker.in_(chunk))
+                if exchange_code:
+                    query = query.filter(self.FigiMapping.exchange_code == exchange_code)
+                for row in query.order_by(self.FigiMapping.ticker, self.FigiMapping.isin).all():
+                    found.setdefault(row.ticker, []).append(self.format_figi_mapping(row))
+        return found
 
     # Implement required interface methods for backward compatibility
     def get_instruments(
@@ -1599,18 +1655,29 @@ class InstrumentService(InstrumentServiceInterface):
                 raise e
 
     def search_instruments(self, query: str, limit: int = 100) -> List[InstrumentInterface]:
-        """Search instruments by name, symbol, or ISIN."""
+        """Search instruments by name, symbol, ISIN or issuer, best matches first."""
+        from ...database.fulltext import match_instruments
+
         with get_session() as session:
-            return (
-                session.query(self.Instrument)
-                .filter(
-                    (self.Instrument.full_name.ilike(f"%{query}%"))
-                    | (self.Instrument.short_name.ilike(f"%{query}%"))
-                    | (self.Instrument.isin.ilike(f"%{query}%"))
+            matched = match_instruments(session.query(self.Instrument), self.Instrument, query)
+            if matched is not None:
+                ranked_query, rank = matched
+                instruments = ranked_query.order_by(rank, self.Instrument.isin).limit(limit).all()
+            else:
+                # No full-text index: substring scan
+                instruments = (
+                    session.query(self.Instrument)
+                    .filter(
+                        (self.Instrument.full_name.ilike(f"%{query}%"))
+                        | (self.Instrument.short_name.ilike(f"%{query}%"))
+                        | (self.Instrument.isin.ilike(f"%{query}%"))
+                    )
+                    .limit(limit)
+                    .all()
                 )
-                .limit(limit)
-                .all()
-            )
+            # Detach loaded rows so they stay readable after the session commits and closes
+            session.expunge_all()
+            return instruments
 
     def validate_instrument_data(self, data: Dict[str, Any]) -> None:
         """Validate instrument data."""
@@ -1738,6 +1805,13 @@ class InstrumentService(InstrumentServiceInterface):
                 avg_time = results["elapsed_time"] / results["total_created"]
                 self.logger.info(f"   Average per instrument: {avg_time:.1f}s")
 
+                # Pick up the new instruments in the autocomplete index and stats
+                from ..utils.instrument_typeahead import instrument_typeahead
+                from ..utils.statistics import statistics_store
+
+                instrument_typeahead.refresh()
+                statistics_store.refresh()
+
             return results
 
         except Exception as e:
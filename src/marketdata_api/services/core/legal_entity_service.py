@@ -1,16 +1,18 @@
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Integer, String, and_, cast, literal, or_, select
+from sqlalchemy.orm import Session, aliased, joinedload
 
-from ...constants import RetryConfig
+from ...constants import RetryConfig, ServiceDefaults
 from ..utils.gleif import flatten_address, map_lei_record
 from ...database.session import SessionLocal, get_session
 from ...config import DatabaseConfig
 from ..utils.gleif import fetch_lei_info  # Re-enabled for enrichment
 from ..interfaces.legal_entity_service_interface import LegalEntityServiceInterface
 
+RELATIONSHIP_TYPES = ("DIRECT", "ULTIMATE")
+
 
 class LegalEntityServiceError(Exception):
     """Base exception for legal entity service errors."""
@@ -138,6 +140,42 @@ class LegalEntityService(LegalEntityServiceInterface):
             session.close()
             raise
 
+    def _apply_filters(self, query, filters: Optional[Dict[str, Any]]) -> Tuple[Any, Optional[Any]]:
+        """
+        Apply status, jurisdiction and name filters to a legal entity query.
+
+        Name matches come from the full-text name index (prefix matches,
+        falling back to fuzzy matches scoring at least filters['threshold']),
+        or ILIKE when no index exists.
+
+        Returns:
+            (query, rank) where rank orders name matches best first, or None
+        """
+        if not filters:
+            return query, None
+
+        filter_conditions = []
+        if "status" in filters and filters["status"]:
+            filter_conditions.append(self.LegalEntity.status == filters["status"])
+        if "jurisdiction" in filters and filters["jurisdiction"]:
+            filter_conditions.append(self.LegalEntity.jurisdiction == filters["jurisdiction"])
+
+        if filter_conditions:
+            query = query.filter(and_(*filter_conditions))
+
+        rank = None
+        if filters.get("name"):
+            from ...database.fulltext import match_legal_entities
+
+            threshold = filters.get("threshold", ServiceDefaults.NAME_SEARCH_THRESHOLD)
+            matched = match_legal_entities(query, self.LegalEntity, filters["name"], threshold)
+            if matched is not None:
+                query, rank = matched
+            else:
+                query = query.filter(self.LegalEntity.name.ilike(f"%{filters['name']}%"))
+
+        return query, rank
+
     def count_entities(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """
         Get count of legal entities with optional filtering.
@@ -150,18 +188,8 @@ class LegalEntityService(LegalEntityServiceInterface):
         """
         session = SessionLocal()
         try:
-            query = session.query(self.LegalEntity)
-
             # Apply filters if provided (same logic as get_all_entities)
-            if filters:
-                filter_conditions = []
-                if "status" in filters and filters["status"]:
-                    filter_conditions.append(self.LegalEntity.status == filters["status"])
-                if "jurisdiction" in filters and filters["jurisdiction"]:
-                    filter_conditions.append(self.LegalEntity.jurisdiction == filters["jurisdiction"])
-
-                if filter_conditions:
-                    query = query.filter(and_(*filter_conditions))
+            query, _ = self._apply_filters(session.query(self.LegalEntity), filters)
 
             count = query.count()
             return count
@@ -173,6 +201,7 @@ class LegalEntityService(LegalEntityServiceInterface):
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         filters: Optional[Dict[str, Any]] = None,
+        after_lei: Optional[str] = None,
     ) -> Tuple[Session, List[object]]:
         """
         Get all legal entities with optional pagination and filtering.
@@ -180,7 +209,9 @@ class LegalEntityService(LegalEntityServiceInterface):
         Args:
             limit (int, optional): Maximum number of results to return
             offset (int, optional): Number of results to skip (for pagination)
-            filters (dict, optional): Dictionary of filters to apply (e.g. {'status': 'ACTIVE'})
+            filters (dict, optional): Dictionary of filters to apply (e.g. {'status': 'ACTIVE'});
+                a 'name' filter ranks results by name match unless after_lei is given
+            after_lei (str, optional): Keyset pagination - only return entities ordered after this LEI
 
         Returns:
             tuple: (session, list of entities)
@@ -196,18 +227,19 @@ class LegalEntityService(LegalEntityServiceInterface):
             )
 
             # Apply filters if provided
-            if filters:
-                filter_conditions = []
-                if "status" in filters and filters["status"]:
-                    filter_conditions.append(self.LegalEntity.status == filters["status"])
-                if "jurisdiction" in filters and filters["jurisdiction"]:
-                    filter_conditions.append(self.LegalEntity.jurisdiction == filters["jurisdiction"])
+            query, rank = self._apply_filters(query, filters)
 
-                if filter_conditions:
-                    query = query.filter(and_(*filter_conditions))
+            if after_lei is not None:
+                if after_lei:
+                    query = query.filter(self.LegalEntity.lei > after_lei)
+                # Keyset pages follow LEI order, not name match rank
+                rank = None
 
             # Apply pagination with ORDER BY for SQL Server compatibility
-            query = query.order_by(self.LegalEntity.lei)
+            if rank is not None:
+                query = query.order_by(rank, self.LegalEntity.lei)
+            else:
+                query = query.order_by(self.LegalEntity.lei)
             if offset is not None:
                 query = query.offset(offset)
             if limit is not None:
@@ -219,6 +251,247 @@ class LegalEntityService(LegalEntityServiceInterface):
             session.close()
             raise
 
+    def get_entity_summary(self, lei: str) -> Optional[Dict[str, Any]]:
+        """Get the identifying fields of a legal entity without loading its relationships."""
+        with get_session() as session:
+            row = (
+                session.query(
+                    self.LegalEntity.lei,
+                    self.LegalEntity.name,
+                    self.LegalEntity.jurisdiction,
+                    self.LegalEntity.legal_form,
+                    self.LegalEntity.status,
+                )
+                .filter(self.LegalEntity.lei == lei)
+                .first()
+            )
+            return dict(row._mapping) if row else None
+
+    def _relationship_query(self, session: Session, lei: str, filters: Optional[Dict[str, Any]]):
+        """
+        Relationships of an entity, filtered by type, status and direction.
+
+        Each branch of the parent/child match is served by the
+        (parent_lei | child_lei, relationship_type, relationship_status) indexes.
+
+        Raises:
+            ValueError: If the relationship type or direction is not recognised
+        """
+        filters = filters or {}
+        Relationship = self.EntityRelationship
+
+        direction = (filters.get("direction") or "").upper()
+        if direction == "PARENT":
+            # Relationships to this entity's parents
+            query = session.query(Relationship).filter(Relationship.child_lei == lei)
+        elif direction == "CHILD":
+            query = session.query(Relationship).filter(Relationship.parent_lei == lei)
+        elif not direction:
+            query = session.query(Relationship).filter(
+                or_(Relationship.parent_lei == lei, Relationship.child_lei == lei)
+            )
+        else:
+            raise ValueError(f"Invalid direction: {filters['direction']} (expected PARENT or CHILD)")
+
+        relationship_type = (filters.get("relationship_type") or "").upper()
+        if relationship_type:
+            if relationship_type not in RELATIONSHIP_TYPES:
+                raise ValueError(
+                    f"Invalid relationship_type: {filters['relationship_type']} "
+                    f"(expected {' or '.join(RELATIONSHIP_TYPES)})"
+                )
+            query = query.filter(Relationship.relationship_type == relationship_type)
+
+        if filters.get("relationship_status"):
+            query = query.filter(Relationship.relationship_status == filters["relationship_status"].upper())
+
+        return query
+
+    def count_relationships(self, lei: str, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Count an entity's relationships matching the filters."""
+        with get_session() as session:
+            return self._relationship_query(session, lei, filters).count()
+
+    def get_relationships(
+        self,
+        lei: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get one page of an entity's relationships with both entities' names.
+
+        Parent and child names come from outer joins in the same query, so
+        the page costs one round trip whatever its size.
+
+        Args:
+            lei: Entity whose relationships are listed (as parent or child)
+            filters: relationship_type, relationship_status and direction filters
+            limit: Maximum number of relationships
+            offset: Number of relationships to skip (page mode)
+            after_id: Keyset pagination - only return relationships ordered after this id
+
+        Returns:
+            Relationship rows as dicts, ordered by relationship id
+
+        Raises:
+            ValueError: If a filter value is not recognised
+        """
+        Relationship = self.EntityRelationship
+        Parent = aliased(self.LegalEntity)
+        Child = aliased(self.LegalEntity)
+
+        with get_session() as session:
+            query = (
+                self._relationship_query(session, lei, filters)
+                .outerjoin(Parent, Parent.lei == Relationship.parent_lei)
+                .outerjoin(Child, Child.lei == Relationship.child_lei)
+                .with_entities(
+                    Relationship.id,
+                    Relationship.relationship_type,
+                    Relationship.relationship_status,
+                    Relationship.parent_lei,
+                    Parent.name.label("parent_name"),
+                    Parent.jurisdiction.label("parent_jurisdiction"),
+                    Relationship.child_lei,
+                    Child.name.label("child_name"),
+                    Child.jurisdiction.label("child_jurisdiction"),
+                    Relationship.relationship_period_start,
+                    Relationship.relationship_period_end,
+                    Relationship.percentage_of_ownership,
+                )
+            )
+            if after_id:
+                query = query.filter(Relationship.id > after_id)
+
+            query = query.order_by(Relationship.id)
+            if offset:
+                query = query.offset(offset)
+            if limit is not None:
+                query = query.limit(limit)
+
+            return [dict(row._mapping) for row in query.all()]
+
+    def get_hierarchy(
+        self,
+        lei: str,
+        max_depth: int = ServiceDefaults.HIERARCHY_DEFAULT_DEPTH,
+        relationship_type: str = "DIRECT",
+        include_inactive: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the corporate tree below an entity in one recursive query.
+
+        A recursive CTE walks entity_relationships from parent to child up to
+        max_depth levels, carrying the path of LEIs visited so a relationship
+        loop stops instead of recursing forever; entity names are joined on
+        the final select.
+
+        Args:
+            lei: Root entity
+            max_depth: Maximum number of levels below the root
+                (1..ServiceDefaults.HIERARCHY_MAX_DEPTH)
+            relationship_type: DIRECT (group tree) or ULTIMATE (every entity
+                the root ultimately controls, one level deep)
+            include_inactive: Also follow relationships that are not ACTIVE
+
+        Returns:
+            Dict with root_entity, hierarchy (nested nodes with children),
+            total_entities (root included) and max_depth (deepest level reached),
+            or None if the LEI is neither a stored entity nor a parent
+
+        Raises:
+            ValueError: If max_depth or relationship_type is out of range
+        """
+        if not 1 <= max_depth <= ServiceDefaults.HIERARCHY_MAX_DEPTH:
+            raise ValueError(f"max_depth must be between 1 and {ServiceDefaults.HIERARCHY_MAX_DEPTH}")
+        relationship_type = (relationship_type or "").upper()
+        if relationship_type not in RELATIONSHIP_TYPES:
+            raise ValueError(
+                f"Invalid relationship_type: {relationship_type} (expected {' or '.join(RELATIONSHIP_TYPES)})"
+            )
+
+        Relationship = self.EntityRelationship
+        # Depth and the path of visited LEIs ('/root/child/.../') are cast so
+        # both CTE branches have identical column types, as SQL Server requires
+        path_type = String(ServiceDefaults.HIERARCHY_MAX_DEPTH * 21 + 22)
+
+        def followed(relationship):
+            conditions = [relationship.relationship_type == relationship_type]
+            if not include_inactive:
+                conditions.append(relationship.relationship_status == "ACTIVE")
+            return conditions
+
+        anchor = select(
+            Relationship.parent_lei.label("parent_lei"),
+            Relationship.child_lei.label("child_lei"),
+            cast(literal(1), Integer).label("depth"),
+            cast(literal("/") + Relationship.parent_lei + "/" + Relationship.child_lei + "/", path_type).label("path"),
+        ).where(Relationship.parent_lei == lei, Relationship.child_lei != lei, *followed(Relationship))
+        tree = anchor.cte("entity_tree", recursive=True)
+
+        step = aliased(Relationship)
+        tree = tree.union_all(
+            select(
+                step.parent_lei,
+                step.child_lei,
+                cast(tree.c.depth + 1, Integer),
+                cast(tree.c.path + step.child_lei + "/", path_type),
+            ).where(
+                step.parent_lei == tree.c.child_lei,
+                tree.c.depth < max_depth,
+                ~tree.c.path.contains("/" + step.child_lei + "/"),
+                *followed(step),
+            )
+        )
+
+        Entity = self.LegalEntity
+        root = self.get_entity_summary(lei)
+        with get_session() as session:
+            rows = session.execute(
+                select(
+                    tree.c.parent_lei,
+                    tree.c.child_lei,
+                    tree.c.depth,
+                    Entity.name,
+                    Entity.jurisdiction,
+                    Entity.legal_form,
+                    Entity.status,
+                )
+                .outerjoin(Entity, Entity.lei == tree.c.child_lei)
+                .order_by(tree.c.depth, tree.c.parent_lei, tree.c.child_lei)
+            ).all()
+
+        if root is None and not rows:
+            return None
+
+        root = root or {"lei": lei, "name": None, "jurisdiction": None, "legal_form": None, "status": None}
+        nodes = {lei: dict(root, depth=0, children=[])}
+        for parent_lei, child_lei, depth, name, jurisdiction, legal_form, status in rows:
+            # An entity reachable along several paths is placed at its shallowest one
+            if child_lei in nodes or parent_lei not in nodes:
+                continue
+            node = {
+                "lei": child_lei,
+                "name": name,
+                "jurisdiction": jurisdiction,
+                "legal_form": legal_form,
+                "status": status,
+                "depth": depth,
+                "children": [],
+            }
+            nodes[child_lei] = node
+            nodes[parent_lei]["children"].append(node)
+
+        return {
+            "root_entity": root,
+            "hierarchy": nodes[lei],
+            "total_entities": len(nodes),
+            "max_depth": max(node["depth"] for node in nodes.values()),
+        }
+
     def create_or_update_entity(self, lei: str) -> Tuple[Session, Optional[object]]:
         """Create or update legal entity from GLEIF data."""
         # Lazy import to avoid conflicts
@@ -12,16 +12,18 @@ import os
 import time
 import uuid
 from datetime import UTC, date, datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
 from ...config import Config, esmaConfig, DatabaseConfig
-from ...constants import ServiceDefaults, BusinessConstants, FilePatterns
+from ...constants import ServiceDefaults, BusinessConstants, FilePatterns, FitrsColumns
 from ...database.session import SessionLocal, get_session
 from ..utils.esma_data_loader import EsmaDataLoader
+from ..utils.esma_utils import FitrsNormalizer
+from ..utils.fitrs_index import FitrsIsinIndex
 from ..interfaces.transparency_service_interface import TransparencyServiceInterface
 
 logger = logging.getLogger(__name__)
@@ -85,7 +87,7 @@ class TransparencyService(TransparencyServiceInterface):
             raise TransparencyValidationError(f"Missing required fields: {', '.join(missing)}")
 
         # Validate ISIN presence for non-equity data
-        if "ISIN" not in data and "Id" not in data:
+        if FitrsColumns.KEY not in data and "ISIN" not in data and "Id" not in data:
             raise TransparencyValidationError("Either ISIN or Id field must be present")
 
         # For debt instruments, check for basic classification
@@ -229,71 +231,13 @@ class TransparencyService(TransparencyServiceInterface):
         Returns:
             Created Any instance or existing record if duplicate found
         """
-        self.validate_transparency_data(data)
-
-        # Determine file type
-        file_type = self.determine_file_type(data, source_filename)
-        
-        # Extract core identification fields
-        isin = data.get("ISIN") or data.get("Id")
-        from_date = self._parse_date(data.get("FrDt"))
-        to_date = self._parse_date(data.get("ToDt"))
-        tech_record_id = data.get("TechRcrdId")
-
         session = SessionLocal()
         try:
-            # Get methodology for uniqueness check
-            methodology = self._determine_methodology(data)
-            
-            # Check for existing record to prevent duplicates
-            # Unique criteria: (isin, file_type, from_date, to_date, methodology)
-            existing = session.query(self.TransparencyCalculation).filter(
-                self.TransparencyCalculation.isin == isin,
-                self.TransparencyCalculation.file_type == file_type,
-                self.TransparencyCalculation.from_date == from_date,
-                self.TransparencyCalculation.to_date == to_date
-            ).first()
-            
-            # Additional check for methodology in raw_data if existing found
-            if existing:
-                existing_methodology = self._get_methodology_from_calculation(existing)
-                if existing_methodology == methodology:
-                    self.logger.info(f"Found existing transparency calculation {existing.id} for {isin} ({file_type}, {methodology})")
-                    return existing
-
-            # Create new record
-            self.logger.info(f"Creating new transparency calculation for {isin} ({file_type})")
-            
-            # Prepare raw_data based on database type
-            if self.database_type == 'sqlite':
-                raw_data = data.copy()  # SQLite supports JSON columns
-            else:
-                # SQL Server requires JSON as text
-                import json
-                raw_data = json.dumps(data.copy(), default=str)  # Serialize to JSON string
-            
-            transparency_calc = self.TransparencyCalculation(
-                id=str(uuid.uuid4()),
-                tech_record_id=tech_record_id,
-                isin=isin,
-                from_date=from_date,
-                to_date=to_date,
-                liquidity=self._determine_liquidity(data, file_type),
-                total_transactions_executed=self._parse_numeric(data.get("TtlNbOfTxsExctd")),
-                total_volume_executed=self._parse_numeric(data.get("TtlVolOfTxsExctd")),
-                file_type=file_type,
-                source_file=source_filename,
-                raw_data=raw_data,  # Store all original data (database-type appropriate)
+            transparency_calc, created = self._add_transparency_calculation(
+                session, data, source_filename
             )
-
-            session.add(transparency_calc)
-            session.flush()  # Get the ID
-
-            # Create threshold records
-            thresholds = self.TransparencyThreshold.create_from_fitrs_data(transparency_calc.id, data)
-
-            for threshold in thresholds:
-                session.add(threshold)
+            if not created:
+                return transparency_calc
 
             session.commit()
 
@@ -305,13 +249,15 @@ class TransparencyService(TransparencyServiceInterface):
             )  # This loads the relationship and forces evaluation
 
             self.logger.info(
-                f"Created transparency calculation {transparency_calc.id} for {file_type}"
+                f"Created transparency calculation {transparency_calc.id} for {transparency_calc.file_type}"
             )
 
             # Create a detached copy to return
             session.expunge(transparency_calc)
             return transparency_calc
 
+        except TransparencyValidationError:
+            raise
         except Exception as e:
             session.rollback()
             self.logger.error(f"Failed to create transparency calculation: {str(e)}")
@@ -319,6 +265,85 @@ class TransparencyService(TransparencyServiceInterface):
         finally:
             session.close()
 
+    def _add_transparency_calculation(
+        self, session: Session, data: Dict[str, Any], source_filename: str = None
+    ) -> Tuple[Any, bool]:
+        """
+        Stage a transparency calculation and its thresholds on an open session.
+
+        The caller owns the transaction, which lets bulk writers commit many
+        records at once. Returns (calculation, created) where created is False
+        when an equivalent record already exists.
+        """
+        self.validate_transparency_data(data)
+
+        # Determine file type
+        file_type = self.determine_file_type(data, source_filename)
+
+        # Extract core identification fields
+        isin = data.get(FitrsColumns.KEY) or data.get("ISIN") or data.get("Id")
+        from_date = self._parse_date(data.get("FrDt"))
+        to_date = self._parse_date(data.get("ToDt"))
+        tech_record_id = data.get("TechRcrdId")
+
+        # Get methodology for uniqueness check
+        methodology = self._determine_methodology(data)
+
+        # Check for existing record to prevent duplicates
+        # Unique criteria: (isin, file_type, from_date, to_date, methodology)
+        existing = session.query(self.TransparencyCalculation).filter(
+            self.TransparencyCalculation.isin == isin,
+            self.TransparencyCalculation.file_type == file_type,
+            self.TransparencyCalculation.from_date == from_date,
+            self.TransparencyCalculation.to_date == to_date
+        ).first()
+
+        # Additional check for methodology in raw_data if existing found
+        if existing:
+            existing_methodology = self._get_methodology_from_calculation(existing)
+            if existing_methodology == methodology:
+                self.logger.info(f"Found existing transparency calculation {existing.id} for {isin} ({file_type}, {methodology})")
+                return existing, False
+
+        # Create new record
+        self.logger.info(f"Creating new transparency calculation for {isin} ({file_type})")
+
+        # Prepare raw_data based on database type
+        if self.database_type == 'sqlite':
+            # SQLite supports JSON columns; typed dates still need to be serialized
+            raw_data = {
+                k: (v.isoformat() if isinstance(v, date) else v) for k, v in data.items()
+            }
+        else:
+            # SQL Server requires JSON as text
+            import json
+            raw_data = json.dumps(data.copy(), default=str)  # Serialize to JSON string
+
+        transparency_calc = self.TransparencyCalculation(
+            id=str(uuid.uuid4()),
+            tech_record_id=tech_record_id,
+            isin=isin,
+            from_date=from_date,
+            to_date=to_date,
+            liquidity=self._determine_liquidity(data, file_type),
+            total_transactions_executed=self._parse_numeric(data.get("TtlNbOfTxsExctd")),
+            total_volume_executed=self._parse_numeric(data.get("TtlVolOfTxsExctd")),
+            file_type=file_type,
+            source_file=source_filename,
+            raw_data=raw_data,  # Store all original data (database-type appropriate)
+        )
+
+        session.add(transparency_calc)
+        session.flush()  # Get the ID
+
+        # Create threshold records
+        thresholds = self.TransparencyThreshold.create_from_fitrs_data(transparency_calc.id, data)
+
+        for threshold in thresholds:
+            session.add(threshold)
+
+        return transparency_calc, True
+
     def _determine_methodology(self, data: Dict[str, Any]) -> str:
         """Extract methodology from FITRS data."""
         methodology = data.get("Mthdlgy", "")
@@ -457,11 +482,10 @@ class TransparencyService(TransparencyServiceInterface):
 
         self.logger.info(f"Processing FITRS file {source_filename} with {len(file_data)} records")
 
-        for index, row in file_data.iterrows():
-            try:
-                # Convert pandas Series to dict, handling NaN values
-                data = {k: (None if pd.isna(v) else v) for k, v in row.to_dict().items()}
+        records = FitrsNormalizer.to_records(FitrsNormalizer.normalize(file_data))
 
+        for index, data in enumerate(records):
+            try:
                 calc = self.create_transparency_calculation(
                     data=data, source_filename=source_filename
                 )
@@ -550,60 +574,73 @@ class TransparencyService(TransparencyServiceInterface):
         self.logger.debug(f"Target letters: {target_letters}")
         self.logger.debug(f"Target files: {target_files}")
 
-        for filename in target_files:
-            filepath = os.path.join(fitrs_directory, filename)
-            self.logger.debug(f"Searching file {filename} for ISIN {isin}")
+        # Read only the indexed rows for this ISIN; fall back to full scans if the index fails
+        try:
+            indexed_records = self._normalize_indexed_records(
+                FitrsIsinIndex(fitrs_directory).read_records(isin, target_files)
+            )
+        except Exception as e:
+            self.logger.warning(f"FITRS ISIN index unavailable, scanning files: {str(e)}")
+            indexed_records = self._scan_fitrs_files_for_isin(fitrs_directory, target_files, isin)
 
+        for filename, data in indexed_records:
             try:
-                # Read the CSV file with dtype specification to avoid warnings
-                # Most FITRS columns are mixed text/numeric, so read as string first
-                df = pd.read_csv(filepath, dtype=str, low_memory=False)
+                calc = self.create_transparency_calculation(
+                    data=data, source_filename=filename
+                )
+                created_calculations.append(calc)
+
+            except Exception as e:
+                self.logger.warning(
+                    f"Failed to create transparency calculation from {filename}: {str(e)}"
+                )
+                continue
 
-                # Search for the ISIN in both 'ISIN' and 'Id' columns (FULECR uses 'Id')
-                # Fixed pandas alignment issue by using proper column checks
-                matching_rows = pd.DataFrame()
+        self.logger.info(
+            f"Created {len(created_calculations)} transparency calculations for {isin} from FITRS files"
+        )
+        return created_calculations
+
+    def _normalize_indexed_records(self, indexed_records: List[tuple]) -> List[tuple]:
+        """Type raw index rows like full-file reads, one small frame per source file."""
+        by_file = {}
+        for filename, record in indexed_records:
+            by_file.setdefault(filename, []).append(record)
+
+        normalized = []
+        for filename, records in by_file.items():
+            frame = FitrsNormalizer.normalize(pd.DataFrame.from_records(records))
+            normalized.extend((filename, record) for record in FitrsNormalizer.to_records(frame))
+        return normalized
 
-                if "ISIN" in df.columns:
-                    isin_matches = df[df["ISIN"] == isin]
-                    matching_rows = pd.concat([matching_rows, isin_matches], ignore_index=True)
+    def _scan_fitrs_files_for_isin(
+        self, fitrs_directory: str, target_files: List[str], isin: str
+    ) -> List[tuple]:
+        """Read candidate FITRS files in full and return (filename, record) rows for an ISIN."""
+        records = []
 
-                if "Id" in df.columns:
-                    id_matches = df[df["Id"] == isin]
-                    matching_rows = pd.concat([matching_rows, id_matches], ignore_index=True)
+        for filename in target_files:
+            filepath = os.path.join(fitrs_directory, filename)
+            self.logger.debug(f"Searching file {filename} for ISIN {isin}")
+
+            try:
+                df = FitrsNormalizer.read_csv(filepath)
+                if df.empty:
+                    continue
 
-                # Remove duplicates if any
-                matching_rows = matching_rows.drop_duplicates()
+                matching_rows = df[df[FitrsColumns.KEY] == isin]
 
                 if not matching_rows.empty:
                     self.logger.info(f"Found {len(matching_rows)} records for {isin} in {filename}")
-
-                    # Create transparency calculations for each matching row
-                    for index, row in matching_rows.iterrows():
-                        try:
-                            # Convert pandas Series to dict, handling NaN values
-                            data = {
-                                k: (None if pd.isna(v) else v) for k, v in row.to_dict().items()
-                            }
-
-                            calc = self.create_transparency_calculation(
-                                data=data, source_filename=filename
-                            )
-                            created_calculations.append(calc)
-
-                        except Exception as e:
-                            self.logger.warning(
-                                f"Failed to create transparency calculation from row {index} in {filename}: {str(e)}"
-                            )
-                            continue
+                    records.extend(
+                        (filename, record) for record in FitrsNormalizer.to_records(matching_rows)
+                    )
 
             except Exception as e:
                 self.logger.warning(f"Failed to read FITRS file {filename}: {str(e)}")
                 continue
 
-        self.logger.info(
-            f"Created {len(created_calculations)} transparency calculations for {isin} from FITRS files"
-        )
-        return created_calculations
+        return records
 
     def _get_fitrs_file_patterns(self, instrument_type_or_cfi: str) -> List[str]:
         """
@@ -823,7 +860,11 @@ class TransparencyService(TransparencyServiceInterface):
         return None
 
     def create_transparency_bulk(
-        self, limit: Optional[int] = None, batch_size: int = ServiceDefaults.TRANSPARENCY_BATCH_SIZE, skip_existing: bool = True
+        self,
+        limit: Optional[int] = None,
+        batch_size: int = ServiceDefaults.TRANSPARENCY_BATCH_SIZE,
+        skip_existing: bool = True,
+        workers: int = ServiceDefaults.TRANSPARENCY_BULK_WORKERS,
     ) -> Dict[str, Any]:
         """
         Create transparency calculations in bulk for instruments that don't have them yet.
@@ -832,11 +873,14 @@ class TransparencyService(TransparencyServiceInterface):
         - Groups instruments by asset type (CFI code) to minimize file switching
         - Loads each FITRS file only once per asset type
         - Processes all instruments of same type together for maximum efficiency
+        - With workers > 1, extracts asset type groups concurrently in worker
+          processes while this process writes the results in batches
 
         Args:
             limit: Maximum number of instruments to process (None = no limit)
             batch_size: Number of instruments to process per batch (default: 10)
             skip_existing: Skip instruments that already have transparency data (default: True)
+            workers: Number of worker processes for asset type extraction (default: 1 = sequential)
 
         Returns:
             Dict with creation results and statistics
@@ -859,6 +903,7 @@ class TransparencyService(TransparencyServiceInterface):
             self.logger.info(f"   Limit: {limit or 'No limit'}")
             self.logger.info(f"   Skip existing: {skip_existing}")
             self.logger.info(f"   Batch size: {batch_size}")
+            self.logger.info(f"   Workers: {workers}")
 
             # Get instruments without transparency calculations
             instruments_to_process = self._get_instruments_without_transparency(
@@ -881,14 +926,16 @@ class TransparencyService(TransparencyServiceInterface):
             for asset_type, count in [(t, len(instrs)) for t, instrs in instruments_by_asset_type.items()]:
                 self.logger.info(f"   📂 {asset_type}: {count} instruments")
 
-            # Process each asset type group efficiently
-            for asset_type, type_instruments in instruments_by_asset_type.items():
-                type_start_time = time.time()
-                self.logger.info(f"� Processing asset type '{asset_type}' ({len(type_instruments)} instruments)")
-                
-                # Process this asset type with optimized file handling
-                type_result = self._process_asset_type_batch(asset_type, type_instruments, batch_size)
-                
+            if workers > 1 and len(instruments_by_asset_type) > 1:
+                type_results = self._process_asset_types_parallel(
+                    instruments_by_asset_type, batch_size, workers
+                )
+            else:
+                type_results = self._process_asset_types_sequential(
+                    instruments_by_asset_type, batch_size
+                )
+
+            for type_result in type_results:
                 # Update overall results
                 results["total_processed"] += type_result["processed"]
                 results["total_created_calculations"] += type_result["created_calculations"]
@@ -896,22 +943,7 @@ class TransparencyService(TransparencyServiceInterface):
                 results["total_failed"] += type_result["failed"]
                 results["failed_instruments"].extend(type_result["failed_instruments"])
                 results["successful_instruments"].extend(type_result["successful_instruments"])
-                
-                type_elapsed = time.time() - type_start_time
-                type_result["elapsed_time"] = type_elapsed
-                type_result["asset_type"] = asset_type
                 results["asset_type_results"].append(type_result)
-                
-                self.logger.info(
-                    f"✅ Asset type '{asset_type}' completed: {type_result['created_calculations']} calculations, "
-                    f"{type_result['failed']} failed ({type_elapsed:.1f}s)"
-                )
-                
-                # Progress update
-                progress_pct = (results["total_processed"] / len(instruments_to_process)) * 100
-                self.logger.info(
-                    f"📈 Overall progress: {results['total_processed']}/{len(instruments_to_process)} ({progress_pct:.1f}%)"
-                )
 
             results["elapsed_time"] = time.time() - start_time
 
@@ -1013,6 +1045,103 @@ class TransparencyService(TransparencyServiceInterface):
         
         return dict(grouped)
 
+    def _process_asset_types_sequential(
+        self, instruments_by_asset_type: Dict[str, List[Dict[str, Any]]], batch_size: int
+    ) -> List[Dict[str, Any]]:
+        """Process asset type groups one after another in this process."""
+        type_results = []
+        total = sum(len(instrs) for instrs in instruments_by_asset_type.values())
+        processed = 0
+
+        for asset_type, type_instruments in instruments_by_asset_type.items():
+            type_start_time = time.time()
+            self.logger.info(f"🔄 Processing asset type '{asset_type}' ({len(type_instruments)} instruments)")
+
+            # Process this asset type with optimized file handling
+            type_result = self._process_asset_type_batch(asset_type, type_instruments, batch_size)
+            self._finish_asset_type_result(type_result, asset_type, type_start_time)
+            type_results.append(type_result)
+
+            # Progress update
+            processed += type_result["processed"]
+            progress_pct = (processed / total) * 100
+            self.logger.info(f"📈 Overall progress: {processed}/{total} ({progress_pct:.1f}%)")
+
+        return type_results
+
+    def _process_asset_types_parallel(
+        self,
+        instruments_by_asset_type: Dict[str, List[Dict[str, Any]]],
+        batch_size: int,
+        workers: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract asset type groups concurrently in worker processes.
+
+        Each worker loads only the FITRS files for its own asset type, so groups
+        never contend for the same files. Database writes stay in this process:
+        results are persisted in batches as soon as each group finishes, which
+        keeps a single writer and avoids SQLite lock contention.
+        """
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        type_results = []
+        total = sum(len(instrs) for instrs in instruments_by_asset_type.values())
+        processed = 0
+        max_workers = min(workers, len(instruments_by_asset_type))
+
+        self.logger.info(
+            f"⚡ Parallel extraction: {len(instruments_by_asset_type)} asset types on {max_workers} workers"
+        )
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _extract_fitrs_records_timed,
+                    asset_type,
+                    [instr["isin"] for instr in type_instruments],
+                ): asset_type
+                for asset_type, type_instruments in instruments_by_asset_type.items()
+            }
+
+            for future in as_completed(futures):
+                asset_type = futures[future]
+                type_instruments = instruments_by_asset_type[asset_type]
+
+                # Groups wait for a free worker, so each is timed from its own start
+                type_start_time = time.time()
+                try:
+                    type_start_time, batch_results = future.result()
+                    type_result = self._persist_asset_type_records(
+                        asset_type, type_instruments, batch_results, batch_size
+                    )
+                except Exception as e:
+                    self.logger.error(f"Batch extraction failed for asset type {asset_type}: {str(e)}")
+                    self.logger.info(f"🔄 Falling back to individual processing for asset type {asset_type}")
+                    type_result = self._process_transparency_batch(type_instruments)
+
+                self._finish_asset_type_result(type_result, asset_type, type_start_time)
+                type_results.append(type_result)
+
+                processed += type_result["processed"]
+                progress_pct = (processed / total) * 100
+                self.logger.info(f"📈 Overall progress: {processed}/{total} ({progress_pct:.1f}%)")
+
+        return type_results
+
+    def _finish_asset_type_result(
+        self, type_result: Dict[str, Any], asset_type: str, start_time: float
+    ) -> None:
+        """Stamp an asset type result with its identity and elapsed time."""
+        type_elapsed = time.time() - start_time
+        type_result["elapsed_time"] = type_elapsed
+        type_result["asset_type"] = asset_type
+
+        self.logger.info(
+            f"✅ Asset type '{asset_type}' completed: {type_result['created_calculations']} calculations, "
+            f"{type_result['failed']} failed ({type_elapsed:.1f}s)"
+        )
+
     def _process_asset_type_batch(
         self, asset_type: str, instruments: List[Dict[str, Any]], batch_size: int
     ) -> Dict[str, Any]:
@@ -1022,92 +1151,136 @@ class TransparencyService(TransparencyServiceInterface):
         Uses the new BatchDataExtractor from esma_utils for maximum performance.
         Loads FITRS files once per asset type and processes all ISINs in memory.
         """
-        from ..utils.esma_utils import BatchDataExtractor
-        
-        type_result = {
-            "processed": 0,
-            "created_calculations": 0,
-            "skipped": 0,
-            "failed": 0,
-            "failed_instruments": [],
-            "successful_instruments": [],
-        }
-        
         # Extract ISINs for this asset type
         target_isins = [instr["isin"] for instr in instruments]
         
         self.logger.info(f"🚀 Using optimized batch extraction for {len(target_isins)} ISINs of type {asset_type}")
         
         try:
-            # Use the new optimized batch extractor
-            batch_results = BatchDataExtractor.batch_extract_fitrs_data(
-                isin_list=target_isins,
-                asset_type_mapping={isin: asset_type for isin in target_isins},
-                logger=self.logger
-            )
-            
-            found_results = batch_results.get('results', {})
-            
-            # Process each Any
-            for Any in instruments:
-                isin = Any["isin"]
-                type_result["processed"] += 1
-                
-                if isin in found_results:
-                    transparency_records = found_results[isin]
-                    calculations_created = 0
-                    
-                    # Create transparency calculations for each found record
-                    for record_data in transparency_records:
-                        try:
-                            # Get source filename for tracking
-                            source_filename = record_data.get('source_file', f"batch_extracted_{asset_type}")
-                            
-                            # Create transparency calculation
-                            calc = self.create_transparency_calculation(
-                                data=record_data, 
-                                source_filename=source_filename
-                            )
-                            
-                            if calc:
-                                calculations_created += 1
-                                
-                        except Exception as e:
-                            self.logger.warning(f"Failed to create calculation for {isin}: {str(e)}")
-                            continue
-                    
-                    if calculations_created > 0:
-                        type_result["created_calculations"] += calculations_created
-                        type_result["successful_instruments"].append({
-                            "isin": isin, 
-                            "calculations_created": calculations_created
-                        })
-                        self.logger.debug(f"   ✅ Created {calculations_created} calculations for {isin}")
-                    else:
-                        type_result["skipped"] += 1
-                        self.logger.debug(f"   ⚪ Found records but failed to create calculations for {isin}")
-                        
-                else:
-                    type_result["skipped"] += 1
-                    self.logger.debug(f"   ⚪ No transparency data found for {isin}")
-            
-            # Log batch statistics
-            batch_stats = batch_results.get('statistics', {})
-            self.logger.info(
-                f"� Asset type {asset_type} batch results: "
-                f"{type_result['created_calculations']} calculations, "
-                f"{batch_results.get('total_found', 0)} raw records found"
+            batch_results = extract_fitrs_records_for_asset_type(
+                asset_type, target_isins, logger=self.logger
             )
+            return self._persist_asset_type_records(asset_type, instruments, batch_results, batch_size)
             
         except Exception as e:
             self.logger.error(f"Batch extraction failed for asset type {asset_type}: {str(e)}")
             # Fall back to individual processing
             self.logger.info(f"🔄 Falling back to individual processing for asset type {asset_type}")
             return self._process_transparency_batch(instruments)
-        
+
+    def _persist_asset_type_records(
+        self,
+        asset_type: str,
+        instruments: List[Dict[str, Any]],
+        batch_results: Dict[str, Any],
+        batch_size: int,
+    ) -> Dict[str, Any]:
+        """
+        Write extracted FITRS records for one asset type in batched transactions.
+
+        Commits once per batch_size instruments. If a batch fails at the database
+        level it is rolled back and retried record by record so one bad row
+        cannot discard its neighbours.
+        """
+        type_result = {
+            "processed": 0,
+            "created_calculations": 0,
+            "skipped": 0,
+            "failed": 0,
+            "failed_instruments": [],
+            "successful_instruments": [],
+        }
+        found_results = batch_results.get('results', {})
+        batch_size = max(1, batch_size or 1)
+
+        for batch_start in range(0, len(instruments), batch_size):
+            batch = instruments[batch_start:batch_start + batch_size]
+            try:
+                created_by_isin = self._write_transparency_batch(batch, found_results, asset_type)
+            except Exception as e:
+                self.logger.warning(
+                    f"Batched write failed for asset type {asset_type}, retrying per record: {str(e)}"
+                )
+                created_by_isin = self._write_transparency_records_individually(
+                    batch, found_results, asset_type
+                )
+
+            for instrument_data in batch:
+                isin = instrument_data["isin"]
+                type_result["processed"] += 1
+                calculations_created = created_by_isin.get(isin, 0)
+
+                if calculations_created > 0:
+                    type_result["created_calculations"] += calculations_created
+                    type_result["successful_instruments"].append({
+                        "isin": isin, 
+                        "calculations_created": calculations_created
+                    })
+                    self.logger.debug(f"   ✅ Created {calculations_created} calculations for {isin}")
+                elif isin in found_results:
+                    type_result["skipped"] += 1
+                    self.logger.debug(f"   ⚪ Found records but failed to create calculations for {isin}")
+                else:
+                    type_result["skipped"] += 1
+                    self.logger.debug(f"   ⚪ No transparency data found for {isin}")
+
+        # Log batch statistics
+        self.logger.info(
+            f"📊 Asset type {asset_type} batch results: "
+            f"{type_result['created_calculations']} calculations, "
+            f"{batch_results.get('total_found', 0)} raw records found"
+        )
         return type_result
 
+    def _write_transparency_batch(
+        self, batch: List[Dict[str, Any]], found_results: Dict[str, List[Dict]], asset_type: str
+    ) -> Dict[str, int]:
+        """Stage all records for a batch of instruments on one session and commit once."""
+        created_by_isin = {}
+        session = SessionLocal()
+        try:
+            for instrument_data in batch:
+                isin = instrument_data["isin"]
+                for record_data in found_results.get(isin, []):
+                    source_filename = record_data.get('source_file', f"batch_extracted_{asset_type}")
+                    try:
+                        _, created = self._add_transparency_calculation(
+                            session, record_data, source_filename
+                        )
+                    except TransparencyValidationError as e:
+                        self.logger.warning(f"Failed to create calculation for {isin}: {str(e)}")
+                        continue
+                    # Existing records count as handled, matching create_transparency_calculation
+                    created_by_isin[isin] = created_by_isin.get(isin, 0) + 1
+
+            session.commit()
+            return created_by_isin
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
 
+    def _write_transparency_records_individually(
+        self, batch: List[Dict[str, Any]], found_results: Dict[str, List[Dict]], asset_type: str
+    ) -> Dict[str, int]:
+        """Fallback writer committing each record in its own transaction."""
+        created_by_isin = {}
+        for instrument_data in batch:
+            isin = instrument_data["isin"]
+            for record_data in found_results.get(isin, []):
+                source_filename = record_data.get('source_file', f"batch_extracted_{asset_type}")
+                try:
+                    calc = self.create_transparency_calculation(
+                        data=record_data, 
+                        source_filename=source_filename
+                    )
+                    if calc:
+                        created_by_isin[isin] = created_by_isin.get(isin, 0) + 1
+                except Exception as e:
+                    self.logger.warning(f"Failed to create calculation for {isin}: {str(e)}")
+                    continue
+        return created_by_isin
 
     def _process_transparency_batch(self, instruments: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Process a batch of instruments for transparency creation (legacy method)."""
@@ -1151,3 +1324,27 @@ class TransparencyService(TransparencyServiceInterface):
                 self.logger.warning(f"   ❌ Failed to create transparency for {isin}: {error_msg}")
 
         return batch_result
+
+
+def extract_fitrs_records_for_asset_type(
+    asset_type: str, isins: List[str], logger: logging.Logger = None
+) -> Dict[str, Any]:
+    """
+    Extract FITRS records for the ISINs of a single asset type.
+
+    Kept at module level so it can run inside a ProcessPoolExecutor worker;
+    it only reads files and never touches the database.
+    """
+    from ..utils.esma_utils import BatchDataExtractor
+
+    return BatchDataExtractor.batch_extract_fitrs_data(
+        isin_list=isins,
+        asset_type_mapping={isin: asset_type for isin in isins},
+        logger=logger,
+    )
+
+
+def _extract_fitrs_records_timed(asset_type: str, isins: List[str]) -> Tuple[float, Dict[str, Any]]:
+    """Worker entry point: extract one asset type and report when the worker started on it."""
+    started = time.time()
+    return started, extract_fitrs_records_for_asset_type(asset_type, isins)
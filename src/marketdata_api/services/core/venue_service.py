@@ -9,11 +9,13 @@ import logging
 from datetime import UTC, datetime
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import and_, case, func, or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, case, func
+from sqlalchemy.orm import Session
 
 from ...database.session import get_session
 from ...config import DatabaseConfig
+from ..utils.mic_reference import mic_reference
+from ..utils.statistics import statistics_store
 
 logger = logging.getLogger(__name__)
 
@@ -57,9 +59,7 @@ class VenueService:
         try:
             with get_session() as session:
                 # Build query - using self.MarketIdentificationCode as primary source
-                query = session.query(self.MarketIdentificationCode).options(
-                    joinedload(self.MarketIdentificationCode.trading_venues)
-                )
+                query = session.query(self.MarketIdentificationCode)
                 
                 # Apply filters
                 if filters.get("country"):
@@ -82,36 +82,33 @@ class VenueService:
                         self.MarketIdentificationCode.operating_mic == filters["operating_mic"].upper()
                     )
                 
+                ranks = None
                 if filters.get("search"):
-                    search_term = f"%{filters['search']}%"
-                    query = query.filter(
-                        or_(
-                            self.MarketIdentificationCode.market_name.ilike(search_term),
-                            self.MarketIdentificationCode.legal_entity_name.ilike(search_term),
-                            self.MarketIdentificationCode.mic.ilike(search_term),
-                        )
-                    )
+                    ranks = self._rank_mics(filters["search"], filters.get("threshold"))
+                    query = query.filter(self.MarketIdentificationCode.mic.in_(list(ranks)))
                 
                 if filters.get("has_instruments"):
-                    has_instruments = filters["has_instruments"].lower() == "true"
-                    if has_instruments:
-                        query = query.join(self.TradingVenue)
+                    # EXISTS instead of a join, so MICs are not repeated per trading venue
+                    has_venues = self.MarketIdentificationCode.trading_venues.any()
+                    if filters["has_instruments"].lower() == "true":
+                        query = query.filter(has_venues)
                     else:
-                        # Left join and filter for null
-                        query = query.outerjoin(self.TradingVenue).filter(self.TradingVenue.mic_code.is_(None))
+                        query = query.filter(~has_venues)
                 
                 # Get total count before pagination
                 total = query.count()
                 
                 # Apply pagination (with ORDER BY for SQL Server compatibility)
                 offset = (page - 1) * per_page
-                venues_data = query.order_by(self.MarketIdentificationCode.mic).offset(offset).limit(per_page).all()
+                if ranks is not None:
+                    # Search results are capped, so rank them in memory
+                    venues_data = self._order_by_rank(query.all(), ranks)[offset:offset + per_page]
+                else:
+                    venues_data = query.order_by(self.MarketIdentificationCode.mic).offset(offset).limit(per_page).all()
                 
-                # Format results
-                venues = []
-                for mic in venues_data:
-                    venue_info = self._format_venue_summary(mic)
-                    venues.append(venue_info)
+                # Format results with instrument counts for the whole page
+                counts = self._instrument_counts(session, [mic.mic for mic in venues_data])
+                venues = [self._format_venue_summary(mic, counts.get(mic.mic, 0)) for mic in venues_data]
                 
                 return {
                     "venues": venues,
@@ -146,7 +143,8 @@ class VenueService:
                     return None
                 
                 # Build detailed venue info
-                venue_detail = self._format_venue_detail(mic)
+                counts = self._instrument_counts(session, [mic.mic])
+                venue_detail = self._format_venue_detail(mic, counts.get(mic.mic, 0))
                 
                 if include_instruments:
                     # Get instruments traded on this venue
@@ -207,11 +205,7 @@ class VenueService:
         try:
             with get_session() as session:
                 # First verify the MIC exists
-                mic_exists = session.query(self.MarketIdentificationCode).filter(
-                    self.MarketIdentificationCode.mic == mic_code.upper()
-                ).first()
-                
-                if not mic_exists:
+                if not mic_reference.snapshot().exists(mic_code):
                     return None
                 
                 # Build instruments query
@@ -264,31 +258,30 @@ class VenueService:
             raise
 
     def search_venues(
-        self, query: str, filters: Dict[str, Any], limit: int = 20
+        self, query: str, filters: Dict[str, Any], limit: int = 20, offset: int = 0
     ) -> List[Dict[str, Any]]:
         """
         Search venues with fuzzy matching.
         
+        Venues are ranked by how well the MIC code, market name, legal entity
+        name or acronym matches the query (see MICSnapshot.search).
+        
         Args:
             query: Search query
-            filters: Additional filters
+            filters: Additional filters (country, status, threshold)
             limit: Maximum results to return
+            offset: Number of ranked results to skip
             
         Returns:
-            List of matching venues
+            List of matching venues, best match first
         """
         try:
             with get_session() as session:
-                # Build search query
-                search_term = f"%{query}%"
+                # Rank candidate MICs in memory, then apply filters in the database
+                ranks = self._rank_mics(query, filters.get("threshold"))
                 
                 db_query = session.query(self.MarketIdentificationCode).filter(
-                    or_(
-                        self.MarketIdentificationCode.market_name.ilike(search_term),
-                        self.MarketIdentificationCode.legal_entity_name.ilike(search_term),
-                        self.MarketIdentificationCode.mic.ilike(search_term),
-                        self.MarketIdentificationCode.acronym.ilike(search_term),
-                    )
+                    self.MarketIdentificationCode.mic.in_(list(ranks))
                 )
                 
                 # Apply additional filters
@@ -302,14 +295,12 @@ class VenueService:
                         self.MarketIdentificationCode.status == filters["status"].upper()
                     )
                 
-                # Limit results
-                results = db_query.limit(limit).all()
+                # Order by match score and page
+                results = self._order_by_rank(db_query.all(), ranks)[offset:offset + limit]
                 
-                # Format results
-                venues = []
-                for mic in results:
-                    venue_info = self._format_venue_summary(mic)
-                    venues.append(venue_info)
+                # Format results with instrument counts for the whole page
+                counts = self._instrument_counts(session, [mic.mic for mic in results])
+                venues = [self._format_venue_summary(mic, counts.get(mic.mic, 0)) for mic in results]
                 
                 return venues
 
@@ -317,67 +308,35 @@ class VenueService:
             logger.error(f"Error searching venues with query '{query}': {str(e)}")
             raise
 
+    def _rank_mics(self, query: str, threshold: Optional[float] = None) -> Dict[str, float]:
+        """Rank MIC codes by name match using the MIC reference name index."""
+        if threshold is None:
+            return mic_reference.snapshot().search(query)
+        return mic_reference.snapshot().search(query, threshold)
+
+    @staticmethod
+    def _order_by_rank(mics: List[Any], ranks: Dict[str, float]) -> List[Any]:
+        return sorted(mics, key=lambda mic: (-ranks[mic.mic], mic.mic))
+
     def get_venue_statistics(self) -> Dict[str, Any]:
         """
         Get venue and trading statistics.
         
+        Figures are read from the materialised statistics store, so this
+        does not scan the MIC or trading venue tables on every request.
+        
         Returns:
-            Dictionary with venue statistics
+            Dictionary with venue statistics and their computed_at time
         """
         try:
-            with get_session() as session:
-                # Basic MIC counts
-                total_mics = session.query(self.MarketIdentificationCode).count()
-                operating_mics = session.query(self.MarketIdentificationCode).filter(
-                    self.MarketIdentificationCode.operation_type == "OPRT"
-                ).count()
-                segment_mics = session.query(self.MarketIdentificationCode).filter(
-                    self.MarketIdentificationCode.operation_type == "SGMT"
-                ).count()
-                
-                # Status breakdown
-                status_counts = {}
-                for status in self.MICStatus:
-                    count = session.query(self.MarketIdentificationCode).filter(
-                        self.MarketIdentificationCode.status == status.value
-                    ).count()
-                    status_counts[status.value] = count
-                
-                # Country breakdown (top 10)
-                country_counts = (
-                    session.query(
-                        self.MarketIdentificationCode.iso_country_code,
-                        func.count(self.MarketIdentificationCode.mic).label('count')
-                    )
-                    .group_by(self.MarketIdentificationCode.iso_country_code)
-                    .order_by(func.count(self.MarketIdentificationCode.mic).desc())
-                    .limit(10)
-                    .all()
-                )
-                
-                # Venues with instruments
-                venues_with_instruments = (
-                    session.query(self.MarketIdentificationCode)
-                    .join(self.TradingVenue)
-                    .distinct()
-                    .count()
-                )
-                
-                # Total trading venues (individual venue records)
-                total_trading_venues = session.query(self.TradingVenue).count()
-                
-                return {
-                    "total_mics": total_mics,
-                    "operating_mics": operating_mics,
-                    "segment_mics": segment_mics,
-                    "status_breakdown": status_counts,
-                    "top_countries": [
-                        {"country_code": country, "count": count}
-                        for country, count in country_counts
-                    ],
-                    "venues_with_instruments": venues_with_instruments,
-                    "total_trading_venues": total_trading_venues,
-                }
+            snapshot = statistics_store.get("venues")
+            stats = dict(snapshot.figures)
+            stats["status_breakdown"] = {
+                status.value: snapshot.figures["status_breakdown"].get(status.value, 0)
+                for status in self.MICStatus
+            }
+            stats["computed_at"] = snapshot.computed_at.isoformat()
+            return stats
 
         except Exception as e:
             logger.error(f"Error getting venue statistics: {str(e)}")
@@ -429,34 +388,52 @@ class VenueService:
             logger.error(f"Error getting venue countries: {str(e)}")
             raise
 
-    def _format_venue_summary(self, mic) -> Dict[str, Any]:
-        """Format MIC data for venue summary display."""
-        # Count associated instruments (instruments trading on this MIC)
+    def _instrument_counts(self, session: Session, mic_codes: List[str]) -> Dict[str, int]:
+        """
+        Count instruments for a page of MICs with one grouped query per source.
+        
+        An instrument counts for a MIC when it has a trading venue record on
+        it or names it as its relevant trading venue; the higher of the two
+        counts is used (the more comprehensive approach).
+        
+        Returns:
+            MIC code -> instrument count, for every requested MIC
+        """
+        codes = sorted(set(mic_codes))
+        if not codes:
+            return {}
+        
         try:
-            with get_session() as debug_session:
-                # Try multiple approaches to count instruments for this MIC
-                
-                # Method 1: Count instruments via trading_venues table with this MIC
-                venues_count = debug_session.query(self.Instrument.id).join(
-                    self.TradingVenue, self.Instrument.id == self.TradingVenue.instrument_id
-                ).filter(
-                    self.TradingVenue.mic_code == mic.mic
-                ).distinct().count()
-                
-                # Method 2: Count instruments that have relevant_trading_venue matching this MIC
-                direct_count = debug_session.query(self.Instrument).filter(
-                    self.Instrument.relevant_trading_venue == mic.mic
-                ).count()
-                
-                # Use the higher count (more comprehensive approach)
-                self.Instrument_count = max(venues_count, direct_count)
-                
-                logger.debug(f"MIC {mic.mic}: Via trading_venues={venues_count}, direct={direct_count}, using={self.Instrument_count}")
-                
+            # Method 1: Distinct instruments via trading_venues, grouped by MIC
+            via_venues = dict(
+                session.query(
+                    self.TradingVenue.mic_code,
+                    func.count(func.distinct(self.Instrument.id)),
+                )
+                .join(self.Instrument, self.Instrument.id == self.TradingVenue.instrument_id)
+                .filter(self.TradingVenue.mic_code.in_(codes))
+                .group_by(self.TradingVenue.mic_code)
+                .all()
+            )
+            
+            # Method 2: Instruments whose relevant_trading_venue is the MIC
+            direct = dict(
+                session.query(
+                    self.Instrument.relevant_trading_venue,
+                    func.count(self.Instrument.id),
+                )
+                .filter(self.Instrument.relevant_trading_venue.in_(codes))
+                .group_by(self.Instrument.relevant_trading_venue)
+                .all()
+            )
         except Exception as e:
-            logger.error(f"Error counting instruments for MIC {mic.mic}: {str(e)}")
-            self.Instrument_count = 0
+            logger.error(f"Error counting instruments for {len(codes)} MICs: {str(e)}")
+            return {}
         
+        return {code: max(via_venues.get(code, 0), direct.get(code, 0)) for code in codes}
+
+    def _format_venue_summary(self, mic, instrument_count: int = 0) -> Dict[str, Any]:
+        """Format MIC data for venue summary display (counts come from _instrument_counts)."""
         try:
             return {
                 "mic_code": mic.mic,
@@ -469,7 +446,7 @@ class VenueService:
                 "operation_type": mic.operation_type.value if hasattr(mic.operation_type, 'value') else mic.operation_type,
                 "market_category": mic.market_category_code.value if hasattr(mic.market_category_code, 'value') else mic.market_category_code,
                 "website": mic.website,
-                "instrument_count": self.Instrument_count,
+                "instrument_count": instrument_count,
                 "last_update_date": self._safe_isoformat(mic.last_update_date),
             }
         except Exception as e:
@@ -486,13 +463,13 @@ class VenueService:
                 "operation_type": str(mic.operation_type) if mic.operation_type else None,
                 "market_category": str(mic.market_category_code) if mic.market_category_code else None,
                 "website": mic.website,
-                "instrument_count": self.Instrument_count,
+                "instrument_count": instrument_count,
                 "last_update_date": str(mic.last_update_date) if mic.last_update_date else None,
             }
 
-    def _format_venue_detail(self, mic) -> Dict[str, Any]:
+    def _format_venue_detail(self, mic, instrument_count: int = 0) -> Dict[str, Any]:
         """Format MIC data for detailed venue display."""
-        venue_data = self._format_venue_summary(mic)
+        venue_data = self._format_venue_summary(mic, instrument_count)
         
         # Add detailed fields
         venue_data.update({
@@ -506,21 +483,16 @@ class VenueService:
         })
         
         # Add segment MICs if this is an operating MIC
-        if mic.operation_type == "OPRT":
+        if venue_data.get("operation_type") == "OPRT":
             try:
-                with get_session() as session:
-                    segments = session.query(self.MarketIdentificationCode).filter(
-                        self.MarketIdentificationCode.operating_mic == mic.mic
-                    ).all()
-                    
-                    venue_data["segment_mics"] = [
-                        {
-                            "mic_code": seg.mic,
-                            "market_name": seg.market_name,
-                            "status": seg.status.value if hasattr(seg.status, 'value') else seg.status,
-                        }
-                        for seg in segments
-                    ]
+                venue_data["segment_mics"] = [
+                    {
+                        "mic_code": seg["mic"],
+                        "market_name": seg["market_name"],
+                        "status": seg["status"],
+                    }
+                    for seg in mic_reference.snapshot().segments(mic.mic)
+                ]
             except Exception as e:
                 logger.warning(f"Error loading segment MICs for {mic.mic}: {str(e)}")
                 venue_data["segment_mics"] = []
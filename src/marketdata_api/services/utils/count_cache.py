@@ -0,0 +1,171 @@
+"""
+Total Count Cache
+
+Caches list endpoint totals keyed by resource and normalized filter set.
+
+Each entry remembers the data versions of the tables it was counted from
+(see database.data_version); a write to any of those tables makes the entry
+stale for exact reads. A TTL bounds staleness across worker processes, whose
+version counters are not shared.
+
+Count modes:
+- exact: cached exact count, recounted when stale
+- estimate: any cached count for the filter set (even stale), else database
+  row statistics for unfiltered lists, else an exact count
+- none: no total at all
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import text
+
+from ...constants import CountModes, ServiceDefaults
+from ...database import data_version
+
+logger = logging.getLogger(__name__)
+
+FilterKey = Tuple[Tuple[str, str], ...]
+
+
+def normalize_filters(filters: Optional[Dict[str, Any]]) -> FilterKey:
+    """Turn a filter dict into a hashable key, ignoring empty values and key order."""
+    if not filters:
+        return ()
+    return tuple(
+        sorted(
+            (name, str(value).strip())
+            for name, value in filters.items()
+            if value is not None and str(value).strip() != ""
+        )
+    )
+
+
+class CountCache:
+    """LRU cache of total counts invalidated by table data versions."""
+
+    def __init__(
+        self,
+        ttl_seconds: int = ServiceDefaults.COUNT_CACHE_TTL_SECONDS,
+        max_entries: int = ServiceDefaults.COUNT_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, FilterKey], Tuple[Tuple[int, ...], float, int]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def _lookup(self, key) -> Optional[Tuple[Tuple[int, ...], float, int]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _store(self, key, versions: Tuple[int, ...], count: int) -> None:
+        with self._lock:
+            self._entries[key] = (versions, time.monotonic(), count)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_exact(
+        self, resource: str, filters: Optional[Dict[str, Any]], tables: Tuple[str, ...],
+        count_fn: Callable[[], int],
+    ) -> int:
+        """Return a fresh count, calling count_fn only when the cached value is stale."""
+        key = (resource, normalize_filters(filters))
+        versions = data_version.get_version(*tables)
+
+        entry = self._lookup(key)
+        if (
+            entry is not None
+            and entry[0] == versions
+            and time.monotonic() - entry[1] < self.ttl_seconds
+        ):
+            return entry[2]
+
+        count = count_fn()
+        self._store(key, versions, count)
+        return count
+
+    def get_any(self, resource: str, filters: Optional[Dict[str, Any]]) -> Optional[int]:
+        """Return the last count seen for a filter set, however old."""
+        entry = self._lookup((resource, normalize_filters(filters)))
+        return entry[2] if entry is not None else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Process-wide cache shared by all list endpoints
+count_cache = CountCache()
+
+
+def estimate_table_rows(table: str) -> Optional[int]:
+    """
+    Approximate a table's row count from database metadata, without scanning it.
+
+    SQLite uses MAX(rowid) (exact unless rows were deleted); SQL Server reads
+    partition statistics. Returns None when no estimate is available.
+    """
+    from ...database.session import get_session
+
+    try:
+        with get_session() as session:
+            dialect = session.get_bind().dialect.name
+            if dialect == "sqlite":
+                result = session.execute(text(f'SELECT MAX(rowid) FROM "{table}"')).scalar()
+                return int(result or 0)
+            if dialect == "mssql":
+                result = session.execute(
+                    text(
+                        "SELECT SUM(row_count) FROM sys.dm_db_partition_stats "
+                        "WHERE object_id = OBJECT_ID(:table) AND index_id IN (0, 1)"
+                    ),
+                    {"table": table},
+                ).scalar()
+                return int(result) if result is not None else None
+    except Exception as e:
+        logger.warning(f"Could not estimate row count for {table}: {e}")
+    return None
+
+
+def resolve_total(
+    mode: str,
+    resource: str,
+    filters: Optional[Dict[str, Any]],
+    tables: Tuple[str, ...],
+    count_fn: Callable[[], int],
+) -> Optional[int]:
+    """
+    Resolve a list endpoint's total according to the requested count mode.
+
+    Args:
+        mode: One of CountModes.VALID_MODES
+        resource: Cache namespace (usually the endpoint's main table)
+        filters: Filters applied to the listing
+        tables: Tables the count reads from; tables[0] is used for estimates
+        count_fn: Callable performing the exact count
+
+    Returns:
+        Total count, or None for mode 'none'
+    """
+    if mode == CountModes.NONE:
+        return None
+
+    if mode == CountModes.ESTIMATE:
+        cached = count_cache.get_any(resource, filters)
+        if cached is not None:
+            return cached
+        if not normalize_filters(filters):
+            estimate = estimate_table_rows(tables[0])
+            if estimate is not None:
+                return estimate
+
+    return count_cache.get_exact(resource, filters, tables, count_fn)
@@ -19,6 +19,7 @@ from requests.models import Response
 from tqdm import tqdm
 
 from marketdata_api.config import esmaConfig
+from marketdata_api.constants import FitrsColumns
 
 
 class Utils:
@@ -179,6 +180,9 @@ class Utils:
                             df.to_pickle(file_name)
                         logger.info(f"Data saved: {file_name}")
 
+                        if is_fitrs and file_name.endswith(".csv"):
+                            Utils._update_fitrs_index(file_name)
+
                     except Exception as e:
                         warnings.warn(f"Error saving file: {file_name}\n{str(e)}")
                         logger.error(f"Error, file not saved: {file_name}\n{df}")
@@ -214,6 +218,17 @@ class Utils:
 
         return decorator
 
+    @staticmethod
+    def _update_fitrs_index(file_name: str):
+        """Add a freshly saved FITRS file to the ISIN index; failures only cost lookup speed."""
+        from .fitrs_index import FitrsIsinIndex
+
+        try:
+            FitrsIsinIndex(os.path.dirname(file_name)).index_file(file_name)
+        except Exception as e:
+            logger = Utils.set_logger("EsmaDataUtils")
+            logger.warning(f"Could not update FITRS ISIN index for {file_name}: {str(e)}")
+
     @staticmethod
     def extract_file_name_from_url(url: str) -> str:
         """
@@ -432,6 +447,7 @@ class Utils:
         root_list = list(root.iter("NonEqtyTrnsprncyData"))
         if not root_list:
             root_list = list(root.iter("EqtyTrnsprncyData"))
+        is_transparency = bool(root_list)
         if not root_list:
             root_list = list(root.iter("VolCapRslt"))
 
@@ -443,6 +459,11 @@ class Utils:
 
         df = pd.DataFrame.from_records(list_dicts)
         delivery_df = df.map(lambda x: x[0] if isinstance(x, list) else x)
+
+        # FITRS: canonical isin key plus typed numeric/date columns
+        if is_transparency:
+            delivery_df = FitrsNormalizer.normalize(delivery_df)
+
         logger.info(f"Final DataFrame shape: {delivery_df.shape}")
         return delivery_df
 
@@ -538,6 +559,69 @@ class QueryUrl:
     )
 
 
+class FitrsNormalizer:
+    """
+    Normalizes FITRS DataFrames into a canonical, typed shape.
+
+    FULECR files key on 'Id' while FULNCR files use 'ISIN', and every field is
+    parsed from XML as text. The normalizer adds a single 'isin' key column and
+    converts statistic, threshold and date columns in one vectorized pass, so
+    consumers can filter on one column and skip per-record parsing.
+
+    Normalization is idempotent: it runs when a FITRS file is ingested and again
+    when CSVs are read back, which also upgrades files saved before this step existed.
+    """
+
+    @staticmethod
+    def is_numeric_column(column: str) -> bool:
+        base = re.sub(FitrsColumns.REPEAT_SUFFIX_PATTERN, "", column)
+        return base in FitrsColumns.NUMERIC_FIELDS or base.endswith(FitrsColumns.NUMERIC_SUFFIXES)
+
+    @staticmethod
+    def is_date_column(column: str) -> bool:
+        return re.sub(FitrsColumns.REPEAT_SUFFIX_PATTERN, "", column) in FitrsColumns.DATE_FIELDS
+
+    @staticmethod
+    def normalize(df: pd.DataFrame) -> pd.DataFrame:
+        """Add the canonical key column and type numeric and date columns."""
+        if df.empty:
+            return df
+
+        df = df.copy()
+
+        key = pd.Series(pd.NA, index=df.index, dtype="object")
+        for source_column in FitrsColumns.SOURCE_KEYS:
+            if source_column in df.columns:
+                key = key.fillna(df[source_column])
+        if FitrsColumns.KEY in df.columns:
+            key = df[FitrsColumns.KEY].fillna(key)
+        df[FitrsColumns.KEY] = key
+
+        for column in df.columns:
+            if FitrsNormalizer.is_numeric_column(column):
+                df[column] = pd.to_numeric(df[column], errors="coerce")
+            elif FitrsNormalizer.is_date_column(column):
+                parsed = pd.to_datetime(df[column], errors="coerce", format="mixed")
+                df[column] = parsed.dt.date.astype("object").where(parsed.notna(), None)
+
+        return df
+
+    @staticmethod
+    def read_csv(filepath: str) -> pd.DataFrame:
+        """Read a stored FITRS CSV and return it normalized."""
+        df = pd.read_csv(
+            filepath, dtype=str, low_memory=False, keep_default_na=False, na_values=list(FitrsColumns.NA_VALUES)
+        )
+        return FitrsNormalizer.normalize(df)
+
+    @staticmethod
+    def to_records(df: pd.DataFrame) -> list:
+        """Convert a normalized DataFrame to record dicts with missing values as None."""
+        if df.empty:
+            return []
+        return df.astype("object").where(df.notna(), None).to_dict("records")
+
+
 class BatchDataExtractor:
     """
     High-performance batch data extraction utility for ESMA FIRDS/FITRS files.
@@ -689,7 +773,7 @@ class BatchDataExtractor:
         for filename in sorted(matching_files):
             filepath = os.path.join(data_directory, filename)
             try:
-                df = pd.read_csv(filepath, dtype=str, low_memory=False)
+                df = FitrsNormalizer.read_csv(filepath)
                 if not df.empty:
                     df['source_file'] = filename  # Track source for debugging
                     consolidated_dfs.append(df)
@@ -864,29 +948,14 @@ class BatchDataExtractor:
                 statistics[asset_type] = 0
                 continue
             
-            # Search in both ISIN and Id columns (FULECR uses 'Id')
-            matches = pd.DataFrame()
-            
-            if 'ISIN' in consolidated_df.columns:
-                isin_matches = consolidated_df[consolidated_df['ISIN'].isin(group_isins)]
-                matches = pd.concat([matches, isin_matches], ignore_index=True)
-            
-            if 'Id' in consolidated_df.columns:
-                id_matches = consolidated_df[consolidated_df['Id'].isin(group_isins)]
-                matches = pd.concat([matches, id_matches], ignore_index=True)
-            
-            # Remove duplicates
-            matches = matches.drop_duplicates()
+            # Normalized files carry a single canonical key column
+            matches = consolidated_df[consolidated_df[FitrsColumns.KEY].isin(group_isins)]
             found_count = len(matches)
             
             if found_count > 0:
-                # Group matches by ISIN (handle both ISIN and Id columns)
-                for _, row in matches.iterrows():
-                    isin = row.get('ISIN') or row.get('Id')
-                    if isin and isin in group_isins:
-                        if isin not in results:
-                            results[isin] = []
-                        results[isin].append(row.to_dict())
+                # Group matches by ISIN, records already typed with None for missing values
+                for isin, isin_matches in matches.groupby(FitrsColumns.KEY, sort=False):
+                    results.setdefault(isin, []).extend(FitrsNormalizer.to_records(isin_matches))
                 
                 total_found += found_count
                 logger.info(f"   ✅ Found {found_count} transparency records for asset type {asset_type}")
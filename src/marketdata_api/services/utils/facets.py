@@ -0,0 +1,82 @@
+"""
+Instrument Facets
+
+Counts of instruments per value of the dimensions filter UIs offer
+(instrument type, CFI category, currency, competent authority and venue
+MIC), for the same filter set the instrument list accepts.
+
+Each facet is one grouped aggregate over the filtered instruments. The
+unfiltered facets are a materialised statistics group (see
+services.utils.statistics); filtered facets are computed on demand and kept
+in facet_cache, keyed by the normalized filter set and invalidated by the
+data versions of the tables they read.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import distinct, func
+from sqlalchemy.orm import aliased
+
+from ...constants import ServiceDefaults
+from .count_cache import CountCache
+from .statistics import CFI_CATEGORIES
+
+# Tables the facets are computed from
+FACET_TABLES = ("instruments", "trading_venues")
+
+# Filtered facet results, one entry per (filter set, data versions)
+facet_cache = CountCache()
+
+
+def _facet_values(counts: Dict[Any, int], limit: int) -> List[Dict[str, Any]]:
+    """Largest counts first, ties by value."""
+    ordered = sorted(counts.items(), key=lambda item: (-item[1], str(item[0])))
+    return [{"value": value, "count": count} for value, count in ordered[:limit]]
+
+
+def compute_instrument_facets(
+    session,
+    models: Dict[str, Any],
+    filter_fn: Optional[Callable[[Any], Any]] = None,
+    limit: int = ServiceDefaults.FACET_MAX_VALUES,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Count instruments per facet value, one grouped query per facet.
+
+    Args:
+        session: Database session
+        models: Model classes by name ("Instrument", "TradingVenue")
+        filter_fn: Applies the list filters to a query selecting from
+            instruments (None for all instruments)
+        limit: Values kept per facet
+
+    Returns:
+        Facet name -> [{"value", "count"}], largest counts first
+    """
+    Instrument = models["Instrument"]
+    # Aliased so a mic_code filter can still join trading_venues itself
+    Venue = aliased(models["TradingVenue"])
+    instruments = func.count(distinct(Instrument.id))
+
+    def grouped(column, join_venues: bool = False) -> Dict[Any, int]:
+        query = session.query(column, instruments).select_from(Instrument)
+        if join_venues:
+            query = query.join(Venue, Venue.instrument_id == Instrument.id)
+        if filter_fn is not None:
+            query = filter_fn(query)
+        return {value: count for value, count in query.group_by(column).all() if value}
+
+    # CFI categories are folded from full codes, avoiding dialect-specific SUBSTRING
+    categories: Dict[str, int] = {}
+    for cfi_code, count in grouped(Instrument.cfi_code).items():
+        category = cfi_code[:1].upper()
+        if category in CFI_CATEGORIES:
+            categories[category] = categories.get(category, 0) + count
+
+    return {
+        "instrument_type": _facet_values(grouped(Instrument.instrument_type), limit),
+        "cfi_category": _facet_values(categories, limit),
+        "currency": _facet_values(grouped(Instrument.currency), limit),
+        "competent_authority": _facet_values(grouped(Instrument.competent_authority), limit),
+        "venue": _facet_values(grouped(Venue.mic_code, join_venues=True), limit),
+    }
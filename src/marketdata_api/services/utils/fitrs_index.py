@@ -0,0 +1,269 @@
+"""
+FITRS ISIN Index
+
+Persisted ISIN -> (file, byte offset, length) index over the FITRS CSV store.
+
+Single-instrument transparency creation only needs the handful of rows that
+belong to one ISIN, but the FITRS files are large. The index lets callers seek
+straight to those rows instead of parsing every candidate file in full.
+
+The index is a small SQLite database that lives next to the CSV files. It is
+updated when a FITRS file is downloaded and re-validated against each file's
+size and modification time on lookup, so files replaced or removed outside the
+download path are re-indexed or dropped automatically.
+"""
+
+import csv
+import io
+import json
+import logging
+import os
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ...constants import FitrsColumns
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".fitrs_isin_index.sqlite"
+
+# Bumped when the stored layout changes; older indexes are dropped and rebuilt on open
+# (1: headers stored as JSON arrays instead of comma-joined text)
+INDEX_FORMAT_VERSION = 1
+
+# Normalized files carry 'isin'; older files key on 'ISIN' (FULNCR) or 'Id' (FULECR)
+KEY_COLUMNS = (FitrsColumns.KEY,) + FitrsColumns.SOURCE_KEYS
+
+
+class FitrsIsinIndex:
+    """
+    ISIN index over a directory of FITRS CSV files.
+
+    Example:
+        index = FitrsIsinIndex(fitrs_directory)
+        index.index_file("FULECR_20250426_E_1of1_fitrs_data.csv")
+        for filename, record in index.read_records("SE0000242455"):
+            ...
+    """
+
+    def __init__(self, directory: str):
+        self.directory = str(directory)
+        self.index_path = os.path.join(self.directory, INDEX_FILENAME)
+        self.logger = logging.getLogger(__name__)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.index_path)
+        if conn.execute("PRAGMA user_version").fetchone()[0] < INDEX_FORMAT_VERSION:
+            with conn:
+                conn.execute("DROP TABLE IF EXISTS isin_offsets")
+                conn.execute("DROP TABLE IF EXISTS indexed_files")
+            conn.execute(f"PRAGMA user_version = {INDEX_FORMAT_VERSION}")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS indexed_files ("
+            "filename TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime REAL NOT NULL, "
+            "header TEXT NOT NULL, rows INTEGER NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS isin_offsets ("
+            "isin TEXT NOT NULL, filename TEXT NOT NULL, "
+            "offset INTEGER NOT NULL, length INTEGER NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_isin_offsets_isin ON isin_offsets (isin)")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_isin_offsets_filename ON isin_offsets (filename)"
+        )
+        return conn
+
+    @staticmethod
+    def _scan_offsets(path: str) -> Tuple[List[str], List[Tuple[str, int, int]]]:
+        """
+        Read a CSV once and return its header columns plus (isin, offset, length) per row.
+
+        Offsets are tracked on the raw byte stream so quoted fields containing
+        newlines are still captured as a single record.
+        """
+        entries = []
+        with open(path, "rb") as fh:
+            position = 0
+
+            def lines():
+                nonlocal position
+                for raw in fh:
+                    position += len(raw)
+                    yield raw.decode("utf-8")
+
+            reader = csv.reader(lines())
+            header = next(reader, None)
+            if not header:
+                return [], entries
+            header[0] = header[0].lstrip("\ufeff")
+            header_line_end = position
+
+            key_positions = [header.index(col) for col in KEY_COLUMNS if col in header]
+            record_start = header_line_end
+            for row in reader:
+                record_end = position
+                for key_position in key_positions:
+                    if key_position < len(row) and row[key_position]:
+                        entries.append((row[key_position], record_start, record_end - record_start))
+                        break
+                record_start = record_end
+
+        return header, entries
+
+    def index_file(self, filename: str) -> int:
+        """(Re)build index entries for one CSV file. Returns the number of rows indexed."""
+        filename = os.path.basename(filename)
+        path = os.path.join(self.directory, filename)
+        stat = os.stat(path)
+        header, entries = self._scan_offsets(path)
+
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM isin_offsets WHERE filename = ?", (filename,))
+                conn.executemany(
+                    "INSERT INTO isin_offsets (isin, filename, offset, length) VALUES (?, ?, ?, ?)",
+                    ((isin, filename, offset, length) for isin, offset, length in entries),
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO indexed_files (filename, size, mtime, header, rows) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (filename, stat.st_size, stat.st_mtime, json.dumps(header), len(entries)),
+                )
+        finally:
+            conn.close()
+
+        self.logger.info(f"Indexed {len(entries)} FITRS rows from {filename}")
+        return len(entries)
+
+    def remove_file(self, filename: str) -> None:
+        """Drop all index entries for a file."""
+        filename = os.path.basename(filename)
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM isin_offsets WHERE filename = ?", (filename,))
+                conn.execute("DELETE FROM indexed_files WHERE filename = ?", (filename,))
+        finally:
+            conn.close()
+
+    def refresh(self, filenames: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Bring the index in line with the files on disk.
+
+        Args:
+            filenames: Files to validate (defaults to every CSV in the directory)
+
+        Returns:
+            Dict with counts of 'indexed' and 'removed' files
+        """
+        if filenames is None:
+            filenames = [f for f in os.listdir(self.directory) if f.endswith(".csv")]
+        filenames = [os.path.basename(f) for f in filenames]
+
+        conn = self._connect()
+        try:
+            known = {
+                row[0]: (row[1], row[2])
+                for row in conn.execute("SELECT filename, size, mtime FROM indexed_files")
+            }
+        finally:
+            conn.close()
+
+        result = {"indexed": 0, "removed": 0}
+
+        for filename in filenames:
+            path = os.path.join(self.directory, filename)
+            if not os.path.exists(path):
+                continue
+
+            stat = os.stat(path)
+            if known.get(filename) != (stat.st_size, stat.st_mtime):
+                self.index_file(filename)
+                result["indexed"] += 1
+
+        # Forget files that disappeared from the directory (e.g. auto-cleanup)
+        for filename in known:
+            if not os.path.exists(os.path.join(self.directory, filename)):
+                self.remove_file(filename)
+                result["removed"] += 1
+
+        return result
+
+    def lookup(
+        self, isin: str, filenames: Optional[Iterable[str]] = None
+    ) -> List[Tuple[str, int, int]]:
+        """Return (filename, offset, length) for every row of an ISIN, optionally limited to some files."""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT filename, offset, length FROM isin_offsets WHERE isin = ? "
+                "ORDER BY filename, offset",
+                (isin,),
+            ).fetchall()
+        finally:
+            conn.close()
+
+        if filenames is not None:
+            allowed = {os.path.basename(f) for f in filenames}
+            rows = [row for row in rows if row[0] in allowed]
+        return rows
+
+    def read_records(
+        self, isin: str, filenames: Optional[Iterable[str]] = None
+    ) -> List[Tuple[str, Dict[str, Optional[str]]]]:
+        """
+        Read only the rows belonging to an ISIN.
+
+        The candidate files are validated first so a stale index never serves
+        offsets from a replaced file. Empty fields and NA tokens
+        (FitrsColumns.NA_VALUES) are returned as None, matching the NaN -> None
+        conversion used for full-file reads.
+
+        Returns:
+            List of (filename, record dict) tuples
+        """
+        if filenames is not None:
+            filenames = [os.path.basename(f) for f in filenames]
+        self.refresh(filenames)
+
+        locations = self.lookup(isin, filenames)
+        if not locations:
+            return []
+
+        located_files = sorted({location[0] for location in locations})
+        conn = self._connect()
+        try:
+            headers = {
+                row[0]: json.loads(row[1])
+                for row in conn.execute(
+                    "SELECT filename, header FROM indexed_files WHERE filename IN (%s)"
+                    % ",".join("?" * len(located_files)),
+                    located_files,
+                )
+            }
+        finally:
+            conn.close()
+
+        records = []
+        handles = {}
+        try:
+            for filename, offset, length in locations:
+                if filename not in handles:
+                    handles[filename] = open(os.path.join(self.directory, filename), "rb")
+                fh = handles[filename]
+                fh.seek(offset)
+                raw = fh.read(length).decode("utf-8")
+
+                values = next(csv.reader(io.StringIO(raw)), [])
+                record = {
+                    column: (None if value in FitrsColumns.NA_VALUES else value)
+                    for column, value in zip(headers[filename], values)
+                }
+                records.append((filename, record))
+        finally:
+            for fh in handles.values():
+                fh.close()
+
+        return records
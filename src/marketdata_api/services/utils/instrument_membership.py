@@ -0,0 +1,330 @@
+"""
+Instrument Membership Index
+
+Process-local answer to "which of these ISINs are loaded, and with what",
+served by POST /instruments/exists without per-ISIN queries.
+
+The index holds every loaded ISIN in one sorted array with a parallel
+bytearray of status bits (one byte per instrument):
+
+    1  loaded        the instrument exists
+    2  figi          it has at least one FIGI mapping
+    4  transparency  it has at least one transparency calculation
+    8  legal_entity  its issuer LEI is stored in legal_entities
+
+A check is one binary search per input ISIN, so n ISINs against N loaded
+instruments cost O(n log N) in memory.
+
+The index is maintained on write. Session events record the ISINs (and
+issuer LEIs) each committed ORM write touched, and the next check re-reads
+the status bits of just those instruments into a small overlay on the
+sorted array. Writes that carry no keys (bulk statements) and writes made
+by other processes are picked up by a full rebuild in the background while
+the current index keeps serving, as are overlays grown past
+MEMBERSHIP_MAX_PATCHES.
+"""
+
+import copy
+import logging
+import threading
+import time
+from bisect import bisect_left
+from typing import Collection, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from ...constants import ServiceDefaults
+
+logger = logging.getLogger(__name__)
+
+# Status bit per flag, in bit order
+MEMBERSHIP_FLAGS = (("loaded", 1), ("figi", 2), ("transparency", 4), ("legal_entity", 8))
+
+LOADED, FIGI, TRANSPARENCY, LEGAL_ENTITY = (bit for _, bit in MEMBERSHIP_FLAGS)
+
+# Tables the status bits are read from, with the key their written rows carry: ISIN or issuer LEI
+_WRITE_KEYS = {
+    "instruments": "isin",
+    "figi_mappings": "isin",
+    "transparency_calculations": "isin",
+    "legal_entities": "lei",
+}
+
+_PENDING_KEY = "_instrument_membership_pending_writes"
+
+
+class MembershipIndex:
+    """Immutable sorted ISIN array with per-ISIN status bits and an overlay of patched ISINs."""
+
+    def __init__(self, statuses: Iterable[Tuple[str, int]]):
+        ordered = sorted(statuses)
+        self._isins: List[str] = [isin for isin, _ in ordered]
+        self._statuses = bytearray(status for _, status in ordered)
+        self._patches: Dict[str, int] = {}
+        self._size = len(self._isins)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def patch_count(self) -> int:
+        return len(self._patches)
+
+    def status(self, isin: str) -> int:
+        """Status bits of an ISIN; 0 when it is not loaded."""
+        patched = self._patches.get(isin)
+        if patched is not None:
+            return patched
+        index = bisect_left(self._isins, isin)
+        if index < len(self._isins) and self._isins[index] == isin:
+            return self._statuses[index]
+        return 0
+
+    def statuses(self, isins: Iterable[str]) -> List[int]:
+        return [self.status(isin) for isin in isins]
+
+    def patched(self, statuses: Dict[str, int]) -> "MembershipIndex":
+        """Copy sharing the sorted array, with the given ISINs' bits replaced (0 removes)."""
+        index = copy.copy(self)
+        index._patches = {**self._patches, **statuses}
+        index._size = self._size + sum(bool(bits) - bool(self.status(isin)) for isin, bits in statuses.items())
+        return index
+
+
+class InstrumentMembership:
+    """Holder for the current membership index, patched with this process's writes."""
+
+    def __init__(
+        self,
+        refresh_seconds: int = ServiceDefaults.MEMBERSHIP_REFRESH_SECONDS,
+        max_patches: int = ServiceDefaults.MEMBERSHIP_MAX_PATCHES,
+    ):
+        self.refresh_seconds = refresh_seconds
+        self.max_patches = max_patches
+        self._index: Optional[MembershipIndex] = None
+        self._built_at = 0.0
+        self._build_lock = threading.Lock()
+        self._patch_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False
+
+        # Keys committed since they were last applied, and whether a keyless write happened
+        self._pending_lock = threading.Lock()
+        self._pending_isins: Set[str] = set()
+        self._pending_leis: Set[str] = set()
+        self._untracked = False
+
+        # Keys applied while a rebuild reads, re-applied to the index it builds
+        self._journal: Optional[Tuple[Set[str], Set[str]]] = None
+
+    def index(self) -> MembershipIndex:
+        """
+        Return an index reflecting this process's committed ORM writes.
+
+        Builds synchronously on first use. Writes with known keys are patched
+        in before returning; keyless writes, a grown overlay or an index past
+        the refresh interval start a rebuild in the background instead.
+        """
+        index = self._index
+        if index is None:
+            return self.rebuild(force=False)
+        if self._pending_isins or self._pending_leis:
+            index = self._apply_pending()
+        if (
+            self._untracked
+            or index.patch_count > self.max_patches
+            or time.monotonic() - self._built_at > self.refresh_seconds
+        ):
+            self.refresh()
+        return index
+
+    def statuses(self, isins: Iterable[str]) -> List[int]:
+        return self.index().statuses(isins)
+
+    def record_writes(self, isins: Iterable[str] = (), leis: Iterable[str] = (), untracked: bool = False) -> None:
+        """Note committed writes to apply on the next check; untracked ones need a rebuild."""
+        with self._pending_lock:
+            self._pending_isins.update(isins)
+            self._pending_leis.update(leis)
+            self._untracked = self._untracked or untracked
+
+    def rebuild(self, force: bool = True) -> MembershipIndex:
+        """
+        Build a new index from the database and swap it in.
+
+        With force=False, an index another thread built while this one
+        waited for the lock is reused.
+        """
+        with self._build_lock:
+            if not force and self._index is not None:
+                return self._index
+            with self._patch_lock:
+                self._journal = (set(), set())
+            with self._pending_lock:
+                self._untracked = False
+
+            started = time.monotonic()
+            try:
+                index = MembershipIndex(self._read_statuses())
+            finally:
+                with self._patch_lock:
+                    isins, leis = self._journal
+                    self._journal = None
+
+            with self._patch_lock:
+                # Writes patched into the old index during the read may be missing from it
+                if isins or leis:
+                    index = self._patched(index, isins, leis)
+                self._index = index
+                self._built_at = time.monotonic()
+
+        logger.info(
+            f"Instrument membership index built with {len(index)} instruments "
+            f"in {self._built_at - started:.2f}s"
+        )
+        return index
+
+    def refresh(self) -> None:
+        """Rebuild in a background thread unless a refresh is already running."""
+        with self._refresh_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._safe_rebuild, name="instrument-membership", daemon=True).start()
+
+    def clear(self) -> None:
+        with self._build_lock:
+            self._index = None
+            self._built_at = 0.0
+        with self._pending_lock:
+            self._pending_isins.clear()
+            self._pending_leis.clear()
+            self._untracked = False
+
+    def _apply_pending(self) -> MembershipIndex:
+        with self._patch_lock:
+            with self._pending_lock:
+                isins, leis = self._pending_isins, self._pending_leis
+                self._pending_isins, self._pending_leis = set(), set()
+            if not (isins or leis):
+                # Another thread applied them while this one waited
+                return self._index
+
+            try:
+                self._index = self._patched(self._index, isins, leis)
+            except Exception:
+                self.record_writes(isins, leis)
+                raise
+            if self._journal is not None:
+                self._journal[0].update(isins)
+                self._journal[1].update(leis)
+            return self._index
+
+    def _patched(self, index: MembershipIndex, isins: Collection[str], leis: Collection[str]) -> MembershipIndex:
+        # Written ISINs no longer loaded drop to 0; issuer LEIs re-read their instruments
+        statuses = dict.fromkeys(isins, 0)
+        statuses.update(self._read_statuses(isins, leis))
+        return index.patched(statuses)
+
+    def _safe_rebuild(self) -> None:
+        try:
+            self.rebuild()
+        except Exception as e:
+            logger.warning(f"Could not build instrument membership index: {e}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing = False
+
+    @staticmethod
+    def _read_statuses(isins: Collection[str] = (), leis: Collection[str] = ()) -> List[Tuple[str, int]]:
+        """Status bits of every instrument, or only those with the given ISINs or issuer LEIs."""
+        from sqlalchemy import case, exists
+
+        from ...config import DatabaseConfig
+        from ...database.session import get_session
+
+        if DatabaseConfig.get_database_type() == "sqlite":
+            from ...models.sqlite.figi import FigiMapping
+            from ...models.sqlite.instrument import Instrument
+            from ...models.sqlite.legal_entity import LegalEntity
+            from ...models.sqlite.transparency import TransparencyCalculation
+        else:
+            from ...models.sqlserver.figi import SqlServerFigiMapping as FigiMapping
+            from ...models.sqlserver.instrument import SqlServerInstrument as Instrument
+            from ...models.sqlserver.legal_entity import SqlServerLegalEntity as LegalEntity
+            from ...models.sqlserver.transparency import (
+                SqlServerTransparencyCalculation as TransparencyCalculation,
+            )
+
+        def flag(condition, bit: int):
+            return case((condition, bit), else_=0)
+
+        # One streaming pass; the flags are indexed EXISTS probes per instrument
+        status = (
+            LOADED
+            + flag(exists().where(FigiMapping.isin == Instrument.isin), FIGI)
+            + flag(exists().where(TransparencyCalculation.isin == Instrument.isin), TRANSPARENCY)
+            + flag(exists().where(LegalEntity.lei == Instrument.lei_id), LEGAL_ENTITY)
+        )
+        with get_session() as session:
+            query = session.query(Instrument.isin, status)
+            if not (isins or leis):
+                rows = query.yield_per(ServiceDefaults.EXPORT_BATCH_SIZE)
+                return [(isin, int(bits)) for isin, bits in rows]
+
+            chunk_size = ServiceDefaults.LOOKUP_CHUNK_SIZE
+            statuses = []
+            for column, keys in ((Instrument.isin, sorted(isins)), (Instrument.lei_id, sorted(leis))):
+                for start in range(0, len(keys), chunk_size):
+                    rows = query.filter(column.in_(keys[start:start + chunk_size])).all()
+                    statuses.extend((isin, int(bits)) for isin, bits in rows)
+            return statuses
+
+
+# Process-wide membership index shared by the exists endpoint
+instrument_membership = InstrumentMembership()
+
+
+def _pending_writes(session: Session) -> dict:
+    return session.info.setdefault(_PENDING_KEY, {"isins": set(), "leis": set(), "untracked": False})
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_keys(session, flush_context):
+    for instance in list(session.new) + list(session.dirty) + list(session.deleted):
+        state = inspect(instance)
+        attribute = next(
+            (_WRITE_KEYS[table.name] for table in state.mapper.tables if table.name in _WRITE_KEYS), None
+        )
+        if attribute is None:
+            continue
+        # Old and new values, without loading expired attributes
+        keys = [key for key in state.attrs[attribute].history.sum() if key]
+        writes = _pending_writes(session)
+        if not keys:
+            writes["untracked"] = True
+        elif attribute == "lei":
+            writes["leis"].update(keys)
+        else:
+            writes["isins"].update(keys)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_statement_writes(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if getattr(table, "name", None) in _WRITE_KEYS:
+            _pending_writes(orm_execute_state.session)["untracked"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _record_committed_writes(session):
+    writes = session.info.pop(_PENDING_KEY, None)
+    if writes:
+        instrument_membership.record_writes(writes["isins"], writes["leis"], writes["untracked"])
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_writes(session):
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,220 @@
+"""
+Instrument Typeahead Index
+
+Process-local prefix index for instrument autocomplete, served by
+/instruments/search without touching the database.
+
+Keys (ISINs, short names and FIGI tickers, case-folded) are held in one
+sorted array; a lookup is a binary search to the first key >= prefix and a
+short forward scan while keys still start with it.
+
+Like the MIC reference, an index is immutable and replaced wholesale:
+- built at startup (warm, in a background thread) from a streaming read
+- rebuilt in the background after ingests, when the data version of the
+  instruments or figi_mappings tables moves, or when the index is older
+  than the refresh interval (writes made by other processes)
+Readers keep using the previous index until the new one is swapped in.
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from datetime import UTC, datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from ...constants import ServiceDefaults
+from ...database import data_version
+
+logger = logging.getLogger(__name__)
+
+TYPEAHEAD_TABLES = ("instruments", "figi_mappings")
+
+# Record fields indexed as prefix keys
+TYPEAHEAD_KEY_FIELDS = ("isin", "short_name", "ticker")
+
+
+class TypeaheadRecord(NamedTuple):
+    isin: str
+    short_name: Optional[str]
+    full_name: Optional[str]
+    instrument_type: Optional[str]
+    ticker: Optional[str]
+
+
+def normalize_key(value: Optional[str]) -> str:
+    """Case-fold and collapse whitespace so 'volv  b' and 'VOLV B' share a key."""
+    return " ".join((value or "").split()).casefold()
+
+
+class TypeaheadIndex:
+    """Immutable sorted-array prefix index over instrument keys."""
+
+    def __init__(self, records: Iterable[TypeaheadRecord], loaded_at: Optional[datetime] = None):
+        self.records: Tuple[TypeaheadRecord, ...] = tuple(records)
+
+        entries = set()
+        for position, record in enumerate(self.records):
+            for field in TYPEAHEAD_KEY_FIELDS:
+                key = normalize_key(getattr(record, field))
+                if key:
+                    entries.add((key, position, field))
+
+        ordered = sorted(entries)
+        self._keys: List[str] = [key for key, _, _ in ordered]
+        self._positions: List[int] = [position for _, position, _ in ordered]
+        self._fields: List[str] = [field for _, _, field in ordered]
+        self.loaded_at = loaded_at or datetime.now(UTC)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def search(self, prefix: str, limit: int) -> List[Tuple[TypeaheadRecord, str]]:
+        """
+        Return up to limit (record, matched field) pairs whose keys start with prefix.
+
+        Results follow key order, so an exact key match comes first.
+        """
+        prefix = normalize_key(prefix)
+        if not prefix or limit <= 0:
+            return []
+
+        results = []
+        seen = set()
+        index = bisect_left(self._keys, prefix)
+        while index < len(self._keys) and len(results) < limit:
+            key = self._keys[index]
+            if not key.startswith(prefix):
+                break
+            position = self._positions[index]
+            if position not in seen:
+                seen.add(position)
+                results.append((self.records[position], self._fields[index]))
+            index += 1
+        return results
+
+
+class InstrumentTypeahead:
+    """Holder for the current typeahead index with background rebuilds."""
+
+    def __init__(self, refresh_seconds: int = ServiceDefaults.TYPEAHEAD_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._index: Optional[TypeaheadIndex] = None
+        self._version: Optional[Tuple[int, ...]] = None
+        self._built_at = 0.0
+        self._build_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False
+
+    def index(self) -> TypeaheadIndex:
+        """
+        Return the current index.
+
+        The first call builds it synchronously; afterwards an outdated index
+        is still returned while a rebuild runs in the background.
+        """
+        index = self._index
+        if index is None:
+            return self.rebuild()
+        if (
+            self._version != data_version.get_version(*TYPEAHEAD_TABLES)
+            or time.monotonic() - self._built_at > self.refresh_seconds
+        ):
+            self.refresh()
+        return index
+
+    def search(self, prefix: str, limit: int) -> List[Tuple[TypeaheadRecord, str]]:
+        return self.index().search(prefix, limit)
+
+    def rebuild(self) -> TypeaheadIndex:
+        """Build a new index from the database and swap it in."""
+        with self._build_lock:
+            version = data_version.get_version(*TYPEAHEAD_TABLES)
+            started = time.monotonic()
+            index = TypeaheadIndex(self._read_records())
+            self._index = index
+            self._version = version
+            self._built_at = time.monotonic()
+
+        logger.info(
+            f"Instrument typeahead index built with {len(index)} instruments "
+            f"in {self._built_at - started:.2f}s"
+        )
+        return index
+
+    def refresh(self) -> None:
+        """Rebuild in a background thread unless a refresh is already running."""
+        with self._refresh_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._safe_rebuild, name="instrument-typeahead", daemon=True).start()
+
+    def warm(self) -> None:
+        """Start building the index at startup without delaying it."""
+        self.refresh()
+
+    def clear(self) -> None:
+        with self._build_lock:
+            self._index = None
+            self._version = None
+            self._built_at = 0.0
+
+    def _safe_rebuild(self) -> None:
+        try:
+            self.rebuild()
+        except Exception as e:
+            logger.warning(f"Could not build instrument typeahead index: {e}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing = False
+
+    @staticmethod
+    def _read_records() -> List[TypeaheadRecord]:
+        from ...config import DatabaseConfig
+        from ...database.session import get_session
+
+        if DatabaseConfig.get_database_type() == "sqlite":
+            from ...models.sqlite.figi import FigiMapping
+            from ...models.sqlite.instrument import Instrument
+        else:
+            from ...models.sqlserver.figi import SqlServerFigiMapping as FigiMapping
+            from ...models.sqlserver.instrument import SqlServerInstrument as Instrument
+
+        batch_size = ServiceDefaults.EXPORT_BATCH_SIZE
+        with get_session() as session:
+            tickers: Dict[str, str] = {}
+            for isin, ticker in (
+                session.query(FigiMapping.isin, FigiMapping.ticker)
+                .filter(FigiMapping.ticker.isnot(None))
+                .yield_per(batch_size)
+            ):
+                tickers.setdefault(isin, ticker)
+
+            return [
+                TypeaheadRecord(isin, short_name, full_name, instrument_type, tickers.get(isin))
+                for isin, short_name, full_name, instrument_type in (
+                    session.query(
+                        Instrument.isin,
+                        Instrument.short_name,
+                        Instrument.full_name,
+                        Instrument.instrument_type,
+                    ).yield_per(batch_size)
+                )
+            ]
+
+
+# Process-wide typeahead index shared by the search endpoint
+instrument_typeahead = InstrumentTypeahead()
+
+
+def format_typeahead_result(record: TypeaheadRecord, matched_on: str) -> Dict[str, Any]:
+    """API representation of a typeahead hit."""
+    return {
+        "isin": record.isin,
+        "short_name": record.short_name,
+        "full_name": record.full_name,
+        "instrument_type": record.instrument_type,
+        "ticker": record.ticker,
+        "matched_on": matched_on,
+    }
@@ -16,7 +16,9 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 import requests
 from sqlalchemy.orm import Session
 
-from ...constants import ExternalAPIs, APITimeouts, ValidationLimits
+from ...constants import ExternalAPIs, APITimeouts, ServiceDefaults, ValidationLimits
+from .mic_reference import MIC_NAME_FIELDS, mic_reference
+from .name_search import NameSearchIndex
 
 logger = logging.getLogger(__name__)
 
@@ -148,6 +150,9 @@ class MICDataLoader:
                     f"MIC data loaded: {created_count} created, {updated_count} updated, {len(errors)} errors"
                 )
 
+                # Hot-swap the in-process MIC reference snapshot
+                mic_reference.reload(self.session)
+
             finally:
                 if isinstance(csv_source, str):
                     file_handle.close()
@@ -425,6 +430,7 @@ class RemoteMICLookupService:
         self.cache_duration_minutes = cache_duration_minutes
         self._cache = {}
         self._cache_timestamp = None
+        self._name_index = None
 
     def _fetch_remote_data(self, url: str = ExternalAPIs.ISO_MIC_CSV_URL) -> Dict[str, Dict[str, Any]]:
         """Fetch and parse MIC data from remote URL."""
@@ -479,9 +485,19 @@ class RemoteMICLookupService:
         if not self._is_cache_valid():
             self._cache = self._fetch_remote_data()
             self._cache_timestamp = datetime.now(UTC)
+            self._name_index = None
 
         return self._cache
 
+    def _get_name_index(self, data: Dict[str, Dict[str, Any]]) -> NameSearchIndex:
+        """Get the name index over the cached data, building it after each refresh."""
+        if self._name_index is None:
+            self._name_index = NameSearchIndex(
+                (mic_code, {field: mic_info.get(field) for field in MIC_NAME_FIELDS})
+                for mic_code, mic_info in data.items()
+            )
+        return self._name_index
+
     def lookup_mic(self, mic_code: str) -> Optional[Dict[str, Any]]:
         """
         Look up a specific MIC code from remote source.
@@ -503,39 +519,30 @@ class RemoteMICLookupService:
             logger.error(f"Failed to lookup MIC {mic_code}: {str(e)}")
             raise
 
-    def search_mics(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
+    def search_mics(
+        self, query: str, limit: int = 50, threshold: float = ServiceDefaults.NAME_SEARCH_THRESHOLD
+    ) -> List[Dict[str, Any]]:
         """
         Search MICs by name or code from remote source.
 
+        Matches are ranked by the name index over MIC code, market name,
+        legal entity name and acronym, so prefixes and small typos match.
+
         Args:
             query: Search query
             limit: Maximum number of results
+            threshold: Minimum match score (0-1)
 
         Returns:
-            List of matching MIC records
+            List of matching MIC records, best match first
         """
-        query = query.lower().strip()
-        if not query:
+        if not query.strip():
             return []
 
         try:
             data = self._get_cached_data()
-            results = []
-
-            for mic_code, mic_info in data.items():
-                if (
-                    query in mic_code.lower()
-                    or query in mic_info.get("market_name", "").lower()
-                    or query in mic_info.get("legal_entity_name", "").lower()
-                    or query in mic_info.get("acronym", "").lower()
-                ):
-
-                    results.append(mic_info)
-
-                    if len(results) >= limit:
-                        break
-
-            return results
+            matches = self._get_name_index(data).search(query, threshold, limit=limit)
+            return [data[mic_code] for mic_code, _ in matches]
 
         except Exception as e:
             logger.error(f"Failed to search MICs: {str(e)}")
@@ -600,6 +607,7 @@ class RemoteMICLookupService:
         """Clear the cached MIC data."""
         self._cache = {}
         self._cache_timestamp = None
+        self._name_index = None
         logger.info("MIC cache cleared")
 
 
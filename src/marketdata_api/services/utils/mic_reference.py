@@ -0,0 +1,180 @@
+"""
+MIC Reference Cache
+
+Process-local, immutable snapshot of the ISO 10383 MIC table.
+
+The MIC list is small (a few thousand rows) and changes roughly monthly, but
+it is read on hot paths: primary venue displays, FIGI enrichment, venue
+lookups and MIC validation. Instead of querying per call, those paths read a
+snapshot indexed by MIC, operating MIC, country and status, plus a ranked
+name index over MIC code, market name, legal entity name and acronym.
+
+Snapshots are never mutated. A reload builds a new snapshot and swaps the
+reference, so readers always see a consistent view. Reloads happen:
+- at application startup (warm)
+- after MICDataLoader.load_from_csv / load_from_remote_url commits
+- lazily, when the MIC table's data version moved since the last load
+"""
+
+import logging
+import threading
+from datetime import UTC, datetime
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from ...constants import ServiceDefaults
+from ...database import data_version
+from .name_search import NameSearchIndex
+
+logger = logging.getLogger(__name__)
+
+MIC_TABLE = "market_identification_codes"
+
+MICRecord = Mapping[str, Any]
+
+# Record fields covered by MIC name search
+MIC_NAME_FIELDS = ("mic", "market_name", "legal_entity_name", "acronym")
+
+
+class MICSnapshot:
+    """Immutable MIC lookup tables built from MIC to_dict() records."""
+
+    def __init__(self, records: Iterable[Dict[str, Any]], loaded_at: Optional[datetime] = None):
+        by_mic: Dict[str, MICRecord] = {}
+        by_operating_mic: Dict[str, List[MICRecord]] = {}
+        by_country: Dict[str, List[MICRecord]] = {}
+        by_status: Dict[str, List[MICRecord]] = {}
+
+        for record in records:
+            frozen = MappingProxyType(dict(record))
+            by_mic[frozen["mic"]] = frozen
+            if frozen.get("operating_mic"):
+                by_operating_mic.setdefault(frozen["operating_mic"], []).append(frozen)
+            if frozen.get("iso_country_code"):
+                by_country.setdefault(frozen["iso_country_code"], []).append(frozen)
+            if frozen.get("status"):
+                by_status.setdefault(frozen["status"], []).append(frozen)
+
+        def freeze(groups: Dict[str, List[MICRecord]]) -> Mapping[str, Tuple[MICRecord, ...]]:
+            return MappingProxyType({key: tuple(values) for key, values in groups.items()})
+
+        self.by_mic: Mapping[str, MICRecord] = MappingProxyType(by_mic)
+        self.by_operating_mic = freeze(by_operating_mic)
+        self.by_country = freeze(by_country)
+        self.by_status = freeze(by_status)
+        self.name_index = NameSearchIndex(
+            (mic, {field: record.get(field) for field in MIC_NAME_FIELDS})
+            for mic, record in by_mic.items()
+        )
+        self.loaded_at = loaded_at or datetime.now(UTC)
+
+    def __len__(self) -> int:
+        return len(self.by_mic)
+
+    def get(self, mic_code: Optional[str]) -> Optional[MICRecord]:
+        """Return the record for a MIC (case-insensitive), or None."""
+        if not mic_code:
+            return None
+        return self.by_mic.get(mic_code.upper())
+
+    def exists(self, mic_code: Optional[str]) -> bool:
+        return self.get(mic_code) is not None
+
+    def operating_mic_for(self, mic_code: Optional[str]) -> Optional[str]:
+        """Return the operating MIC of a MIC (the MIC itself for operating MICs)."""
+        record = self.get(mic_code)
+        if record is None:
+            return None
+        return record.get("operating_mic") or record["mic"]
+
+    def search(
+        self,
+        query: str,
+        threshold: float = ServiceDefaults.NAME_SEARCH_THRESHOLD,
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> Dict[str, float]:
+        """
+        Rank MICs by name match.
+
+        Returns:
+            MIC code -> score (0-1), best match first, at most
+            ServiceDefaults.NAME_SEARCH_MAX_RESULTS entries
+        """
+        return dict(self.name_index.search(query, threshold, fields))
+
+    def segments(self, operating_mic: str) -> Tuple[MICRecord, ...]:
+        """Return segment MICs under an operating MIC, excluding the operating MIC itself."""
+        return tuple(
+            record
+            for record in self.by_operating_mic.get(operating_mic.upper(), ())
+            if record["mic"] != operating_mic.upper()
+        )
+
+
+class MICReferenceCache:
+    """Holder for the current MIC snapshot with hot-swap reloads."""
+
+    def __init__(self):
+        self._snapshot: Optional[MICSnapshot] = None
+        self._version: Optional[Tuple[int, ...]] = None
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> MICSnapshot:
+        """Return the current snapshot, (re)loading it if missing or outdated."""
+        snapshot = self._snapshot
+        if snapshot is None or self._version != data_version.get_version(MIC_TABLE):
+            snapshot = self.reload()
+        return snapshot
+
+    def reload(self, session=None) -> MICSnapshot:
+        """
+        Build a new snapshot from the database and swap it in.
+
+        Args:
+            session: Optional open session (e.g. the loader's, after commit)
+        """
+        with self._lock:
+            version = data_version.get_version(MIC_TABLE)
+            if session is not None:
+                records = self._read_records(session)
+            else:
+                from ...database.session import get_session
+
+                with get_session() as own_session:
+                    records = self._read_records(own_session)
+
+            snapshot = MICSnapshot(records)
+            self._snapshot = snapshot
+            self._version = version
+
+        logger.info(f"MIC reference snapshot loaded with {len(snapshot)} MICs")
+        return snapshot
+
+    def warm(self) -> None:
+        """Load the snapshot at startup; failures are logged and retried lazily."""
+        try:
+            self.reload()
+        except Exception as e:
+            logger.warning(f"Could not warm MIC reference snapshot: {e}")
+
+    def clear(self) -> None:
+        """Drop the snapshot; the next read reloads it."""
+        with self._lock:
+            self._snapshot = None
+            self._version = None
+
+    @staticmethod
+    def _read_records(session) -> List[Dict[str, Any]]:
+        from ...config import DatabaseConfig
+
+        if DatabaseConfig.get_database_type() == "sqlite":
+            from ...models.sqlite.market_identification_code import MarketIdentificationCode
+        else:
+            from ...models.sqlserver.market_identification_code import (
+                SqlServerMarketIdentificationCode as MarketIdentificationCode,
+            )
+        return [mic.to_dict() for mic in session.query(MarketIdentificationCode).all()]
+
+
+# Process-wide MIC reference shared by API and services
+mic_reference = MICReferenceCache()
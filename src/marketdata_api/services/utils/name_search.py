@@ -0,0 +1,95 @@
+"""
+In-memory Name Search Index
+
+Ranked, typo-tolerant name search over small reference sets (MICs, the
+remote ISO MIC registry) that are already held in memory.
+
+Each entry has a key and a few named text fields. Normalised tokens are kept
+in a sorted array for prefix lookups and in a trigram posting map for fuzzy
+candidates; candidates are then scored with the same 0-1 score the database
+name search uses (see database.fulltext.score_tokens), so a threshold means
+the same thing everywhere.
+"""
+
+from bisect import bisect_left
+from collections import Counter
+from math import ceil
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from ...constants import ServiceDefaults
+from ...database.fulltext import name_tokens, score_tokens, token_trigrams
+
+
+class NameSearchIndex:
+    """Immutable token and trigram index over named text fields."""
+
+    def __init__(self, entries: Iterable[Tuple[Hashable, Mapping[str, Optional[str]]]]):
+        self._fields: Dict[Hashable, Dict[str, Tuple[str, ...]]] = {}
+        token_postings: Dict[str, Set[Hashable]] = {}
+        trigram_postings: Dict[str, Set[Hashable]] = {}
+
+        for key, texts in entries:
+            fields = {name: tuple(name_tokens(value)) for name, value in texts.items() if value}
+            self._fields[key] = fields
+            for tokens in fields.values():
+                for token in tokens:
+                    token_postings.setdefault(token, set()).add(key)
+                    for trigram in token_trigrams(token):
+                        trigram_postings.setdefault(trigram, set()).add(key)
+
+        self._tokens: List[str] = sorted(token_postings)
+        self._token_postings = token_postings
+        self._trigram_postings = trigram_postings
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def search(
+        self,
+        query: str,
+        threshold: float = ServiceDefaults.NAME_SEARCH_THRESHOLD,
+        fields: Optional[Sequence[str]] = None,
+        limit: Optional[int] = ServiceDefaults.NAME_SEARCH_MAX_RESULTS,
+    ) -> List[Tuple[Hashable, float]]:
+        """
+        Return (key, score) pairs scoring at least threshold, best first.
+
+        Args:
+            query: Free-text search input
+            threshold: Minimum score (0-1)
+            fields: Only score these fields (default: all)
+            limit: Maximum number of matches (None for all)
+        """
+        query_tokens = name_tokens(query)
+        if not query_tokens:
+            return []
+
+        candidates: Set[Hashable] = set()
+        for query_token in query_tokens:
+            # Keys with a token starting with the query token
+            position = bisect_left(self._tokens, query_token)
+            while position < len(self._tokens) and self._tokens[position].startswith(query_token):
+                candidates |= self._token_postings[self._tokens[position]]
+                position += 1
+
+            # Keys sharing enough trigrams to possibly reach the threshold
+            trigrams = token_trigrams(query_token)
+            shared = Counter(
+                key for trigram in trigrams for key in self._trigram_postings.get(trigram, ())
+            )
+            needed = max(1, ceil(threshold * len(trigrams)))
+            candidates.update(key for key, count in shared.items() if count >= needed)
+
+        scored = []
+        for key in candidates:
+            key_fields = self._fields[key]
+            names = fields if fields is not None else key_fields.keys()
+            score = max(
+                (score_tokens(query_tokens, key_fields[name]) for name in names if name in key_fields),
+                default=0.0,
+            )
+            if score >= threshold and score > 0:
+                scored.append((key, score))
+
+        scored.sort(key=lambda item: (-item[1], str(item[0])))
+        return scored if limit is None else scored[:limit]
@@ -473,6 +473,7 @@ def map_figi_data(data: list, isin: str):
                     composite_figi=item.composite_figi,
                     share_class_figi=item.share_class_figi,
                     ticker=item.ticker,
+                    exchange_code=item.exch_code,
                     security_type=item.security_type,
                     market_sector=item.market_sector,
                     security_description=item.security_description,
@@ -490,6 +491,7 @@ def map_figi_data(data: list, isin: str):
                                 composite_figi=figi_item.get("compositeFIGI"),
                                 share_class_figi=figi_item.get("shareClassFIGI"),
                                 ticker=figi_item.get("ticker"),
+                                exchange_code=figi_item.get("exchCode"),
                                 security_type=figi_item.get("securityType"),
                                 market_sector=figi_item.get("marketSector"),
                                 security_description=figi_item.get("securityDescription"),
@@ -504,6 +506,7 @@ def map_figi_data(data: list, isin: str):
                             composite_figi=figi_data.get("compositeFIGI"),
                             share_class_figi=figi_data.get("shareClassFIGI"),
                             ticker=figi_data.get("ticker"),
+                            exchange_code=figi_data.get("exchCode"),
                             security_type=figi_data.get("securityType"),
                             market_sector=figi_data.get("marketSector"),
                             security_description=figi_data.get("securityDescription"),
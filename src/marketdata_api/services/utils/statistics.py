@@ -0,0 +1,402 @@
+"""
+Materialised Statistics
+
+Precomputed figures behind the stats endpoints (/instruments/stats,
+/instruments/stats/coverage, /venues/statistics, /legal-entities/stats,
+/system/status) and the unfiltered /instruments/facets, stored in the
+data_statistics table so dashboards polling them read one small row instead
+of scanning the large tables.
+
+Figures are grouped by source: each group is rebuilt with one aggregate
+pass per table it reads (GROUP BY plus conditional sums) and stored with the
+time the rebuild started, which endpoints report as computed_at.
+
+Like the typeahead index, stored figures are served while a rebuild runs
+in the background:
+- when nothing is stored yet, the group is built synchronously
+- a group is rebuilt when one of its source tables was written in this
+  process after the figures were computed (see database.data_version), e.g.
+  by an ingest or enrichment
+- or when the figures are older than the refresh interval (writes made by
+  other processes); a newer row stored by another worker is adopted instead
+"""
+
+import json
+import logging
+import threading
+import time
+from datetime import UTC, datetime
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+
+from sqlalchemy import case, distinct, func
+
+from ...constants import ServiceDefaults
+from ...database import data_version
+
+logger = logging.getLogger(__name__)
+
+STATISTICS_TABLE = "data_statistics"
+
+# CFI categories reported in the instrument CFI breakdown
+CFI_CATEGORIES = ("C", "D", "E", "F", "H", "I", "J", "O", "R", "S")
+
+TOP_COUNTRIES = 10
+
+
+class StatisticsSnapshot(NamedTuple):
+    figures: Dict[str, Any]
+    computed_at: datetime
+
+
+def _models() -> Dict[str, Any]:
+    from ...config import DatabaseConfig
+
+    if DatabaseConfig.get_database_type() == "sqlite":
+        from ...models.sqlite.figi import FigiMapping
+        from ...models.sqlite.instrument import Instrument, TradingVenue
+        from ...models.sqlite.legal_entity import LegalEntity
+        from ...models.sqlite.market_identification_code import MarketIdentificationCode
+        from ...models.sqlite.statistics import DataStatistics
+        from ...models.sqlite.transparency import TransparencyCalculation
+    else:
+        from ...models.sqlserver.figi import SqlServerFigiMapping as FigiMapping
+        from ...models.sqlserver.instrument import SqlServerInstrument as Instrument
+        from ...models.sqlserver.instrument import SqlServerTradingVenue as TradingVenue
+        from ...models.sqlserver.legal_entity import SqlServerLegalEntity as LegalEntity
+        from ...models.sqlserver.market_identification_code import (
+            SqlServerMarketIdentificationCode as MarketIdentificationCode,
+        )
+        from ...models.sqlserver.statistics import SqlServerDataStatistics as DataStatistics
+        from ...models.sqlserver.transparency import (
+            SqlServerTransparencyCalculation as TransparencyCalculation,
+        )
+
+    return {
+        "DataStatistics": DataStatistics,
+        "FigiMapping": FigiMapping,
+        "Instrument": Instrument,
+        "LegalEntity": LegalEntity,
+        "MarketIdentificationCode": MarketIdentificationCode,
+        "TradingVenue": TradingVenue,
+        "TransparencyCalculation": TransparencyCalculation,
+    }
+
+
+def _enum_value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+def _compute_instruments(session, models: Dict[str, Any]) -> Dict[str, Any]:
+    """Instrument totals, type/CFI breakdowns and LEI, FIGI and transparency coverage."""
+    from ...models.utils.cfi_instrument_manager import get_valid_instrument_types
+
+    Instrument = models["Instrument"]
+    LegalEntity = models["LegalEntity"]
+    FigiMapping = models["FigiMapping"]
+    TransparencyCalculation = models["TransparencyCalculation"]
+
+    # Pass 1: instruments (with their issuer) grouped by type and CFI code
+    rows = (
+        session.query(
+            Instrument.instrument_type,
+            Instrument.cfi_code,
+            func.count(Instrument.id),
+            func.sum(case((Instrument.lei_id != "", 1), else_=0)),
+            func.sum(case((LegalEntity.lei.isnot(None), 1), else_=0)),
+        )
+        .outerjoin(LegalEntity, Instrument.lei_id == LegalEntity.lei)
+        .group_by(Instrument.instrument_type, Instrument.cfi_code)
+        .all()
+    )
+
+    valid_types = set(get_valid_instrument_types())
+    total = with_lei = with_entity = 0
+    type_counts: Dict[str, int] = {}
+    cfi_counts: Dict[str, int] = {}
+    for instrument_type, cfi_code, count, lei_count, entity_count in rows:
+        total += count
+        with_lei += lei_count or 0
+        with_entity += entity_count or 0
+        if instrument_type in valid_types:
+            type_counts[instrument_type] = type_counts.get(instrument_type, 0) + count
+        category = (cfi_code or "")[:1]
+        if category in CFI_CATEGORIES:
+            cfi_counts[category] = cfi_counts.get(category, 0) + count
+
+    # Pass 2: FIGI mappings
+    figi_mappings, with_figi = session.query(
+        func.count(FigiMapping.id), func.count(distinct(FigiMapping.isin))
+    ).one()
+
+    # Pass 3: transparency calculations
+    transparency_calculations, with_transparency = session.query(
+        func.count(TransparencyCalculation.id), func.count(distinct(TransparencyCalculation.isin))
+    ).one()
+
+    return {
+        "total_instruments": total,
+        "type_breakdown": dict(sorted(type_counts.items())),
+        "cfi_type_breakdown": {category: cfi_counts[category] for category in CFI_CATEGORIES if category in cfi_counts},
+        "with_lei": with_lei,
+        "with_entity": with_entity,
+        "with_figi": with_figi or 0,
+        "figi_mappings": figi_mappings or 0,
+        "with_transparency": with_transparency or 0,
+        "transparency_calculations": transparency_calculations or 0,
+    }
+
+
+def _compute_venues(session, models: Dict[str, Any]) -> Dict[str, Any]:
+    """MIC totals by operation type, status and country, plus trading venue coverage."""
+    MarketIdentificationCode = models["MarketIdentificationCode"]
+    TradingVenue = models["TradingVenue"]
+
+    # Pass 1: MICs grouped by operation type, status and country
+    rows = (
+        session.query(
+            MarketIdentificationCode.operation_type,
+            MarketIdentificationCode.status,
+            MarketIdentificationCode.iso_country_code,
+            func.count(MarketIdentificationCode.mic),
+        )
+        .group_by(
+            MarketIdentificationCode.operation_type,
+            MarketIdentificationCode.status,
+            MarketIdentificationCode.iso_country_code,
+        )
+        .all()
+    )
+
+    total = 0
+    operation_counts: Dict[str, int] = {}
+    status_counts: Dict[str, int] = {}
+    country_counts: Dict[str, int] = {}
+    for operation_type, status, country, count in rows:
+        total += count
+        operation_type, status = _enum_value(operation_type), _enum_value(status)
+        operation_counts[operation_type] = operation_counts.get(operation_type, 0) + count
+        status_counts[status] = status_counts.get(status, 0) + count
+        country_counts[country] = country_counts.get(country, 0) + count
+
+    top_countries = sorted(country_counts.items(), key=lambda item: (-item[1], item[0] or ""))[:TOP_COUNTRIES]
+
+    # Pass 2: trading venue records and the MICs they reference
+    total_trading_venues, venues_with_instruments = (
+        session.query(func.count(TradingVenue.id), func.count(distinct(MarketIdentificationCode.mic)))
+        .select_from(TradingVenue)
+        .outerjoin(MarketIdentificationCode, MarketIdentificationCode.mic == TradingVenue.mic_code)
+        .one()
+    )
+
+    return {
+        "total_mics": total,
+        "operating_mics": operation_counts.get("OPRT", 0),
+        "segment_mics": operation_counts.get("SGMT", 0),
+        "status_breakdown": status_counts,
+        "top_countries": [{"country_code": country, "count": count} for country, count in top_countries],
+        "venues_with_instruments": venues_with_instruments or 0,
+        "total_trading_venues": total_trading_venues or 0,
+    }
+
+
+def _compute_legal_entities(session, models: Dict[str, Any]) -> Dict[str, Any]:
+    """Legal entity totals by status and jurisdiction."""
+    LegalEntity = models["LegalEntity"]
+
+    # Single pass: entities grouped by status and jurisdiction
+    rows = (
+        session.query(LegalEntity.status, LegalEntity.jurisdiction, func.count(LegalEntity.lei))
+        .group_by(LegalEntity.status, LegalEntity.jurisdiction)
+        .all()
+    )
+
+    total = 0
+    status_counts: Dict[str, int] = {}
+    jurisdiction_counts: Dict[str, int] = {}
+    for status, jurisdiction, count in rows:
+        total += count
+        status_counts[status] = status_counts.get(status, 0) + count
+        jurisdiction_counts[jurisdiction] = jurisdiction_counts.get(jurisdiction, 0) + count
+
+    top_jurisdictions = sorted(jurisdiction_counts.items(), key=lambda item: (-item[1], item[0] or ""))
+    return {
+        "total_entities": total,
+        "status_breakdown": dict(sorted(status_counts.items())),
+        "top_jurisdictions": [
+            {"jurisdiction": jurisdiction, "count": count}
+            for jurisdiction, count in top_jurisdictions[:TOP_COUNTRIES]
+        ],
+    }
+
+
+def _compute_instrument_facets(session, models: Dict[str, Any]) -> Dict[str, Any]:
+    """Unfiltered instrument facet counts (/instruments/facets without filters)."""
+    from .facets import compute_instrument_facets
+
+    return compute_instrument_facets(session, models)
+
+
+# Statistics group -> (source tables, builder)
+STATISTICS_GROUPS: Dict[str, Tuple[Tuple[str, ...], Callable[[Any, Dict[str, Any]], Dict[str, Any]]]] = {
+    "instruments": (
+        ("instruments", "legal_entities", "figi_mappings", "transparency_calculations"),
+        _compute_instruments,
+    ),
+    "venues": (("market_identification_codes", "trading_venues"), _compute_venues),
+    "legal_entities": (("legal_entities",), _compute_legal_entities),
+    "instrument_facets": (("instruments", "trading_venues"), _compute_instrument_facets),
+}
+
+
+class StatisticsStore:
+    """Reads and rebuilds the materialised statistics groups."""
+
+    def __init__(self, refresh_seconds: int = ServiceDefaults.STATISTICS_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._snapshots: Dict[str, StatisticsSnapshot] = {}
+        self._build_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refreshing: set = set()
+
+    def get(self, name: str) -> StatisticsSnapshot:
+        """
+        Return the figures of a statistics group.
+
+        The first read loads the stored row, or builds the group when none
+        exists; afterwards outdated figures are returned while a rebuild runs
+        in the background.
+
+        Raises:
+            ValueError: If the group is unknown
+        """
+        if name not in STATISTICS_GROUPS:
+            raise ValueError(f"Unknown statistics group: {name}")
+
+        snapshot = self._snapshots.get(name)
+        if snapshot is None:
+            snapshot = self._load(name)
+            if snapshot is None:
+                return self.rebuild(name)
+            self._snapshots[name] = snapshot
+
+        if self.is_stale(name, snapshot):
+            self.refresh(name)
+        return snapshot
+
+    def is_stale(self, name: str, snapshot: StatisticsSnapshot) -> bool:
+        """
+        Stale when this process wrote to the group's tables since the figures
+        were computed, or once they are older than the refresh interval.
+        Writes made by other processes are picked up by the interval only.
+        """
+        written = data_version.last_written(*STATISTICS_GROUPS[name][0])
+        if written is not None and written >= snapshot.computed_at:
+            return True
+        age = (datetime.now(UTC) - snapshot.computed_at).total_seconds()
+        return age > self.refresh_seconds
+
+    def rebuild(self, name: str) -> StatisticsSnapshot:
+        """Recompute a group, store it and make it current."""
+        from ...database.session import get_session
+
+        _, build = STATISTICS_GROUPS[name]
+        models = _models()
+        with self._build_lock:
+            computed_at = datetime.now(UTC).replace(microsecond=0)
+            started = time.monotonic()
+            with get_session() as session:
+                figures = build(session, models)
+            duration_ms = int((time.monotonic() - started) * 1000)
+            snapshot = StatisticsSnapshot(figures, computed_at)
+            self._store(models, name, snapshot, duration_ms)
+            self._snapshots[name] = snapshot
+
+        logger.info(f"Statistics '{name}' rebuilt in {duration_ms}ms")
+        return snapshot
+
+    def rebuild_all(self) -> Dict[str, StatisticsSnapshot]:
+        return {name: self.rebuild(name) for name in STATISTICS_GROUPS}
+
+    def refresh(self, *names: str) -> None:
+        """Rebuild groups (default: all) in a background thread, skipping those already refreshing."""
+        with self._refresh_lock:
+            pending = [name for name in (names or STATISTICS_GROUPS) if name not in self._refreshing]
+            self._refreshing.update(pending)
+        if pending:
+            threading.Thread(
+                target=self._safe_refresh, args=(pending,), name="statistics-refresh", daemon=True
+            ).start()
+
+    def freshness(self) -> Dict[str, Optional[str]]:
+        """computed_at of the figures currently held, per group."""
+        return {
+            name: snapshot.computed_at.isoformat() if (snapshot := self._snapshots.get(name)) else None
+            for name in STATISTICS_GROUPS
+        }
+
+    def clear(self) -> None:
+        with self._build_lock:
+            self._snapshots.clear()
+
+    def _safe_refresh(self, names: Iterable[str]) -> None:
+        for name in names:
+            try:
+                # Adopt figures another worker stored since ours were computed
+                stored = self._load(name)
+                current = self._snapshots.get(name)
+                if (
+                    stored is not None
+                    and (current is None or stored.computed_at > current.computed_at)
+                    and not self.is_stale(name, stored)
+                ):
+                    self._snapshots[name] = stored
+                else:
+                    self.rebuild(name)
+            except Exception as e:
+                logger.warning(f"Could not refresh statistics '{name}': {e}")
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(name)
+
+    @staticmethod
+    def _load(name: str) -> Optional[StatisticsSnapshot]:
+        from ...database.session import get_session
+
+        DataStatistics = _models()["DataStatistics"]
+        try:
+            with get_session() as session:
+                row = session.get(DataStatistics, name)
+                if row is None:
+                    return None
+                return StatisticsSnapshot(json.loads(row.payload), row.computed_at.replace(tzinfo=UTC))
+        except Exception as e:
+            # e.g. a database created before the statistics table existed
+            logger.warning(f"Could not read stored statistics '{name}': {e}")
+            return None
+
+    @staticmethod
+    def _store(models: Dict[str, Any], name: str, snapshot: StatisticsSnapshot, duration_ms: int) -> None:
+        from ...database.session import get_session
+
+        try:
+            with get_session() as session:
+                session.merge(
+                    models["DataStatistics"](
+                        name=name,
+                        payload=json.dumps(snapshot.figures),
+                        computed_at=snapshot.computed_at.replace(tzinfo=None),
+                        duration_ms=duration_ms,
+                    )
+                )
+        except Exception as e:
+            # Figures are still served from memory
+            logger.warning(f"Could not store statistics '{name}': {e}")
+
+
+# Process-wide statistics store shared by the stats endpoints
+statistics_store = StatisticsStore()
+
+
+def coverage(covered: int, total: int) -> float:
+    """Percentage of total, rounded to one decimal."""
+    return round((covered / total * 100) if total > 0 else 0, 1)
@@ -4,15 +4,19 @@ Test configuration and fixtures for MarketDataAPI tests.
 Provides shared fixtures, test data, and configuration for the test suite.
 """
 
+import inspect
 import os
 import shutil
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
+from flask import Flask
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from marketdata_api.config import Config
 from marketdata_api.database.session import get_session
@@ -172,6 +176,47 @@ def temp_directory():
     shutil.rmtree(temp_dir)
 
 
+@pytest.fixture
+def service_db(monkeypatch):
+    """
+    Route get_session() to a fresh in-memory SQLite database holding every table.
+
+    Yields the session maker, for seeding. Every loaded copy of the session
+    module is patched, since some tests re-import it.
+    """
+    import marketdata_api.database.session  # noqa: F401 - the copy lazily imported services use
+    import marketdata_api.models.sqlite  # noqa: F401 - registers every model on Base
+    from marketdata_api.api.utils.http_cache import response_cache
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    session_maker = sessionmaker(bind=engine)
+
+    functions = {get_session, sys.modules["marketdata_api.database.session"].get_session}
+    for module in list(sys.modules.values()):
+        function = getattr(module, "get_session", None)
+        if getattr(function, "__module__", None) == "marketdata_api.database.session":
+            functions.add(function)
+    for function in functions:
+        monkeypatch.setitem(inspect.unwrap(function).__globals__, "_get_session_maker", lambda: session_maker)
+
+    response_cache.clear()
+    yield session_maker
+    response_cache.clear()
+    engine.dispose()
+
+
+@pytest.fixture
+def api_client():
+    """Test client for the API blueprint alone, without create_app's database setup."""
+    from marketdata_api.api import create_swagger_blueprint
+
+    app = Flask(__name__)
+    app.config["TESTING"] = True
+    app.register_blueprint(create_swagger_blueprint())
+    return app.test_client()
+
+
 @pytest.fixture
 def mock_external_services():
     """Mock external services like ESMA, GLEIF, OpenFIGI."""
@@ -0,0 +1,63 @@
+"""
+Tests for response compression and precompressed static assets.
+"""
+
+import gzip
+
+from flask import Flask
+
+from marketdata_api.api.utils.compression import init_compression, serve_precompressed_static
+from marketdata_api.api.utils.http_cache import conditional_get, response_cache
+
+
+def test_large_json_is_gzipped_with_weak_etag():
+    response_cache.clear()
+    app = Flask(__name__)
+    init_compression(app)
+
+    @app.route("/big")
+    @conditional_get("test_compression_big")
+    def big():
+        return {"status": "success", "data": ["x" * 10] * 500}
+
+    @app.route("/small")
+    def small():
+        return {"status": "success"}
+
+    client = app.test_client()
+    plain = client.get("/big")
+    assert "Content-Encoding" not in plain.headers
+
+    compressed = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in compressed.headers["Vary"]
+    assert gzip.decompress(compressed.get_data()) == plain.get_data()
+    assert compressed.headers["ETag"].startswith('W/')
+
+    revalidated = client.get(
+        "/big", headers={"Accept-Encoding": "gzip", "If-None-Match": compressed.headers["ETag"]}
+    )
+    assert revalidated.status_code == 304
+
+    assert "Content-Encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+
+
+def test_precompressed_static_assets(tmp_path):
+    (tmp_path / "app-3f9a1c2d.js").write_text("x" * 2000)
+    (tmp_path / "app-3f9a1c2d.js.gz").write_bytes(gzip.compress(b"x" * 2000))
+    (tmp_path / "robots.txt").write_text("User-agent: *")
+    app = Flask(__name__, static_folder=str(tmp_path), static_url_path="/assets")
+    serve_precompressed_static(app)
+    client = app.test_client()
+
+    response = client.get("/assets/app-3f9a1c2d.js", headers={"Accept-Encoding": "br, gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.mimetype == "text/javascript"
+    assert response.cache_control.immutable and response.cache_control.max_age == 365 * 24 * 3600
+    assert gzip.decompress(response.get_data()) == b"x" * 2000
+    response.close()
+
+    response = client.get("/assets/robots.txt", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+    assert response.cache_control.no_cache
+    response.close()
@@ -0,0 +1,36 @@
+"""
+Tests for the list endpoint total count cache.
+"""
+
+from marketdata_api.constants import CountModes
+from marketdata_api.database import data_version
+from marketdata_api.services.utils.count_cache import CountCache, normalize_filters, resolve_total
+
+
+def test_normalize_filters_ignores_order_and_empty_values():
+    assert normalize_filters({"b": "2", "a": " 1 ", "c": None, "d": ""}) == (("a", "1"), ("b", "2"))
+    assert normalize_filters(None) == ()
+
+
+def test_exact_count_is_cached_until_table_version_changes():
+    cache = CountCache(ttl_seconds=60, max_entries=10)
+    calls = []
+
+    def count():
+        calls.append(1)
+        return len(calls) * 10
+
+    assert cache.get_exact("things", {"type": "x"}, ("test_things",), count) == 10
+    assert cache.get_exact("things", {"type": "x"}, ("test_things",), count) == 10
+    assert len(calls) == 1
+
+    data_version.bump("test_things")
+    assert cache.get_exact("things", {"type": "x"}, ("test_things",), count) == 20
+    assert cache.get_any("things", {"type": "x"}) == 20
+
+
+def test_none_mode_skips_counting():
+    def count():
+        raise AssertionError("count should not run")
+
+    assert resolve_total(CountModes.NONE, "things", {}, ("test_things",), count) is None
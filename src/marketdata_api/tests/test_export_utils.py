@@ -0,0 +1,30 @@
+"""
+Tests for the streaming export serializers.
+"""
+
+import json
+from datetime import date
+
+from marketdata_api.api.utils.export_utils import iter_csv, iter_ndjson
+
+ROWS = [
+    {"isin": "SE0000000001", "name": "First, AB", "from_date": date(2025, 1, 2)},
+    {"isin": "SE0000000002", "name": "Second", "from_date": None},
+    {"isin": "SE0000000003", "name": "Third", "from_date": None},
+]
+
+
+def test_ndjson_chunks_by_batch_size():
+    chunks = list(iter_ndjson(iter(ROWS), ["isin", "from_date"], batch_size=2))
+
+    assert len(chunks) == 2
+    lines = "".join(chunks).splitlines()
+    assert json.loads(lines[0]) == {"isin": "SE0000000001", "from_date": "2025-01-02"}
+    assert len(lines) == 3
+
+
+def test_csv_header_first_then_quoted_rows():
+    chunks = list(iter_csv(iter(ROWS), ["isin", "name"], batch_size=10))
+
+    assert chunks[0] == "isin,name\r\n"
+    assert chunks[1].splitlines()[0] == 'SE0000000001,"First, AB"'
@@ -0,0 +1,85 @@
+"""
+Tests for FIGI and ticker reverse lookups.
+"""
+
+import pytest
+
+from marketdata_api.constants import ServiceDefaults
+from marketdata_api.models.sqlite.figi import FigiMapping
+from marketdata_api.models.sqlite.instrument import Instrument
+from marketdata_api.services.core.instrument_service import InstrumentService
+
+VOLVO = "SE0000108656"
+APPLE = "US0378331005"
+VOLVO_COMPOSITE = "BBG000VOLVC1"
+VOLVO_SHARE_CLASS = "BBG001VOLVS1"
+APPLE_FIGI = "BBG000B9XRY4"
+
+
+@pytest.fixture
+def mappings(service_db):
+    with service_db() as session:
+        session.add_all([
+            Instrument(isin=VOLVO, instrument_type="equity"),
+            Instrument(isin=APPLE, instrument_type="equity"),
+            # One share class listed in Stockholm and Frankfurt
+            FigiMapping(isin=VOLVO, figi="BBG000VOLVB1", composite_figi=VOLVO_COMPOSITE,
+                        share_class_figi=VOLVO_SHARE_CLASS, ticker="VOLVB", exchange_code="SS"),
+            FigiMapping(isin=VOLVO, figi="BBG000VOLVB2", composite_figi=VOLVO_COMPOSITE,
+                        share_class_figi=VOLVO_SHARE_CLASS, ticker="VOLVB", exchange_code="GY"),
+            FigiMapping(isin=APPLE, figi=APPLE_FIGI, composite_figi=APPLE_FIGI, ticker="AAPL", exchange_code="US"),
+        ])
+        session.commit()
+    return InstrumentService()
+
+
+def test_lookup_figis_matches_every_figi_level(mappings, monkeypatch):
+    found = mappings.lookup_figis([VOLVO_COMPOSITE, APPLE_FIGI, "BBG000NOPE00"])
+
+    assert sorted(found) == [APPLE_FIGI, VOLVO_COMPOSITE]
+    assert [mapping["figi"] for mapping in found[VOLVO_COMPOSITE]] == ["BBG000VOLVB1", "BBG000VOLVB2"]
+    # A row matching on both figi and composite_figi is listed once
+    assert len(found[APPLE_FIGI]) == 1
+
+    monkeypatch.setattr(ServiceDefaults, "LOOKUP_CHUNK_SIZE", 1)
+    assert mappings.lookup_figis([VOLVO_SHARE_CLASS, APPLE_FIGI]).keys() == {VOLVO_SHARE_CLASS, APPLE_FIGI}
+
+
+def test_lookup_tickers_filters_by_exchange(mappings):
+    found = mappings.lookup_tickers(["VOLVB", "AAPL", "NOPE"])
+    assert {ticker: len(rows) for ticker, rows in found.items()} == {"VOLVB": 2, "AAPL": 1}
+
+    stockholm = mappings.lookup_tickers(["VOLVB", "AAPL"], exchange_code="SS")
+    assert [mapping["figi"] for mapping in stockholm["VOLVB"]] == ["BBG000VOLVB1"]
+    assert "AAPL" not in stockholm
+
+
+def test_figi_endpoints(mappings, api_client):
+    detail = api_client.get(f"/api/v1/figi/{VOLVO_SHARE_CLASS.lower()}")
+    assert detail.status_code == 200
+    assert detail.get_json()["meta"]["isins"] == [VOLVO]
+    assert api_client.get("/api/v1/figi/BBG000NOPE00").status_code == 404
+    assert api_client.get("/api/v1/figi/SHORT").status_code == 400
+
+    lookup = api_client.post("/api/v1/figi/lookup", json={"figis": [APPLE_FIGI, "BBG000NOPE00", "bad"]})
+    body = lookup.get_json()
+    assert list(body["data"]["found"]) == [APPLE_FIGI]
+    assert sorted(body["data"]["not_found"]) == ["BBG000NOPE00", "bad"]
+
+    too_many = {"figis": [APPLE_FIGI] * (ServiceDefaults.LOOKUP_MAX_IDENTIFIERS + 1)}
+    assert api_client.post("/api/v1/figi/lookup", json=too_many).status_code == 400
+
+
+def test_ticker_endpoints(mappings, api_client):
+    search = api_client.get("/api/v1/figi/search", query_string={"ticker": "volvb", "exchange_code": "ss"})
+    assert search.status_code == 200
+    assert search.get_json()["meta"]["total"] == 1
+    assert api_client.get("/api/v1/figi/search").status_code == 400
+
+    lookup = api_client.post("/api/v1/figi/search", json={"tickers": ["VOLVB", "AAPL"], "exchange_code": "GY"})
+    body = lookup.get_json()
+    assert [mapping["figi"] for mapping in body["data"]["found"]["VOLVB"]] == ["BBG000VOLVB2"]
+    assert list(body["data"]["not_found"]) == ["AAPL"]
+
+    invalid = api_client.post("/api/v1/figi/search", json={"tickers": ["VOLVB"], "exchange_code": 5})
+    assert invalid.status_code == 400
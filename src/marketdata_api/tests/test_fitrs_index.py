@@ -0,0 +1,120 @@
+"""
+Tests for FITRS ingest helpers: the persisted ISIN index and column normalization.
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from marketdata_api.services.utils.esma_utils import FitrsNormalizer
+from marketdata_api.services.utils.fitrs_index import FitrsIsinIndex
+
+ECR_FILE = "FULECR_20250426_E_1of1_fitrs_data.csv"
+NCR_FILE = "FULNCR_20250426_D_1of1_fitrs_data.csv"
+
+
+@pytest.fixture
+def fitrs_dir(tmp_path):
+    """FITRS directory with one equity (Id keyed) and one non-equity (ISIN keyed) file."""
+    (tmp_path / ECR_FILE).write_text(
+        "TechRcrdId,Id,FrDt,Mthdlgy\n"
+        "1,SE0000242455,2025-01-01,SINT\n"
+        "2,SE0000108656,2025-01-01,\n",
+        encoding="utf-8",
+    )
+    (tmp_path / NCR_FILE).write_text(
+        "TechRcrdId,ISIN,Desc\n"
+        '3,XS1234567890,"multi\nline description"\n'
+        "4,XS1234567890,second row\n",
+        encoding="utf-8",
+    )
+    return tmp_path
+
+
+def test_read_records_uses_id_and_isin_columns(fitrs_dir):
+    index = FitrsIsinIndex(fitrs_dir)
+
+    equity = index.read_records("SE0000108656")
+    assert equity == [
+        (ECR_FILE, {"TechRcrdId": "2", "Id": "SE0000108656", "FrDt": "2025-01-01", "Mthdlgy": None})
+    ]
+
+    debt = index.read_records("XS1234567890")
+    assert [record["TechRcrdId"] for _, record in debt] == ["3", "4"]
+    assert debt[0][1]["Desc"] == "multi\nline description"
+
+
+def test_read_records_respects_file_filter(fitrs_dir):
+    index = FitrsIsinIndex(fitrs_dir)
+
+    assert index.read_records("XS1234567890", [ECR_FILE]) == []
+    assert len(index.read_records("XS1234567890", [NCR_FILE])) == 2
+
+
+def test_refresh_reindexes_changed_and_drops_removed_files(fitrs_dir):
+    index = FitrsIsinIndex(fitrs_dir)
+    index.refresh()
+
+    (fitrs_dir / ECR_FILE).write_text(
+        "TechRcrdId,Id,FrDt,Mthdlgy\n9,SE0000242455,2025-06-01,SINT\n", encoding="utf-8"
+    )
+    (fitrs_dir / NCR_FILE).unlink()
+
+    assert index.read_records("SE0000108656") == []
+    assert index.read_records("SE0000242455")[0][1]["TechRcrdId"] == "9"
+    assert index.lookup("XS1234567890") == []
+
+
+def test_quoted_headers_and_na_tokens_match_full_file_reads(tmp_path):
+    (tmp_path / NCR_FILE).write_text(
+        'TechRcrdId,ISIN,"Desc, long",Mthdlgy\n'
+        "5,XS1234567890,N/A,NULL\n"
+        "6,XS1234567890,callable,nan\n",
+        encoding="utf-8",
+    )
+
+    indexed = [record for _, record in FitrsIsinIndex(tmp_path).read_records("XS1234567890")]
+    assert indexed[0] == {"TechRcrdId": "5", "ISIN": "XS1234567890", "Desc, long": None, "Mthdlgy": None}
+    assert indexed[1]["Desc, long"] == "callable"
+
+    full = FitrsNormalizer.read_csv(tmp_path / NCR_FILE)
+    assert full[["Desc, long", "Mthdlgy"]].isna().values.tolist() == [[True, True], [False, True]]
+
+
+def test_index_in_old_format_is_rebuilt(fitrs_dir):
+    import sqlite3
+
+    from marketdata_api.services.utils.fitrs_index import INDEX_FILENAME
+
+    index = FitrsIsinIndex(fitrs_dir)
+    index.refresh()
+    # Indexes written before headers were stored as JSON
+    with sqlite3.connect(fitrs_dir / INDEX_FILENAME) as conn:
+        conn.execute("UPDATE indexed_files SET header = 'TechRcrdId,Id,FrDt,Mthdlgy'")
+        conn.execute("PRAGMA user_version = 0")
+
+    assert index.read_records("SE0000108656")[0][1]["Id"] == "SE0000108656"
+
+
+def test_normalizer_adds_key_and_types_columns():
+    raw = pd.DataFrame(
+        {
+            "Id": ["SE0000242455", None],
+            "ISIN": [None, "XS1234567890"],
+            "FrDt": ["2025-01-01", None],
+            "TtlNbOfTxsExctd": ["10", ""],
+            "PreTradLrgInScaleThrshld_Amt": [None, "250000.5"],
+            "Desc": ["share", None],
+        }
+    )
+
+    records = FitrsNormalizer.to_records(FitrsNormalizer.normalize(raw))
+
+    assert [record["isin"] for record in records] == ["SE0000242455", "XS1234567890"]
+    assert records[0]["FrDt"] == date(2025, 1, 1)
+    assert records[0]["TtlNbOfTxsExctd"] == 10.0
+    assert records[1]["PreTradLrgInScaleThrshld_Amt"] == 250000.5
+    assert records[1]["TtlNbOfTxsExctd"] is None
+    assert records[1]["FrDt"] is None
+    assert records[1]["Desc"] is None
@@ -0,0 +1,103 @@
+"""
+Tests for the instrument full-text search index.
+"""
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from marketdata_api.database.fulltext import (
+    build_match_query,
+    build_trigram_query,
+    ensure_instrument_fulltext,
+    ensure_legal_entity_fulltext,
+    match_instruments,
+    match_legal_entities,
+    name_tokens,
+    score_name,
+)
+from marketdata_api.models.sqlite.instrument import Instrument
+from marketdata_api.models.sqlite.legal_entity import LegalEntity
+
+
+def test_build_match_query():
+    assert build_match_query("Volvo b", "sqlite") == '"Volvo"* "b"*'
+    assert build_match_query("volvo b", "mssql") == '"volvo*" AND "b*"'
+    assert build_match_query(" %'\" ", "sqlite") is None
+    assert build_trigram_query("AB Volvo") == '"lvo" OR "olv" OR "vol"'
+
+
+def test_sqlite_index_is_ranked_and_kept_in_sync():
+    engine = create_engine("sqlite://")
+    Instrument.metadata.create_all(engine, tables=[LegalEntity.__table__, Instrument.__table__])
+    assert ensure_instrument_fulltext(engine)
+
+    with Session(engine) as session:
+        session.add_all([
+            Instrument(isin="SE0000115446", instrument_type="equity", full_name="Volvo Car AB"),
+            Instrument(isin="SE0000108656", instrument_type="equity", full_name="Volvo AB ser. B",
+                       short_name="VOLV B", lei_id="549300HGV012CNC8JD22"),
+        ])
+        session.commit()
+
+        def search(term):
+            query, rank = match_instruments(session.query(Instrument), Instrument, term)
+            return [i.isin for i in query.order_by(rank, Instrument.isin)]
+
+        assert sorted(search("volv")) == ["SE0000108656", "SE0000115446"]
+        assert search("volv b") == ["SE0000108656"]
+
+        # Issuer names stored after their instruments are picked up by triggers
+        session.add(LegalEntity(
+            lei="549300HGV012CNC8JD22", name="AB Volvo Group", jurisdiction="SE", legal_form="AB",
+            registered_as="556012-5790", status="ACTIVE", registration_status="ISSUED",
+            managing_lou="549300O897ZC5H7CY412",
+        ))
+        session.query(Instrument).filter_by(isin="SE0000115446").delete()
+        session.commit()
+
+        assert search("group") == ["SE0000108656"]
+        assert search("car") == []
+
+
+def test_name_score():
+    assert score_name(name_tokens("volvo"), "AB Volvo") == 1.0
+    assert 0.5 < score_name(name_tokens("volv"), "AB Volvo") < 1.0
+    assert score_name(name_tokens("societe"), "Société Générale") == 1.0
+    assert 0.5 < score_name(name_tokens("ericson"), "LM Ericsson") < 0.9
+    assert score_name(name_tokens("zzz"), "AB Volvo") == 0.0
+
+
+def _entity(lei, name):
+    return LegalEntity(
+        lei=lei, name=name, jurisdiction="SE", legal_form="AB", registered_as="556012-5790",
+        status="ACTIVE", registration_status="ISSUED", managing_lou="549300O897ZC5H7CY412",
+    )
+
+
+def test_legal_entity_name_search_ranks_and_falls_back_to_fuzzy():
+    engine = create_engine("sqlite://")
+    LegalEntity.metadata.create_all(engine, tables=[LegalEntity.__table__])
+    assert ensure_legal_entity_fulltext(engine)
+
+    with Session(engine) as session:
+        session.add_all([
+            _entity("549300HGV012CNC8JD22", "AB Volvo"),
+            _entity("549300HGV012CNC8JD23", "Volvo Car Corporation"),
+            _entity("549300HGV012CNC8JD24", "Telefonaktiebolaget LM Ericsson"),
+        ])
+        session.commit()
+
+        def search(term, threshold=0.3):
+            query, rank = match_legal_entities(session.query(LegalEntity), LegalEntity, term, threshold)
+            return [e.name for e in query.order_by(rank, LegalEntity.lei)]
+
+        assert search("volvo") == ["AB Volvo", "Volvo Car Corporation"]
+        assert search("volvo car") == ["Volvo Car Corporation"]
+
+        # No token starts with "ericson": trigram candidates scored against the threshold
+        assert search("ericson") == ["Telefonaktiebolaget LM Ericsson"]
+        assert search("ericson", threshold=0.9) == []
+
+        session.query(LegalEntity).filter_by(lei="549300HGV012CNC8JD22").delete()
+        session.commit()
+        assert search("volvo") == ["Volvo Car Corporation"]
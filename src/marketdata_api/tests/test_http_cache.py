@@ -0,0 +1,58 @@
+"""
+Tests for conditional GETs and the data-versioned response cache.
+"""
+
+from flask import Flask
+
+from marketdata_api.api.utils.http_cache import conditional_get, response_cache
+from marketdata_api.database import data_version
+
+
+def _make_app(calls):
+    app = Flask(__name__)
+    app.config["RESPONSE_CACHE_ENABLED"] = True
+
+    @app.route("/things/<name>")
+    @conditional_get("test_http_things")
+    def get_thing(name):
+        calls.append(name)
+        if name == "missing":
+            return {"status": "error"}, 404
+        return {"status": "success", "data": {"name": name, "calls": len(calls)}}
+
+    return app
+
+
+def test_etag_304_and_cache_invalidation():
+    response_cache.clear()
+    calls = []
+    client = _make_app(calls).test_client()
+
+    first = client.get("/things/a")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert first.headers["Last-Modified"]
+
+    # Served from the cache, then revalidated without running the handler
+    assert client.get("/things/a").get_data() == first.get_data()
+    not_modified = client.get("/things/a", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.get_data() == b""
+    assert calls == ["a"]
+
+    data_version.bump("test_http_things")
+    changed = client.get("/things/a", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert calls == ["a", "a"]
+
+
+def test_errors_are_not_cached():
+    response_cache.clear()
+    calls = []
+    client = _make_app(calls).test_client()
+
+    assert client.get("/things/missing").status_code == 404
+    assert client.get("/things/missing").status_code == 404
+    assert "ETag" not in client.get("/things/missing").headers
+    assert calls == ["missing"] * 3
@@ -0,0 +1,80 @@
+"""
+Tests for the instrument membership index.
+"""
+
+import pytest
+from sqlalchemy import delete
+
+from marketdata_api.models.sqlite.figi import FigiMapping
+from marketdata_api.models.sqlite.instrument import Instrument
+from marketdata_api.models.sqlite.legal_entity import LegalEntity
+from marketdata_api.services.utils.instrument_membership import (
+    FIGI,
+    LEGAL_ENTITY,
+    LOADED,
+    MembershipIndex,
+    instrument_membership,
+)
+
+LEI = "549300TUL1DMLW1DVX48"
+
+
+def test_statuses_follow_input_order():
+    index = MembershipIndex([
+        ("US0378331005", LOADED),
+        ("SE0000108656", LOADED | FIGI | LEGAL_ENTITY),
+    ])
+
+    assert len(index) == 2
+    assert index.statuses(["SE0000108656", "SE0000000000", "US0378331005", "SE0000108656"]) == [11, 0, 1, 11]
+    assert index.status("ZZ9999999999") == 0
+
+
+def test_patched_index_overlays_the_sorted_array():
+    index = MembershipIndex([("SE0000108656", LOADED), ("US0378331005", LOADED)])
+
+    patched = index.patched({"SE0000108656": 0, "DE0007164600": LOADED | FIGI, "ZZ9999999999": 0})
+
+    assert patched.statuses(["SE0000108656", "DE0007164600", "US0378331005"]) == [0, 3, 1]
+    assert (len(patched), patched.patch_count) == (2, 3)
+    assert index.status("SE0000108656") == LOADED and len(index) == 2
+
+
+def test_committed_writes_are_patched_in_without_a_rebuild(service_db, monkeypatch):
+    monkeypatch.setattr(instrument_membership, "refresh", lambda: refreshes.append(True))
+    refreshes = []
+    instrument_membership.clear()
+    with service_db() as session:
+        session.add_all([
+            Instrument(isin="SE0000108656", instrument_type="equity", lei_id=LEI),
+            Instrument(isin="US0378331005", instrument_type="equity"),
+        ])
+        session.commit()
+    assert instrument_membership.statuses(["SE0000108656"]) == [LOADED]
+
+    monkeypatch.setattr(instrument_membership, "rebuild", lambda force=True: pytest.fail("rebuilt"))
+    with service_db() as session:
+        session.add_all([
+            FigiMapping(isin="SE0000108656", figi="BBG000VOLVB1"),
+            LegalEntity(
+                lei=LEI, name="Volvo AB", jurisdiction="SE", legal_form="AB", registered_as="Volvo AB",
+                status="ACTIVE", registration_status="ISSUED", managing_lou="549300O897ZC5H7CY412",
+            ),
+            Instrument(isin="DE0007164600", instrument_type="equity"),
+        ])
+        session.delete(session.query(Instrument).filter_by(isin="US0378331005").one())
+        session.commit()
+
+        index = instrument_membership.index()
+        assert index.statuses(["SE0000108656", "DE0007164600", "US0378331005"]) == [
+            LOADED | FIGI | LEGAL_ENTITY, LOADED, 0,
+        ]
+        assert len(index) == 2 and not refreshes
+
+        # Bulk statements carry no keys; the index is rebuilt in the background
+        session.execute(delete(FigiMapping))
+        session.commit()
+        assert instrument_membership.statuses(["SE0000108656"]) == [LOADED | FIGI | LEGAL_ENTITY]
+        assert refreshes
+
+    instrument_membership.clear()
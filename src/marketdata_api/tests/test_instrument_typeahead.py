@@ -0,0 +1,31 @@
+"""
+Tests for the in-memory instrument typeahead index.
+"""
+
+from marketdata_api.services.utils.instrument_typeahead import TypeaheadIndex, TypeaheadRecord
+
+RECORDS = [
+    TypeaheadRecord("SE0000108656", "VOLV B", "Volvo AB ser. B", "equity", "VOLVB"),
+    TypeaheadRecord("SE0000115446", "VOLCAR B", "Volvo Car AB", "equity", None),
+    TypeaheadRecord("US0378331005", "APPLE", "Apple Inc.", "equity", "AAPL"),
+]
+
+
+def test_prefix_search_is_case_insensitive_and_deduplicated():
+    index = TypeaheadIndex(RECORDS)
+
+    assert [(r.isin, field) for r, field in index.search("volv", 10)] == [
+        ("SE0000108656", "short_name"),
+    ]
+    # Both short name and ticker start with "vol"; each instrument is returned once
+    assert [r.isin for r, _ in index.search("VOL", 10)] == ["SE0000115446", "SE0000108656"]
+    assert [(r.isin, field) for r, field in index.search("aap", 10)] == [("US0378331005", "ticker")]
+    assert [r.isin for r, _ in index.search("se", 1)] == ["SE0000108656"]
+
+
+def test_blank_or_unknown_prefix_returns_nothing():
+    index = TypeaheadIndex(RECORDS)
+
+    assert index.search("  ", 10) == []
+    assert index.search("zzz", 10) == []
+    assert index.search("volv", 0) == []
@@ -0,0 +1,62 @@
+"""
+Tests for the pluggable JSON serializer.
+"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from marketdata_api.api.utils.json_serializer import (
+    HAS_MSGSPEC,
+    HAS_ORJSON,
+    JSONSerializer,
+    get_serializer,
+)
+
+PAYLOAD = {
+    "nan": float("nan"),
+    "inf": [float("inf"), float("-inf"), 1.5],
+    "date": date(2024, 3, 1),
+    "datetime": datetime(2024, 3, 1, 12, 30),
+    "decimal": Decimal("2.50"),
+    1: "non-string key",
+}
+
+EXPECTED = {
+    "nan": None,
+    "inf": [None, None, 1.5],
+    "date": "2024-03-01",
+    "datetime": "2024-03-01T12:30:00",
+    "decimal": 2.5,
+    "1": "non-string key",
+}
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "stdlib",
+        pytest.param("orjson", marks=pytest.mark.skipif(not HAS_ORJSON, reason="orjson not installed")),
+        pytest.param("msgspec", marks=pytest.mark.skipif(not HAS_MSGSPEC, reason="msgspec not installed")),
+    ],
+)
+def test_backends_encode_the_same_json(name):
+    serializer = get_serializer(name)
+    assert serializer.name == name
+    assert json.loads(serializer.dumps(PAYLOAD)) == EXPECTED
+    # The stdlib cannot sort mixed int/str keys, so sorting is checked on str keys only
+    sortable = {key: value for key, value in PAYLOAD.items() if isinstance(key, str)}
+    pretty = serializer.dumps(sortable, indent=True, sort_keys=True).decode("utf-8")
+    assert "\n" in pretty
+    assert list(json.loads(pretty)) == sorted(sortable)
+
+
+def test_unknown_or_missing_backend():
+    with pytest.raises(ValueError):
+        get_serializer("ujson")
+    if not HAS_MSGSPEC:
+        assert type(get_serializer("msgspec")) is JSONSerializer
+    with pytest.raises(TypeError):
+        get_serializer("stdlib").dumps({"value": object()})
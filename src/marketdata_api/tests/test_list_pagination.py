@@ -0,0 +1,66 @@
+"""
+Tests for cursor pagination on the instrument and MIC list endpoints.
+"""
+
+import pytest
+
+from marketdata_api.models.sqlite.instrument import Instrument
+from marketdata_api.models.sqlite.market_identification_code import MarketIdentificationCode
+
+ISINS = ["DE0007164600", "SE0000108656", "SE0000120784", "US0378331005", "XS2908107019"]
+INSTRUMENTS_URL = "/api/v1/instruments/"
+MIC_URL = "/api/v1/mic/"
+
+
+@pytest.fixture
+def instruments(service_db):
+    with service_db() as session:
+        session.add_all(Instrument(isin=isin, instrument_type="equity") for isin in reversed(ISINS))
+        session.commit()
+
+
+def test_instrument_list_pages_by_cursor(instruments, api_client):
+    first = api_client.get(INSTRUMENTS_URL, query_string={"cursor": "", "per_page": 2})
+    assert first.status_code == 200
+    meta = first.get_json()["meta"]
+    assert [row["isin"] for row in first.get_json()["data"]] == ISINS[:2]
+    assert meta["total"] is None and meta["next_cursor"]
+
+    seen, cursor = [], ""
+    while cursor is not None:
+        body = api_client.get(INSTRUMENTS_URL, query_string={"cursor": cursor, "per_page": 2}).get_json()
+        seen += [row["isin"] for row in body["data"]]
+        cursor = body["meta"]["next_cursor"]
+    assert seen == ISINS
+
+
+@pytest.mark.parametrize(
+    "query, message",
+    [
+        ({"cursor": "garbage"}, "Invalid cursor"),
+        ({"count": "bogus"}, "Invalid count mode"),
+        ({"cursor": "", "count": "bogus"}, "Invalid count mode"),
+    ],
+)
+def test_instrument_list_rejects_invalid_parameters(instruments, api_client, query, message):
+    response = api_client.get(INSTRUMENTS_URL, query_string=query)
+
+    assert response.status_code == 400
+    assert response.get_json()["error"]["message"].startswith(message)
+
+
+def test_mic_list_invalid_cursor_keeps_error_message(service_db, api_client):
+    with service_db() as session:
+        session.add(MarketIdentificationCode(
+            mic="XSTO", operating_mic="XSTO", operation_type="OPRT",
+            market_name="NASDAQ STOCKHOLM AB", iso_country_code="SE",
+        ))
+        session.commit()
+
+    listed = api_client.get(MIC_URL, query_string={"cursor": ""})
+    assert listed.status_code == 200
+    assert [row["mic"] for row in listed.get_json()["data"]] == ["XSTO"]
+
+    response = api_client.get(MIC_URL, query_string={"cursor": "garbage"})
+    assert response.status_code == 400
+    assert response.get_json()["error"]["message"].startswith("Invalid cursor")
@@ -0,0 +1,39 @@
+"""
+Tests for multi-get lookup helpers.
+"""
+
+import pytest
+from flask import Flask
+
+from marketdata_api.api.utils.api_utils import validate_isin
+from marketdata_api.api.utils.lookup_utils import (
+    build_lookup_response,
+    chunked,
+    read_lookup_identifiers,
+)
+
+
+def test_identifiers_are_normalised_deduplicated_and_validated():
+    app = Flask(__name__)
+    body = {"isins": ["SE0000108656", " se0000108656", "US0378331005", "bad"]}
+    with app.test_request_context(json=body):
+        isins, invalid = read_lookup_identifiers("isins", validate_isin)
+
+    assert isins == ["SE0000108656", "US0378331005"]
+    assert list(invalid) == ["bad"]
+
+    response = build_lookup_response(isins, {"US0378331005": {"isin": "US0378331005"}}, invalid, "Not found")
+    assert response["data"]["not_found"] == {"SE0000108656": "Not found", "bad": invalid["bad"]}
+    assert response["meta"] == {"requested": 3, "found": 1, "not_found": 2}
+
+
+def test_malformed_body_is_rejected():
+    app = Flask(__name__)
+    for body in ({"isin": ["SE0000108656"]}, {"isins": "SE0000108656"}, {"isins": [1]}):
+        with app.test_request_context(json=body):
+            with pytest.raises(ValueError):
+                read_lookup_identifiers("isins", validate_isin)
+
+
+def test_chunked():
+    assert [list(chunk) for chunk in chunked(list(range(5)), 2)] == [[0, 1], [2, 3], [4]]
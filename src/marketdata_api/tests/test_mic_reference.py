@@ -0,0 +1,59 @@
+"""
+Tests for the in-process MIC reference snapshot.
+"""
+
+import pytest
+
+from marketdata_api.services.utils.mic_reference import MICSnapshot
+
+RECORDS = [
+    {"mic": "XSTO", "operating_mic": "XSTO", "operation_type": "OPRT",
+     "market_name": "NASDAQ STOCKHOLM AB", "iso_country_code": "SE", "status": "ACTIVE"},
+    {"mic": "SSME", "operating_mic": "XSTO", "operation_type": "SGMT",
+     "market_name": "SEB - LIQUIDITY PROVIDER", "iso_country_code": "SE", "status": "ACTIVE"},
+    {"mic": "XLON", "operating_mic": "XLON", "operation_type": "OPRT",
+     "market_name": "LONDON STOCK EXCHANGE", "iso_country_code": "GB", "status": "EXPIRED"},
+]
+
+
+def test_snapshot_indexes():
+    snapshot = MICSnapshot(RECORDS)
+
+    assert len(snapshot) == 3
+    assert snapshot.get("xsto")["market_name"] == "NASDAQ STOCKHOLM AB"
+    assert snapshot.get(None) is None
+    assert snapshot.operating_mic_for("SSME") == "XSTO"
+    assert [record["mic"] for record in snapshot.segments("XSTO")] == ["SSME"]
+    assert [record["mic"] for record in snapshot.by_country["SE"]] == ["XSTO", "SSME"]
+    assert [record["mic"] for record in snapshot.by_status["EXPIRED"]] == ["XLON"]
+
+
+def test_snapshot_is_immutable():
+    snapshot = MICSnapshot(RECORDS)
+
+    with pytest.raises(TypeError):
+        snapshot.get("XSTO")["market_name"] = "changed"
+    with pytest.raises(TypeError):
+        snapshot.by_mic["NEWM"] = {}
+
+
+def test_figi_search_mic_comes_from_the_snapshot(monkeypatch):
+    from types import SimpleNamespace
+
+    from marketdata_api.services.core.instrument_service import InstrumentService
+    from marketdata_api.services.utils.mic_reference import mic_reference
+
+    from marketdata_api.services.utils.mic_reference import MIC_TABLE, data_version
+
+    monkeypatch.setattr(mic_reference, "_snapshot", MICSnapshot(RECORDS))
+    monkeypatch.setattr(mic_reference, "_version", data_version.get_version(MIC_TABLE))
+    service = InstrumentService()
+
+    def mic_for(venue=None, firds_data=None):
+        instrument = SimpleNamespace(relevant_trading_venue=venue, firds_data=firds_data)
+        return service._extract_mic_for_figi_search(instrument)
+
+    assert mic_for("SSME") == "XSTO"
+    assert mic_for(firds_data={"TechAttrbts_RlvntTradgVn": "XSTO"}) == "XSTO"
+    assert mic_for("NEWM") == "NEWM"
+    assert mic_for() == ""
@@ -0,0 +1,28 @@
+"""
+Tests for the in-memory name search index.
+"""
+
+from marketdata_api.services.utils.name_search import NameSearchIndex
+
+INDEX = NameSearchIndex([
+    ("XSTO", {"mic": "XSTO", "market_name": "NASDAQ STOCKHOLM AB", "acronym": None}),
+    ("XLON", {"mic": "XLON", "market_name": "LONDON STOCK EXCHANGE", "acronym": "LSE"}),
+    ("XNYS", {"mic": "XNYS", "market_name": "NEW YORK STOCK EXCHANGE, INC.", "acronym": "NYSE"}),
+])
+
+
+def test_search_ranks_prefix_and_typo_matches():
+    assert [key for key, _ in INDEX.search("lse")] == ["XLON"]
+    assert [key for key, _ in INDEX.search("stock exchange")][:2] == ["XLON", "XNYS"]
+    assert [key for key, _ in INDEX.search("stokholm")] == ["XSTO"]
+
+    # Exact token beats prefix beats typo
+    assert INDEX.search("nyse")[0] == ("XNYS", 1.0)
+    assert INDEX.search("stock", fields=("market_name",))[0][1] == 1.0
+
+
+def test_threshold_fields_and_limit():
+    assert INDEX.search("stokholm", threshold=0.9) == []
+    assert INDEX.search("lse", fields=("market_name",)) == []
+    assert len(INDEX.search("x", limit=2)) == 2
+    assert INDEX.search("  ") == []
@@ -0,0 +1,32 @@
+"""
+Tests for the pre-rendered OpenAPI document.
+"""
+
+from marketdata_api.config import Config
+
+SPEC_URL = "/api/v1/swagger.json"
+
+
+def test_spec_is_served_with_etag_cache_headers_and_304(api_client):
+    first = api_client.get(SPEC_URL)
+    etag, weak = first.get_etag()
+
+    assert first.status_code == 200
+    assert "paths" in first.get_json()
+    assert etag and not weak
+    assert first.cache_control.public
+    assert first.cache_control.max_age == Config.OPENAPI_CACHE_SECONDS
+
+    # Rendered once per process
+    api = api_client.application.blueprints["swagger"].api
+    assert api.spec_document() is api.spec_document()
+    assert api_client.get(SPEC_URL).get_data() == first.get_data()
+
+    for tag in (f'"{etag}"', f'W/"{etag}"'):
+        not_modified = api_client.get(SPEC_URL, headers={"If-None-Match": tag})
+        assert not_modified.status_code == 304
+        assert not_modified.get_data() == b""
+        assert not_modified.get_etag() == (etag, False)
+        assert not_modified.cache_control.max_age == Config.OPENAPI_CACHE_SECONDS
+
+    assert api_client.get(SPEC_URL, headers={"If-None-Match": '"stale"'}).status_code == 200
@@ -0,0 +1,172 @@
+"""
+Tests for entity relationship queries and the hierarchy endpoint.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from marketdata_api.constants import ErrorMessages, ServiceDefaults
+from marketdata_api.models.sqlite.legal_entity import EntityRelationship, LegalEntity
+from marketdata_api.services.core.legal_entity_service import LegalEntityService
+
+ROOT = "ROOT0000000000000001"
+CHILD_A = "CHLDA000000000000002"
+CHILD_B = "CHLDB000000000000003"
+GRANDCHILD = "GRAND000000000000004"  # Not stored as an entity
+INACTIVE = "INACT000000000000005"
+ULTIMATE = "ULTIM000000000000006"
+
+
+def _entity(lei, name):
+    return LegalEntity(
+        lei=lei, name=name, jurisdiction="SE", legal_form="AB", registered_as=name,
+        status="ACTIVE", registration_status="ISSUED", managing_lou="549300O897ZC5H7CY412",
+    )
+
+
+def _relationship(parent, child, relationship_type="DIRECT", status="ACTIVE"):
+    return EntityRelationship(
+        parent_lei=parent, child_lei=child, relationship_type=relationship_type,
+        relationship_status=status, relationship_period_start=datetime(2020, 1, 1),
+    )
+
+
+@pytest.fixture
+def group(service_db):
+    with service_db() as session:
+        session.add_all([
+            _entity(ROOT, "Root Holding AB"),
+            _entity(CHILD_A, "Child A AB"),
+            _entity(CHILD_B, "Child B AB"),
+            _entity(INACTIVE, "Sold Off AB"),
+            _entity(ULTIMATE, "Ultimate Sub AB"),
+            _relationship(ROOT, CHILD_A),
+            _relationship(ROOT, CHILD_B),
+            _relationship(CHILD_A, GRANDCHILD),
+            # Loops back into the tree must not recurse
+            _relationship(GRANDCHILD, CHILD_A),
+            _relationship(GRANDCHILD, ROOT),
+            _relationship(ROOT, INACTIVE, status="INACTIVE"),
+            _relationship(ROOT, ULTIMATE, relationship_type="ULTIMATE"),
+        ])
+        session.commit()
+    return LegalEntityService()
+
+
+def _children(node):
+    return [child["lei"] for child in node["children"]]
+
+
+def test_hierarchy_is_built_from_one_recursive_query(group):
+    result = group.get_hierarchy(ROOT)
+
+    assert result["root_entity"]["name"] == "Root Holding AB"
+    tree = result["hierarchy"]
+    assert _children(tree) == [CHILD_A, CHILD_B]
+    grandchild = tree["children"][0]["children"][0]
+    assert (grandchild["lei"], grandchild["depth"], grandchild["name"]) == (GRANDCHILD, 2, None)
+    # The loops back to CHILD_A and ROOT stop at the first repeated LEI
+    assert grandchild["children"] == []
+    assert (result["total_entities"], result["max_depth"]) == (4, 2)
+
+
+def test_hierarchy_depth_status_and_type_filters(group):
+    shallow = group.get_hierarchy(ROOT, max_depth=1)
+    assert (shallow["total_entities"], shallow["max_depth"]) == (3, 1)
+    assert shallow["hierarchy"]["children"][0]["children"] == []
+
+    assert INACTIVE in _children(group.get_hierarchy(ROOT, include_inactive=True)["hierarchy"])
+    assert _children(group.get_hierarchy(ROOT, relationship_type="ultimate")["hierarchy"]) == [ULTIMATE]
+
+    leaf = group.get_hierarchy(CHILD_B)
+    assert (leaf["total_entities"], leaf["hierarchy"]["children"]) == (1, [])
+    assert group.get_hierarchy("UNKNOWN0000000000000") is None
+
+
+def test_hierarchy_rejects_invalid_parameters(group):
+    for max_depth in (0, ServiceDefaults.HIERARCHY_MAX_DEPTH + 1):
+        with pytest.raises(ValueError):
+            group.get_hierarchy(ROOT, max_depth=max_depth)
+    with pytest.raises(ValueError):
+        group.get_hierarchy(ROOT, relationship_type="SIDEWAYS")
+
+
+def test_hierarchy_endpoint_errors_keep_their_message(group, api_client):
+    url = f"/api/v1/relationships/hierarchy/{ROOT}"
+
+    ok = api_client.get(url)
+    assert ok.status_code == 200
+    assert _children(ok.get_json()["data"]["hierarchy"]) == [CHILD_A, CHILD_B]
+
+    missing = api_client.get("/api/v1/relationships/hierarchy/UNKNOWN0000000000000")
+    assert missing.status_code == 404
+    assert missing.get_json() == {
+        "status": "error",
+        "error": {"code": "404", "message": ErrorMessages.ENTITY_NOT_FOUND},
+    }
+
+    invalid = api_client.get(url, query_string={"max_depth": 0})
+    assert invalid.status_code == 400
+    assert "max_depth" in invalid.get_json()["error"]["message"]
+    assert "data" not in invalid.get_json()
+
+
+def test_relationship_filters_and_counts(group):
+    assert group.count_relationships(ROOT) == 5
+    assert group.count_relationships(ROOT, {"direction": "child"}) == 4
+    assert group.count_relationships(ROOT, {"direction": "PARENT"}) == 1
+    active_direct = {"direction": "CHILD", "relationship_type": "direct", "relationship_status": "active"}
+    assert group.count_relationships(ROOT, active_direct) == 2
+
+    for filters in ({"direction": "SIDEWAYS"}, {"relationship_type": "INDIRECT"}):
+        with pytest.raises(ValueError):
+            group.count_relationships(ROOT, filters)
+
+
+def test_relationship_pages_and_keyset_agree(group):
+    everything = group.get_relationships(ROOT)
+    ids = [row["id"] for row in everything]
+    assert ids == sorted(ids) and len(ids) == 5
+
+    pages = [group.get_relationships(ROOT, limit=2, offset=offset) for offset in (0, 2, 4)]
+    assert [row["id"] for page in pages for row in page] == ids
+    assert group.get_relationships(ROOT, limit=2, after_id=ids[1]) == pages[1]
+
+    # Both entities' names are joined onto each row
+    to_child_a = next(row for row in everything if row["child_lei"] == CHILD_A)
+    assert (to_child_a["parent_name"], to_child_a["child_name"]) == ("Root Holding AB", "Child A AB")
+    from_grandchild = next(row for row in everything if row["parent_lei"] == GRANDCHILD)
+    assert from_grandchild["parent_name"] is None
+
+
+def test_relationship_endpoint_pages_by_cursor(group, api_client):
+    url = f"/api/v1/relationships/{ROOT}"
+
+    first = api_client.get(url, query_string={"per_page": 2}).get_json()
+    assert first["meta"]["total"] == 5
+    assert len(first["data"]["relationships"]) == 2
+
+    seen, cursor = [], ""
+    while cursor is not None:
+        body = api_client.get(url, query_string={"per_page": 2, "cursor": cursor}).get_json()
+        seen += [(row["parent_lei"], row["child_lei"]) for row in body["data"]["relationships"]]
+        cursor = body["meta"]["next_cursor"]
+    assert len(seen) == len(set(seen)) == 5
+
+
+@pytest.mark.parametrize(
+    "query, message",
+    [
+        ({"direction": "SIDEWAYS"}, "Invalid direction"),
+        ({"relationship_type": "INDIRECT"}, "Invalid relationship_type"),
+        ({"cursor": "not-a-cursor"}, "Invalid cursor"),
+        ({"count": "sometimes"}, "Invalid count mode"),
+    ],
+)
+def test_relationship_endpoint_rejects_invalid_parameters(group, api_client, query, message):
+    response = api_client.get(f"/api/v1/relationships/{ROOT}", query_string=query)
+
+    assert response.status_code == 400
+    assert response.get_json()["error"]["message"].startswith(message)
+    assert api_client.get("/api/v1/relationships/UNKNOWN0000000000000").status_code == 404
@@ -0,0 +1,38 @@
+"""
+Tests for compiled schema mappings.
+"""
+
+from datetime import date
+
+import pytest
+
+from marketdata_api.schema.schema_mapper import SchemaMapper, compile_transformation
+
+
+def test_compiled_transformations():
+    assert compile_transformation("round(2)")("1.2345") == 1.23
+    assert compile_transformation("format(YYYY-MM-DD)")(date(2024, 3, 1)) == "2024-03-01"
+    assert compile_transformation("upper")("sek") == "SEK"
+    # Failures keep the original value; unknown rules compile to nothing
+    assert compile_transformation("round(2)")("n/a") == "n/a"
+    assert compile_transformation("reverse") is None
+
+
+def test_map_many_includes_inherited_fields():
+    mapper = SchemaMapper()
+    rows = [
+        {"isin": "SE0000108656", "full_name": "Volvo AB", "admission_approval_date": date(2024, 3, 1)},
+        {"isin": "US0378331005"},
+    ]
+
+    first, second = mapper.map_many(rows, "equity")
+
+    assert first["identifier"] == "SE0000108656"
+    assert first["admission_approval_date"] == "2024-03-01"
+    # Required fields are kept as None, optional ones are left out
+    assert second["full_name"] is None
+    assert "currency" not in second
+    assert mapper.compile_schema("equity") is mapper.compile_schema("equity")
+
+    with pytest.raises(ValueError):
+        mapper.map_many(rows, "nope")
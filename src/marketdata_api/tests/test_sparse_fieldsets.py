@@ -0,0 +1,34 @@
+"""
+Tests for sparse fieldset parsing on list endpoints.
+"""
+
+import pytest
+from flask import Flask
+
+from marketdata_api.api.utils.api_utils import get_fieldset
+from marketdata_api.api.utils.type_specific_responses import (
+    INSTRUMENT_PROJECTION_FIELDS,
+    INSTRUMENT_VIEW_FIELDS,
+)
+
+app = Flask(__name__)
+
+
+def _fieldset(query_string):
+    with app.test_request_context(f"/instruments/?{query_string}"):
+        return get_fieldset(INSTRUMENT_PROJECTION_FIELDS, INSTRUMENT_VIEW_FIELDS, "isin")
+
+
+def test_views_and_fields():
+    assert _fieldset("") is None
+    assert _fieldset("view=full") is None
+    assert _fieldset("view=compact") == ["isin", "full_name", "instrument_type"]
+    assert _fieldset("view=standard")[0] == "isin"
+    # fields wins over view; the key field is always first and not duplicated
+    assert _fieldset("view=full&fields=currency,isin,currency") == ["isin", "currency"]
+
+
+@pytest.mark.parametrize("query_string", ["fields=isin,firds_data", "view=tiny"])
+def test_invalid_fieldsets_raise(query_string):
+    with pytest.raises(ValueError):
+        _fieldset(query_string)
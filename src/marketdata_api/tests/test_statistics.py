@@ -0,0 +1,167 @@
+"""
+Tests for the materialised statistics builders.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from marketdata_api.database import data_version
+from marketdata_api.models.sqlite import (
+    Base,
+    FigiMapping,
+    Instrument,
+    LegalEntity,
+    MarketIdentificationCode,
+    TradingVenue,
+    TransparencyCalculation,
+)
+from marketdata_api.models.sqlite.market_identification_code import MICStatus, MICType
+from marketdata_api.services.utils.facets import compute_instrument_facets
+from marketdata_api.services.utils.statistics import (
+    STATISTICS_GROUPS,
+    StatisticsSnapshot,
+    StatisticsStore,
+)
+
+MODELS = {
+    "FigiMapping": FigiMapping,
+    "Instrument": Instrument,
+    "LegalEntity": LegalEntity,
+    "MarketIdentificationCode": MarketIdentificationCode,
+    "TradingVenue": TradingVenue,
+    "TransparencyCalculation": TransparencyCalculation,
+}
+
+
+def _entity(lei, status="ACTIVE", jurisdiction="SE"):
+    return LegalEntity(
+        lei=lei, name=f"Entity {lei}", jurisdiction=jurisdiction, legal_form="AB", registered_as="x",
+        status=status, registration_status="ISSUED", managing_lou="x",
+    )
+
+
+def _build(name, session):
+    return STATISTICS_GROUPS[name][1](session, MODELS)
+
+
+def test_groups_are_built_with_aggregate_passes():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add_all([
+            _entity("549300HGV012CNC8JD22"),
+            _entity("5493000IBP32UQZ0KL24", status="INACTIVE", jurisdiction="NO"),
+            MarketIdentificationCode(mic="XSTO", operating_mic="XSTO", operation_type=MICType.OPRT,
+                                     iso_country_code="SE", market_name="Nasdaq Stockholm", status=MICStatus.ACTIVE),
+            MarketIdentificationCode(mic="SSME", operating_mic="XSTO", operation_type=MICType.SGMT,
+                                     iso_country_code="SE", market_name="Spotlight", status=MICStatus.EXPIRED),
+        ])
+        volvo = Instrument(isin="SE0000108656", instrument_type="equity", cfi_code="ESVUFR",
+                           lei_id="549300HGV012CNC8JD22")
+        bond = Instrument(isin="SE0011281922", instrument_type="debt", cfi_code="DBFTFB",
+                          lei_id="529900UNKNOWNLEI0000")
+        session.add_all([volvo, bond, Instrument(isin="US0378331005", instrument_type="equity", cfi_code="ESVUFR")])
+        session.flush()
+        session.add_all([
+            FigiMapping(isin="SE0000108656", figi="BBG000BLWXT4"),
+            FigiMapping(isin="SE0000108656", figi="BBG000BLWXS5"),
+            TradingVenue(instrument_id=volvo.id, venue_id="XSTO", isin=volvo.isin, mic_code="XSTO"),
+            TradingVenue(instrument_id=bond.id, venue_id="XSTO", isin=bond.isin, mic_code="XSTO"),
+        ])
+        session.commit()
+
+        instruments = _build("instruments", session)
+        assert instruments["total_instruments"] == 3
+        assert instruments["type_breakdown"] == {"debt": 1, "equity": 2}
+        assert instruments["cfi_type_breakdown"] == {"D": 1, "E": 2}
+        # Both LEIs count as set; only Volvo's issuer is stored
+        assert (instruments["with_lei"], instruments["with_entity"]) == (2, 1)
+        assert (instruments["with_figi"], instruments["figi_mappings"]) == (1, 2)
+        assert instruments["with_transparency"] == 0
+
+        venues = _build("venues", session)
+        assert (venues["total_mics"], venues["operating_mics"], venues["segment_mics"]) == (2, 1, 1)
+        assert venues["status_breakdown"] == {"ACTIVE": 1, "EXPIRED": 1}
+        assert venues["top_countries"] == [{"country_code": "SE", "count": 2}]
+        assert (venues["total_trading_venues"], venues["venues_with_instruments"]) == (2, 1)
+
+        entities = _build("legal_entities", session)
+        assert entities["total_entities"] == 2
+        assert entities["status_breakdown"] == {"ACTIVE": 1, "INACTIVE": 1}
+        assert entities["top_jurisdictions"] == [
+            {"jurisdiction": "NO", "count": 1},
+            {"jurisdiction": "SE", "count": 1},
+        ]
+
+
+def test_instrument_facets_follow_filters():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        volvo = Instrument(isin="SE0000108656", instrument_type="equity", cfi_code="ESVUFR", currency="SEK")
+        bond = Instrument(isin="SE0011281922", instrument_type="debt", cfi_code="DBFTFB", currency="SEK",
+                          competent_authority="SE")
+        session.add_all([volvo, bond, Instrument(isin="US0378331005", instrument_type="equity", currency="USD")])
+        session.flush()
+        session.add_all([
+            TradingVenue(instrument_id=volvo.id, venue_id="XSTO", isin=volvo.isin, mic_code="XSTO"),
+            TradingVenue(instrument_id=volvo.id, venue_id="XSTO-2", isin=volvo.isin, mic_code="XSTO"),
+        ])
+        session.commit()
+
+        facets = _build("instrument_facets", session)
+        assert facets["instrument_type"] == [{"value": "equity", "count": 2}, {"value": "debt", "count": 1}]
+        assert facets["cfi_category"] == [{"value": "D", "count": 1}, {"value": "E", "count": 1}]
+        assert facets["competent_authority"] == [{"value": "SE", "count": 1}]
+        assert facets["venue"] == [{"value": "XSTO", "count": 1}]
+
+        sek = compute_instrument_facets(session, MODELS, lambda query: query.filter(Instrument.currency == "SEK"))
+        assert sek["currency"] == [{"value": "SEK", "count": 2}]
+        assert sek["instrument_type"] == [{"value": "debt", "count": 1}, {"value": "equity", "count": 1}]
+
+
+def test_figures_are_stale_after_writes_or_refresh_interval(monkeypatch):
+    store = StatisticsStore(refresh_seconds=60)
+    now = datetime.now(UTC).replace(microsecond=0) + timedelta(seconds=1)
+
+    assert not store.is_stale("legal_entities", StatisticsSnapshot({}, now))
+    assert store.is_stale("legal_entities", StatisticsSnapshot({}, now - timedelta(minutes=5)))
+
+    # Figures stored before this process started stay fresh until it writes
+    with monkeypatch.context() as patch:
+        patch.setattr(data_version, "_modified_at", {})
+        before_start = StatisticsSnapshot({}, data_version._started_at - timedelta(seconds=30))
+        assert not store.is_stale("instruments", before_start)
+
+    data_version.bump("legal_entities")
+    assert store.is_stale("legal_entities", StatisticsSnapshot({}, now - timedelta(seconds=2)))
+
+
+def test_system_status_checks_the_connection_and_reads_stored_figures(service_db, api_client, monkeypatch):
+    from marketdata_api.services.utils.statistics import statistics_store
+
+    computed_at = datetime(2026, 1, 1, tzinfo=UTC)
+    figures = {
+        "instruments": {"total_instruments": 3},
+        "legal_entities": {"total_entities": 2},
+        "venues": {"total_mics": 1},
+    }
+    monkeypatch.setattr(statistics_store, "get", lambda name: StatisticsSnapshot(figures[name], computed_at))
+
+    body = api_client.get("/api/v1/system/status").get_json()
+    assert body["database"]["status"] == "connected"
+    assert body["statistics"]["total_records"] == 6
+    assert body["statistics"]["computed_at"] == computed_at.isoformat()
+
+    def unreachable():
+        raise ConnectionError("database unreachable")
+
+    monkeypatch.setattr("marketdata_api.database.session.get_session", unreachable)
+    body = api_client.get("/api/v1/system/status").get_json()
+    assert body["database"] == {"status": "error", "error": "database unreachable"}
+    assert body["api_info"]["status"] == "degraded"
+    assert body["statistics"]["instruments"] == 3
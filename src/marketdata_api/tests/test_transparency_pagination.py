@@ -369,3 +369,39 @@ class TestClientSideFilteringValidation:
         # Should return empty results with correct structure
         assert data["data"] == []
         assert data["meta"]["total"] == 0
+
+
+class TestKeysetPagination:
+    """Test opaque cursor handling for keyset pagination."""
+
+    def test_cursor_round_trip(self):
+        from marketdata_api.api.utils.api_utils import decode_cursor, encode_cursor
+
+        cursor = encode_cursor("SE0000242455")
+        assert "SE0000242455" not in cursor
+        assert decode_cursor(cursor) == "SE0000242455"
+
+    def test_invalid_cursor_rejected(self):
+        from marketdata_api.api.utils.api_utils import decode_cursor
+
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+    @pytest.mark.integration
+    def test_cursor_mode_returns_next_cursor(self, client):
+        """Test that keyset mode skips the total and exposes next_cursor."""
+        response = client.get("/api/v1/transparency?cursor=&per_page=5")
+        assert response.status_code == 200
+
+        meta = json.loads(response.data).get("meta", {})
+        assert "next_cursor" in meta
+        assert meta.get("total") is None
+
+        if meta["next_cursor"]:
+            next_page = client.get(f"/api/v1/transparency?cursor={meta['next_cursor']}&per_page=5")
+            assert next_page.status_code == 200
+
+    @pytest.mark.integration
+    def test_invalid_cursor_returns_bad_request(self, client):
+        response = client.get("/api/v1/transparency?cursor=not-a-cursor")
+        assert response.status_code == 400
@@ -0,0 +1,97 @@
+"""
+Tests for parallel FITRS extraction and batched transparency writes.
+"""
+
+import concurrent.futures
+import time
+
+import pytest
+
+from marketdata_api.models.sqlite.transparency import TransparencyCalculation
+from marketdata_api.services.core import transparency_service as module
+from marketdata_api.services.core.transparency_service import TransparencyService
+
+SOURCE_FILE = "FULECR_20250830_E_1of1_fitrs_data.csv"
+
+
+def _record(isin, tech_record_id, year=2024, **extra):
+    return dict(
+        isin=isin, TechRcrdId=tech_record_id, FrDt=f"{year}-01-01", ToDt=f"{year}-12-31",
+        Mthdlgy="SINT", source_file=SOURCE_FILE, **extra,
+    )
+
+
+def _result(processed=0, created=0):
+    return {
+        "processed": processed, "created_calculations": created, "skipped": 0, "failed": 0,
+        "failed_instruments": [], "successful_instruments": [],
+    }
+
+
+@pytest.fixture
+def service(service_db, monkeypatch):
+    monkeypatch.setattr(module, "SessionLocal", service_db)
+    return TransparencyService()
+
+
+def _stored(session_maker):
+    with session_maker() as session:
+        return session.query(TransparencyCalculation).count()
+
+
+def test_parallel_groups_are_timed_from_their_own_start(monkeypatch):
+    # Threads stand in for worker processes; one worker makes the groups queue
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", concurrent.futures.ThreadPoolExecutor)
+
+    def extract(asset_type, isins, logger=None):
+        if asset_type == "F":
+            raise OSError("FITRS file unreadable")
+        time.sleep(0.3 if asset_type == "E" else 0)
+        return {"results": {}, "total_found": 0}
+
+    monkeypatch.setattr(module, "extract_fitrs_records_for_asset_type", extract)
+    service = TransparencyService()
+    monkeypatch.setattr(service, "_persist_asset_type_records", lambda t, instruments, r, b: _result(len(instruments)))
+    monkeypatch.setattr(service, "_process_transparency_batch", lambda instruments: _result(len(instruments)))
+
+    groups = {"E": [{"isin": "SE0000108656"}], "D": [{"isin": "SE0011281922"}] * 2, "F": [{"isin": "IE00B4L5Y983"}]}
+    results = {result["asset_type"]: result for result in service._process_asset_types_parallel(groups, 10, 1)}
+
+    assert {asset_type: result["processed"] for asset_type, result in results.items()} == {"E": 1, "D": 2, "F": 1}
+    assert results["E"]["elapsed_time"] >= 0.3
+    # D waited for E's worker, but only its own extraction counts
+    assert results["D"]["elapsed_time"] < 0.2
+
+
+def test_batched_writes_count_created_existing_and_missing(service, service_db):
+    instruments = [{"isin": "SE0000108656"}, {"isin": "SE0000242455"}, {"isin": "SE0000115446"}]
+    found = {
+        "SE0000108656": [_record("SE0000108656", 1), _record("SE0000108656", 2, year=2023)],
+        # A record failing validation is skipped without losing its batch
+        "SE0000242455": [_record("SE0000242455", 3), _record("SE0000242455", None)],
+    }
+
+    result = service._persist_asset_type_records("E", instruments, {"results": found}, batch_size=2)
+
+    assert (result["processed"], result["created_calculations"], result["skipped"]) == (3, 3, 1)
+    assert _stored(service_db) == 3
+
+    # Existing calculations are recognised instead of duplicated
+    again = service._persist_asset_type_records("E", instruments, {"results": found}, batch_size=2)
+    assert again["created_calculations"] == 3
+    assert _stored(service_db) == 3
+
+
+def test_failed_batch_is_retried_record_by_record(service, service_db, monkeypatch):
+    def fail(batch, found_results, asset_type):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(service, "_write_transparency_batch", fail)
+    found = {"SE0000108656": [_record("SE0000108656", 1)], "SE0000242455": [_record("SE0000242455", 2)]}
+
+    result = service._persist_asset_type_records(
+        "E", [{"isin": "SE0000108656"}, {"isin": "SE0000242455"}], {"results": found}, batch_size=10
+    )
+
+    assert result["created_calculations"] == 2
+    assert _stored(service_db) == 2
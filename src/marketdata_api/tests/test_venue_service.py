@@ -0,0 +1,59 @@
+"""
+Tests for venue instrument counts.
+"""
+
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import Session
+
+from marketdata_api.models.sqlite import Base
+from marketdata_api.models.sqlite.instrument import Instrument, TradingVenue
+from marketdata_api.services.core.venue_service import VenueService
+
+
+def test_grouped_instrument_counts_match_per_venue_counts():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        instruments = {
+            isin: Instrument(isin=isin, instrument_type="equity", relevant_trading_venue=venue)
+            for isin, venue in [
+                ("SE0000108656", "XSTO"),
+                ("SE0000242455", None),
+                ("SE0000115446", "XSTO"),
+                ("SE0011281922", "SSME"),
+                ("SE0000667891", "XSTO"),
+            ]
+        }
+        session.add_all(instruments.values())
+        session.flush()
+
+        def venue(isin, venue_id, mic):
+            return TradingVenue(instrument_id=instruments[isin].id, venue_id=venue_id, isin=isin, mic_code=mic)
+
+        session.add_all([
+            # Two venue records on one MIC still count the instrument once
+            venue("SE0000108656", "XSTO", "XSTO"),
+            venue("SE0000108656", "XSTO-2", "XSTO"),
+            venue("SE0000108656", "SSME", "SSME"),
+            venue("SE0000242455", "XSTO", "XSTO"),
+            venue("SE0011281922", "XLON", "XLON"),
+        ])
+        session.commit()
+
+        def per_venue(mic):
+            via_venues = (
+                session.query(func.count(func.distinct(TradingVenue.instrument_id)))
+                .filter(TradingVenue.mic_code == mic)
+                .scalar()
+            )
+            direct = session.query(Instrument).filter(Instrument.relevant_trading_venue == mic).count()
+            return max(via_venues, direct)
+
+        mics = ["XSTO", "SSME", "XLON", "XNOP", "XSTO"]
+        counts = VenueService()._instrument_counts(session, mics)
+
+        assert counts == {mic: per_venue(mic) for mic in mics}
+        # XSTO: 2 instruments with venue records, 3 naming it as relevant venue
+        assert counts == {"XSTO": 3, "SSME": 1, "XLON": 1, "XNOP": 0}
+        assert VenueService()._instrument_counts(session, []) == {}